@@ -10,6 +10,7 @@ Last standardized: 2025-06-14
 """
 
 from globe.location import TLocation
+from engine.globe.world_locations import TWorldLocations
 
 
 class TBaseAlien(TLocation):
@@ -31,6 +32,7 @@ class TBaseAlien(TLocation):
         days_in_month (int): Number of days in a month (for mission planning).
         missions_types (list): List of possible mission types.
         region_id: Region identifier for the base.
+        faction: Faction owning the base.
         pending_missions (list): Missions to be launched this month.
         game: Reference to the game object.
     """
@@ -62,8 +64,14 @@ class TBaseAlien(TLocation):
             'research', 'supply', 'hunt', 'infiltration', 'retaliation', 'create_base'
         ]
         self.region_id = getattr(self, 'region_id', None)
+        self.faction = data.get('faction')
         self.pending_missions = []  # Missions to be launched this month
 
+        # Register on the world map (UFO scripts target bases by region and faction)
+        locations = TWorldLocations.of(self.game)
+        if locations is not None:
+            locations.place(self, 'base')
+
     def tick_day(self):
         """
         Advance base logic by one day. Handles score penalty, mission planning, supply, and growth.
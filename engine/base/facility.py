@@ -9,7 +9,7 @@ Classes:
 Last standardized: 2025-06-14
 """
 
-from base.facility_type import TFacilityType
+from engine.base.facility_type import TFacilityType
 
 
 class TFacility:
@@ -54,11 +54,31 @@ class TFacility:
         """
         Advance construction by one day. If build progress reaches build_time, mark as completed.
         """
+        self.build_days(1)
+
+    def build_days(self, days):
+        """
+        Advance construction by several days at once. If build progress reaches build_time, mark as completed.
+
+        Args:
+            days (int): Days of construction.
+        """
         if not self.completed:
-            self.build_progress += 1
+            self.build_progress += days
             if self.build_progress >= self.facility_type.build_time:
                 self.completed = True
 
+    def days_left(self):
+        """
+        Days of construction left.
+
+        Returns:
+            int: 0 once completed, else days until completion (at least 1).
+        """
+        if self.completed:
+            return 0
+        return max(1, self.facility_type.build_time - self.build_progress)
+
     def get_stats(self):
         """
         Return the facility type if construction is completed, else None.
@@ -12,6 +12,7 @@ Last standardized: 2025-06-14
 from craft.craft import TCraft
 from engine.base.facility import TFacility, TFacilityType
 from engine.globe.location import TLocation
+from engine.globe.world_locations import TWorldLocations
 from unit.unit import TUnit
 from engine.base.base_inv_manager import TBaseInventory
 
@@ -23,9 +24,14 @@ class TBaseXCom(TLocation):
 
     Attributes:
         facilities (dict): Mapping of (x, y) positions to TFacility objects.
+        facilities_version (int): Incremented whenever a facility is added, removed or completed (radar caches
+            key on it).
         inventory (TBaseInventory): Inventory system for items, units, crafts, and captures.
         game: Reference to the game object for mod and research checks.
+        faction (str): Owning faction ('xcom').
     """
+    faction = 'xcom'
+
     def __init__(self, pid, data: dict = {}):
         """
         Initialize an XCOM base at a world location.
@@ -40,18 +46,27 @@ class TBaseXCom(TLocation):
         self.game = TGame()
 
         self.facilities : dict[ tuple, TFacility] = {}  # Dict of (x, y) -> TFacility
+        self.facilities_version = 0
 
         # Initialize the inventory system for this base
         storage_capacity = self.get_storage_space()
         craft_capacity = self.get_craft_space()
         self.inventory = TBaseInventory(storage_capacity=storage_capacity, craft_capacity=craft_capacity)
 
+        # Register on the world map (UFO scripts target bases by region)
+        locations = TWorldLocations.of(self.game)
+        if locations is not None:
+            locations.place(self, 'base')
+
     def add_facility(self, facility_type: TFacilityType, position=None, force_add=False):
         # Check if facility can be built (skip check if force_add is True)
         if not force_add and not self.can_build_facility(facility_type):
             raise Exception("Cannot build facility: requirements not met.")
         facility = TFacility(facility_type, position)
-        self.facilities[position] = facility
+        # Construction progresses from today on
+        with self.game.system_change('facilities'):
+            self.facilities[position] = facility
+        self.facilities_version += 1
 
         # Update inventory capacities when a new facility is built
         self.update_inventory_capacities()
@@ -66,6 +81,7 @@ class TBaseXCom(TLocation):
                 break
         if pos_to_remove is not None:
             del self.facilities[pos_to_remove]
+            self.facilities_version += 1
 
             # Update inventory capacities when a facility is removed
             self.update_inventory_capacities()
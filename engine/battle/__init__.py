@@ -5,10 +5,19 @@ Imports all main classes for battle map generation, objectives, and deployment.
 Last standardized: 2025-06-14
 """
 
+from .battle_clearance import TBattleClearance
 from .battle_generator import TBattleGenerator
+from .battle_journal import TBattleJournal
+from .battle_level import TBattleLevel
+from .battle_lof import TBattleLineOfFire
+from .battle_log import TBattleLog
 from .battle_script import TBattleScript
 from .battle_script_step import TBattleScriptStep
+from .battle_tile_type import TBattleTileTypes
+from .damage_model import TDamageModel
 from .deployment import TDeployment
 from .deployment_group import TDeploymentGroup
+from .deployment_placer import TDeploymentPlacer
 from .objective import TBattleObjective
+from .reactions import TReactionFire
 # ...add more as other files are standardized...
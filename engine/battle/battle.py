@@ -2,17 +2,28 @@
 TBattle: Main battle state and logic manager.
 
 Represents a battle instance created by a mission. Manages all units, map tiles, items, effects, sides, turns, fog of war, and objectives. Responsible for the core battle state, including map generation, unit management, turn processing, and objective tracking.
+Battles may span several independent levels (e.g. underground bases); only levels with player units are kept active.
+All state changes and random draws are recorded in an append-only TBattleLog for replay and statistics.
+The state can be forked and rolled back through a copy-on-write TBattleJournal for AI lookahead and previews.
 
 Classes:
     TBattle: Main class for battle state and logic.
 
 Last standardized: 2025-06-14
 """
+import random
+from contextlib import contextmanager
 
+from engine.battle.battle_clearance import TBattleClearance
 from engine.battle.battle_generator import TBattleGenerator
+from engine.battle.battle_journal import TBattleJournal
+from engine.battle.battle_log import TBattleLog
+from engine.battle.battle_level import TBattleLevel
+from engine.battle.battle_lof import TBattleLineOfFire
 from engine.battle.battle_tile import TBattleTile
 from engine.unit.unit import TUnit
 from engine.battle.objective import TBattleObjective
+from engine.battle.reactions import TReactionFire
 
 
 class TBattle:
@@ -27,14 +38,25 @@ class TBattle:
         SIDE_NEUTRAL (int): Neutral side identifier.
         NUM_SIDES (int): Number of sides in the battle.
         DIPLOMACY (list): Diplomacy matrix for side interactions.
-        tiles (list[list[TBattleTile]]): 2D array of battle map tiles.
-        width (int): Width of the battle map.
-        height (int): Height of the battle map.
+        levels (list[TBattleLevel]): Independent map levels, level 0 is the entry level.
+        current_level (int): Level shown by tiles/width/height/fog_of_war (the viewed level).
+        portals (dict): (level, x, y) -> (level, x, y) links for elevators/teleports.
+        tiles (list[list[TBattleTile]]): 2D array of tiles of the current level.
+        width (int): Width of the current level.
+        height (int): Height of the current level.
         sides (list[list[TUnit]]): List of units for each side.
-        fog_of_war (list): Fog of war state for each tile and side.
+        fog_of_war (list): Fog of war state for each tile and side of the current level.
         current_side (int): Currently active side.
         turn (int): Current turn number.
         objectives (list[TBattleObjective]): List of mission objectives.
+        log (TBattleLog): Event log with periodic state snapshots.
+        rng (random.Random): Battle random generator, draws are logged.
+        journal (TBattleJournal): Copy-on-write layers for fork/rollback.
+        revision (int): Counter bumped on every tile or unit change (cache invalidation).
+        line_of_fire (TBattleLineOfFire): Shared batched chance-to-hit calculator.
+        reactions (TReactionFire): Overwatch watch zones and reaction fire.
+        destroyed_terrain (list): (level, x, y, layer, component) of every terrain part destroyed in battle.
+        clearance (TBattleClearance): Per-level largest-square clearance layer for large units.
     """
     SIDE_PLAYER = 0
     SIDE_ENEMY = 1
@@ -49,28 +71,33 @@ class TBattle:
         [0, 1, 0, -1],  # 2: Ally
         [0, 2, -1, 0],  # 3: Neutral
     ]
+    # Sides whose units keep a level active (levels without them are frozen)
+    LEVEL_ACTIVATING_SIDES = (SIDE_PLAYER, SIDE_ALLY)
 
-    def __init__(self, generator: TBattleGenerator):
+    def __init__(self, generator: TBattleGenerator, level_generators: list[TBattleGenerator] = None,
+                 seed: int = None, snapshot_interval: int = 5):
         """
         Initialize a TBattle instance with a battle map generator.
 
         Args:
             generator (TBattleGenerator): Generator for creating the battle map and initial state.
+            level_generators (list[TBattleGenerator], optional): Generators for additional levels,
+                each with its own terrain and script. Extra levels start frozen.
+            seed (int, optional): Seed for the battle random generator (for reproducible battles).
+            snapshot_interval (int): Turns between state snapshots in the event log (default 5).
         """
-        # Generate the battle map (2D list of TBattleTile)
-        self.tiles: list[list[TBattleTile]] = generator.generate()
-        self.width = len(self.tiles[0]) if self.tiles else 0
-        self.height = len(self.tiles)
+        # Generate the entry level (2D list of TBattleTile); each tile may have fire/smoke/gas and light
+        self.levels: list[TBattleLevel] = [TBattleLevel(0, generator.generate(), self.NUM_SIDES)]
+        self.current_level = 0
+        for level_generator in level_generators or []:
+            self.add_level(level_generator)
 
-        # Each tile may have fire/smoke/gas, light, fog of war
-        # (Already handled in TBattleTile)
+        # Elevators/teleports between levels: (level, x, y) -> (level, x, y)
+        self.portals: dict[tuple[int, int, int], tuple[int, int, int]] = {}
 
         # Sides: each has a list of units
         self.sides: list[list[TUnit]] = [[] for _ in range(self.NUM_SIDES)]
 
-        # Fog of war: 3 states per tile per side (0=hidden, 1=partial, 2=full)
-        self.fog_of_war = [[[0 for _ in range(self.width)] for _ in range(self.height)] for _ in range(self.NUM_SIDES)]
-
         # Turn/side management
         self.current_side = self.SIDE_PLAYER
         self.turn = 1
@@ -78,7 +105,99 @@ class TBattle:
         # Mission objectives
         self.objectives: list[TBattleObjective] = []
 
-    def add_unit(self, unit: TUnit, side: int, x: int, y: int):
+        # Event log and logged random generator
+        self.log = TBattleLog(snapshot_interval)
+        self.rng = random.Random(seed)
+
+        # Copy-on-write journal for fork/rollback (AI lookahead, previews)
+        self.journal = TBattleJournal()
+
+        # Bumped on every tile/unit write so derived caches (line of fire) know when to rebuild
+        self.revision = 0
+
+        # Chance to hit and reaction fire (watch zones indexed by tile)
+        self.line_of_fire = TBattleLineOfFire(self)
+        self.reactions = TReactionFire(self, self.line_of_fire)
+
+        # Destroyed walls/objects/floors, kept for the post-battle report instead of rescanning tiles
+        self.destroyed_terrain: list[tuple] = []
+
+        # Largest unit size fitting at each tile, updated locally on terrain change
+        self.clearance = TBattleClearance(self)
+
+    @property
+    def tiles(self) -> list[list[TBattleTile]]:
+        """
+        Tiles of the current level (activated on access if frozen).
+        """
+        level = self.levels[self.current_level]
+        level.activate()
+        return level.tiles
+
+    @property
+    def width(self) -> int:
+        """Width of the current level."""
+        return self.levels[self.current_level].width
+
+    @property
+    def height(self) -> int:
+        """Height of the current level."""
+        return self.levels[self.current_level].height
+
+    @property
+    def fog_of_war(self) -> list:
+        """
+        Fog of war of the current level: 3 states per tile per side (0=hidden, 1=partial, 2=full).
+        """
+        level = self.levels[self.current_level]
+        level.activate()
+        return level.fog_of_war
+
+    def add_level(self, generator: TBattleGenerator, name: str = '') -> int:
+        """
+        Generate an additional level and store it frozen until a unit transitions to it.
+        Args:
+            generator (TBattleGenerator): Generator with the level's own terrain and script.
+            name (str, optional): Level name.
+        Returns:
+            int: Index of the new level.
+        """
+        level = TBattleLevel(len(self.levels), generator.generate(), self.NUM_SIDES, name)
+        level.freeze()
+        self.levels.append(level)
+        return level.index
+
+    def get_level(self, index: int) -> TBattleLevel:
+        """
+        Get a level by index.
+        Args:
+            index (int): Level index.
+        Returns:
+            TBattleLevel: The level.
+        """
+        return self.levels[index]
+
+    def get_tile(self, x: int, y: int, level: int = None) -> TBattleTile:
+        """
+        Get a live tile, activating its level if needed.
+        Args:
+            x (int): X coordinate.
+            y (int): Y coordinate.
+            level (int, optional): Level index, defaults to the current level.
+        Returns:
+            TBattleTile: Tile at the given position.
+        """
+        return self.levels[self.current_level if level is None else level].get_tile(x, y)
+
+    def get_active_levels(self) -> list[TBattleLevel]:
+        """
+        Get all levels that currently keep live simulation layers.
+        Returns:
+            list[TBattleLevel]: Active levels.
+        """
+        return [level for level in self.levels if level.active]
+
+    def add_unit(self, unit: TUnit, side: int, x: int, y: int, level: int = 0):
         """
         Add a unit to the battle at the specified side and coordinates.
         Args:
@@ -86,17 +205,397 @@ class TBattle:
             side (int): Side identifier.
             x (int): X coordinate.
             y (int): Y coordinate.
+            level (int, optional): Level index (default 0).
         """
         self.sides[side].append(unit)
-        self.tiles[y][x].unit = unit
-        unit.x = x
-        unit.y = y
-        unit.side = side
+        if side in self.LEVEL_ACTIVATING_SIDES:
+            self.levels[level].activate()
+        for fx, fy in self.footprint(unit, x, y):
+            self._write_tile_unit(level, fx, fy, unit)
+        self._write_unit(unit, x=x, y=y, level=level, side=side)
+        self.log.record_unit(unit, side, x, y, level)
+
+    def unit_size(self, unit) -> int:
+        """
+        Size of a unit in tiles per side (1 for normal units, 2 for 2x2 units).
+        Args:
+            unit (TUnit): Unit to check.
+        Returns:
+            int: Unit size.
+        """
+        size = getattr(unit, 'size', None)
+        if size is None:
+            size = getattr(getattr(unit, 'stats', None), 'size', 1)
+        return max(1, int(size or 1))
+
+    def footprint(self, unit, x: int, y: int) -> list[tuple[int, int]]:
+        """
+        Tiles covered by a unit whose top-left tile is at (x, y).
+        Args:
+            unit (TUnit): Unit to place.
+            x (int): Top-left X coordinate.
+            y (int): Top-left Y coordinate.
+        Returns:
+            list: (x, y) footprint tiles.
+        """
+        size = self.unit_size(unit)
+        if size == 1:
+            return [(x, y)]
+        return [(x + dx, y + dy) for dy in range(size) for dx in range(size)]
+
+    def add_portal(self, source: tuple[int, int, int], target: tuple[int, int, int], two_way: bool = True):
+        """
+        Link two tiles on (usually different) levels, e.g. an elevator or teleport.
+        Args:
+            source (tuple): (level, x, y) of the entry tile.
+            target (tuple): (level, x, y) of the exit tile.
+            two_way (bool): Also link target back to source.
+        """
+        self.portals[tuple(source)] = tuple(target)
+        if two_way:
+            self.portals[tuple(target)] = tuple(source)
+
+    def use_portal(self, unit: TUnit) -> bool:
+        """
+        Move a unit standing on a portal tile to the linked tile.
+        Args:
+            unit (TUnit): Unit on a portal tile.
+        Returns:
+            bool: True if the unit was moved.
+        """
+        target = self.portals.get((getattr(unit, 'level', 0), unit.x, unit.y))
+        if target is None:
+            return False
+        return self.transfer_unit(unit, *target)
+
+    def transfer_unit(self, unit: TUnit, level: int, x: int, y: int) -> bool:
+        """
+        Move a unit to a tile on another level, activating the target level and freezing
+        the source level if no unit keeps it active anymore.
+        Args:
+            unit (TUnit): Unit to move.
+            level (int): Target level index.
+            x (int): Target X coordinate.
+            y (int): Target Y coordinate.
+        Returns:
+            bool: True if moved, False if any target footprint tile is occupied or off the map.
+        """
+        battle_level = self.levels[level]
+        target = self.footprint(unit, x, y)
+        for fx, fy in target:
+            if not (0 <= fx < battle_level.width and 0 <= fy < battle_level.height):
+                return False
+            occupant = battle_level.get_unit(fx, fy)
+            if occupant is not None and occupant is not unit:
+                return False
+        source_level = getattr(unit, 'level', 0)
+        self.log.record_move(unit, (source_level, unit.x, unit.y), (level, x, y))
+        for fx, fy in self.footprint(unit, unit.x, unit.y):
+            self._write_tile_unit(source_level, fx, fy, None)
+        for fx, fy in target:
+            self._write_tile_unit(level, fx, fy, unit)
+        self._write_unit(unit, x=x, y=y, level=level)
+        if source_level != level:
+            self.update_active_levels()
+        return True
+
+    def move_unit(self, unit: TUnit, x: int, y: int) -> bool:
+        """
+        Move a unit to another tile on its current level.
+        Args:
+            unit (TUnit): Unit to move.
+            x (int): Target X coordinate.
+            y (int): Target Y coordinate.
+        Returns:
+            bool: True if moved, False if the target tile is occupied.
+        """
+        return self.transfer_unit(unit, getattr(unit, 'level', 0), x, y)
+
+    def set_terrain(self, x: int, y: int, layer: str, new_id, level: int = None):
+        """
+        Change one tile layer (e.g. a destroyed wall replaced by rubble) and log it.
+        Args:
+            x (int): X coordinate.
+            y (int): Y coordinate.
+            layer (str): 'floor_id', 'wall_id' or 'roof_id'.
+            new_id (str|None): New tile id for the layer.
+            level (int, optional): Level index, defaults to the current level.
+        """
+        level = self.current_level if level is None else level
+        self._write_tile(level, x, y, layer, new_id)
+        self.log.record_terrain(x, y, layer, new_id, level)
+        self.reactions.on_terrain_changed(level, x, y)
+
+    def record_destroyed(self, x: int, y: int, layer: str, component, level: int = None):
+        """
+        Remember a destroyed terrain component (wall, object, floor) for scoring.
+        Args:
+            x (int): X coordinate.
+            y (int): Y coordinate.
+            layer (str): 'wall', 'objects' or 'floor'.
+            component: Destroyed component (may carry score_loss).
+            level (int, optional): Level index, defaults to the current level.
+        """
+        level = self.current_level if level is None else level
+        self.destroyed_terrain.append((level, x, y, layer, component))
+
+    def set_unit_status(self, unit: TUnit, alive: bool = None, stunned: bool = None):
+        """
+        Change a unit's alive/stunned status and log it.
+        Args:
+            unit (TUnit): Unit to update.
+            alive (bool, optional): New alive status.
+            stunned (bool, optional): New stunned status.
+        """
+        if alive is not None:
+            self._write_unit(unit, alive=alive)
+        if stunned is not None:
+            self._write_unit(unit, stunned=stunned)
+        self.log.record_status(unit)
+
+    def random(self, tag: str = None) -> float:
+        """
+        Draw a random float in [0, 1) from the battle generator and log it.
+        Args:
+            tag (str, optional): What the draw is used for (e.g. 'hit', 'crit').
+        Returns:
+            float: Random value.
+        """
+        value = self.rng.random()
+        self.log.record_rng(value, tag)
+        return value
+
+    def capture_state(self) -> dict:
+        """
+        Capture the replayable battle state (tile layers, environment flags, units, turn, rng).
+        Frozen levels are captured from their compact form (see TBattleLevel.capture()).
+        Returns:
+            dict: Compact state for TBattleLog snapshots and restore_state().
+        """
+        levels = [level.capture() for level in self.levels]
+        units = [
+            (unit, getattr(unit, 'level', 0), unit.x, unit.y,
+             getattr(unit, 'alive', True), getattr(unit, 'stunned', False))
+            for side_units in self.sides for unit in side_units
+        ]
+        return {
+            'turn': self.turn,
+            'current_side': self.current_side,
+            'levels': levels,
+            'units': units,
+            'rng': self.rng.getstate(),
+        }
+
+    def restore_state(self, state: dict):
+        """
+        Restore a state captured by capture_state().
+        Units added after the capture stay off the map until their placement is replayed. Levels come back
+        active or frozen as they were at capture time.
+        Args:
+            state (dict): Captured state.
+        """
+        for level, captured in zip(self.levels, state['levels']):
+            level.restore(captured)
+        for unit, level, x, y, alive, stunned in state['units']:
+            unit.level, unit.x, unit.y = level, x, y
+            unit.alive, unit.stunned = alive, stunned
+            for fx, fy in self.footprint(unit, x, y):
+                self.levels[level].set_unit(fx, fy, unit)
+        self.clearance.invalidate()
+        self.turn = state['turn']
+        self.current_side = state['current_side']
+        self.rng.setstate(state['rng'])
+        self.revision += 1
+        self.update_active_levels()
+
+    def fork(self) -> int:
+        """
+        Start a copy-on-write lookahead layer. Changes made through the TBattle API after this call
+        can be undone with rollback() or kept with commit(). Forks can be nested.
+        Returns:
+            int: Token identifying the fork.
+        """
+        mark = (self.turn, self.current_side, self.rng.getstate(), self.log.mark(),
+                [len(side_units) for side_units in self.sides], len(self.destroyed_terrain))
+        return self.journal.push(mark)
+
+    def rollback(self, token: int = None):
+        """
+        Undo all changes made since a fork (and every fork nested in it).
+        Cost is proportional to the number of changed tile/unit cells; only watch zones of restored overwatch
+        entries and of watchers near restored terrain are recomputed.
+        Args:
+            token (int, optional): Token from fork(), defaults to the innermost fork.
+        """
+        token = self.journal.depth - 1 if token is None else token
+        watchers, terrain = {}, {}
+        while self.journal.depth > token:
+            layer, mark = self.journal.pop()
+            for key, old_value in layer.items():
+                self._undo(key, old_value)
+                if key[0] == 'watcher':
+                    watchers[old_value[0]] = None
+                elif key[0] == 'tile' and key[4] in TBattleLog.LAYERS:
+                    terrain[key[1:4]] = None
+            self.turn, self.current_side, rng_state, log_mark, side_sizes, destroyed_count = mark
+            del self.destroyed_terrain[destroyed_count:]
+            self.rng.setstate(rng_state)
+            self.log.truncate(log_mark)
+            for side_units, size in zip(self.sides, side_sizes):
+                del side_units[size:]
+        self.update_active_levels()
+        self.reactions.refresh(watchers, terrain)
+
+    def commit(self, token: int = None):
+        """
+        Keep all changes made since a fork and close it (and every fork nested in it).
+        Args:
+            token (int, optional): Token from fork(), defaults to the innermost fork.
+        """
+        token = self.journal.depth - 1 if token is None else token
+        while self.journal.depth > token:
+            self.journal.merge_top()
+
+    @contextmanager
+    def lookahead(self):
+        """
+        Context manager that forks the battle and always rolls back on exit.
+        Usage:
+            with battle.lookahead():
+                battle.move_unit(unit, x, y)
+                score = evaluate(battle)
+        """
+        token = self.fork()
+        try:
+            yield self
+        finally:
+            self.rollback(token)
+
+    def _write_tile(self, level: int, x: int, y: int, attr: str, value):
+        """
+        Set a tile attribute, journaling the previous value while forked.
+        Args:
+            level (int): Level index.
+            x (int): X coordinate.
+            y (int): Y coordinate.
+            attr (str): Tile attribute (e.g. 'wall_id', 'smoke').
+            value: New value.
+        """
+        tile = self.levels[level].get_tile(x, y)
+        if self.journal.is_recording():
+            self.journal.record(('tile', level, x, y, attr), getattr(tile, attr))
+        setattr(tile, attr, value)
+        if attr in TBattleLog.LAYERS:
+            tile.update_properties()
+        if attr in TBattleClearance.AFFECTING_ATTRS:
+            self.clearance.update(level, x, y)
+        self.revision += 1
+
+    def _write_tile_unit(self, level: int, x: int, y: int, unit):
+        """
+        Place or clear the unit of a tile (works on frozen levels), journaling the previous occupant.
+        Args:
+            level (int): Level index.
+            x (int): X coordinate.
+            y (int): Y coordinate.
+            unit (TUnit|None): New occupant.
+        """
+        battle_level = self.levels[level]
+        if self.journal.is_recording():
+            self.journal.record(('tile', level, x, y, 'unit'), battle_level.get_unit(x, y))
+        battle_level.set_unit(x, y, unit)
+        self.revision += 1
+
+    def _write_unit(self, unit: TUnit, **values):
+        """
+        Set unit-state table values (position, level, status), journaling the previous values.
+        Args:
+            unit (TUnit): Unit to update.
+            **values: Attribute name -> new value.
+        """
+        for attr, value in values.items():
+            if self.journal.is_recording():
+                self.journal.record(('unit', id(unit), attr), (unit, getattr(unit, attr, None)))
+            setattr(unit, attr, value)
+        self.revision += 1
+
+    def _write_object(self, obj, **values):
+        """
+        Set attributes of other battle state (unit stats, armour shields, reaction state), journaling the
+        previous values so lookahead rollback restores them.
+        Args:
+            obj: Object to update.
+            **values: Attribute name -> new value.
+        """
+        for attr, value in values.items():
+            if self.journal.is_recording():
+                self.journal.record(('object', id(obj), attr), (obj, getattr(obj, attr, None)))
+            setattr(obj, attr, value)
+        self.revision += 1
+
+    def _undo(self, key: tuple, old_value):
+        """
+        Restore one journaled cell.
+        Args:
+            key (tuple): Journal key.
+            old_value: Value stored at the first write.
+        """
+        self.revision += 1
+        if key[0] in ('unit', 'object'):
+            obj, value = old_value
+            setattr(obj, key[2], value)
+            return
+        if key[0] == 'watcher':
+            unit, entry = old_value
+            if entry is None:
+                self.reactions.watchers.pop(unit, None)
+            else:
+                self.reactions.watchers[unit] = entry
+            return
+        _, level, x, y, attr = key
+        if attr == 'unit':
+            self.levels[level].set_unit(x, y, old_value)
+            return
+        tile = self.levels[level].get_tile(x, y)
+        setattr(tile, attr, old_value)
+        if attr in TBattleLog.LAYERS:
+            tile.update_properties()
+        if attr in TBattleClearance.AFFECTING_ATTRS:
+            self.clearance.update(level, x, y)
+
+    def update_active_levels(self):
+        """
+        Activate levels with units of LEVEL_ACTIVATING_SIDES on them and freeze all others.
+        The current (viewed) level is always kept active.
+        """
+        needed = {self.current_level}
+        for side in self.LEVEL_ACTIVATING_SIDES:
+            for unit in self.sides[side]:
+                if getattr(unit, 'alive', True):
+                    needed.add(getattr(unit, 'level', 0))
+        for level in self.levels:
+            if level.index in needed:
+                level.activate()
+            else:
+                level.freeze()
+
+    def set_current_level(self, index: int):
+        """
+        Change the viewed level, keeping only needed levels active.
+        Args:
+            index (int): Level index.
+        """
+        self.current_level = index
+        self.update_active_levels()
 
     def process_turn(self):
         """
         Process the current turn, handling all side and unit actions.
+        Logs the turn start and stores a state snapshot every log.snapshot_interval turns (not during lookahead).
         """
+        snapshot_due = self.log.snapshot_due(self.turn) and not self.journal.is_recording()
+        state = self.capture_state() if snapshot_due else None
+        self.log.record_turn(self.turn, self.current_side, state)
         for side in range(self.NUM_SIDES):
             self.process_side(side)
         self.turn += 1
@@ -104,10 +603,13 @@ class TBattle:
     def process_side(self, side: int):
         """
         Process all actions for a given side during their turn.
+        Units on frozen levels are skipped until a level is activated.
         Args:
             side (int): Side identifier.
         """
         for unit in self.sides[side]:
+            if not self.levels[getattr(unit, 'level', 0)].active:
+                continue
             self.process_unit(unit)
 
     def process_unit(self, unit: TUnit):
@@ -191,34 +693,34 @@ class TBattle:
 
     def find_objects(self, object_ids=None):
         """
-        Find objects in the battle matching the given IDs.
+        Find objects in the battle matching the given IDs, on all levels (frozen levels are not activated).
         Args:
             object_ids (list, optional): List of object IDs to find.
         Returns:
             list: List of matching objects.
         """
         result = []
-        for row in self.tiles:
-            for tile in row:
-                for obj in getattr(tile, 'objects', []):
-                    if object_ids is not None and getattr(obj, 'id', None) not in object_ids:
-                        continue
-                    result.append(obj)
+        for level in self.levels:
+            for obj in level.iter_objects():
+                if object_ids is not None and getattr(obj, 'id', None) not in object_ids:
+                    continue
+                result.append(obj)
         return result
 
-    def find_tiles(self, objective_marker=None):
+    def find_tiles(self, objective_marker=None, level=None):
         """
         Find tiles in the battle matching a given objective marker.
         Args:
             objective_marker (any, optional): Marker to filter tiles.
+            level (int, optional): Level index, defaults to the current level.
         Returns:
             list: List of matching tiles.
         """
         result = []
-        for y, row in enumerate(self.tiles):
-            for x, tile in enumerate(row):
-                if objective_marker is not None and getattr(tile, 'objective_marker', None) != objective_marker:
-                    continue
-                result.append((x, y, tile))
+        battle_level = self.levels[self.current_level if level is None else level]
+        for x, y, tile in battle_level.iter_tiles():
+            if objective_marker is not None and getattr(tile, 'objective_marker', None) != objective_marker:
+                continue
+            result.append((x, y, tile))
         return result
 
@@ -0,0 +1,174 @@
+"""
+engine/battle/battle_clearance.py
+
+Defines the TBattleClearance class, a per-level clearance layer storing for each tile the size of the largest
+square (with that tile as its top-left corner) that contains only walkable tiles. Large units (2x2 and more)
+test a single value instead of scanning their whole footprint.
+
+Classes:
+    TBattleClearance: Lazily built, locally updated clearance grids for all levels of a battle.
+
+Last standardized: 2026-10-18
+"""
+from typing import Dict
+
+
+class TBattleClearance:
+    """
+    Clearance grids for the levels of a battle.
+    clearance[y][x] = 0 for blocked tiles, otherwise 1 + min(right, below, below-right), capped at MAX_SIZE.
+    Because values are capped, a terrain change at (x, y) can only affect tiles up to MAX_SIZE - 1 to the left
+    and above it, so updates recompute a MAX_SIZE x MAX_SIZE window instead of the whole level.
+
+    Attributes:
+        battle (TBattle): Battle the grids belong to.
+        grids (dict): Level index -> bytearray of clearance values (row-major), built on first use.
+        MAX_SIZE (int): Largest unit size tracked.
+        AFFECTING_ATTRS (tuple): Tile attributes whose change can alter walkability.
+    """
+    MAX_SIZE = 4
+    AFFECTING_ATTRS = ('floor_id', 'wall_id', 'wall', 'passable')
+
+    def __init__(self, battle):
+        """
+        Initialize clearance tracking for a battle (grids are built lazily).
+
+        Args:
+            battle (TBattle): Battle to track.
+        """
+        self.battle = battle
+        self.grids: Dict[int, bytearray] = {}
+
+    @staticmethod
+    def is_open(tile) -> bool:
+        """
+        Check whether a tile can hold part of a unit.
+
+        Args:
+            tile (TBattleTile): Tile to check.
+        Returns:
+            bool: True if walkable.
+        """
+        return tile.passable and tile.is_walkable()
+
+    @classmethod
+    def compute(cls, tiles) -> bytearray:
+        """
+        Compute a full clearance grid for a 2D tile array.
+
+        Args:
+            tiles (list[list[TBattleTile]]): Tiles of one level.
+        Returns:
+            bytearray: Clearance values, row-major.
+        """
+        height = len(tiles)
+        width = len(tiles[0]) if tiles else 0
+        grid = bytearray(width * height)
+        for y in range(height - 1, -1, -1):
+            for x in range(width - 1, -1, -1):
+                grid[y * width + x] = cls._cell(grid, tiles[y][x], x, y, width, height)
+        return grid
+
+    @classmethod
+    def _cell(cls, grid: bytearray, tile, x: int, y: int, width: int, height: int) -> int:
+        """
+        Clearance of one tile from its already computed right/below neighbours.
+
+        Args:
+            grid (bytearray): Clearance grid.
+            tile (TBattleTile): Tile at (x, y).
+            x (int): X coordinate.
+            y (int): Y coordinate.
+            width (int): Grid width.
+            height (int): Grid height.
+        Returns:
+            int: Clearance value.
+        """
+        if not cls.is_open(tile):
+            return 0
+        if x == width - 1 or y == height - 1:
+            return 1
+        offset = y * width + x
+        return min(cls.MAX_SIZE, 1 + min(grid[offset + 1], grid[offset + width], grid[offset + width + 1]))
+
+    def grid(self, level: int) -> bytearray:
+        """
+        Get the clearance grid of a level, building it on first use.
+
+        Args:
+            level (int): Level index.
+        Returns:
+            bytearray: Clearance values, row-major.
+        """
+        grid = self.grids.get(level)
+        if grid is None:
+            battle_level = self.battle.levels[level]
+            rows = [[None] * battle_level.width for _ in range(battle_level.height)]
+            for x, y, tile in battle_level.iter_tiles():
+                rows[y][x] = tile
+            grid = self.compute(rows)
+            self.grids[level] = grid
+        return grid
+
+    def get(self, level: int, x: int, y: int) -> int:
+        """
+        Largest square unit size whose top-left tile can be at (x, y).
+
+        Args:
+            level (int): Level index.
+            x (int): X coordinate.
+            y (int): Y coordinate.
+        Returns:
+            int: Clearance (0 = blocked).
+        """
+        battle_level = self.battle.levels[level]
+        return self.grid(level)[y * battle_level.width + x]
+
+    def fits(self, level: int, x: int, y: int, size: int = 1) -> bool:
+        """
+        Check whether a size x size unit fits with its top-left tile at (x, y).
+
+        Args:
+            level (int): Level index.
+            x (int): X coordinate.
+            y (int): Y coordinate.
+            size (int): Unit size in tiles.
+        Returns:
+            bool: True if all footprint tiles are walkable.
+        """
+        battle_level = self.battle.levels[level]
+        if not (0 <= x < battle_level.width and 0 <= y < battle_level.height):
+            return False
+        return self.get(level, x, y) >= size
+
+    def update(self, level: int, x: int, y: int) -> None:
+        """
+        Recompute clearance around a changed tile (no-op if the level's grid was not built yet).
+
+        Args:
+            level (int): Level index.
+            x (int): X coordinate of the changed tile.
+            y (int): Y coordinate of the changed tile.
+        """
+        grid = self.grids.get(level)
+        if grid is None:
+            return
+        battle_level = self.battle.levels[level]
+        width, height = battle_level.width, battle_level.height
+        for ty in range(y, max(-1, y - self.MAX_SIZE), -1):
+            for tx in range(x, max(-1, x - self.MAX_SIZE), -1):
+                tile = battle_level.get_tile(tx, ty)
+                grid[ty * width + tx] = self._cell(grid, tile, tx, ty, width, height)
+
+    def invalidate(self, level: int = None) -> None:
+        """
+        Drop grids so they are rebuilt on next use.
+
+        Args:
+            level (int, optional): Level index, defaults to all levels.
+        """
+        if level is None:
+            self.grids.clear()
+        else:
+            self.grids.pop(level, None)
+
@@ -0,0 +1,96 @@
+"""
+engine/battle/battle_journal.py
+
+Defines the TBattleJournal class, a layered copy-on-write change journal used by TBattle to fork the battle state
+for AI lookahead and "what if" previews and to roll it back in time proportional to what changed.
+
+Classes:
+    TBattleJournal: Stack of copy-on-write layers holding the original values of changed tile and unit state.
+
+Last standardized: 2026-10-18
+"""
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+
+class TBattleJournal:
+    """
+    Stack of copy-on-write layers over the live battle state.
+    Each fork pushes an empty layer. The first write to a key (a tile layer cell such as ('tile', level, x, y, attr),
+    a unit-state table cell such as ('unit', id(unit), attr), or another battle object's attribute such as
+    ('object', id(stats), 'hurt')) stores the previous value in the top layer;
+    later writes to the same key are free. Rolling back restores the stored values, committing merges the layer
+    into its parent, so both cost O(changed keys) and forking costs O(1).
+
+    Attributes:
+        layers (list[dict]): Copy-on-write layers, key -> original value.
+        marks (list): Scalar battle state saved at each fork (turn, side, rng, log mark, side sizes).
+    """
+    def __init__(self):
+        """
+        Initialize an empty journal (no fork active).
+        """
+        self.layers: List[Dict[Hashable, Any]] = []
+        self.marks: List[Any] = []
+
+    @property
+    def depth(self) -> int:
+        """
+        Number of active forks.
+        """
+        return len(self.layers)
+
+    def is_recording(self) -> bool:
+        """
+        Check whether writes must be journaled (at least one fork is active).
+
+        Returns:
+            bool: True while forked.
+        """
+        return bool(self.layers)
+
+    def push(self, mark: Any) -> int:
+        """
+        Start a new layer.
+
+        Args:
+            mark: Scalar state to restore on rollback.
+        Returns:
+            int: Token (depth before the push) to pass to rollback/commit.
+        """
+        self.layers.append({})
+        self.marks.append(mark)
+        return len(self.layers) - 1
+
+    def record(self, key: Hashable, old_value: Any) -> None:
+        """
+        Remember the original value of a key in the top layer (first write only).
+
+        Args:
+            key (hashable): State cell identifier.
+            old_value: Value before the write.
+        """
+        if self.layers:
+            self.layers[-1].setdefault(key, old_value)
+
+    def pop(self) -> Tuple[Dict[Hashable, Any], Any]:
+        """
+        Remove the top layer.
+
+        Returns:
+            tuple: (layer dict, mark) of the removed layer.
+        """
+        return self.layers.pop(), self.marks.pop()
+
+    def merge_top(self) -> Optional[Any]:
+        """
+        Commit the top layer: keep its changes and fold its original values into the parent layer.
+
+        Returns:
+            Any: Mark of the committed layer.
+        """
+        layer, mark = self.pop()
+        if self.layers:
+            parent = self.layers[-1]
+            for key, old_value in layer.items():
+                parent.setdefault(key, old_value)
+        return mark
@@ -0,0 +1,297 @@
+"""
+engine/battle/battle_level.py
+
+Defines the TBattleLevel class, representing one independent level of a multilevel battle map (e.g. a floor of an underground alien base).
+Only active levels keep live tiles and simulation layers (fog of war, lighting); inactive levels are frozen into a compact form until a unit transitions to them.
+
+Classes:
+    TBattleLevel: Single level of a battle map, with activate/freeze support.
+
+Last standardized: 2026-10-18
+"""
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from engine.battle.battle_tile import TBattleTile
+
+
+class TBattleLevel:
+    """
+    Represents one level of a multilevel battle map.
+    Each level is generated from its own generator (terrain and script) and cannot interact with other levels
+    except through portals (elevators, teleports) managed by TBattle.
+
+    While active, the level holds a 2D array of TBattleTile objects plus live simulation layers.
+    While frozen, tiles are stored as a palette of (floor_id, wall_id, roof_id, flags) entries, an index grid
+    and a sparse dict holding only tiles whose state differs from a freshly built tile. Fog of war is kept as
+    one bytearray per side so exploration is not lost.
+
+    Attributes:
+        index (int): Level index in the battle (0 is the surface/entry level).
+        name (str): Optional level name for display.
+        width (int): Width of the level in tiles.
+        height (int): Height of the level in tiles.
+        num_sides (int): Number of battle sides (for fog of war layers).
+        tiles (list[list[TBattleTile]]|None): Live tiles, None while frozen.
+        fog_of_war (list|None): Live fog of war per side, [side][y][x], None while frozen.
+        light_map (list|None): Live light level per tile, [y][x], None while frozen.
+        active (bool): Whether the level is currently active.
+    """
+    # Tile attributes stored in the palette; everything else goes to the sparse state
+    PALETTE_ATTRS = ('floor_id', 'wall_id', 'roof_id', 'passable', 'blocks_fire', 'blocks_sight', 'blocks_light')
+
+    def __init__(self, index: int, tiles: List[List[TBattleTile]], num_sides: int, name: str = ''):
+        """
+        Initialize a level from generated tiles. The level starts active.
+
+        Args:
+            index (int): Level index in the battle.
+            tiles (list[list[TBattleTile]]): Generated tiles for this level.
+            num_sides (int): Number of battle sides.
+            name (str, optional): Level name.
+        """
+        self.index = index
+        self.name = name
+        self.tiles: Optional[List[List[TBattleTile]]] = tiles
+        self.width = len(tiles[0]) if tiles else 0
+        self.height = len(tiles)
+        self.num_sides = num_sides
+        self.fog_of_war: Optional[list] = None
+        self.light_map: Optional[list] = None
+        self.active = False
+
+        # Frozen form (set only while inactive)
+        self._palette: List[Tuple] = []
+        self._tile_index: Optional[array] = None
+        self._sparse: Dict[int, Dict[str, Any]] = {}
+        self._frozen_fog: Optional[List[bytearray]] = None
+
+        self.activate()
+
+    def activate(self) -> None:
+        """
+        Make the level active: rebuild tiles from the frozen form if needed and create simulation layers.
+        """
+        if self.active:
+            return
+        if self.tiles is None:
+            self.tiles = self._thaw_tiles()
+        # Fog of war: 0=hidden, 1=partial, 2=full
+        if self._frozen_fog is not None:
+            self.fog_of_war = [
+                [list(fog[y * self.width:(y + 1) * self.width]) for y in range(self.height)]
+                for fog in self._frozen_fog
+            ]
+        else:
+            self.fog_of_war = [[[0] * self.width for _ in range(self.height)] for _ in range(self.num_sides)]
+        self.light_map = [[0] * self.width for _ in range(self.height)]
+        self._palette = []
+        self._tile_index = None
+        self._sparse = {}
+        self._frozen_fog = None
+        self.active = True
+
+    def freeze(self) -> None:
+        """
+        Make the level inactive: drop simulation layers and store tiles in the compact frozen form.
+        """
+        if not self.active:
+            return
+        self._freeze_tiles()
+        self._frozen_fog = [
+            bytearray(value for row in side_fog for value in row) for side_fog in self.fog_of_war
+        ]
+        self.tiles = None
+        self.fog_of_war = None
+        self.light_map = None
+        self.active = False
+
+    def get_tile(self, x: int, y: int) -> TBattleTile:
+        """
+        Get the live tile at (x, y). The level is activated if it is frozen.
+
+        Args:
+            x (int): X coordinate.
+            y (int): Y coordinate.
+        Returns:
+            TBattleTile: Tile at the given coordinates.
+        """
+        if not self.active:
+            self.activate()
+        return self.tiles[y][x]
+
+    def get_unit(self, x: int, y: int) -> Any:
+        """
+        Get the unit standing at (x, y) without activating the level.
+
+        Args:
+            x (int): X coordinate.
+            y (int): Y coordinate.
+        Returns:
+            TUnit|None: Unit on the tile.
+        """
+        if self.active:
+            return self.tiles[y][x].unit
+        return self._sparse.get(y * self.width + x, {}).get('unit')
+
+    def set_unit(self, x: int, y: int, unit: Any) -> None:
+        """
+        Place or clear a unit at (x, y) without activating the level.
+
+        Args:
+            x (int): X coordinate.
+            y (int): Y coordinate.
+            unit (TUnit|None): Unit to place, or None to clear the tile.
+        """
+        if self.active:
+            self.tiles[y][x].unit = unit
+            return
+        offset = y * self.width + x
+        state = self._sparse.setdefault(offset, {})
+        if unit is not None:
+            state['unit'] = unit
+            return
+        state.pop('unit', None)
+        if not state:
+            del self._sparse[offset]
+
+    def iter_tiles(self) -> Iterator[Tuple[int, int, TBattleTile]]:
+        """
+        Iterate over all tiles as (x, y, tile).
+        For frozen levels the tiles are rebuilt snapshots; changes to them are not stored.
+
+        Returns:
+            iterator: (x, y, TBattleTile) tuples.
+        """
+        tiles = self.tiles if self.active else self._thaw_tiles()
+        for y, row in enumerate(tiles):
+            for x, tile in enumerate(row):
+                yield x, y, tile
+
+    def iter_objects(self) -> Iterator[Any]:
+        """
+        Iterate over all objects on this level without activating it.
+        Frozen levels only keep objects in the sparse state, so nothing else is scanned.
+
+        Returns:
+            iterator: Objects lying on tiles of this level.
+        """
+        if self.active:
+            for row in self.tiles:
+                for tile in row:
+                    yield from getattr(tile, 'objects', [])
+            return
+        for state in self._sparse.values():
+            yield from state.get('_objects') or ()
+
+    def capture(self) -> Tuple:
+        """
+        Capture the replayable tile state of this level without activating it.
+        Active levels store (floor_id, wall_id, roof_id, smoke, fire, gas) per tile; frozen levels store their
+        palette, index grid and sparse state (without units), which are only replaced, never changed in place.
+
+        Returns:
+            tuple: ('active', per-tile values) or ('frozen', palette, index grid, sparse state).
+        """
+        if self.active:
+            return 'active', tuple(
+                (tile.floor_id, tile.wall_id, tile.roof_id, tile.smoke, tile.fire, tile.gas)
+                for row in self.tiles for tile in row
+            )
+        sparse = {}
+        for offset, state in self._sparse.items():
+            state = {attr: value for attr, value in state.items() if attr != 'unit'}
+            if state:
+                sparse[offset] = state
+        return 'frozen', self._palette, self._tile_index, sparse
+
+    def restore(self, captured: Tuple) -> None:
+        """
+        Restore a state from capture(), in the form it was captured: levels frozen at capture time are frozen
+        again without rebuilding their tiles. Units are cleared; the battle places them again.
+
+        Args:
+            captured (tuple): State from capture().
+        """
+        if captured[0] == 'frozen':
+            self.freeze()
+            _, self._palette, self._tile_index, sparse = captured
+            # Copies, so units placed later do not leak into the captured state
+            self._sparse = {offset: dict(state) for offset, state in sparse.items()}
+            return
+        self.activate()
+        for (_, _, tile), values in zip(self.iter_tiles(), captured[1]):
+            tile.floor_id, tile.wall_id, tile.roof_id, tile.smoke, tile.fire, tile.gas = values
+            tile.update_properties()
+            tile.unit = None
+
+    def _freeze_tiles(self) -> None:
+        """
+        Convert live tiles into palette, index grid and sparse state.
+        """
+        palette_lookup: Dict[Tuple, int] = {}
+        references: List[TBattleTile] = []
+        self._palette = []
+        self._tile_index = array('I', [0]) * (self.width * self.height)
+        self._sparse = {}
+        for y, row in enumerate(self.tiles):
+            for x, tile in enumerate(row):
+                key = tuple(getattr(tile, attr) for attr in self.PALETTE_ATTRS)
+                palette_id = palette_lookup.get(key)
+                if palette_id is None:
+                    palette_id = len(self._palette)
+                    palette_lookup[key] = palette_id
+                    self._palette.append(key)
+                    # Fresh tile with the same ids: the type records and defaults a thawed tile gets for free
+                    references.append(TBattleTile(key[0], key[1], key[2]))
+                offset = y * self.width + x
+                self._tile_index[offset] = palette_id
+                state = self._tile_state(tile, references[palette_id])
+                if state:
+                    self._sparse[offset] = state
+
+    def _tile_state(self, tile: TBattleTile, reference: TBattleTile) -> Dict[str, Any]:
+        """
+        Collect tile slots that differ from a freshly built tile with the same ids.
+
+        Args:
+            tile (TBattleTile): Tile to inspect.
+            reference (TBattleTile): Fresh tile with the same floor/wall/roof ids.
+        Returns:
+            dict: Slot name -> value for every non-default slot.
+        """
+        state = {}
+        for attr in TBattleTile.__slots__:
+            if attr in self.PALETTE_ATTRS:
+                continue
+            value = getattr(tile, attr)
+            default = getattr(reference, attr)
+            if value is default or (type(value) is type(default) and value == default):
+                continue
+            state[attr] = value
+        return state
+
+    def _thaw_tiles(self) -> List[List[TBattleTile]]:
+        """
+        Rebuild tiles from the frozen form.
+
+        Returns:
+            list[list[TBattleTile]]: Rebuilt tiles.
+        """
+        tiles = []
+        for y in range(self.height):
+            row = []
+            for x in range(self.width):
+                offset = y * self.width + x
+                floor_id, wall_id, roof_id, passable, blocks_fire, blocks_sight, blocks_light = \
+                    self._palette[self._tile_index[offset]]
+                tile = TBattleTile(floor_id, wall_id, roof_id)
+                tile.passable = passable
+                tile.blocks_fire = blocks_fire
+                tile.blocks_sight = blocks_sight
+                tile.blocks_light = blocks_light
+                for attr, value in self._sparse.get(offset, {}).items():
+                    setattr(tile, attr, value)
+                row.append(tile)
+            tiles.append(row)
+        return tiles
@@ -0,0 +1,451 @@
+"""
+engine/battle/battle_log.py
+
+Defines the TBattleLog class, an append-only binary event log for a battle (moves, shots, damage, terrain changes, RNG draws),
+with periodic state snapshots so a replay viewer or debugger can seek to any turn by replaying at most one snapshot interval.
+
+Classes:
+    TBattleLog: Append-only binary battle event log with snapshot based seeking.
+
+Last standardized: 2026-10-18
+"""
+import struct
+from bisect import bisect_right
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class TBattleLog:
+    """
+    Append-only binary event log emitted by TBattle.
+    Each record is one event type byte followed by a fixed size little-endian payload.
+    Units are stored as handles (registration order) and strings (tile ids, damage types, weapons)
+    as indexes into an interned string table, so records stay a few bytes each.
+
+    Every snapshot_interval turns the battle state is captured together with the byte offset of the log,
+    so seek() restores the closest earlier snapshot and replays only the events after it.
+
+    Attributes:
+        snapshot_interval (int): Number of turns between state snapshots.
+        data (bytearray): Encoded event records.
+        strings (list[str]): Interned string table.
+        units (list): Registered units, index is the unit handle.
+        snapshots (list[tuple]): (turn, offset, state) tuples, ordered by turn.
+        turn (int): Turn of the last TURN record.
+    """
+    EVENT_TURN = 1
+    EVENT_UNIT = 2
+    EVENT_MOVE = 3
+    EVENT_SHOT = 4
+    EVENT_DAMAGE = 5
+    EVENT_TERRAIN = 6
+    EVENT_STATUS = 7
+    EVENT_RNG = 8
+
+    # Payload layouts (after the event type byte)
+    FORMATS = {
+        EVENT_TURN: struct.Struct('<HB'),          # turn, side
+        EVENT_UNIT: struct.Struct('<HBHHBH'),      # unit, side, x, y, level, name
+        EVENT_MOVE: struct.Struct('<HBHHBHH'),     # unit, from level, from x, from y, to level, to x, to y
+        EVENT_SHOT: struct.Struct('<HBHHHHB'),     # shooter, level, target x, target y, weapon, mode, hit
+        EVENT_DAMAGE: struct.Struct('<HBHHfH'),    # target unit (NO_UNIT for terrain), level, x, y, amount, damage type
+        EVENT_TERRAIN: struct.Struct('<BHHBH'),    # level, x, y, layer, new tile id
+        EVENT_STATUS: struct.Struct('<HBB'),       # unit, alive, stunned
+        EVENT_RNG: struct.Struct('<dH'),           # value, tag
+    }
+    NO_UNIT = 0xFFFF
+    NO_STRING = 0xFFFF
+    LAYERS = ('floor_id', 'wall_id', 'roof_id')
+
+    def __init__(self, snapshot_interval: int = 5):
+        """
+        Initialize an empty battle log.
+
+        Args:
+            snapshot_interval (int): Number of turns between state snapshots (default 5).
+        """
+        self.snapshot_interval = max(1, snapshot_interval)
+        self.data = bytearray()
+        self.strings: List[str] = []
+        self._string_index: Dict[str, int] = {}
+        self.units: List[Any] = []
+        self._unit_handles: Dict[int, int] = {}
+        self.snapshots: List[Tuple[int, int, Any]] = []
+        self.turn = 0
+
+    # --- Encoding ---
+
+    def intern(self, text: Optional[str]) -> int:
+        """
+        Get the string table index for a string, adding it if needed.
+
+        Args:
+            text (str|None): String to intern.
+        Returns:
+            int: Index in the string table, NO_STRING for None.
+        """
+        if text is None:
+            return self.NO_STRING
+        text = str(text)
+        index = self._string_index.get(text)
+        if index is None:
+            index = len(self.strings)
+            self.strings.append(text)
+            self._string_index[text] = index
+        return index
+
+    def unit_handle(self, unit: Any) -> int:
+        """
+        Get the handle of a registered unit.
+
+        Args:
+            unit: Unit object (or None).
+        Returns:
+            int: Unit handle, NO_UNIT if the unit is None or not registered.
+        """
+        if unit is None:
+            return self.NO_UNIT
+        return self._unit_handles.get(id(unit), self.NO_UNIT)
+
+    def _append(self, event_type: int, *values) -> None:
+        """
+        Append one encoded record.
+
+        Args:
+            event_type (int): Event type constant.
+            *values: Payload values matching FORMATS[event_type].
+        """
+        self.data.append(event_type)
+        self.data += self.FORMATS[event_type].pack(*values)
+
+    # --- Recording ---
+
+    def record_turn(self, turn: int, side: int = 0, state: Any = None) -> None:
+        """
+        Record the start of a turn and store a snapshot when the turn is on the snapshot interval.
+
+        Args:
+            turn (int): Turn number starting.
+            side (int): Side starting the turn.
+            state: Captured battle state (see TBattle.capture_state), stored if a snapshot is due.
+        """
+        self.turn = turn
+        self._append(self.EVENT_TURN, turn, side)
+        if state is not None:
+            self.snapshots.append((turn, len(self.data), state))
+
+    def snapshot_due(self, turn: int) -> bool:
+        """
+        Check whether a snapshot should be stored at the start of the given turn.
+
+        Args:
+            turn (int): Turn number.
+        Returns:
+            bool: True for the first turn and every snapshot_interval turns after it.
+        """
+        return (turn - 1) % self.snapshot_interval == 0
+
+    def record_unit(self, unit: Any, side: int, x: int, y: int, level: int = 0) -> int:
+        """
+        Register a unit and record its placement.
+
+        Args:
+            unit: Unit added to the battle.
+            side (int): Side identifier.
+            x (int): X coordinate.
+            y (int): Y coordinate.
+            level (int): Level index.
+        Returns:
+            int: Unit handle.
+        """
+        handle = self._unit_handles.get(id(unit))
+        if handle is None:
+            handle = len(self.units)
+            self.units.append(unit)
+            self._unit_handles[id(unit)] = handle
+        name = getattr(unit, 'name', '') or getattr(unit, 'id', '') or ''
+        self._append(self.EVENT_UNIT, handle, side, x, y, level, self.intern(name))
+        return handle
+
+    def record_move(self, unit: Any, source: Tuple[int, int, int], target: Tuple[int, int, int]) -> None:
+        """
+        Record a unit moving between tiles (possibly between levels).
+
+        Args:
+            unit: Moving unit.
+            source (tuple): (level, x, y) before the move.
+            target (tuple): (level, x, y) after the move.
+        """
+        self._append(self.EVENT_MOVE, self.unit_handle(unit), source[0], source[1], source[2],
+                     target[0], target[1], target[2])
+
+    def record_shot(self, shooter: Any, target: Tuple[int, int], level: int = 0,
+                    weapon: Optional[str] = None, mode: Optional[str] = None, hit: bool = False) -> None:
+        """
+        Record a shot or other attack.
+
+        Args:
+            shooter: Attacking unit.
+            target (tuple): (x, y) of the target tile.
+            level (int): Level index.
+            weapon (str, optional): Weapon item id.
+            mode (str, optional): Weapon mode name.
+            hit (bool): Whether the shot hit.
+        """
+        self._append(self.EVENT_SHOT, self.unit_handle(shooter), level, target[0], target[1],
+                     self.intern(weapon), self.intern(mode), 1 if hit else 0)
+
+    def record_damage(self, target: Any, x: int, y: int, amount: float,
+                      damage_type: Optional[str] = None, level: int = 0) -> None:
+        """
+        Record damage dealt to a unit or to terrain.
+
+        Args:
+            target: Damaged unit, or None for terrain.
+            x (int): X coordinate.
+            y (int): Y coordinate.
+            amount (float): Damage dealt.
+            damage_type (str, optional): Damage type.
+            level (int): Level index.
+        """
+        self._append(self.EVENT_DAMAGE, self.unit_handle(target), level, x, y, float(amount),
+                     self.intern(damage_type))
+
+    def record_terrain(self, x: int, y: int, layer: str, new_id: Optional[str], level: int = 0) -> None:
+        """
+        Record a terrain change (e.g. wall destroyed and replaced).
+
+        Args:
+            x (int): X coordinate.
+            y (int): Y coordinate.
+            layer (str): 'floor_id', 'wall_id' or 'roof_id'.
+            new_id (str|None): New tile id for the layer.
+            level (int): Level index.
+        """
+        self._append(self.EVENT_TERRAIN, level, x, y, self.LAYERS.index(layer), self.intern(new_id))
+
+    def record_status(self, unit: Any) -> None:
+        """
+        Record a unit status change (death, stun, recovery).
+
+        Args:
+            unit: Unit whose status changed.
+        """
+        self._append(self.EVENT_STATUS, self.unit_handle(unit),
+                     1 if getattr(unit, 'alive', True) else 0, 1 if getattr(unit, 'stunned', False) else 0)
+
+    def record_rng(self, value: float, tag: Optional[str] = None) -> None:
+        """
+        Record a random number draw.
+
+        Args:
+            value (float): Drawn value.
+            tag (str, optional): What the draw was used for.
+        """
+        self._append(self.EVENT_RNG, float(value), self.intern(tag))
+
+    def mark(self) -> Tuple[int, int, int]:
+        """
+        Get the current log position, to truncate back to after a rolled back lookahead.
+
+        Returns:
+            tuple: (data length, unit count, snapshot count).
+        """
+        return len(self.data), len(self.units), len(self.snapshots)
+
+    def truncate(self, mark: Tuple[int, int, int]) -> None:
+        """
+        Drop everything recorded after a mark (interned strings are kept).
+
+        Args:
+            mark (tuple): Value returned by mark().
+        """
+        data_length, unit_count, snapshot_count = mark
+        del self.data[data_length:]
+        for unit in self.units[unit_count:]:
+            self._unit_handles.pop(id(unit), None)
+        del self.units[unit_count:]
+        del self.snapshots[snapshot_count:]
+
+    # --- Reading ---
+
+    def iter_events(self, start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[int, int, tuple]]:
+        """
+        Decode records from the log.
+
+        Args:
+            start (int): Byte offset to start at (must be a record boundary).
+            end (int, optional): Byte offset to stop at (default end of log).
+        Returns:
+            iterator: (offset, event_type, payload tuple) for each record.
+        """
+        data = self.data
+        end = len(data) if end is None else end
+        offset = start
+        while offset < end:
+            event_type = data[offset]
+            fmt = self.FORMATS[event_type]
+            yield offset, event_type, fmt.unpack_from(data, offset + 1)
+            offset += 1 + fmt.size
+
+    def events(self, turn: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Decode events into readable dicts, optionally only for one turn.
+
+        Args:
+            turn (int, optional): Only return events of this turn.
+        Returns:
+            list[dict]: Events with 'type', 'turn' and decoded fields.
+        """
+        result = []
+        current_turn = 0
+        for _, event_type, values in self.iter_events():
+            if event_type == self.EVENT_TURN:
+                current_turn = values[0]
+            if turn is not None and current_turn != turn:
+                continue
+            result.append(self._describe(event_type, values, current_turn))
+        return result
+
+    def _string(self, index: int) -> Optional[str]:
+        """Resolve a string table index."""
+        return None if index == self.NO_STRING else self.strings[index]
+
+    def _unit(self, handle: int) -> Any:
+        """Resolve a unit handle."""
+        return None if handle == self.NO_UNIT else self.units[handle]
+
+    def _describe(self, event_type: int, values: tuple, turn: int) -> Dict[str, Any]:
+        """
+        Convert a decoded record into a dict.
+
+        Args:
+            event_type (int): Event type constant.
+            values (tuple): Unpacked payload.
+            turn (int): Turn the event belongs to.
+        Returns:
+            dict: Readable event.
+        """
+        if event_type == self.EVENT_TURN:
+            return {'type': 'turn', 'turn': values[0], 'side': values[1]}
+        if event_type == self.EVENT_UNIT:
+            return {'type': 'unit', 'turn': turn, 'unit': self._unit(values[0]), 'side': values[1],
+                    'position': (values[4], values[2], values[3]), 'name': self._string(values[5])}
+        if event_type == self.EVENT_MOVE:
+            return {'type': 'move', 'turn': turn, 'unit': self._unit(values[0]),
+                    'source': values[1:4], 'target': values[4:7]}
+        if event_type == self.EVENT_SHOT:
+            return {'type': 'shot', 'turn': turn, 'unit': self._unit(values[0]), 'level': values[1],
+                    'target': (values[2], values[3]), 'weapon': self._string(values[4]),
+                    'mode': self._string(values[5]), 'hit': bool(values[6])}
+        if event_type == self.EVENT_DAMAGE:
+            return {'type': 'damage', 'turn': turn, 'unit': self._unit(values[0]), 'level': values[1],
+                    'position': (values[2], values[3]), 'amount': values[4], 'damage_type': self._string(values[5])}
+        if event_type == self.EVENT_TERRAIN:
+            return {'type': 'terrain', 'turn': turn, 'level': values[0], 'position': (values[1], values[2]),
+                    'layer': self.LAYERS[values[3]], 'new_id': self._string(values[4])}
+        if event_type == self.EVENT_STATUS:
+            return {'type': 'status', 'turn': turn, 'unit': self._unit(values[0]),
+                    'alive': bool(values[1]), 'stunned': bool(values[2])}
+        return {'type': 'rng', 'turn': turn, 'value': values[0], 'tag': self._string(values[1])}
+
+    # --- Replay ---
+
+    def seek(self, battle, turn: int) -> bool:
+        """
+        Restore the battle to the start of the given turn.
+        Restores the closest snapshot at or before the turn and replays the events after it.
+
+        Args:
+            battle (TBattle): Battle to restore (the battle that emitted this log).
+            turn (int): Turn to seek to.
+        Returns:
+            bool: True if restored, False if no snapshot precedes the turn.
+        """
+        index = bisect_right([snapshot[0] for snapshot in self.snapshots], turn) - 1
+        if index < 0:
+            return False
+        snapshot_turn, offset, state = self.snapshots[index]
+        battle.restore_state(state)
+        # Events after the snapshot belong to snapshot_turn; replay them up to the start of the target turn
+        end = offset if snapshot_turn == turn else None
+        for _, event_type, values in self.iter_events(offset, end):
+            if event_type == self.EVENT_TURN:
+                if values[0] >= turn:
+                    break
+                battle.turn = values[0]
+                battle.current_side = values[1]
+                continue
+            self.apply_event(battle, event_type, values)
+        battle.turn = turn
+        battle.update_active_levels()
+        return True
+
+    def apply_event(self, battle, event_type: int, values: tuple) -> None:
+        """
+        Re-apply a state changing event to the battle. Shots and damage are informational (their effects are
+        logged as separate terrain/status events); RNG draws advance the battle generator so it stays in sync.
+
+        Args:
+            battle (TBattle): Battle to update.
+            event_type (int): Event type constant.
+            values (tuple): Unpacked payload.
+        """
+        if event_type == self.EVENT_MOVE:
+            unit = self._unit(values[0])
+            for fx, fy in battle.footprint(unit, values[2], values[3]):
+                battle.levels[values[1]].set_unit(fx, fy, None)
+            for fx, fy in battle.footprint(unit, values[5], values[6]):
+                battle.levels[values[4]].set_unit(fx, fy, unit)
+            unit.level, unit.x, unit.y = values[4], values[5], values[6]
+        elif event_type == self.EVENT_TERRAIN:
+            tile = battle.levels[values[0]].get_tile(values[1], values[2])
+            setattr(tile, self.LAYERS[values[3]], self._string(values[4]))
+            tile.update_properties()
+            battle.clearance.update(values[0], values[1], values[2])
+        elif event_type == self.EVENT_STATUS:
+            unit = self._unit(values[0])
+            unit.alive = bool(values[1])
+            unit.stunned = bool(values[2])
+        elif event_type == self.EVENT_UNIT:
+            unit = self._unit(values[0])
+            for fx, fy in battle.footprint(unit, values[2], values[3]):
+                battle.levels[values[4]].set_unit(fx, fy, unit)
+            unit.level, unit.x, unit.y = values[4], values[2], values[3]
+        elif event_type == self.EVENT_RNG:
+            battle.rng.random()
+
+    # --- Statistics ---
+
+    def summarize(self) -> Dict[Any, Dict[str, float]]:
+        """
+        Compute per-unit statistics from the log (moves, shots, hits, damage dealt and taken).
+        Damage is attributed to the shooter of the last preceding shot.
+
+        Returns:
+            dict: unit -> {'moves', 'shots', 'hits', 'damage_dealt', 'damage_taken'}.
+        """
+        stats: Dict[Any, Dict[str, float]] = {}
+
+        def entry(unit):
+            return stats.setdefault(unit, {'moves': 0, 'shots': 0, 'hits': 0,
+                                           'damage_dealt': 0.0, 'damage_taken': 0.0})
+
+        last_shooter = None
+        for _, event_type, values in self.iter_events():
+            if event_type == self.EVENT_MOVE:
+                entry(self._unit(values[0]))['moves'] += 1
+            elif event_type == self.EVENT_SHOT:
+                last_shooter = self._unit(values[0])
+                if last_shooter is not None:
+                    shooter_stats = entry(last_shooter)
+                    shooter_stats['shots'] += 1
+                    shooter_stats['hits'] += values[6]
+            elif event_type == self.EVENT_DAMAGE:
+                target = self._unit(values[0])
+                if target is not None:
+                    entry(target)['damage_taken'] += values[4]
+                if last_shooter is not None:
+                    entry(last_shooter)['damage_dealt'] += values[4]
+            elif event_type == self.EVENT_TURN:
+                last_shooter = None
+        return stats
@@ -2,6 +2,7 @@
 BattleLoot: Handles post-battle report generation, including loot, score, captures, experience, sanity, ammo, medals, and more.
 
 Provides static methods to generate a summary report after a battle, aggregating all relevant statistics and rewards for the player.
+The report is built in one pass over units and objects plus the battle's destroyed terrain list; no tile scans.
 
 Classes:
     BattleLoot: Main class for post-battle report and loot calculation.
@@ -18,147 +19,91 @@ class BattleLoot:
     def generate(battle):
         """
         Generate a post-battle report summarizing score, loot, captures, experience, sanity, ammo, and medals.
+        Units are visited once (all sides), objects once, and destroyed terrain is read from battle.destroyed_terrain.
         Args:
             battle: Battle object containing all relevant data.
         Returns:
             dict: Report with keys 'score', 'loot', 'captures', 'experience', 'sanity', 'ammo', 'medals'.
         """
-        report = {}
-        report['score'] = BattleLoot._calculate_score(battle)
-        report['loot'] = BattleLoot._collect_loot(battle)
-        report['captures'] = BattleLoot._collect_captures(battle)
-        report['experience'] = BattleLoot._calculate_experience(battle, side=battle.SIDE_PLAYER)
-        report['sanity'] = BattleLoot._calculate_sanity(battle, side=battle.SIDE_PLAYER)
-        report['ammo'] = BattleLoot._calculate_ammo(battle, side=battle.SIDE_PLAYER)
-        report['medals'] = BattleLoot._calculate_medals(battle, side=battle.SIDE_PLAYER)
-        return report
-
-    @staticmethod
-    def _calculate_score(battle):
-        """
-        Calculate the total score for the battle based on objectives, unit status, and other factors.
-        Args:
-            battle: Battle object.
-        Returns:
-            int: Total score value.
-        """
-        score = 0
-        for obj in battle.objectives:
-            obj_score = obj.params.get('score', 0)
-            obj_penalty = obj.params.get('penalty', 0)
-            if obj.status == 'complete':
-                score += obj_score
-            elif obj.status == 'failed':
-                score -= obj_penalty
-        for unit in battle.find_units(side=battle.SIDE_ENEMY, alive=False):
-            score += getattr(unit, 'score_kill', 0)
-        for unit in battle.find_units(side=battle.SIDE_ENEMY, alive=True):
-            if getattr(unit, 'is_stunned', False) or getattr(unit, 'is_surrendered', False):
-                score += getattr(unit, 'score_capture', 0)
-        for obj in battle.find_objects():
-            score += getattr(obj, 'score_loot', 0)
-        for unit in battle.find_units(side=battle.SIDE_PLAYER, alive=False):
-            score -= getattr(unit, 'score_loss', 0)
-        for side in [battle.SIDE_ALLY, battle.SIDE_NEUTRAL]:
-            for unit in battle.find_units(side=side, alive=False):
-                score -= getattr(unit, 'score_loss', 0)
-        for y, row in enumerate(battle.tiles):
-            for x, tile in enumerate(row):
-                if tile.wall and getattr(tile.wall, 'is_destroyed', False):
-                    score -= getattr(tile.wall, 'score_loss', 0)
-        return score
-
-    @staticmethod
-    def _collect_loot(battle):
-        """
-        Collect all loot obtained during the battle.
-        Args:
-            battle: Battle object.
-        Returns:
-            list: List of loot items.
-        """
+        score = BattleLoot._objective_score(battle)
+        captures, experience, sanity, ammo, medals = {}, {}, {}, {}, {}
+        loss_sides = (battle.SIDE_PLAYER, battle.SIDE_ALLY, battle.SIDE_NEUTRAL)
+        for side, side_units in enumerate(battle.sides):
+            for unit in side_units:
+                alive = BattleLoot._is_alive(unit)
+                if side == battle.SIDE_ENEMY:
+                    if not alive:
+                        score += getattr(unit, 'score_kill', 0)
+                    elif BattleLoot._is_captured(unit):
+                        score += getattr(unit, 'score_capture', 0)
+                        unit_id = getattr(unit, 'id', None)
+                        if unit_id:
+                            captures[unit_id] = captures.get(unit_id, 0) + 1
+                elif side in loss_sides and not alive:
+                    score -= getattr(unit, 'score_loss', 0)
+                if side != battle.SIDE_PLAYER:
+                    continue
+                unit_id = getattr(unit, 'id', None)
+                experience[unit_id] = getattr(unit, 'experience_gained', 0)
+                sanity[unit_id] = getattr(unit, 'sanity_lost', 0)
+                medals[unit_id] = getattr(unit, 'medals_earned', [])
+                for item in getattr(unit, 'inventory', []):
+                    if hasattr(item, 'ammo_used'):
+                        ammo[item.id] = ammo.get(item.id, 0) + item.ammo_used
         loot = {}
         for obj in battle.find_objects():
+            score += getattr(obj, 'score_loot', 0)
             obj_id = getattr(obj, 'id', None)
             if obj_id:
                 loot[obj_id] = loot.get(obj_id, 0) + 1
-        return loot
+        for _, _, _, _, component in getattr(battle, 'destroyed_terrain', []):
+            score -= getattr(component, 'score_loss', 0)
+        return {
+            'score': score,
+            'loot': loot,
+            'captures': captures,
+            'experience': experience,
+            'sanity': sanity,
+            'ammo': ammo,
+            'medals': medals,
+        }
 
     @staticmethod
-    def _collect_captures(battle):
+    def _objective_score(battle):
         """
-        Collect all captured units or objects during the battle.
+        Sum objective rewards and penalties.
         Args:
             battle: Battle object.
         Returns:
-            list: List of captured entities.
+            int: Objective score.
         """
-        captures = {}
-        for unit in battle.find_units(side=battle.SIDE_ENEMY, alive=True):
-            if getattr(unit, 'is_stunned', False) or getattr(unit, 'is_surrendered', False):
-                unit_id = getattr(unit, 'id', None)
-                if unit_id:
-                    captures[unit_id] = captures.get(unit_id, 0) + 1
-        return captures
-
-    @staticmethod
-    def _calculate_experience(battle, side):
-        """
-        Calculate experience gained by a given side during the battle.
-        Args:
-            battle: Battle object.
-            side: Side identifier (e.g., player, enemy).
-        Returns:
-            int: Total experience gained.
-        """
-        exp = {}
-        for unit in battle.find_units(side=side):
-            exp[getattr(unit, 'id', None)] = getattr(unit, 'experience_gained', 0)
-        return exp
-
-    @staticmethod
-    def _calculate_sanity(battle, side):
-        """
-        Calculate sanity changes for a given side during the battle.
-        Args:
-            battle: Battle object.
-            side: Side identifier.
-        Returns:
-            int: Sanity value or change.
-        """
-        sanity = {}
-        for unit in battle.find_units(side=side):
-            sanity[getattr(unit, 'id', None)] = getattr(unit, 'sanity_lost', 0)
-        return sanity
+        score = 0
+        for obj in battle.objectives:
+            if obj.status == 'complete':
+                score += obj.params.get('score', 0)
+            elif obj.status == 'failed':
+                score -= obj.params.get('penalty', 0)
+        return score
 
     @staticmethod
-    def _calculate_ammo(battle, side):
+    def _is_alive(unit):
         """
-        Calculate remaining or used ammo for a given side during the battle.
+        Check a unit's alive status (battle 'alive' flag or 'is_alive' attribute).
         Args:
-            battle: Battle object.
-            side: Side identifier.
+            unit: Unit to check.
         Returns:
-            int: Ammo value or change.
+            bool: True if alive.
         """
-        ammo = {}
-        for unit in battle.find_units(side=side):
-            for item in getattr(unit, 'inventory', []):
-                if hasattr(item, 'ammo_used'):
-                    ammo[item.id] = ammo.get(item.id, 0) + item.ammo_used
-        return ammo
+        return getattr(unit, 'alive', True) and getattr(unit, 'is_alive', True)
 
     @staticmethod
-    def _calculate_medals(battle, side):
+    def _is_captured(unit):
         """
-        Calculate medals or awards earned by a given side during the battle.
+        Check whether a living enemy unit is captured (stunned or surrendered).
         Args:
-            battle: Battle object.
-            side: Side identifier.
+            unit: Unit to check.
         Returns:
-            list: List of medals or awards.
+            bool: True if captured.
         """
-        medals = {}
-        for unit in battle.find_units(side=side):
-            medals[getattr(unit, 'id', None)] = getattr(unit, 'medals_earned', [])
-        return medals
+        return (getattr(unit, 'stunned', False) or getattr(unit, 'is_stunned', False)
+                or getattr(unit, 'is_surrendered', False))
@@ -42,6 +42,9 @@ class BattleLOS:
             # Check for wall or high sight cost (opaque)
             if tile.wall and tile.wall.sight_mod >= 100:
                 return False
+            # Walls known only by id (no component loaded) block through the tile flag
+            if tile.wall is None and tile.blocks_sight:
+                return False
             # Check for smoke/fire/gas
             if tile.smoke or tile.fire or tile.gas:
                 return False
@@ -2,6 +2,7 @@
 BattlePathfinder: Provides static pathfinding for battle map tiles using the A* algorithm and tile walkability.
 
 Implements pathfinding logic for units, considering movement cost, walkability, and unit size.
+Large units are checked against the battle clearance layer (TBattleClearance) when available.
 
 Classes:
     BattlePathfinder: Main class for static pathfinding.
@@ -31,15 +32,22 @@ class BattlePathfinder:
         width, height = battle.width, battle.height
         def heuristic(x1, y1, x2, y2):
             return math.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2)
-        def can_unit_fit(x, y):
-            if x + unit_size > width or y + unit_size > height:
-                return False
-            for dy in range(unit_size):
-                for dx in range(unit_size):
-                    tile = battle.tiles[y + dy][x + dx]
-                    if not tile.is_walkable():
-                        return False
-            return True
+        clearance = getattr(battle, 'clearance', None)
+        if clearance is not None:
+            # O(1) per tile for any unit size using the clearance layer
+            level = battle.current_level
+            def can_unit_fit(x, y):
+                return clearance.fits(level, x, y, unit_size)
+        else:
+            def can_unit_fit(x, y):
+                if x + unit_size > width or y + unit_size > height:
+                    return False
+                for dy in range(unit_size):
+                    for dx in range(unit_size):
+                        tile = battle.tiles[y + dy][x + dx]
+                        if not tile.is_walkable():
+                            return False
+                return True
         directions = [
             (0, 1), (1, 0), (0, -1), (-1, 0),
             (1, 1), (-1, -1), (1, -1), (-1, 1)
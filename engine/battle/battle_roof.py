@@ -13,11 +13,17 @@ class TBattleRoof:
     """
     Represents a roof layer on a battle map tile for visual and gameplay purposes (e.g., blocking light, providing cover).
     Currently a placeholder; extend with attributes as needed.
+
+    Attributes:
+        blocks_light (bool): Whether the roof shades the tile (default True).
     """
 
-    def __init__(self):
+    def __init__(self, **kwargs):
         """
         Initialize a TBattleRoof instance.
         Add attributes as needed for gameplay or rendering.
+
+        Args:
+            blocks_light (bool, optional): Whether the roof shades the tile. Default is True.
         """
-        pass
+        self.blocks_light = kwargs.get('blocks_light', True)
@@ -13,7 +13,9 @@ from typing import Optional, Dict, Any
 from engine.battle.battle_floor import TBattleFloor
 from engine.battle.battle_object import TBattleObject
 from engine.battle.battle_roof import TBattleRoof
+from engine.battle.battle_tile_type import TBattleTileTypes
 from engine.battle.battle_wall import TBattleWall
+from engine.battle.damage_model import TDamageModel
 from unit.unit import TUnit
 
 
@@ -21,18 +23,20 @@ class TBattleTile:
     """
     Represents a single tile in the battle map.
     Each tile contains information about its floor, wall, roof, objects, and unit.
+    Floor, wall and roof are shared type records from TBattleTileTypes (one instance per tile id), tiles use
+    __slots__, and the objects, fog of war and metadata containers are only created when something is stored.
 
     Attributes:
-        floor (TBattleFloor): The floor component of the tile.
-        wall (TBattleWall|None): The wall component of the tile.
-        roof (TBattleRoof|None): The roof component of the tile.
-        objects (list[TBattleObject]): List of objects on this tile.
+        floor (TBattleFloor): The floor component of the tile (shared type record).
+        wall (TBattleWall|None): The wall component of the tile (shared type record).
+        roof (TBattleRoof|None): The roof component of the tile (shared type record).
+        objects (list[TBattleObject]|tuple): Objects on this tile; an empty tuple when there are none.
         unit (TUnit|None): Unit currently on this tile.
         smoke (bool): Whether the tile contains smoke.
         fire (bool): Whether the tile contains fire.
         gas (bool): Whether the tile contains gas.
         light_level (int): Light level on this tile.
-        fog_of_war (list): Fog of war state for this tile.
+        fog_of_war (list|tuple): Fog of war state for this tile; an empty tuple when unset.
         floor_id (str): ID of the floor tile.
         wall_id (str|None): ID of the wall tile.
         roof_id (str|None): ID of the roof tile.
@@ -40,8 +44,13 @@ class TBattleTile:
         blocks_fire (bool): Whether the tile blocks fire.
         blocks_sight (bool): Whether the tile blocks line of sight.
         blocks_light (bool): Whether the tile blocks light.
-        metadata (dict): Additional metadata for the tile.
+        metadata (dict): Additional metadata for the tile (created on first access).
+        objective_marker (str|None): Mission objective marker of the tile (e.g. 'extraction', 'poc').
     """
+    __slots__ = ('floor', 'wall', 'roof', '_objects', 'unit', 'smoke', 'fire', 'gas', 'light_level', '_fog_of_war',
+                 'floor_id', 'wall_id', 'roof_id', 'passable', 'blocks_fire', 'blocks_sight', 'blocks_light',
+                 '_metadata', 'objective_marker')
+
     def __init__(self,
                  floor_id: str = '0',
                  wall_id: Optional[str] = None,
@@ -54,16 +63,16 @@ class TBattleTile:
             wall_id (str, optional): ID of the wall tile. Default is None.
             roof_id (str, optional): ID of the roof tile. Default is None.
         """
-        self.floor : TBattleFloor = TBattleFloor()
-        self.wall : TBattleWall = None
-        self.roof : TBattleRoof = None
-        self.objects : list[TBattleObject] = []
+        self.floor : TBattleFloor = TBattleTileTypes.get('floor', floor_id)
+        self.wall : TBattleWall = TBattleTileTypes.get('wall', wall_id)
+        self.roof : TBattleRoof = TBattleTileTypes.get('roof', roof_id)
+        self._objects : Optional[list[TBattleObject]] = None
         self.unit : TUnit = None
         self.smoke = False
         self.fire = False
         self.gas = False
         self.light_level = 0
-        self.fog_of_war = []
+        self._fog_of_war: Optional[list] = None
         self.floor_id: str = floor_id
         self.wall_id: Optional[str] = wall_id
         self.roof_id: Optional[str] = roof_id
@@ -71,11 +80,68 @@ class TBattleTile:
         self.blocks_fire: bool = False
         self.blocks_sight: bool = False
         self.blocks_light: bool = False
-        self.metadata: Dict[str, Any] = {}
+        self._metadata: Optional[Dict[str, Any]] = None
+        self.objective_marker: Optional[str] = None
+
+    @property
+    def objects(self):
+        """
+        Objects on this tile (an empty tuple when there are none; use add_object() to add one).
+
+        Returns:
+            list|tuple: Objects on this tile.
+        """
+        return self._objects or ()
+
+    @objects.setter
+    def objects(self, value) -> None:
+        self._objects = list(value) if value else None
+
+    def add_object(self, obj: TBattleObject) -> None:
+        """
+        Put an object on this tile.
+
+        Args:
+            obj (TBattleObject): Object to add.
+        """
+        if self._objects is None:
+            self._objects = []
+        self._objects.append(obj)
+
+    @property
+    def fog_of_war(self):
+        """
+        Fog of war state for this tile (an empty tuple when unset).
+
+        Returns:
+            list|tuple: Fog of war values.
+        """
+        return self._fog_of_war or ()
+
+    @fog_of_war.setter
+    def fog_of_war(self, value) -> None:
+        self._fog_of_war = value if value else None
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """
+        Additional metadata for the tile; the dict is created on first access.
+
+        Returns:
+            dict: Tile metadata.
+        """
+        if self._metadata is None:
+            self._metadata = {}
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, value: Dict[str, Any]) -> None:
+        self._metadata = value
 
     def copy(self) -> 'TBattleTile':
         """
-        Create a deep copy of this tile, including all properties and contained objects.
+        Create a copy of this tile's terrain: ids, derived flags, objective marker and metadata.
+        Type records are shared through TBattleTileTypes; metadata is only copied when the tile has any.
 
         Returns:
             TBattleTile: A new tile instance with the same properties.
@@ -85,13 +151,20 @@ class TBattleTile:
         new_tile.blocks_fire = self.blocks_fire
         new_tile.blocks_sight = self.blocks_sight
         new_tile.blocks_light = self.blocks_light
-        new_tile.metadata = self.metadata.copy()
+        new_tile.objective_marker = self.objective_marker
+        if self._metadata:
+            new_tile._metadata = self._metadata.copy()
         return new_tile
 
     def update_properties(self) -> None:
         """
         Update all derived properties of the tile based on its components and state.
+        The floor/wall/roof type records are re-resolved from the current ids, so callers that write an id only
+        need to call this afterwards.
         """
+        self.floor = TBattleTileTypes.get('floor', self.floor_id)
+        self.wall = TBattleTileTypes.get('wall', self.wall_id)
+        self.roof = TBattleTileTypes.get('roof', self.roof_id)
         self.passable = True
         self.blocks_fire = False
         self.blocks_sight = False
@@ -238,7 +311,9 @@ class TBattleTile:
         """
         if obj in self.objects:
             new_id = obj.on_destroy()
-            self.objects.remove(obj)
+            self._objects.remove(obj)
+            if not self._objects:
+                self._objects = None
             # Replace with new object logic here if needed
             return new_id
         return None
@@ -266,41 +341,17 @@ class TBattleTile:
     def apply_point_damage(self, damage, damage_type, damage_model, source=None):
         """
         Apply direct damage to this tile and its contents (unit, wall, floor, objects).
-        Follows OpenXcom order: unit -> wall -> object -> floor.
+        Follows OpenXcom order: unit -> wall -> object -> floor. Resolved by the TDamageModel pipeline.
 
         Args:
             damage (float): Damage value.
             damage_type (str): Type of damage.
-            damage_model (dict): Model for splitting HURT/STUN.
+            damage_model (dict|TDamageModel): Model for splitting HURT/STUN.
             source: Source unit or weapon.
+        Returns:
+            dict: Damage report from TDamageModel.resolve().
         """
-        # 1. Unit
-        if self.unit:
-            self.unit.apply_damage(damage, damage_type, damage_model, source)
-        # 2. Wall
-        if self.wall:
-            resisted = self.calculate_resistance(self.wall, damage_type)
-            dmg = max(0, damage * resisted - self.wall.armor)
-            if dmg > 0:
-                destroyed = self.wall.on_destroy() if dmg >= self.wall.armor else None
-                if destroyed:
-                    self.destroy_wall()
-        # 3. Objects
-        for obj in list(self.objects):
-            resisted = self.calculate_resistance(obj, damage_type)
-            dmg = max(0, damage * resisted - obj.armor)
-            if dmg > 0:
-                destroyed = obj.on_destroy() if dmg >= obj.armor else None
-                if destroyed:
-                    self.destroy_object(obj)
-        # 4. Floor
-        if self.floor:
-            resisted = self.calculate_resistance(self.floor, damage_type)
-            dmg = max(0, damage * resisted - self.floor.armor)
-            if dmg > 0:
-                destroyed = self.floor.on_destroy() if dmg >= self.floor.armor else None
-                if destroyed:
-                    self.destroy_floor()
+        return TDamageModel.resolve([(self, damage, damage_type, damage_model)])
 
     def apply_area_damage(self, damage, damage_type, damage_model, source, area_params, battle, x, y):
         """
@@ -315,9 +366,12 @@ class TBattleTile:
             battle (TBattle): Reference for AREA propagation.
             x (int): Tile x coordinate.
             y (int): Tile y coordinate.
+        Returns:
+            dict: Damage report from TDamageModel.resolve().
         """
         radius = area_params.get('radius', 1)
         dropoff = area_params.get('dropoff', 0)
+        hits = []
         for dx in range(-radius, radius+1):
             for dy in range(-radius, radius+1):
                 tx, ty = x+dx, y+dy
@@ -325,7 +379,9 @@ class TBattleTile:
                     dist = max(abs(dx), abs(dy))
                     dmg = max(0, damage - dropoff * dist)
                     if dmg > 0:
-                        battle.tiles[ty][tx].apply_point_damage(dmg, damage_type, damage_model, source)
+                        hits.append(((tx, ty), dmg, damage_type, damage_model))
+        # Whole explosion resolved as one batch
+        return TDamageModel.resolve(hits, battle)
 
     def calculate_resistance(self, obj, damage_type):
         """
@@ -337,9 +393,7 @@ class TBattleTile:
         Returns:
             float: Multiplier (1.0 = no resistance, 0.5 = 50% resist, 1.5 = 50% more damage).
         """
-        if hasattr(obj, 'resistances') and damage_type in obj.resistances:
-            return obj.resistances[damage_type]
-        return 1.0
+        return TDamageModel.resistance(obj, damage_type)
 
     def distribute_damage(self, damage, damage_model):
         """
@@ -351,9 +405,8 @@ class TBattleTile:
         Returns:
             tuple: (hurt, stun) values.
         """
-        hurt = damage * damage_model.get('hurt', 1.0)
-        stun = damage * damage_model.get('stun', 0.0)
-        return hurt, stun
+        hurt, stun = TDamageModel.ratios(damage_model)
+        return damage * hurt, damage * stun
 
     @staticmethod
     def gid_to_tileset_name(gid, used_tilesets):
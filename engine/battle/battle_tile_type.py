@@ -0,0 +1,104 @@
+"""
+engine/battle/battle_tile_type.py
+
+Defines the TBattleTileTypes registry, which holds one shared floor/wall/roof record per tile id.
+Records are built once from the mod's 'tiles' definitions and referenced by every TBattleTile using that id,
+so tiles no longer allocate their own component objects.
+
+Classes:
+    TBattleTileTypes: Registry of shared, read-only floor/wall/roof type records keyed by tile id.
+
+Last standardized: 2026-10-18
+"""
+from typing import Any, Dict, Optional
+
+from engine.battle.battle_floor import TBattleFloor
+from engine.battle.battle_roof import TBattleRoof
+from engine.battle.battle_wall import TBattleWall
+from engine.battle.damage_model import TDamageModel
+
+
+class TBattleTileTypes:
+    """
+    Registry of shared tile type records (flyweights).
+    A record is the TBattleFloor/TBattleWall/TBattleRoof describing a tile id; all tiles with that id point to
+    the same instance, which must be treated as read-only (per-tile state lives on TBattleTile). Records carry
+    their tile id as pid, which keys their cached resistances in TDamageModel.
+    Floors without a record use DEFAULT_FLOOR; walls and roofs without a record are None.
+
+    Attributes:
+        LAYERS (dict): Layer name -> record class.
+        DEFAULT_FLOOR (TBattleFloor): Record shared by all floors without a definition.
+        PROPERTIES (dict): Mod 'tiles' key -> record property.
+    """
+    LAYERS = {'floor': TBattleFloor, 'wall': TBattleWall, 'roof': TBattleRoof}
+    PROPERTIES = {'armour': 'armor', 'sound_step': 'sound'}
+    DEFAULT_FLOOR = TBattleFloor()
+
+    # layer -> {tile id -> record}
+    _records: Dict[str, Dict[Any, Any]] = {'floor': {}, 'wall': {}, 'roof': {}}
+
+    @classmethod
+    def register(cls, layer: str, tile_id, data: Optional[Dict[str, Any]] = None):
+        """
+        Create (or replace) the shared record of a tile id.
+
+        Args:
+            layer (str): 'floor', 'wall' or 'roof'.
+            tile_id: Tile id ('XXX_YYY').
+            data (dict, optional): Record properties passed to the component class.
+        Returns:
+            The registered record.
+        """
+        record = cls.LAYERS[layer](**(data or {}))
+        record.pid = tile_id
+        if tile_id in cls._records[layer]:
+            # Cached resistances of the replaced record are keyed by the same pid
+            TDamageModel.clear_tables()
+        cls._records[layer][tile_id] = record
+        return record
+
+    @classmethod
+    def load(cls, data: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Register all records of a mod's 'tiles' section, grouped into layers by each tile's 'type'.
+        'armour' becomes the record's armor and 'dead_tile' its destroyed tile id; entries without a known
+        type are skipped.
+
+        Args:
+            data (dict): {tile id: {'type': 'floor'|'wall'|'roof', 'armour': int, 'dead_tile': id, ...}}.
+        """
+        for tile_id, dat in data.items():
+            layer = (dat or {}).get('type')
+            if layer not in cls.LAYERS:
+                continue
+            record = {cls.PROPERTIES.get(key, key): value for key, value in dat.items()
+                      if key not in ('type', 'dead_tile')}
+            if dat.get('dead_tile') is not None:
+                record[f'destroyed_{layer}_id'] = dat['dead_tile']
+            cls.register(layer, tile_id, record)
+
+    @classmethod
+    def get(cls, layer: str, tile_id):
+        """
+        Get the shared record of a tile id.
+
+        Args:
+            layer (str): 'floor', 'wall' or 'roof'.
+            tile_id: Tile id.
+        Returns:
+            Record, DEFAULT_FLOOR for undefined floors, None for undefined walls/roofs or a None id.
+        """
+        record = cls._records[layer].get(tile_id) if tile_id is not None else None
+        if record is None and layer == 'floor':
+            return cls.DEFAULT_FLOOR
+        return record
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Drop all registered records and their cached resistances (call before loading another mod).
+        """
+        for records in cls._records.values():
+            records.clear()
+        TDamageModel.clear_tables()
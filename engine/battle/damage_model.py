@@ -1,17 +1,293 @@
 """
 TDamageModel: Handles all damage calculations for weapons, explosions, and other sources in battle.
-This class is responsible for applying damage logic, including armor penetration, critical hits, damage types, and distributing damage to body parts.
+This class is responsible for applying damage logic: shields, armour resistance, armour value, the HURT/STUN split
+and terrain destruction. A damage model instance defines how damage is split into HURT and STUN; the class-level
+pipeline resolves a whole batch of hits (auto-fire, area weapons) in one pass.
 
 Typical usage:
-    damage = TDamageModel.calculate_damage(weapon, target, hit_location)
+    report = TDamageModel.resolve([(unit, 30, 'ballistic', model), (tile, 12, 'explosive', model)], battle)
 
-Last update: 2025-06-10
+Classes:
+    TDamageModel: Damage model (HURT/STUN split) and batched damage pipeline.
+
+Last update: 2026-10-18
 """
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
 
 class TDamageModel:
     """
     TDamageModel encapsulates the logic for calculating and applying damage from various sources in battle.
-    This includes handling armor penetration, critical hits, different damage types, and distributing damage to specific body parts.
-    Extend this class with methods for each type of damage calculation as needed by the battle system.
+    Each instance is a named damage model (how damage is split into HURT and STUN, e.g. kinetic 80/20).
+    resolve() is the single damage pipeline used by tiles, armour and weapons:
+    shield -> resistance (per damage type table) -> armour value (N - K) -> HURT/STUN split for units, and
+    resistance -> armour -> destruction for terrain in OpenXcom order unit -> wall -> objects -> floor.
+
+    Attributes:
+        pid (str): Damage model identifier.
+        hurt (float): Fraction of damage applied as HURT.
+        stun (float): Fraction of damage applied as STUN.
+        TERRAIN_LAYERS (tuple): Terrain components in damage order after the unit.
     """
-    pass
\ No newline at end of file
+    TERRAIN_LAYERS = ('wall', 'objects', 'floor')
+
+    # damage type -> {(source class, pid) -> multiplier}, filled lazily and shared by all batches
+    _resistance_tables: Dict[str, Dict[Any, float]] = {}
+
+    def __init__(self, pid: str = 'default', data: Optional[Dict[str, Any]] = None):
+        """
+        Initialize a damage model.
+
+        Args:
+            pid (str): Damage model identifier.
+            data (dict, optional): {'hurt': float, 'stun': float}; defaults to all HURT.
+        """
+        data = data or {}
+        self.pid = pid
+        self.hurt = float(data.get('hurt', 1.0))
+        self.stun = float(data.get('stun', 0.0))
+
+    def split(self, damage: float) -> Tuple[float, float]:
+        """
+        Split damage into HURT and STUN.
+
+        Args:
+            damage (float): Damage after resistance and armour.
+        Returns:
+            tuple: (hurt, stun) values.
+        """
+        return damage * self.hurt, damage * self.stun
+
+    @staticmethod
+    def ratios(model) -> Tuple[float, float]:
+        """
+        Get the (hurt, stun) fractions of a model given as TDamageModel, dict or None.
+
+        Args:
+            model (TDamageModel|dict|None): Damage model.
+        Returns:
+            tuple: (hurt, stun) fractions.
+        """
+        if model is None:
+            return 1.0, 0.0
+        if isinstance(model, dict):
+            return model.get('hurt', 1.0), model.get('stun', 0.0)
+        return model.hurt, model.stun
+
+    @classmethod
+    def resistance(cls, source, damage_type: str) -> float:
+        """
+        Resistance multiplier of a source (armour type or terrain component) against a damage type.
+        Values are looked up once per (damage type, source class, pid) and kept in the per-type tables; sources
+        without a pid (e.g. components keyed only by material) are looked up directly.
+
+        Args:
+            source: Object with 'armour_resistance' (TItemType) or 'resistances' (terrain) dict.
+            damage_type (str): Damage type.
+        Returns:
+            float: Multiplier (1.0 = no resistance, 0.5 = 50% resist, 1.5 = 50% more damage).
+        """
+        resistances = getattr(source, 'armour_resistance', None)
+        if resistances is None:
+            resistances = getattr(source, 'resistances', None)
+        if not resistances:
+            return 1.0
+        pid = getattr(source, 'pid', None)
+        if pid is None:
+            # Same class and material may still differ in resistances, so only pids are cached
+            return float(resistances.get(damage_type, 1.0))
+        key = (type(source).__name__, pid)
+        table = cls._resistance_tables.setdefault(damage_type, {})
+        value = table.get(key)
+        if value is None:
+            value = float(resistances.get(damage_type, 1.0))
+            table[key] = value
+        return value
+
+    @classmethod
+    def clear_tables(cls) -> None:
+        """
+        Drop the precomputed resistance tables (call after mod data changes).
+        """
+        cls._resistance_tables.clear()
+
+    @classmethod
+    def absorb(cls, armour, damage: float, damage_type: str, battle=None) -> float:
+        """
+        Apply an armour's shield (no resistance) and then its resistance to incoming damage.
+
+        Args:
+            armour (TItemArmour): Armour item with shield and item_type.
+            damage (float): Incoming damage.
+            damage_type (str): Damage type.
+            battle (TBattle, optional): Battle journaling the shield change (lookahead rollback).
+        Returns:
+            float: Damage passing the shield, after resistance.
+        """
+        shield_damage = min(armour.shield, damage)
+        if battle is not None:
+            battle._write_object(armour, shield=armour.shield - shield_damage)
+        else:
+            armour.shield -= shield_damage
+        remaining = damage - shield_damage
+        if remaining <= 0:
+            return 0.0
+        return remaining * cls.resistance(armour.item_type, damage_type)
+
+    @classmethod
+    def resolve(cls, hits: Iterable[Tuple[Any, float, str, Any]], battle=None) -> Dict[str, Any]:
+        """
+        Resolve a batch of hits in one pass.
+        A hit target is a unit, a TBattleTile, or (x, y[, level]) coordinates when a battle is given.
+        Tile hits damage the unit on the tile first, then wall, objects and floor. The tile hits of a batch are one
+        area event: a unit covering several hit tiles (2x2 units) takes only its strongest tile hit. Direct unit
+        hits (auto-fire) accumulate. Unit damage is applied once per unit at the end; each terrain component is
+        destroyed at most once.
+
+        Args:
+            hits (iterable): (target, damage, damage_type, model) tuples; model is TDamageModel, dict or None.
+            battle (TBattle, optional): Battle for coordinate targets, logged terrain changes and unit status.
+        Returns:
+            dict: {'units': {unit: (hurt, stun)}, 'killed': [units], 'stunned': [units],
+                   'destroyed': [(tile, layer, replacement id)]}
+        """
+        unit_damage: Dict[int, List] = {}
+        # id(unit) -> strongest tile hit (unit, damage, damage_type, model) of the area event
+        area_hits: Dict[int, Tuple[Any, float, str, Any]] = {}
+        destroyed: List[Tuple[Any, str, Any]] = []
+        destroyed_keys = set()
+        for target, damage, damage_type, model in hits:
+            if damage <= 0:
+                continue
+            tile, coords = cls._target_tile(target, battle)
+            if tile is None:
+                cls._hit_unit(unit_damage, target, damage, damage_type, model, battle)
+                continue
+            unit = tile.unit
+            if unit is not None and (id(unit) not in area_hits or damage > area_hits[id(unit)][1]):
+                area_hits[id(unit)] = (unit, damage, damage_type, model)
+            for layer in cls.TERRAIN_LAYERS:
+                components = list(tile.objects) if layer == 'objects' else [getattr(tile, layer)]
+                for component in components:
+                    if component is None or (id(tile), id(component)) in destroyed_keys:
+                        continue
+                    armor = getattr(component, 'armor', 0)
+                    effective = damage * cls.resistance(component, damage_type) - armor
+                    if effective > 0 and effective >= armor:
+                        destroyed_keys.add((id(tile), id(component)))
+                        destroyed.append(cls._destroy(tile, layer, component, coords, battle))
+        for unit, damage, damage_type, model in area_hits.values():
+            cls._hit_unit(unit_damage, unit, damage, damage_type, model, battle)
+        return cls._apply_units(unit_damage, destroyed, battle)
+
+    @classmethod
+    def _target_tile(cls, target, battle) -> Tuple[Any, Optional[Tuple[int, int, int]]]:
+        """
+        Resolve a hit target into a tile and its coordinates.
+
+        Args:
+            target: Unit, TBattleTile or (x, y[, level]).
+            battle (TBattle|None): Battle for coordinate targets.
+        Returns:
+            tuple: (tile or None for unit targets, (level, x, y) or None).
+        """
+        if isinstance(target, tuple):
+            x, y = target[0], target[1]
+            level = target[2] if len(target) > 2 else battle.current_level
+            return battle.levels[level].get_tile(x, y), (level, x, y)
+        if hasattr(target, 'objects') and hasattr(target, 'floor'):
+            return target, None
+        return None, None
+
+    @classmethod
+    def _hit_unit(cls, unit_damage: Dict[int, List], unit, damage: float, damage_type: str, model,
+                  battle=None) -> None:
+        """
+        Pass one hit through the unit's armour and accumulate HURT/STUN.
+
+        Args:
+            unit_damage (dict): id(unit) -> [unit, hurt, stun, damage type] accumulator.
+            unit (TUnit): Hit unit.
+            damage (float): Incoming damage.
+            damage_type (str): Damage type.
+            model: Damage model (TDamageModel, dict or None).
+            battle (TBattle, optional): Battle journaling shield changes.
+        """
+        try:
+            armour = unit.armour
+        except AttributeError:
+            armour = None
+        if armour is not None:
+            damage = cls.absorb(armour, damage, damage_type, battle)
+            damage -= getattr(armour.item_type, 'armour_defense', 0)
+        if damage <= 0:
+            return
+        hurt, stun = cls.ratios(model)
+        entry = unit_damage.setdefault(id(unit), [unit, 0.0, 0.0, damage_type])
+        entry[1] += damage * hurt
+        entry[2] += damage * stun
+
+    @classmethod
+    def _destroy(cls, tile, layer: str, component, coords, battle) -> Tuple[Any, str, Any]:
+        """
+        Destroy a terrain component, through the battle (logged and journaled) when coordinates are known.
+
+        Args:
+            tile (TBattleTile): Damaged tile.
+            layer (str): 'wall', 'objects' or 'floor'.
+            component: Destroyed component.
+            coords (tuple|None): (level, x, y) of the tile.
+            battle (TBattle|None): Battle owning the tile.
+        Returns:
+            tuple: (tile, layer, replacement id).
+        """
+        if battle is None or coords is None:
+            if layer == 'objects':
+                return tile, layer, tile.destroy_object(component)
+            new_id = tile.destroy_wall() if layer == 'wall' else tile.destroy_floor()
+            return tile, layer, new_id
+        # Through the battle so the change is journaled (lookahead) and logged
+        level, x, y = coords
+        battle.record_destroyed(x, y, layer, component, level)
+        new_id = component.on_destroy()
+        if layer == 'objects':
+            battle._write_tile(level, x, y, 'objects', [obj for obj in tile.objects if obj is not component])
+            return tile, layer, new_id
+        # The tile re-resolves its type record from the new id
+        battle.set_terrain(x, y, layer + '_id', new_id, level)
+        return tile, layer, new_id
+
+    @classmethod
+    def _apply_units(cls, unit_damage: Dict[int, List], destroyed: List, battle) -> Dict[str, Any]:
+        """
+        Apply accumulated HURT/STUN once per unit, log one damage event per unit and collect status changes.
+
+        Args:
+            unit_damage (dict): id(unit) -> [unit, hurt, stun, damage type].
+            destroyed (list): Destroyed terrain components.
+            battle (TBattle|None): Battle for the damage log and status changes.
+        Returns:
+            dict: Batch report (see resolve()).
+        """
+        report = {'units': {}, 'killed': [], 'stunned': [], 'destroyed': destroyed}
+        for unit, hurt, stun, damage_type in unit_damage.values():
+            report['units'][unit] = (hurt, stun)
+            if battle is not None:
+                battle.log.record_damage(unit, getattr(unit, 'x', 0), getattr(unit, 'y', 0), hurt + stun,
+                                         damage_type, getattr(unit, 'level', 0))
+            stats = getattr(unit, 'stats', None)
+            if stats is None:
+                continue
+            if battle is not None:
+                # Journal HP before the stat methods change it, so lookahead rollback restores it
+                battle._write_object(stats, hurt=stats.hurt, stun=stats.stun)
+            dead, unconscious = stats.receive_damage(hurt) if hurt else (False, False)
+            if stun:
+                unconscious = stats.receive_stun(stun) or unconscious
+            if dead:
+                report['killed'].append(unit)
+            elif unconscious:
+                report['stunned'].append(unit)
+            if battle is not None and (dead or unconscious):
+                battle.set_unit_status(unit, alive=not dead, stunned=unconscious and not dead)
+        return report
@@ -9,7 +9,7 @@ Classes:
 Last standardized: 2025-06-15
 """
 import random
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 class TDeploymentGroup:
     """
@@ -47,16 +47,19 @@ class TDeploymentGroup:
         self.patrol = data.get('patrol', False)
         self.guard = data.get('guard', False)
 
-    def pick_units(self) -> List[str]:
+    def pick_units(self, rng: Optional[random.Random] = None) -> List[str]:
         """
         Randomly pick units for this group based on weights and quantity.
+        Args:
+            rng (random.Random, optional): Random generator (e.g. a seeded placer's); defaults to the random module.
         Returns:
             list[str]: List of unit type identifiers.
         """
-        count = random.randint(self.qty_low, self.qty_high)
+        rng = rng or random
+        count = rng.randint(self.qty_low, self.qty_high)
         if not self.unit_weights or count == 0:
             return []
-        units = random.choices(
+        units = rng.choices(
             population=list(self.unit_weights.keys()),
             weights=list(self.unit_weights.values()),
             k=count
@@ -0,0 +1,300 @@
+"""
+engine/battle/deployment_placer.py
+
+Defines the TDeploymentPlacer class, which places the units of a TDeployment on a generated battle map.
+Candidate tile sets per constraint (inside UFO blocks, outside, named spawn zones) are computed once from the map;
+groups are then placed by sampling those sets and rejecting overlaps with an occupancy bitmap.
+
+Classes:
+    TDeploymentPlacer: Places deployment groups on a battle map honoring inside/outside UFO, leader, patrol and guard.
+
+Last standardized: 2026-10-18
+"""
+import random
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .battle_clearance import TBattleClearance
+from .deployment import TDeployment
+from .deployment_group import TDeploymentGroup
+
+
+class TDeploymentPlacer:
+    """
+    Places deployment groups on a battle map.
+    Candidate lists are built once per constraint; sampling swaps rejected (occupied) candidates out of the live
+    part of the list, so each candidate is inspected at most once and placement never fails while free tiles remain.
+
+    Roles:
+        leader: placed inside the UFO when possible (command position).
+        guard: clustered around the first unit of the group (the guarded spot).
+        patrol: spread over the group's area; flagged so the AI keeps them moving.
+
+    Attributes:
+        width (int): Map width in tiles.
+        height (int): Map height in tiles.
+        candidates (dict): Constraint name ('inside', 'outside', spawn zone name) -> list of tile offsets.
+        masks (dict): Constraint name -> bytearray membership mask (1 = tile belongs to the set).
+        occupied (bytearray): Occupancy bitmap, 1 = tile taken by a unit or blocked.
+        rng (random.Random): Random generator used for sampling.
+        clearance (bytearray): Largest square size fitting at each tile (for large units).
+        unit_sizes (dict): Unit type id -> size in tiles (missing ids are 1x1).
+        GUARD_RADIUS (int): Max distance of guards from the guarded spot.
+    """
+    INSIDE = 'inside'
+    OUTSIDE = 'outside'
+    GUARD_RADIUS = 3
+
+    def __init__(self, tiles: List[List], ufo_tiles: Iterable[Tuple[int, int]] = (),
+                 spawn_zones: Optional[Dict[str, Sequence[Tuple[int, int, int, int]]]] = None,
+                 rng: Optional[random.Random] = None, unit_sizes: Optional[Dict[str, int]] = None):
+        """
+        Precompute candidate tile sets from a generated map.
+
+        Args:
+            tiles (list[list[TBattleTile]]): Generated battle map.
+            ufo_tiles (iterable): (x, y) tiles belonging to UFO blocks.
+            spawn_zones (dict, optional): Zone name -> list of (x, y, width, height) rectangles (e.g. 'player').
+            rng (random.Random, optional): Random generator for sampling.
+            unit_sizes (dict, optional): Unit type id -> size in tiles for large units.
+        """
+        self.height = len(tiles)
+        self.width = len(tiles[0]) if tiles else 0
+        self.rng = rng or random.Random()
+        self.unit_sizes = unit_sizes or {}
+        self.clearance = TBattleClearance.compute(tiles)
+        size = self.width * self.height
+        self.occupied = bytearray(size)
+        free = bytearray(size)
+        for y, row in enumerate(tiles):
+            for x, tile in enumerate(row):
+                offset = y * self.width + x
+                if getattr(tile, 'unit', None) is not None:
+                    self.occupied[offset] = 1
+                if tile.passable and tile.is_walkable():
+                    free[offset] = 1
+
+        inside = bytearray(size)
+        for x, y in ufo_tiles:
+            offset = y * self.width + x
+            inside[offset] = free[offset]
+        outside = bytearray(a & (b ^ 1) for a, b in zip(free, inside))
+        self.masks: Dict[str, bytearray] = {self.INSIDE: inside, self.OUTSIDE: outside}
+        for name, rects in (spawn_zones or {}).items():
+            mask = bytearray(size)
+            for zx, zy, zw, zh in rects:
+                for y in range(max(0, zy), min(self.height, zy + zh)):
+                    for x in range(max(0, zx), min(self.width, zx + zw)):
+                        offset = y * self.width + x
+                        mask[offset] = free[offset]
+            self.masks[name] = mask
+        self.candidates: Dict[str, List[int]] = {
+            name: [offset for offset, flag in enumerate(mask) if flag] for name, mask in self.masks.items()
+        }
+        # Number of not yet rejected candidates at the front of each list; large units use (name, size) lists
+        self._live: Dict = {name: len(offsets) for name, offsets in self.candidates.items()}
+
+    @classmethod
+    def from_generator(cls, generator, ufo_blocks: Sequence[str] = ('ufo',), spawn_zones=None,
+                       rng: Optional[random.Random] = None,
+                       unit_sizes: Optional[Dict[str, int]] = None) -> 'TDeploymentPlacer':
+        """
+        Build a placer from a TBattleGenerator after generate(): UFO tiles are the footprints of UFO blocks.
+
+        Args:
+            generator (TBattleGenerator): Generator holding battle_map and block_grid.
+            ufo_blocks (sequence): Block names treated as UFO blocks.
+            spawn_zones (dict, optional): Zone name -> list of (x, y, width, height) rectangles.
+            rng (random.Random, optional): Random generator for sampling.
+            unit_sizes (dict, optional): Unit type id -> size in tiles for large units.
+        Returns:
+            TDeploymentPlacer: Placer for the generated map.
+        """
+        block_size = generator.block_size
+        map_blocks = generator.game.mod.map_blocks
+        ufo_tiles = []
+        for by, row in enumerate(generator.block_grid):
+            for bx, name in enumerate(row):
+                if name not in ufo_blocks:
+                    continue
+                span = getattr(map_blocks.get(name), 'size', 1) * block_size
+                for y in range(by * block_size, by * block_size + span):
+                    for x in range(bx * block_size, bx * block_size + span):
+                        ufo_tiles.append((x, y))
+        return cls(generator.battle_map, ufo_tiles, spawn_zones, rng, unit_sizes)
+
+    def is_free(self, x: int, y: int) -> bool:
+        """
+        Check whether a tile is not occupied.
+
+        Args:
+            x (int): X coordinate.
+            y (int): Y coordinate.
+        Returns:
+            bool: True if no unit is placed there.
+        """
+        return not self.occupied[y * self.width + x]
+
+    def sample(self, constraint: str, size: int = 1) -> Optional[Tuple[int, int]]:
+        """
+        Take a random free spot from a candidate set and mark its footprint occupied.
+        Occupancy only grows during placement, so a rejected candidate is dropped for good.
+
+        Args:
+            constraint (str): Candidate set name.
+            size (int): Unit size; the returned tile is the top-left of a free size x size footprint.
+        Returns:
+            tuple|None: (x, y), or None if the set has no free spot left.
+        """
+        key = constraint if size == 1 else (constraint, size)
+        offsets = self._candidate_list(constraint, size)
+        if not offsets:
+            return None
+        live = self._live[key]
+        while live:
+            i = self.rng.randrange(live)
+            offset = offsets[i]
+            # Move the drawn candidate out of the live range; it is either used now or already taken
+            live -= 1
+            offsets[i], offsets[live] = offsets[live], offsets[i]
+            footprint = self._footprint(offset, size)
+            if not any(self.occupied[tile] for tile in footprint):
+                self._live[key] = live
+                for tile in footprint:
+                    self.occupied[tile] = 1
+                return offset % self.width, offset // self.width
+        self._live[key] = 0
+        return None
+
+    def _candidate_list(self, constraint: str, size: int) -> Optional[List[int]]:
+        """
+        Candidate top-left offsets of a set for a unit size (built once per size from the clearance layer).
+
+        Args:
+            constraint (str): Candidate set name.
+            size (int): Unit size.
+        Returns:
+            list|None: Candidate offsets, None for unknown sets.
+        """
+        if size == 1:
+            return self.candidates.get(constraint)
+        key = (constraint, size)
+        offsets = self.candidates.get(key)
+        if offsets is None:
+            mask = self.masks.get(constraint)
+            if mask is None:
+                return None
+            offsets = [
+                offset for offset in self.candidates[constraint]
+                if self.clearance[offset] >= size and all(mask[tile] for tile in self._footprint(offset, size))
+            ]
+            self.candidates[key] = offsets
+            self._live[key] = len(offsets)
+        return offsets
+
+    def _footprint(self, offset: int, size: int) -> List[int]:
+        """
+        Offsets covered by a size x size unit with its top-left tile at offset.
+
+        Args:
+            offset (int): Top-left tile offset.
+            size (int): Unit size.
+        Returns:
+            list[int]: Footprint offsets.
+        """
+        if size == 1:
+            return [offset]
+        return [offset + dy * self.width + dx for dy in range(size) for dx in range(size)]
+
+    def sample_near(self, constraint: str, x: int, y: int, radius: int) -> Optional[Tuple[int, int]]:
+        """
+        Take the nearest free tile of a set around (x, y), searching rings outwards up to a radius.
+
+        Args:
+            constraint (str): Candidate set name.
+            x (int): Center X coordinate.
+            y (int): Center Y coordinate.
+            radius (int): Maximum ring distance.
+        Returns:
+            tuple|None: (x, y), or None if no free tile of the set is within the radius.
+        """
+        mask = self.masks.get(constraint)
+        if mask is None:
+            return None
+        for ring in range(1, radius + 1):
+            ring_tiles = [
+                (tx, ty)
+                for ty in range(y - ring, y + ring + 1)
+                for tx in range(x - ring, x + ring + 1)
+                if max(abs(tx - x), abs(ty - y)) == ring and 0 <= tx < self.width and 0 <= ty < self.height
+            ]
+            self.rng.shuffle(ring_tiles)
+            for tx, ty in ring_tiles:
+                offset = ty * self.width + tx
+                if mask[offset] and not self.occupied[offset]:
+                    self.occupied[offset] = 1
+                    return tx, ty
+        return None
+
+    def place_group(self, group: TDeploymentGroup, unit_ids: List[str],
+                    zone: Optional[str] = None) -> List[Tuple[str, int, int, str]]:
+        """
+        Place the units picked for one group.
+
+        Args:
+            group (TDeploymentGroup): Group with inside/outside UFO chances and role flags.
+            unit_ids (list[str]): Unit type ids picked for the group.
+            zone (str, optional): Spawn zone overriding the inside/outside UFO choice.
+        Returns:
+            list: (unit id, x, y, role) per placed unit; role is 'leader', 'guard', 'patrol' or ''.
+        """
+        role = 'leader' if group.leader else 'guard' if group.guard else 'patrol' if group.patrol else ''
+        placed = []
+        anchor = None
+        for unit_id in unit_ids:
+            if zone is not None:
+                order = [zone]
+            elif group.leader:
+                order = [self.INSIDE, self.OUTSIDE]
+            else:
+                inside_first = self.rng.random() < group.inside_ufo
+                order = [self.INSIDE, self.OUTSIDE] if inside_first else [self.OUTSIDE, self.INSIDE]
+            size = self.unit_sizes.get(unit_id, 1)
+            position = None
+            if group.guard and anchor is not None and size == 1:
+                for constraint in order:
+                    position = self.sample_near(constraint, anchor[0], anchor[1], self.GUARD_RADIUS)
+                    if position:
+                        break
+            if position is None:
+                for constraint in order:
+                    position = self.sample(constraint, size)
+                    if position:
+                        break
+            if position is None:
+                break
+            anchor = anchor or position
+            placed.append((unit_id, position[0], position[1], role))
+        return placed
+
+    def place_deployment(self, deployment: TDeployment, zone: Optional[str] = None) -> List[Tuple[str, int, int, str]]:
+        """
+        Pick and place all groups and civilians of a deployment; unit picks use the placer's rng, so a seeded
+        placer gives the same deployment.
+
+        Args:
+            deployment (TDeployment): Deployment to place.
+            zone (str, optional): Spawn zone for all units (e.g. player side).
+        Returns:
+            list: (unit id, x, y, role) per placed unit; civilians get the role 'civilian'.
+        """
+        placed = []
+        for group in deployment.groups:
+            placed.extend(self.place_group(group, group.pick_units(self.rng), zone))
+        for _ in range(deployment.civilians):
+            if not deployment.civilian_types:
+                break
+            position = self.sample(zone or self.OUTSIDE)
+            if position is None:
+                break
+            placed.append((self.rng.choice(deployment.civilian_types), position[0], position[1], 'civilian'))
+        return placed
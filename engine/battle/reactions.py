@@ -2,18 +2,349 @@
 engine/battle/reactions.py
 
 Defines the TReactionFire class, which handles the mechanics of reaction fire during battle. Manages how and when units perform reaction shots in response to enemy actions, such as movement or attacks.
+Each overwatching unit has a watch zone (tiles it can see and reach with its weapon) stored in a spatial index,
+so a moving unit's step only queries the watchers of the tile it entered.
 
 Classes:
     TReactionFire: Manages the logic for reaction fire in battle.
 
-Last standardized: 2025-06-15
+Last standardized: 2026-10-18
 """
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from engine.battle.battle_lof import TBattleLineOfFire
+from engine.battle.battle_los import BattleLOS
+from engine.battle.damage_model import TDamageModel
+
 
 class TReactionFire:
     """
     Manages the logic for reaction fire in battle.
-    Determines when a unit is eligible to perform a reaction shot, resolves the outcome, and integrates with the battle system.
-    Extend this class with methods for checking triggers, resolving shots, and updating unit states as needed.
+    A unit goes on overwatch (1 AP) with a weapon and mode; its watch zone is computed once and registered in
+    a tile index (level, x, y) -> watchers. When a hostile unit enters a tile, only the watchers of that tile
+    take a reaction test (watcher reflex vs mover reflex) and fire if they pass and have AP left.
+    Zones are recomputed only for watchers near a changed tile; a watcher that moves leaves overwatch.
+    Overwatch entries and AP spent are journaled by the battle, so a rollback restores them and only re-registers
+    the watchers it touched.
+
+    Attributes:
+        battle (TBattle): Battle the reactions belong to.
+        line_of_fire (TBattleLineOfFire): Chance-to-hit calculator used for reaction shots.
+        watchers (dict): Overwatching unit -> (item type, mode, level, x, y, radius).
+        zones (dict): Overwatching unit -> frozenset of watched (level, x, y) tiles.
+        index (dict): (level, x, y) -> overwatching units (insertion-ordered dict used as a set).
+        OVERWATCH_AP (int): Action points spent to go on overwatch.
+        DEFAULT_SIGHT (int): Sight range used when a unit has no sight stat.
     """
-    # TODO: Implement methods for checking triggers, resolving shots, and updating unit states.
-    pass
\ No newline at end of file
+    OVERWATCH_AP = 1
+    DEFAULT_SIGHT = 20
+
+    def __init__(self, battle, line_of_fire: Optional[TBattleLineOfFire] = None):
+        """
+        Initialize reaction fire for a battle.
+
+        Args:
+            battle (TBattle): Battle to manage.
+            line_of_fire (TBattleLineOfFire, optional): Shared chance-to-hit calculator.
+        """
+        self.battle = battle
+        self.line_of_fire = line_of_fire or TBattleLineOfFire(battle)
+        self.watchers: Dict[Any, Tuple] = {}
+        self.zones: Dict[Any, FrozenSet[Tuple[int, int, int]]] = {}
+        self.index: Dict[Tuple[int, int, int], Dict[Any, None]] = {}
+
+    def set_overwatch(self, unit, item_type, mode: str = 'snap') -> bool:
+        """
+        Put a unit on overwatch with a weapon mode and register its watch zone.
+
+        Args:
+            unit (TUnit): Unit going on overwatch.
+            item_type (TItemType): Weapon type used for reaction shots.
+            mode (str): Weapon mode used for reaction shots.
+        Returns:
+            bool: True if the unit is now on overwatch.
+        """
+        stats = getattr(unit, 'stats', None)
+        if stats is not None:
+            if stats.action_points_left < self.OVERWATCH_AP:
+                return False
+            self._use_ap(stats, self.OVERWATCH_AP)
+        self.cancel_overwatch(unit)
+        sight = self.DEFAULT_SIGHT
+        if stats is not None and stats.get_sight():
+            sight = stats.get_sight()
+        radius = int(min(sight, item_type.get_mode_parameters(mode)['range']))
+        self._set_watcher(unit, (item_type, mode, getattr(unit, 'level', 0), unit.x, unit.y, radius))
+        self._register(unit)
+        return True
+
+    def cancel_overwatch(self, unit) -> None:
+        """
+        Take a unit off overwatch and remove its watch zone from the index.
+
+        Args:
+            unit (TUnit): Overwatching unit.
+        """
+        self._unindex(unit)
+        if unit in self.watchers:
+            self._set_watcher(unit, None)
+
+    def is_watching(self, unit) -> bool:
+        """
+        Check whether a unit is on overwatch.
+
+        Args:
+            unit (TUnit): Unit to check.
+        Returns:
+            bool: True if on overwatch.
+        """
+        return unit in self.watchers
+
+    def watchers_at(self, level: int, x: int, y: int) -> List[Any]:
+        """
+        Overwatching units whose watch zone contains a tile.
+
+        Args:
+            level (int): Level index.
+            x (int): X coordinate.
+            y (int): Y coordinate.
+        Returns:
+            list: Watching units in overwatch order (may be empty).
+        """
+        return list(self.index.get((level, x, y), ()))
+
+    def watch_zone(self, level: int, x: int, y: int, radius: int) -> FrozenSet[Tuple[int, int, int]]:
+        """
+        Compute the tiles visible from (x, y) within a radius.
+
+        Args:
+            level (int): Level index.
+            x (int): Watcher X coordinate.
+            y (int): Watcher Y coordinate.
+            radius (int): Sight/weapon range in tiles.
+        Returns:
+            frozenset: Watched (level, x, y) tiles.
+        """
+        battle_level = self.battle.levels[level]
+        battle_level.activate()
+        zone = set()
+        for ty in range(max(0, y - radius), min(battle_level.height, y + radius + 1)):
+            for tx in range(max(0, x - radius), min(battle_level.width, x + radius + 1)):
+                if (tx, ty) == (x, y):
+                    continue
+                if BattleLOS.has_los(battle_level, (x, y), (tx, ty), radius):
+                    zone.add((level, tx, ty))
+        return frozenset(zone)
+
+    def on_terrain_changed(self, level: int, x: int, y: int) -> None:
+        """
+        Recompute the zones of watchers within range of a changed tile.
+
+        Args:
+            level (int): Level index.
+            x (int): X coordinate of the changed tile.
+            y (int): Y coordinate of the changed tile.
+        """
+        for unit, (_, _, w_level, wx, wy, radius) in list(self.watchers.items()):
+            if w_level == level and max(abs(wx - x), abs(wy - y)) <= radius:
+                self._register(unit)
+
+    def refresh(self, units=None, tiles=()) -> None:
+        """
+        Recompute watch zones; without arguments all of them, and watchers that moved leave overwatch.
+        After a rollback only the given units (overwatch entries restored by the journal) and the watchers in
+        range of the given restored tiles are re-registered.
+
+        Args:
+            units (iterable, optional): Units whose overwatch entry changed.
+            tiles (iterable): (level, x, y) tiles whose terrain changed.
+        """
+        if units is None:
+            for unit, (_, _, level, x, y, _) in list(self.watchers.items()):
+                if (getattr(unit, 'level', 0), unit.x, unit.y) != (level, x, y):
+                    self.cancel_overwatch(unit)
+                else:
+                    self._register(unit)
+            return
+        dirty = dict.fromkeys(units)
+        for level, x, y in tiles:
+            for unit, (_, _, w_level, wx, wy, radius) in self.watchers.items():
+                if w_level == level and max(abs(wx - x), abs(wy - y)) <= radius:
+                    dirty[unit] = None
+        for unit in dirty:
+            if unit in self.watchers:
+                self._register(unit)
+            else:
+                self._unindex(unit)
+
+    def on_unit_moved(self, unit) -> List[Tuple[Any, bool]]:
+        """
+        Trigger reaction fire for a unit that just entered a tile.
+        Only watchers indexed at that tile are tested.
+
+        Args:
+            unit (TUnit): Unit that moved.
+        Returns:
+            list: (watcher, hit) for every reaction shot fired.
+        """
+        if unit in self.watchers:
+            # Moving out of overwatch cancels it
+            self.cancel_overwatch(unit)
+        level = getattr(unit, 'level', 0)
+        shots = []
+        for watcher in self.watchers_at(level, unit.x, unit.y):
+            if not getattr(unit, 'alive', True) or getattr(unit, 'stunned', False):
+                break
+            if not self._is_hostile(watcher, unit) or not self._can_react(watcher):
+                continue
+            if self.battle.random('reaction') >= self.reaction_chance(watcher, unit):
+                continue
+            shots.append((watcher, self.fire(watcher, unit)))
+        return shots
+
+    def move_along(self, unit, path: List[Tuple[int, int]]) -> List[Tuple[Any, bool]]:
+        """
+        Move a unit tile by tile, resolving reaction fire at each step.
+        Stops when the unit is killed, stunned or blocked.
+
+        Args:
+            unit (TUnit): Moving unit.
+            path (list): (x, y) tiles to enter in order.
+        Returns:
+            list: All (watcher, hit) reaction shots.
+        """
+        shots = []
+        for x, y in path:
+            if not self.battle.move_unit(unit, x, y):
+                break
+            shots.extend(self.on_unit_moved(unit))
+            if not getattr(unit, 'alive', True) or getattr(unit, 'stunned', False):
+                break
+        return shots
+
+    def reaction_chance(self, watcher, target) -> float:
+        """
+        Chance that a watcher reacts to a target: watcher reflex / (watcher reflex + target reflex).
+
+        Args:
+            watcher (TUnit): Overwatching unit.
+            target (TUnit): Moving unit.
+        Returns:
+            float: Reaction chance in [0, 1].
+        """
+        own = getattr(getattr(watcher, 'stats', None), 'reflex', 0)
+        other = getattr(getattr(target, 'stats', None), 'reflex', 0)
+        if own + other <= 0:
+            return 0.5
+        return own / float(own + other)
+
+    def fire(self, watcher, target) -> bool:
+        """
+        Resolve one reaction shot: spend AP, roll to hit, apply damage and log the shot.
+
+        Args:
+            watcher (TUnit): Firing unit.
+            target (TUnit): Target unit.
+        Returns:
+            bool: True if the shot hit.
+        """
+        item_type, mode = self.watchers[watcher][:2]
+        params = item_type.get_mode_parameters(mode)
+        stats = getattr(watcher, 'stats', None)
+        if stats is not None:
+            self._use_ap(stats, params['ap_cost'])
+        chance = self.line_of_fire.chance_to_hit(watcher, target, item_type, mode)
+        hit = self.battle.random('hit') < chance
+        level = getattr(target, 'level', 0)
+        self.battle.log.record_shot(watcher, (target.x, target.y), level, item_type.pid, mode, hit)
+        if hit:
+            damage_type = getattr(item_type, 'unit_damage_type', '')
+            # The pipeline logs the damage event
+            TDamageModel.resolve([(target, params['damage'], damage_type, None)], self.battle)
+        return hit
+
+    def _set_watcher(self, unit, entry) -> None:
+        """
+        Set or clear (entry None) a unit's overwatch entry, journaling the previous entry while forked.
+
+        Args:
+            unit (TUnit): Unit.
+            entry (tuple|None): (item type, mode, level, x, y, radius).
+        """
+        journal = self.battle.journal
+        if journal.is_recording():
+            journal.record(('watcher', id(unit)), (unit, self.watchers.get(unit)))
+        if entry is None:
+            self.watchers.pop(unit, None)
+        else:
+            self.watchers[unit] = entry
+
+    def _use_ap(self, stats, amount: int) -> None:
+        """
+        Spend action points through the battle journal.
+
+        Args:
+            stats (TUnitStats): Unit stats.
+            amount (int): Action points spent.
+        """
+        self.battle._write_object(stats, action_points_left=max(0, stats.action_points_left - amount))
+
+    def _register(self, unit) -> None:
+        """
+        (Re)compute a watcher's zone and update the tile index.
+
+        Args:
+            unit (TUnit): Overwatching unit.
+        """
+        self._unindex(unit)
+        _, _, level, x, y, radius = self.watchers[unit]
+        zone = self.watch_zone(level, x, y, radius)
+        self.zones[unit] = zone
+        for key in zone:
+            self.index.setdefault(key, {})[unit] = None
+
+    def _unindex(self, unit) -> None:
+        """
+        Remove a watcher's zone from the tile index.
+
+        Args:
+            unit (TUnit): Overwatching unit.
+        """
+        for key in self.zones.pop(unit, frozenset()):
+            watchers = self.index.get(key)
+            if watchers is not None:
+                watchers.pop(unit, None)
+                if not watchers:
+                    del self.index[key]
+
+    def _is_hostile(self, watcher, target) -> bool:
+        """
+        Check the diplomacy matrix for watcher vs target sides.
+
+        Args:
+            watcher (TUnit): Overwatching unit.
+            target (TUnit): Moving unit.
+        Returns:
+            bool: True if the watcher should fire at the target.
+        """
+        side, other = getattr(watcher, 'side', None), getattr(target, 'side', None)
+        if side is None or other is None:
+            return False
+        return self.battle.DIPLOMACY[side][other] > 0
+
+    def _can_react(self, watcher) -> bool:
+        """
+        Check that a watcher is able to fire (alive, conscious, enough AP for its mode).
+
+        Args:
+            watcher (TUnit): Overwatching unit.
+        Returns:
+            bool: True if the watcher can fire.
+        """
+        if not getattr(watcher, 'alive', True) or getattr(watcher, 'stunned', False):
+            return False
+        stats = getattr(watcher, 'stats', None)
+        if stats is None:
+            return True
+        item_type, mode = self.watchers[watcher][:2]
+        return stats.action_points_left >= item_type.get_mode_parameters(mode)['ap_cost']
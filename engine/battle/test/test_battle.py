@@ -4,9 +4,19 @@ Covers initialization and attribute defaults using pytest.
 """
 import pytest
 from engine.battle.battle import TBattle
+from engine.battle.battle_tile import TBattleTile
 
 class DummyGenerator:
-    pass
+    def __init__(self, width=4, height=4, floor_id='floor_001'):
+        self.width = width
+        self.height = height
+        self.floor_id = floor_id
+
+    def generate(self):
+        return [[TBattleTile(self.floor_id) for _ in range(self.width)] for _ in range(self.height)]
+
+class DummyUnit:
+    alive = True
 
 @pytest.fixture
 def battle():
@@ -28,3 +38,30 @@ def test_init_sets_attributes(battle):
     assert battle.SIDE_NEUTRAL == 3
     assert battle.NUM_SIDES == 4
     assert isinstance(battle.DIPLOMACY, list)
+
+def test_extra_levels_start_frozen():
+    """Test additional levels are generated frozen and the entry level is active."""
+    battle = TBattle(DummyGenerator(), level_generators=[DummyGenerator(6, 5, 'base_001')])
+    assert len(battle.levels) == 2
+    assert battle.levels[0].active
+    assert not battle.levels[1].active
+    assert battle.width == 4 and battle.height == 4
+
+def test_portal_transfer_activates_and_freezes_levels():
+    """Test a player unit using a portal activates the target level and freezes the empty one."""
+    battle = TBattle(DummyGenerator(), level_generators=[DummyGenerator(6, 5, 'base_001')])
+    soldier = DummyUnit()
+    alien = DummyUnit()
+    battle.add_unit(soldier, battle.SIDE_PLAYER, 1, 1)
+    battle.add_unit(alien, battle.SIDE_ENEMY, 3, 3, level=1)
+    assert not battle.levels[1].active
+    assert battle.levels[1].get_unit(3, 3) is alien
+    battle.add_portal((0, 1, 1), (1, 0, 0))
+    assert battle.use_portal(soldier)
+    assert (soldier.level, soldier.x, soldier.y) == (1, 0, 0)
+    assert battle.levels[1].active
+    assert battle.levels[1].get_tile(0, 0).unit is soldier
+    battle.set_current_level(1)
+    assert not battle.levels[0].active
+    assert battle.levels[0].get_unit(1, 1) is None
+    assert battle.tiles[3][3].unit is alien
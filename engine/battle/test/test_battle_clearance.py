@@ -0,0 +1,69 @@
+"""
+Test suite for engine.battle.battle_clearance (TBattleClearance)
+Covers full computation, local updates, multi-tile occupancy and clearance-based pathing using pytest.
+"""
+import pytest
+from engine.battle.battle import TBattle
+from engine.battle.battle_clearance import TBattleClearance
+from engine.battle.battle_pathfinder import BattlePathfinder
+from engine.battle.battle_tile import TBattleTile
+
+
+class DummyGenerator:
+    def generate(self):
+        return [[TBattleTile('floor_001') for _ in range(8)] for _ in range(8)]
+
+
+class BigUnit:
+    size = 2
+
+    def __init__(self):
+        self.alive = True
+        self.stunned = False
+
+
+def test_compute_caps_and_blocks():
+    """Test clearance shrinks toward walls and map edges and is capped at MAX_SIZE."""
+    tiles = DummyGenerator().generate()
+    tiles[3][3].passable = False
+    grid = TBattleClearance.compute(tiles)
+    assert grid[0] == 3
+    assert grid[4] == TBattleClearance.MAX_SIZE
+    assert grid[3 * 8 + 3] == 0
+    assert grid[2 * 8 + 2] == 1
+    assert grid[7 * 8 + 7] == 1
+
+
+def test_local_update_matches_full_recompute():
+    """Test terrain changes update the clearance window exactly like a full rebuild."""
+    battle = TBattle(DummyGenerator())
+    assert battle.clearance.fits(0, 4, 4, 2)
+    battle.set_terrain(5, 5, 'wall_id', 'wall_001')
+    assert not battle.clearance.fits(0, 4, 4, 2)
+    assert battle.clearance.grid(0) == TBattleClearance.compute(battle.tiles)
+    battle.set_terrain(5, 5, 'wall_id', None)
+    assert battle.clearance.fits(0, 4, 4, 2)
+    assert battle.clearance.grid(0) == TBattleClearance.compute(battle.tiles)
+
+
+def test_large_unit_occupies_footprint():
+    """Test a 2x2 unit occupies four tiles and blocks overlapping moves."""
+    battle = TBattle(DummyGenerator())
+    big, other = BigUnit(), BigUnit()
+    battle.add_unit(big, battle.SIDE_ENEMY, 1, 1)
+    assert all(battle.tiles[y][x].unit is big for x, y in [(1, 1), (2, 1), (1, 2), (2, 2)])
+    battle.add_unit(other, battle.SIDE_ENEMY, 5, 5)
+    assert not battle.move_unit(other, 2, 2)
+    assert battle.move_unit(big, 2, 1)
+    assert battle.tiles[1][1].unit is None and battle.tiles[2][3].unit is big
+    assert not battle.move_unit(big, 7, 0)
+
+
+def test_pathfinder_uses_clearance_for_large_units():
+    """Test a 2x2 unit is routed around a one-tile gap that a 1x1 unit can pass."""
+    battle = TBattle(DummyGenerator())
+    for y in range(8):
+        if y != 3:
+            battle.set_terrain(4, y, 'wall_id', 'wall_001')
+    assert BattlePathfinder.find_path(battle, (0, 3), (6, 3), unit_size=1)
+    assert BattlePathfinder.find_path(battle, (0, 3), (6, 3), unit_size=2) == []
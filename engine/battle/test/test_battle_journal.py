@@ -0,0 +1,101 @@
+"""
+Test suite for engine.battle.battle_journal (TBattleJournal) and TBattle fork/rollback
+Covers copy-on-write layers, nested forks, commit and rollback using pytest.
+"""
+import pytest
+from engine.battle.battle import TBattle
+from engine.battle.battle_journal import TBattleJournal
+from engine.battle.battle_tile import TBattleTile
+from engine.battle.battle_tile_type import TBattleTileTypes
+
+
+class DummyGenerator:
+    def generate(self):
+        return [[TBattleTile('floor_001') for _ in range(4)] for _ in range(4)]
+
+
+class DummyUnit:
+    alive = True
+    stunned = False
+
+
+@pytest.fixture
+def battle():
+    battle = TBattle(DummyGenerator(), seed=1)
+    battle.unit = DummyUnit()
+    battle.add_unit(battle.unit, battle.SIDE_PLAYER, 0, 0)
+    return battle
+
+
+def test_journal_keeps_first_value_only():
+    """Test only the first write per key is stored and commit folds into the parent layer."""
+    journal = TBattleJournal()
+    journal.push('outer')
+    journal.record('a', 1)
+    journal.push('inner')
+    journal.record('a', 2)
+    journal.record('b', 3)
+    journal.record('b', 4)
+    assert journal.layers[-1] == {'a': 2, 'b': 3}
+    assert journal.merge_top() == 'inner'
+    assert journal.layers[-1] == {'a': 1, 'b': 3}
+
+
+def test_rollback_restores_changes(battle):
+    """Test rollback undoes moves, terrain, status, rng draws and log records."""
+    unit = battle.unit
+    log_size = len(battle.log.data)
+    state = battle.rng.getstate()
+    with battle.lookahead():
+        battle.move_unit(unit, 2, 3)
+        battle.set_terrain(1, 1, 'wall_id', 'wall_001')
+        battle.set_unit_status(unit, alive=False)
+        battle.random('hit')
+        assert battle.tiles[3][2].unit is unit
+        assert not battle.tiles[1][1].passable
+        assert len(battle.journal.layers[-1]) < 10
+    assert (unit.x, unit.y) == (0, 0)
+    assert battle.tiles[0][0].unit is unit and battle.tiles[3][2].unit is None
+    assert battle.tiles[1][1].wall_id is None and battle.tiles[1][1].passable
+    assert unit.alive is True
+    assert battle.rng.getstate() == state
+    assert len(battle.log.data) == log_size
+
+
+def test_nested_fork_commit_and_rollback(battle):
+    """Test committing an inner fork keeps its changes until the outer fork is rolled back."""
+    unit = battle.unit
+    outer = battle.fork()
+    battle.move_unit(unit, 1, 0)
+    battle.fork()
+    battle.move_unit(unit, 2, 0)
+    battle.commit()
+    assert (unit.x, unit.y) == (2, 0)
+    extra = DummyUnit()
+    battle.add_unit(extra, battle.SIDE_ENEMY, 3, 3)
+    battle.rollback(outer)
+    assert (unit.x, unit.y) == (0, 0)
+    assert battle.tiles[0][2].unit is None
+    assert battle.tiles[3][3].unit is None
+    assert extra not in battle.sides[battle.SIDE_ENEMY]
+    assert battle.journal.depth == 0
+
+
+def test_terrain_records_follow_ids(battle):
+    """Test wall records are re-resolved on set_terrain, on rollback and when a log event is replayed."""
+    TBattleTileTypes.clear()
+    record = TBattleTileTypes.register('wall', 'wall_001')
+    try:
+        tile = battle.tiles[1][1]
+        with battle.lookahead():
+            battle.set_terrain(1, 1, 'wall_id', 'wall_001')
+            assert tile.wall is record
+        assert tile.wall is None
+        battle.process_turn()
+        battle.set_terrain(1, 1, 'wall_id', 'wall_001')
+        battle.process_turn()
+        assert battle.log.seek(battle, battle.turn)
+        tile = battle.tiles[1][1]
+        assert tile.wall_id == 'wall_001' and tile.wall is record
+    finally:
+        TBattleTileTypes.clear()
@@ -0,0 +1,55 @@
+"""
+Test suite for engine.battle.battle_level (TBattleLevel)
+Covers freezing, thawing and unit placement on frozen levels using pytest.
+"""
+import pytest
+from engine.battle.battle_level import TBattleLevel
+from engine.battle.battle_object import TBattleObject
+from engine.battle.battle_tile import TBattleTile
+
+
+@pytest.fixture
+def level():
+    tiles = [[TBattleTile('grass_001') for _ in range(4)] for _ in range(3)]
+    tiles[1][2] = TBattleTile('floor_002', 'wall_001')
+    tiles[1][2].update_properties()
+    tiles[0][0].add_object(TBattleObject(armor=3))
+    tiles[2][3].smoke = True
+    return TBattleLevel(1, tiles, num_sides=2, name='Hangar')
+
+
+def test_init_is_active(level):
+    """Test a new level is active with live layers."""
+    assert level.active
+    assert level.width == 4 and level.height == 3
+    assert len(level.fog_of_war) == 2
+    assert len(level.light_map) == 3
+
+
+def test_freeze_and_activate_roundtrip(level):
+    """Test tiles, tile state and fog survive a freeze/activate cycle."""
+    level.fog_of_war[1][2][3] = 2
+    level.freeze()
+    assert not level.active
+    assert level.tiles is None and level.fog_of_war is None and level.light_map is None
+    level.activate()
+    wall_tile = level.get_tile(2, 1)
+    assert wall_tile.wall_id == 'wall_001' and not wall_tile.passable
+    assert level.get_tile(3, 2).smoke is True
+    assert len(level.get_tile(0, 0).objects) == 1
+    assert level.get_tile(1, 1).floor_id == 'grass_001'
+    assert level.fog_of_war[1][2][3] == 2
+
+
+def test_frozen_queries_do_not_activate(level):
+    """Test objects and units can be read and placed on a frozen level."""
+    level.freeze()
+    unit = object()
+    level.set_unit(1, 1, unit)
+    assert level.get_unit(1, 1) is unit
+    assert len(list(level.iter_objects())) == 1
+    assert not level.active
+    level.set_unit(1, 1, None)
+    assert level.get_unit(1, 1) is None
+    level.activate()
+    assert level.get_tile(1, 1).unit is None
@@ -0,0 +1,117 @@
+"""
+Test suite for engine.battle.battle_lof (TBattleLineOfFire)
+Covers cover products along lines of fire, batched chance to hit and cache invalidation using pytest.
+"""
+import pytest
+from engine.battle.battle import TBattle
+from engine.battle.battle_floor import TBattleFloor
+from engine.battle.battle_lof import TBattleLineOfFire
+from engine.battle.battle_object import TBattleObject
+from engine.battle.battle_tile import TBattleTile
+
+
+class DummyGenerator:
+    def generate(self):
+        return [[TBattleTile('floor_001') for _ in range(10)] for _ in range(10)]
+
+
+class DummyStats:
+    def __init__(self, aim):
+        self.aim = aim
+
+
+class DummyUnit:
+    def __init__(self, aim=80):
+        self.stats = DummyStats(aim)
+        self.alive = True
+        self.stunned = False
+
+
+class DummyItemType:
+    pid = 'rifle'
+    modes = {'snap': None, 'aimed': None}
+
+    def get_mode_parameters(self, mode_name):
+        accuracy = 70 if mode_name == 'snap' else 100
+        return {'ap_cost': 2, 'range': 8, 'accuracy': accuracy, 'shots': 1, 'damage': 30}
+
+
+@pytest.fixture
+def battle():
+    battle = TBattle(DummyGenerator())
+    for side_fog in battle.fog_of_war:
+        for row in side_fog:
+            row[:] = [2] * len(row)
+    return battle
+
+
+def test_chance_to_hit_multiplies_cover(battle):
+    """Test three tiles of 10% cover give a 0.9^3 modifier (wiki example)."""
+    shooter, target = DummyUnit(80), DummyUnit()
+    battle.add_unit(shooter, battle.SIDE_PLAYER, 0, 0)
+    battle.add_unit(target, battle.SIDE_ENEMY, 4, 0)
+    rough = TBattleFloor(accuracy_cost=10)
+    for x in (1, 2, 3):
+        battle.tiles[0][x].floor = rough
+    lof = TBattleLineOfFire(battle)
+    chance = lof.chance_to_hit(shooter, target, DummyItemType(), 'snap')
+    assert chance == pytest.approx(0.8 * 0.7 * 0.9 ** 3)
+
+
+def test_wall_blocks_and_range_limits(battle):
+    """Test walls stop the shot and targets beyond mode range cannot be hit."""
+    shooter, near, far = DummyUnit(), DummyUnit(), DummyUnit()
+    battle.add_unit(shooter, battle.SIDE_PLAYER, 0, 0)
+    battle.add_unit(near, battle.SIDE_ENEMY, 0, 4)
+    battle.add_unit(far, battle.SIDE_ENEMY, 9, 9)
+    battle.set_terrain(0, 2, 'wall_id', 'wall_001')
+    lof = TBattleLineOfFire(battle)
+    item = DummyItemType()
+    assert lof.evaluate([(shooter, near, item, 'snap'), (shooter, far, item, 'snap')]) == [0.0, 0.0]
+
+
+def test_batch_matches_single_and_hidden_penalty(battle):
+    """Test batched evaluation of a side matches per-pair results, with a penalty for unseen targets."""
+    shooter, target = DummyUnit(100), DummyUnit()
+    battle.add_unit(shooter, battle.SIDE_PLAYER, 1, 1)
+    battle.add_unit(target, battle.SIDE_ENEMY, 4, 3)
+    battle.tiles[2][2].add_object(TBattleObject())
+    battle.tiles[2][2].objects[0].fire_mod = 30
+    battle.fog_of_war[battle.SIDE_PLAYER][3][4] = 1
+    lof = TBattleLineOfFire(battle)
+    results = lof.evaluate_side(battle.SIDE_PLAYER, weapons={shooter: DummyItemType()})
+    assert set(results) == {(shooter, target, 'snap'), (shooter, target, 'aimed')}
+    assert results[(shooter, target, 'aimed')] == pytest.approx(1.0 * 0.7 * 0.5)
+    fresh = TBattleLineOfFire(battle)
+    assert fresh.chance_to_hit(shooter, target, DummyItemType(), 'snap') == pytest.approx(results[(shooter, target, 'snap')])
+
+
+def test_fog_change_applies_to_cached_chance(battle):
+    """Test a fog of war update changes the chance of an already cached pair without a revision bump."""
+    shooter, target = DummyUnit(), DummyUnit()
+    battle.add_unit(shooter, battle.SIDE_PLAYER, 0, 0)
+    battle.add_unit(target, battle.SIDE_ENEMY, 5, 0)
+    lof = TBattleLineOfFire(battle)
+    item = DummyItemType()
+    seen = lof.chance_to_hit(shooter, target, item)
+    revision = battle.revision
+    battle.fog_of_war[battle.SIDE_PLAYER][0][5] = 1
+    assert battle.revision == revision
+    assert lof.chance_to_hit(shooter, target, item) == pytest.approx(seen * lof.NOT_SEEN_FACTOR)
+    battle.fog_of_war[battle.SIDE_PLAYER][0][5] = 2
+    assert lof.chance_to_hit(shooter, target, item) == pytest.approx(seen)
+
+
+def test_cache_invalidated_on_changes(battle):
+    """Test cached chances are reused until a unit moves or terrain changes."""
+    shooter, target = DummyUnit(), DummyUnit()
+    battle.add_unit(shooter, battle.SIDE_PLAYER, 0, 0)
+    battle.add_unit(target, battle.SIDE_ENEMY, 5, 0)
+    lof = TBattleLineOfFire(battle)
+    item = DummyItemType()
+    first = lof.chance_to_hit(shooter, target, item)
+    assert len(lof.cache) == 1
+    battle.set_terrain(3, 0, 'wall_id', 'wall_001')
+    assert lof.chance_to_hit(shooter, target, item) == 0.0
+    battle.move_unit(shooter, 0, 3)
+    assert lof.chance_to_hit(shooter, target, item) == pytest.approx(first)
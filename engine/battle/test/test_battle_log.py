@@ -0,0 +1,92 @@
+"""
+Test suite for engine.battle.battle_log (TBattleLog)
+Covers binary recording, decoding, statistics and snapshot seeking using pytest.
+"""
+import pytest
+from engine.battle.battle import TBattle
+from engine.battle.battle_log import TBattleLog
+from engine.battle.battle_tile import TBattleTile
+
+
+class DummyGenerator:
+    def generate(self):
+        return [[TBattleTile('floor_001') for _ in range(5)] for _ in range(5)]
+
+
+class DummyUnit:
+    def __init__(self, name):
+        self.name = name
+        self.alive = True
+        self.stunned = False
+
+
+@pytest.fixture
+def log():
+    return TBattleLog(snapshot_interval=2)
+
+
+def test_records_are_compact_and_decodable(log):
+    """Test events are encoded as fixed size records and decoded back."""
+    shooter, target = DummyUnit('Ann'), DummyUnit('Sectoid')
+    log.record_turn(1)
+    log.record_unit(shooter, 0, 1, 1)
+    log.record_unit(target, 1, 3, 3)
+    log.record_shot(shooter, (3, 3), weapon='rifle', mode='snap', hit=True)
+    log.record_damage(target, 3, 3, 12.5, 'kinetic')
+    log.record_rng(0.25, 'hit')
+    events = log.events()
+    assert [e['type'] for e in events] == ['turn', 'unit', 'unit', 'shot', 'damage', 'rng']
+    assert events[3]['weapon'] == 'rifle' and events[3]['hit'] is True
+    assert events[4]['amount'] == pytest.approx(12.5)
+    assert len(log.data) < 80
+    stats = log.summarize()
+    assert stats[shooter]['hits'] == 1
+    assert stats[shooter]['damage_dealt'] == pytest.approx(12.5)
+    assert stats[target]['damage_taken'] == pytest.approx(12.5)
+
+
+def test_snapshot_due_interval(log):
+    """Test snapshots are due on the first turn and every interval after it."""
+    assert [t for t in range(1, 7) if log.snapshot_due(t)] == [1, 3, 5]
+
+
+def test_seek_restores_turn_state():
+    """Test seeking restores unit positions, terrain and rng state at the start of a turn."""
+    battle = TBattle(DummyGenerator(), seed=7, snapshot_interval=2)
+    unit = DummyUnit('Ann')
+    battle.add_unit(unit, battle.SIDE_PLAYER, 0, 0)
+    rng_states = {}
+    for turn in range(1, 5):
+        rng_states[turn] = battle.rng.getstate()
+        battle.process_turn()
+        battle.move_unit(unit, turn, turn - 1)
+        battle.random('hit')
+        if turn == 2:
+            battle.set_terrain(4, 4, 'wall_id', 'wall_001')
+    # Turn 4 starts after the moves of turn 3
+    assert battle.log.seek(battle, 4)
+    assert (unit.x, unit.y) == (3, 2)
+    assert battle.tiles[2][3].unit is unit
+    assert battle.tiles[4][4].wall_id == 'wall_001'
+    assert battle.turn == 4
+    assert battle.rng.getstate() == rng_states[4]
+    assert battle.log.seek(battle, 1)
+    assert (unit.x, unit.y) == (0, 0)
+    assert battle.tiles[4][4].wall_id is None
+
+
+def test_snapshots_keep_frozen_levels_frozen(monkeypatch):
+    """Test snapshots and seeks of a frozen level neither rebuild its tiles nor activate it."""
+    battle = TBattle(DummyGenerator(), [DummyGenerator()], seed=3, snapshot_interval=1)
+    enemy = DummyUnit('Sectoid')
+    battle.add_unit(enemy, battle.SIDE_ENEMY, 1, 1, level=1)
+    frozen = battle.levels[1]
+    assert not frozen.active
+    monkeypatch.setattr(frozen, '_thaw_tiles', lambda: pytest.fail('frozen level was rebuilt'))
+    battle.process_turn()
+    battle.levels[1].set_unit(1, 1, None)
+    battle.levels[1].set_unit(2, 2, enemy)
+    battle.process_turn()
+    assert battle.log.seek(battle, 1)
+    assert not frozen.active
+    assert frozen.get_unit(1, 1) is enemy and frozen.get_unit(2, 2) is None
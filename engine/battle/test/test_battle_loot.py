@@ -6,3 +6,70 @@ import pytest
 from engine.battle import battle_loot
 
 # Add your test cases here following best practices
+from engine.battle.battle import TBattle
+from engine.battle.battle_loot import BattleLoot
+from engine.battle.battle_object import TBattleObject
+from engine.battle.battle_tile import TBattleTile
+from engine.battle.battle_tile_type import TBattleTileTypes
+from engine.battle.battle_wall import TBattleWall
+from engine.battle.damage_model import TDamageModel
+
+
+class DummyGenerator:
+    def generate(self):
+        return [[TBattleTile('floor_001') for _ in range(5)] for _ in range(5)]
+
+
+class DummyUnit:
+    def __init__(self, uid, **values):
+        self.id = uid
+        self.alive = True
+        self.stunned = False
+        for key, value in values.items():
+            setattr(self, key, value)
+
+
+def test_generate_single_pass_report():
+    """Test the report covers kills, captures, losses, loot, player stats and destroyed terrain."""
+    battle = TBattle(DummyGenerator())
+    dead_alien = DummyUnit('sectoid', score_kill=10)
+    captured = DummyUnit('floater', score_capture=20)
+    soldier = DummyUnit('rookie', score_loss=5, experience_gained=3, medals_earned=['purple'])
+    battle.add_unit(dead_alien, battle.SIDE_ENEMY, 0, 0)
+    battle.add_unit(captured, battle.SIDE_ENEMY, 1, 0)
+    battle.add_unit(soldier, battle.SIDE_PLAYER, 2, 0)
+    battle.set_unit_status(dead_alien, alive=False)
+    battle.set_unit_status(captured, stunned=True)
+    battle.set_unit_status(soldier, alive=False)
+    corpse = TBattleObject()
+    corpse.id = 'sectoid_corpse'
+    corpse.score_loot = 4
+    battle.tiles[4][4].add_object(corpse)
+    wall = TBattleWall(armor=1)
+    wall.score_loss = 2
+    battle.tiles[3][3].wall = wall
+    TDamageModel.resolve([((3, 3), 50, 'explosive', None)], battle)
+    report = BattleLoot.generate(battle)
+    assert report['score'] == 10 + 20 - 5 + 4 - 2
+    assert report['captures'] == {'floater': 1}
+    assert report['loot'] == {'sectoid_corpse': 1}
+    assert report['experience'] == {'rookie': 3}
+    assert report['medals'] == {'rookie': ['purple']}
+
+
+def test_rollback_forgets_destroyed_terrain():
+    """Test terrain destroyed inside a lookahead is not scored."""
+    battle = TBattle(DummyGenerator())
+    TBattleTileTypes.clear()
+    wall = TBattleTileTypes.register('wall', 'wall_001', {'armor': 1})
+    wall.score_loss = 2
+    try:
+        battle.set_terrain(3, 3, 'wall_id', 'wall_001')
+        with battle.lookahead():
+            TDamageModel.resolve([((3, 3), 50, 'explosive', None)], battle)
+            assert len(battle.destroyed_terrain) >= 1
+            assert battle.tiles[3][3].wall is None
+        assert battle.destroyed_terrain == []
+        assert battle.tiles[3][3].wall is wall
+    finally:
+        TBattleTileTypes.clear()
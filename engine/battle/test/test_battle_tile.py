@@ -6,3 +6,63 @@ import pytest
 from engine.battle import battle_tile
 
 # Add your test cases here following best practices
+
+from engine.battle.battle_object import TBattleObject
+from engine.battle.battle_tile import TBattleTile
+from engine.battle.battle_tile_type import TBattleTileTypes
+
+
+@pytest.fixture(autouse=True)
+def tile_types():
+    TBattleTileTypes.clear()
+    yield TBattleTileTypes
+    TBattleTileTypes.clear()
+
+
+def test_tiles_share_type_records(tile_types):
+    """Test tiles with the same ids reference one shared floor/wall record."""
+    tile_types.load({'mud_001': {'type': 'floor', 'move_cost': 2},
+                     'brick_001': {'type': 'wall', 'armour': 30, 'dead_tile': 'rubble_001'},
+                     'sign_001': {'armour': 5}})
+    a, b = TBattleTile('mud_001', 'brick_001'), TBattleTile('mud_001', 'brick_001')
+    assert a.floor is b.floor and a.floor.move_cost == 2
+    assert a.wall is b.wall and a.wall.armor == 30
+    assert a.wall.on_destroy() == 'rubble_001'
+    assert TBattleTileTypes.get('wall', 'sign_001') is None
+    assert TBattleTile('grass_001').floor is TBattleTileTypes.DEFAULT_FLOOR
+    assert TBattleTile('grass_001', 'unknown_001').wall is None
+
+
+def test_containers_are_created_lazily():
+    """Test empty tiles hold no containers and use slots instead of a dict."""
+    tile = TBattleTile('floor_001')
+    assert not hasattr(tile, '__dict__')
+    assert tile.objects == () and tile.fog_of_war == ()
+    assert tile._objects is None and tile._metadata is None
+    obj = TBattleObject()
+    tile.add_object(obj)
+    assert tile.objects == [obj]
+    tile.destroy_object(obj)
+    assert tile._objects is None
+
+
+def test_copy_shares_records_and_skips_empty_metadata(tile_types):
+    """Test copies share type records and only duplicate metadata that exists."""
+    tile_types.register('floor', 'mud_001', {'move_cost': 3})
+    tile = TBattleTile('mud_001')
+    clone = tile.copy()
+    assert clone.floor is tile.floor
+    assert clone._metadata is None
+    tile.metadata['spawn'] = 'player'
+    clone = tile.copy()
+    assert clone.metadata == {'spawn': 'player'} and clone.metadata is not tile.metadata
+
+
+def test_objective_marker_survives_freeze():
+    """Test objective markers can be set on slotted tiles and are found by the battle after a freeze."""
+    from engine.battle.battle_level import TBattleLevel
+    level = TBattleLevel(0, [[TBattleTile('floor_001') for _ in range(3)] for _ in range(3)], 2)
+    level.get_tile(1, 2).objective_marker = 'poc'
+    assert level.get_tile(1, 2).copy().objective_marker == 'poc'
+    level.freeze()
+    assert [(x, y) for x, y, tile in level.iter_tiles() if tile.objective_marker == 'poc'] == [(1, 2)]
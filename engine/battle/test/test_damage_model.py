@@ -4,5 +4,134 @@ Covers all public methods and edge cases using pytest.
 """
 import pytest
 from engine.battle import damage_model
+from engine.battle.battle import TBattle
+from engine.battle.battle_tile import TBattleTile
+from engine.battle.battle_wall import TBattleWall
+from engine.battle.damage_model import TDamageModel
+from engine.unit.unit_stat import TUnitStats
 
-# Add your test cases here following best practices
+
+class DummyArmourType:
+    pid = 'dummy_vest'
+    armour_defense = 2
+    armour_resistance = {'ballistic': 0.5}
+
+
+class DummyArmour:
+    def __init__(self, shield=0):
+        self.shield = shield
+        self.item_type = DummyArmourType()
+
+
+class DummyUnit:
+    def __init__(self, health=20, armour=None):
+        self.stats = TUnitStats({'health': health})
+        self.armour = armour
+        self.alive = True
+        self.stunned = False
+
+
+class DummyGenerator:
+    def generate(self):
+        return [[TBattleTile('floor_001') for _ in range(5)] for _ in range(5)]
+
+
+@pytest.fixture(autouse=True)
+def clear_tables():
+    TDamageModel.clear_tables()
+    yield
+    TDamageModel.clear_tables()
+
+
+def test_split_and_ratios():
+    """Test HURT/STUN split from model instances, dicts and defaults."""
+    model = TDamageModel('kinetic', {'hurt': 0.8, 'stun': 0.2})
+    assert model.split(10) == pytest.approx((8.0, 2.0))
+    assert TDamageModel.ratios({'stun': 1.0}) == (1.0, 1.0)
+    assert TDamageModel.ratios(None) == (1.0, 0.0)
+
+
+def test_batch_accumulates_through_armour():
+    """Test auto-fire hits pass shield, resistance and armour value and are applied once per unit."""
+    unit = DummyUnit(health=20, armour=DummyArmour(shield=4))
+    model = TDamageModel('kinetic', {'hurt': 0.5, 'stun': 0.5})
+    hits = [(unit, 10, 'ballistic', model)] * 3
+    report = TDamageModel.resolve(hits)
+    # first hit: (10 - 4) * 0.5 - 2 = 1; next two: 10 * 0.5 - 2 = 3 each
+    assert report['units'][unit] == pytest.approx((3.5, 3.5))
+    assert unit.stats.hurt == pytest.approx(3.5)
+    assert unit.stats.stun == pytest.approx(3.5)
+    assert unit.armour.shield == 0
+
+
+def test_area_hits_destroy_terrain_and_kill():
+    """Test an explosion batch destroys walls once, logs terrain changes and updates unit status."""
+    battle = TBattle(DummyGenerator())
+    unit = DummyUnit(health=5)
+    battle.add_unit(unit, battle.SIDE_ENEMY, 2, 2)
+    wall_tile = battle.tiles[2][3]
+    wall_tile.wall_id = 'wall_001'
+    wall_tile.wall = TBattleWall(armor=5)
+    tile = battle.tiles[2][2]
+    report = tile.apply_area_damage(20, 'explosive', {'hurt': 1.0}, None, {'radius': 1, 'dropoff': 5}, battle, 2, 2)
+    assert report['killed'] == [unit]
+    assert unit.alive is False
+    walls = [entry for entry in report['destroyed'] if entry[1] == 'wall']
+    assert len(walls) == 1 and wall_tile.wall is None
+    assert any(e['type'] == 'terrain' for e in battle.log.events())
+
+
+def test_resistance_tables_are_per_damage_type():
+    """Test resistance lookups are cached per damage type and profile."""
+    armour_type = DummyArmourType()
+    assert TDamageModel.resistance(armour_type, 'ballistic') == 0.5
+    assert TDamageModel.resistance(armour_type, 'laser') == 1.0
+    assert set(TDamageModel._resistance_tables) == {'ballistic', 'laser'}
+    assert TDamageModel.resistance(object(), 'ballistic') == 1.0
+
+
+def test_unkeyed_resistances_are_not_cached():
+    """Test sources without a pid, even with the same material, are never served from the tables."""
+    class Component:
+        def __init__(self, resistances):
+            self.material = 'concrete'
+            self.resistances = resistances
+    assert TDamageModel.resistance(Component({'fire': 0.25}), 'fire') == 0.25
+    assert TDamageModel.resistance(Component({'fire': 2.0}), 'fire') == 2.0
+    assert TDamageModel._resistance_tables == {}
+
+
+def test_pipeline_logs_damage_per_unit():
+    """Test auto-fire through the pipeline logs one damage event per unit with the accumulated damage."""
+    battle = TBattle(DummyGenerator())
+    unit = DummyUnit(health=40)
+    battle.add_unit(unit, battle.SIDE_ENEMY, 2, 2)
+    TDamageModel.resolve([(unit, 5, 'ballistic', {'hurt': 0.5, 'stun': 0.5})] * 3, battle)
+    damage = [e for e in battle.log.events() if e['type'] == 'damage']
+    assert len(damage) == 1
+    assert battle.log.summarize()[unit]['damage_taken'] == pytest.approx(15.0)
+
+
+def test_damage_in_lookahead_is_rolled_back():
+    """Test unit HP and armour shield changed inside a lookahead are restored on rollback."""
+    battle = TBattle(DummyGenerator())
+    unit = DummyUnit(health=40, armour=DummyArmour(shield=4))
+    battle.add_unit(unit, battle.SIDE_ENEMY, 2, 2)
+    with battle.lookahead():
+        TDamageModel.resolve([(unit, 20, 'ballistic', None)], battle)
+        assert unit.stats.hurt > 0 and unit.armour.shield == 0
+    assert unit.stats.hurt == 0
+    assert unit.stats.stun == 0
+    assert unit.armour.shield == 4
+
+
+def test_area_event_hits_large_unit_once():
+    """Test an explosion covering all four tiles of a 2x2 unit damages it once."""
+    battle = TBattle(DummyGenerator())
+    unit = DummyUnit(health=100)
+    unit.size = 2
+    battle.add_unit(unit, battle.SIDE_ENEMY, 1, 1)
+    hits = [((x, y), 10, 'explosive', None) for x in range(4) for y in range(4)]
+    report = TDamageModel.resolve(hits, battle)
+    assert report['units'][unit] == pytest.approx((10.0, 0.0))
+    assert unit.stats.hurt == pytest.approx(10.0)
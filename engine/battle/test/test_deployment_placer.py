@@ -0,0 +1,93 @@
+"""
+Test suite for engine.battle.deployment_placer (TDeploymentPlacer)
+Covers candidate sets, sampling with occupancy, group roles and full deployments using pytest.
+"""
+import random
+import pytest
+from engine.battle.battle_tile import TBattleTile
+from engine.battle.deployment import TDeployment
+from engine.battle.deployment_group import TDeploymentGroup
+from engine.battle.deployment_placer import TDeploymentPlacer
+
+
+def make_tiles(width=10, height=10):
+    return [[TBattleTile('floor_001') for _ in range(width)] for _ in range(height)]
+
+
+UFO = [(x, y) for y in range(3) for x in range(3)]
+
+
+def test_candidate_sets_split_inside_outside():
+    """Test UFO tiles go to the inside set and blocked tiles to no set."""
+    tiles = make_tiles()
+    tiles[5][5].passable = False
+    placer = TDeploymentPlacer(tiles, UFO, rng=random.Random(1))
+    assert len(placer.candidates['inside']) == 9
+    assert len(placer.candidates['outside']) == 100 - 9 - 1
+    assert 5 * 10 + 5 not in placer.candidates['outside']
+
+
+def test_sampling_fills_set_without_overlap():
+    """Test sampling returns every free tile once, then None."""
+    placer = TDeploymentPlacer(make_tiles(), UFO, rng=random.Random(2))
+    positions = [placer.sample('inside') for _ in range(9)]
+    assert sorted(positions) == sorted(UFO)
+    assert placer.sample('inside') is None
+
+
+def test_group_roles_and_ufo_preference():
+    """Test leaders go inside the UFO and guards cluster around the first guard."""
+    placer = TDeploymentPlacer(make_tiles(20, 20), UFO, rng=random.Random(3))
+    leader = TDeploymentGroup({'leader': True})
+    placed = placer.place_group(leader, ['commander'])
+    assert placed[0][3] == 'leader' and placed[0][1:3] in UFO
+    guards = TDeploymentGroup({'guard': True, 'outside_ufo': 1.0})
+    placed = placer.place_group(guards, ['g1', 'g2', 'g3'])
+    ax, ay = placed[0][1:3]
+    assert all(max(abs(x - ax), abs(y - ay)) <= TDeploymentPlacer.GUARD_RADIUS for _, x, y, _ in placed)
+    assert all(role == 'guard' for *_, role in placed)
+
+
+def test_place_deployment_with_spawn_zone():
+    """Test a crowded deployment fills its spawn zone and stops when it is full."""
+    placer = TDeploymentPlacer(make_tiles(), spawn_zones={'player': [(0, 8, 10, 2)]}, rng=random.Random(4))
+    deployment = TDeployment('squad', {'units': [{'qty_low': 25, 'qty_high': 25, 'units': ['soldier']}]})
+    placed = placer.place_deployment(deployment, zone='player')
+    assert len(placed) == 20
+    assert len({(x, y) for _, x, y, _ in placed}) == 20
+    assert all(y >= 8 for _, _, y, _ in placed)
+
+
+def test_large_units_need_free_footprint():
+    """Test 2x2 units are placed on fully free footprints without overlaps."""
+    tiles = make_tiles(6, 6)
+    tiles[2][2].passable = False
+    placer = TDeploymentPlacer(tiles, rng=random.Random(5), unit_sizes={'reaper': 2})
+    group = TDeploymentGroup({'outside_ufo': 1.0})
+    placed = placer.place_group(group, ['reaper'] * 9)
+    covered = [(x + dx, y + dy) for _, x, y, _ in placed for dx in range(2) for dy in range(2)]
+    assert len(covered) == len(set(covered))
+    assert (2, 2) not in covered
+    assert 1 <= len(placed) < 9
+
+
+def test_from_generator_uses_ufo_block_footprints():
+    """Test UFO tiles come from UFO blocks of the generator's block grid, scaled by block size."""
+    from types import SimpleNamespace
+    generator = SimpleNamespace(block_size=2, block_grid=[['ufo', None], [None, 'field']],
+                                battle_map=make_tiles(4, 4),
+                                game=SimpleNamespace(mod=SimpleNamespace(map_blocks={'ufo': SimpleNamespace(size=1)})))
+    placer = TDeploymentPlacer.from_generator(generator, rng=random.Random(6))
+    assert sorted(placer.candidates['inside']) == [0, 1, 4, 5]
+    assert len(placer.candidates['outside']) == 12
+
+
+def test_seeded_placer_gives_same_deployment():
+    """Test unit counts and types are picked with the placer's rng, not the global random state."""
+    data = {'units': [{'qty_low': 1, 'qty_high': 6, 'units': {'sectoid': 3, 'floater': 1}}]}
+    runs = []
+    for noise in (1, 2):
+        random.seed(noise)
+        placer = TDeploymentPlacer(make_tiles(), UFO, rng=random.Random(7))
+        runs.append(placer.place_deployment(TDeployment('crew', data)))
+    assert runs[0] == runs[1]
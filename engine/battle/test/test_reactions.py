@@ -4,5 +4,117 @@ Covers all public methods and edge cases using pytest.
 """
 import pytest
 from engine.battle import reactions
+from engine.battle.battle import TBattle
+from engine.battle.battle_tile import TBattleTile
+from engine.battle.reactions import TReactionFire
+from engine.unit.unit_stat import TUnitStats
 
-# Add your test cases here following best practices
+
+class DummyGenerator:
+    def generate(self):
+        return [[TBattleTile('floor_001') for _ in range(12)] for _ in range(12)]
+
+
+class DummyUnit:
+    def __init__(self, reflex=10, health=30):
+        self.stats = TUnitStats({'health': health, 'reflex': reflex, 'aim': 100, 'sight': (8, 4)})
+        self.alive = True
+        self.stunned = False
+
+
+class DummyItemType:
+    pid = 'rifle'
+    unit_damage_type = 'ballistic'
+    modes = {'snap': None}
+
+    def get_mode_parameters(self, mode_name):
+        return {'ap_cost': 1, 'range': 6, 'accuracy': 100, 'shots': 1, 'damage': 10}
+
+
+@pytest.fixture
+def battle():
+    battle = TBattle(DummyGenerator(), seed=3)
+    for side_fog in battle.fog_of_war:
+        for row in side_fog:
+            row[:] = [2] * len(row)
+    return battle
+
+
+def test_watch_zone_limited_by_range_and_walls(battle):
+    """Test the watch zone covers visible tiles within weapon range and is indexed per tile."""
+    watcher = DummyUnit()
+    battle.add_unit(watcher, battle.SIDE_ENEMY, 0, 0)
+    battle.set_terrain(3, 0, 'wall_id', 'wall_001')
+    assert battle.reactions.set_overwatch(watcher, DummyItemType())
+    assert battle.reactions.watchers_at(0, 2, 2) == [watcher]
+    assert battle.reactions.watchers_at(0, 7, 7) == []
+    assert battle.reactions.watchers_at(0, 5, 0) == []
+    assert watcher.stats.action_points_left == watcher.stats.action_points - TReactionFire.OVERWATCH_AP
+
+
+def test_terrain_change_updates_nearby_zones(battle):
+    """Test removing a wall refreshes the zone of watchers in range."""
+    watcher = DummyUnit()
+    battle.add_unit(watcher, battle.SIDE_ENEMY, 0, 0)
+    battle.set_terrain(3, 0, 'wall_id', 'wall_001')
+    battle.reactions.set_overwatch(watcher, DummyItemType())
+    battle.set_terrain(3, 0, 'wall_id', None)
+    assert battle.reactions.watchers_at(0, 5, 0) == [watcher]
+
+
+def test_move_along_triggers_only_zone_watchers(battle):
+    """Test a moving unit is shot only by hostile watchers of the tiles it enters."""
+    alien, far_alien, soldier = DummyUnit(reflex=100), DummyUnit(reflex=100), DummyUnit(reflex=1)
+    battle.add_unit(alien, battle.SIDE_ENEMY, 6, 0)
+    battle.add_unit(far_alien, battle.SIDE_ENEMY, 11, 11)
+    battle.add_unit(soldier, battle.SIDE_PLAYER, 0, 0)
+    battle.reactions.set_overwatch(alien, DummyItemType())
+    battle.reactions.set_overwatch(far_alien, DummyItemType())
+    shots = battle.reactions.move_along(soldier, [(1, 0), (2, 0)])
+    assert {watcher for watcher, _ in shots} == {alien}
+    assert (soldier.x, soldier.y) == (2, 0)
+    assert any(e['type'] == 'shot' for e in battle.log.events())
+
+
+def test_moving_watcher_leaves_overwatch(battle):
+    """Test a watcher that moves is removed from the index."""
+    watcher = DummyUnit()
+    battle.add_unit(watcher, battle.SIDE_ENEMY, 0, 0)
+    battle.reactions.set_overwatch(watcher, DummyItemType())
+    battle.reactions.move_along(watcher, [(1, 1)])
+    assert not battle.reactions.is_watching(watcher)
+    assert battle.reactions.index == {}
+
+
+def test_rollback_restores_overwatch_and_ap(battle):
+    """Test overwatch entries, zones and AP changed in a lookahead are restored by rollback."""
+    watcher, other = DummyUnit(), DummyUnit()
+    battle.add_unit(watcher, battle.SIDE_ENEMY, 0, 0)
+    battle.add_unit(other, battle.SIDE_ENEMY, 11, 11)
+    battle.reactions.set_overwatch(other, DummyItemType())
+    ap = watcher.stats.action_points_left
+    index = {key: list(units) for key, units in battle.reactions.index.items()}
+    with battle.lookahead():
+        battle.reactions.set_overwatch(watcher, DummyItemType())
+        battle.reactions.cancel_overwatch(other)
+        assert watcher.stats.action_points_left == ap - 1
+    assert watcher.stats.action_points_left == ap
+    assert not battle.reactions.is_watching(watcher)
+    assert battle.reactions.is_watching(other)
+    assert {key: list(units) for key, units in battle.reactions.index.items()} == index
+
+
+def test_rollback_refreshes_only_touched_watchers(battle, monkeypatch):
+    """Test rollback re-registers only watchers whose state or nearby terrain changed."""
+    near, far = DummyUnit(), DummyUnit()
+    battle.add_unit(near, battle.SIDE_ENEMY, 0, 0)
+    battle.add_unit(far, battle.SIDE_ENEMY, 11, 11)
+    battle.reactions.set_overwatch(near, DummyItemType())
+    battle.reactions.set_overwatch(far, DummyItemType())
+    registered = []
+    original = battle.reactions._register
+    monkeypatch.setattr(battle.reactions, '_register', lambda unit: registered.append(unit) or original(unit))
+    with battle.lookahead():
+        battle.set_terrain(1, 1, 'wall_id', 'wall_001')
+        registered.clear()
+    assert registered == [near]
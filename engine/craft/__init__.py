@@ -8,14 +8,18 @@ Imports all classes for handling craft management, including craft entities, inv
 Last standardized: 2025-06-14
 """
 from .craft import TCraft
+from .autopilot import TCraftAutopilot
 from .craft_inv_manager import TCraftInventoryManager, CraftInventoryTemplate
 from .craft_type import TCraftType
 from .interception import TInterception
+from .interception_batch import TInterceptionBatch
 
 __all__ = [
     "TCraft",
+    "TCraftAutopilot",
     "TCraftInventoryManager",
     "CraftInventoryTemplate",
     "TCraftType",
     "TInterception",
+    "TInterceptionBatch",
 ]
@@ -0,0 +1,388 @@
+"""
+autopilot.py
+
+Defines the TCraftAutopilot class, an event-driven scheduler for craft automation (patrol, auto-intercept,
+auto-return and auto-resupply). Crafts are not polled every tick: each craft is woken only when something relevant
+happens to it (radar contact with a UFO in intercept range, fuel reaching the return threshold, arrival at a patrol
+waypoint or at its base). Crafts idle at their bases cost nothing while nothing is happening. UFO positions come
+from the world's location registry, whose 'ufo' updates wake the crafts watching that area.
+
+Classes:
+    TCraftAutopilot: Event-driven automation scheduler for a fleet of crafts.
+
+Last standardized: 2026-10-18
+"""
+import math
+
+from engine.globe.spatial_grid import TSpatialGrid
+from engine.globe.world_locations import TWorldLocations
+from engine.lore.scheduler import TScheduler
+
+
+class TCraftAutopilot:
+    """
+    Event-driven automation of crafts on the world map, measured in movement ticks.
+    Each craft has at most one pending wake-up in a TScheduler (keyed by the craft). Flights are advanced in closed
+    form between events, and only airborne crafts are touched when time advances.
+    UFOs are read from a TWorldLocations registry (kind 'ufo') for "UFOs within intercept range" queries; the
+    autopilot watches the registry, and crafts watching for contacts (auto-intercept enabled, idle or patrolling,
+    fuel above the threshold) are kept in a spatial grid so that a UFO update wakes only the crafts in range of it.
+
+    Attributes:
+        width (int|None): World width for horizontal wrap.
+        intercept_range (float): Radar range in tiles within which auto-intercept crafts react to UFOs.
+        contact_range (float): Distance in tiles at which an intercepting craft engages its target.
+        fuel_threshold (float): Fuel fraction at which auto-return sends a craft home.
+        fuel_per_tick (float): Fuel used per tick of flight.
+        retarget_ticks (int): Ticks between course corrections while chasing a moving UFO.
+        on_engage (callable|None): Function(craft, ufo) called when a craft reaches its target.
+        scheduler (TScheduler): Pending craft wake-ups by tick.
+        tick (int): Current tick.
+        homes (dict): Craft -> (x, y) base position.
+        modes (dict): Craft -> 'idle', 'patrol', 'intercept' or 'return'.
+        targets (dict): Craft -> UFO being intercepted.
+        patrol_index (dict): Craft -> index of the current patrol waypoint.
+        flying (dict): Craft -> tick up to which its flight was advanced.
+        ufos (TWorldLocations): Location registry holding the UFO positions (shared with the world map).
+        watchers (TSpatialGrid): Positions of crafts watching for radar contacts.
+        decisions (int): Number of craft decisions taken (wake-ups run).
+    """
+
+    def __init__(self, width=None, intercept_range=20.0, contact_range=1.0, fuel_threshold=0.2, fuel_per_tick=1.0,
+                 retarget_ticks=5, cell_size=8, on_engage=None, locations=None):
+        """
+        Initialize an autopilot without crafts.
+
+        Args:
+            width (int, optional): World width in tiles; enables horizontal wrap (defaults to the registry's width).
+            intercept_range (float): Radar range in tiles.
+            contact_range (float): Engagement distance in tiles.
+            fuel_threshold (float): Fuel fraction triggering auto-return.
+            fuel_per_tick (float): Fuel used per tick of flight.
+            retarget_ticks (int): Ticks between course corrections while chasing.
+            cell_size (int): Spatial grid cell size in tiles.
+            on_engage (callable, optional): Function(craft, ufo) called on contact (e.g. an interception).
+            locations (TWorldLocations, optional): The world's location registry; a private one if omitted.
+        """
+        if locations is None:
+            locations = TWorldLocations(None, cell_size, width)
+        self.width = width or locations.width
+        self.intercept_range = intercept_range
+        self.contact_range = contact_range
+        self.fuel_threshold = fuel_threshold
+        self.fuel_per_tick = fuel_per_tick
+        self.retarget_ticks = retarget_ticks
+        self.on_engage = on_engage
+        self.scheduler = TScheduler()
+        self.tick = 0
+        self.homes = {}
+        self.modes = {}
+        self.targets = {}
+        self.patrol_index = {}
+        self.flying = {}
+        self.ufos = locations
+        self.ufos.watch('ufo', self._on_ufo)
+        self.watchers = TSpatialGrid(cell_size, self.width)
+        self.decisions = 0
+
+    # Fleet and UFO registration
+
+    def register(self, craft, home=None):
+        """
+        Put a craft under autopilot control.
+
+        Args:
+            craft (TCraft): Craft to control.
+            home (tuple, optional): Base position; defaults to the craft's current position.
+        """
+        position = home if home is not None else craft.position
+        self.homes[craft] = (position[0], position[1])
+        self.modes[craft] = 'idle'
+        self.patrol_index[craft] = 0
+        if craft.flight is not None:
+            self.flying[craft] = self.tick
+        self._update_watch(craft)
+        if (craft.ai_patrol_enabled and craft.patrol_route) or craft.flight is not None or self._contacts(craft):
+            self.wake(craft)
+
+    def unregister(self, craft):
+        """
+        Release a craft from autopilot control.
+
+        Args:
+            craft (TCraft): Controlled craft.
+        """
+        self.scheduler.cancel(craft)
+        self.watchers.remove(craft)
+        for table in (self.homes, self.modes, self.targets, self.patrol_index, self.flying):
+            table.pop(craft, None)
+
+    def update_ufo(self, ufo, x, y):
+        """
+        Record a UFO position in the registry (UFOs on the world map do this themselves when they move).
+
+        Args:
+            ufo (TUfo): UFO.
+            x (float): X coordinate.
+            y (float): Y coordinate.
+        """
+        self.ufos.add(ufo, 'ufo', x, y)
+
+    def remove_ufo(self, ufo):
+        """
+        Remove a UFO from the registry (landed, left or shot down).
+
+        Args:
+            ufo (TUfo): UFO.
+        """
+        self.ufos.remove(ufo)
+
+    def _on_ufo(self, ufo, position):
+        """
+        Registry watcher: a UFO appeared or moved (wake watching crafts that have it in range) or was removed
+        (wake the crafts chasing it).
+
+        Args:
+            ufo (TUfo): UFO.
+            position (tuple|None): New (x, y), None when removed.
+        """
+        if position is None:
+            for craft, target in list(self.targets.items()):
+                if target is ufo:
+                    self.wake(craft)
+            return
+        if ufo in self.targets.values():
+            return
+        for craft, _ in self.watchers.query_radius(position[0], position[1], self.intercept_range):
+            self.wake(craft)
+
+    def wake(self, craft, tick=None):
+        """
+        Request a decision for a craft (no-op if one is already due earlier).
+
+        Args:
+            craft (TCraft): Controlled craft.
+            tick (int, optional): Tick of the decision; defaults to the current tick.
+        """
+        tick = self.tick if tick is None else tick
+        due = self.scheduler.due_day(craft)
+        if due is None or due > tick:
+            self.scheduler.schedule(tick, lambda day: self._decide(craft), key=craft)
+
+    # Time
+
+    def advance(self, ticks):
+        """
+        Advance time, jumping from one craft event to the next.
+
+        Args:
+            ticks (int): Ticks to advance.
+        Returns:
+            int: Decisions taken.
+        """
+        end = self.tick + ticks
+        start = self.decisions
+        while True:
+            due = self.scheduler.next_day()
+            self.tick = end if due is None or due > end else max(due, self.tick)
+            self._sync_flights()
+            self.decisions += self.scheduler.run_until(self.tick)
+            if self.tick >= end:
+                return self.decisions - start
+
+    def _sync_flights(self):
+        """
+        Advance airborne crafts to the current tick, burning fuel and checking their radar.
+        """
+        for craft, last in list(self.flying.items()):
+            ticks = self.tick - last
+            if ticks <= 0:
+                continue
+            used = craft.advance_flight(ticks)
+            craft.current_fuel -= used * self.fuel_per_tick
+            if craft.flight is None:
+                del self.flying[craft]
+            else:
+                self.flying[craft] = self.tick
+            if craft in self.watchers:
+                self.watchers.move(craft, craft.position[0], craft.position[1])
+                if self._contacts(craft):
+                    self.wake(craft)
+
+    # Decisions
+
+    def _decide(self, craft):
+        """
+        Take one automation decision for a woken craft.
+
+        Args:
+            craft (TCraft): Controlled craft.
+        Returns:
+            int|None: Tick of the next wake-up, or None to sleep until an event.
+        """
+        if craft not in self.modes:
+            return None
+        mode = self.modes[craft]
+        at_home = craft.flight is None and self._distance(craft.position, self.homes[craft]) < 1e-9
+        if mode == 'intercept':
+            mode = 'idle'
+            ufo = self.targets.pop(craft, None)
+            if self.ufos.kinds.get(ufo) == 'ufo':
+                if self._distance(craft.position, self.ufos.position(ufo)) <= self.contact_range:
+                    if self.on_engage is not None:
+                        self.on_engage(craft, ufo)
+                elif not self._low_fuel(craft):
+                    self.targets[craft] = ufo
+                    return self._chase(craft, ufo)
+        if mode == 'return' and not at_home:
+            return self._next_wake(craft)
+        if at_home and craft.ai_auto_resupply_enabled and craft.current_fuel < craft.max_fuel:
+            craft.current_fuel = craft.max_fuel
+            self._notify(craft, "Resupplied at base.")
+        if self._low_fuel(craft):
+            if at_home:
+                return self._set_mode(craft, 'idle')
+            self._notify(craft, "Auto-returning to base due to low fuel.")
+            self._fly(craft, self.homes[craft])
+            self._set_mode(craft, 'return')
+            return self._next_wake(craft)
+        if craft.ai_auto_intercept_enabled:
+            contacts = self._contacts(craft)
+            if contacts:
+                ufo = contacts[0][0]
+                self.targets[craft] = ufo
+                self._set_mode(craft, 'intercept')
+                self._notify(craft, "Auto-intercepting UFO.")
+                return self._chase(craft, ufo)
+        if craft.ai_patrol_enabled and craft.patrol_route:
+            route = craft.patrol_route
+            index = self.patrol_index[craft]
+            if mode == 'patrol' and craft.flight is None:
+                index = (index + 1) % len(route)
+                self.patrol_index[craft] = index
+            if mode != 'patrol' or craft.flight is None:
+                self._fly(craft, route[index])
+            self._set_mode(craft, 'patrol')
+            return self._next_wake(craft)
+        if not at_home and craft.ai_auto_return_enabled:
+            if craft.flight is None or mode != 'return':
+                self._fly(craft, self.homes[craft])
+            self._set_mode(craft, 'return')
+            return self._next_wake(craft)
+        self._set_mode(craft, 'idle')
+        return self._next_wake(craft) if craft.flight is not None else None
+
+    def _chase(self, craft, ufo):
+        """
+        Aim a craft at the current position of its target.
+
+        Args:
+            craft (TCraft): Intercepting craft.
+            ufo (TUfo): Target.
+        Returns:
+            int: Tick of the next course correction (or arrival).
+        """
+        self._fly(craft, self.ufos.position(ufo))
+        return self._next_wake(craft, self.retarget_ticks)
+
+    def _fly(self, craft, target):
+        """
+        Start a flight leg and track the craft as airborne.
+
+        Args:
+            craft (TCraft): Craft.
+            target (tuple): (x, y) destination.
+        """
+        craft.fly_to((target[0], target[1]), self.width)
+        self.flying[craft] = self.tick
+
+    def _next_wake(self, craft, limit=math.inf):
+        """
+        Tick of the next event of an airborne craft: arrival or reaching the fuel threshold.
+
+        Args:
+            craft (TCraft): Craft.
+            limit (float): Upper bound on the ticks until the wake-up.
+        Returns:
+            int|None: Wake-up tick, or None if nothing will happen.
+        """
+        ticks = limit
+        if craft.flight is not None:
+            ticks = min(ticks, craft.flight.remaining)
+            if craft.ai_auto_return_enabled and self.fuel_per_tick > 0 and self.modes[craft] != 'return':
+                spare = craft.current_fuel - self.fuel_threshold * craft.max_fuel
+                ticks = min(ticks, math.ceil(spare / self.fuel_per_tick))
+        if ticks == math.inf:
+            return None
+        return self.tick + max(1, int(ticks))
+
+    def _set_mode(self, craft, mode):
+        """
+        Change the mode of a craft and refresh whether it watches for radar contacts.
+
+        Args:
+            craft (TCraft): Craft.
+            mode (str): New mode.
+        """
+        self.modes[craft] = mode
+        self._update_watch(craft)
+
+    def _update_watch(self, craft):
+        """
+        Add or remove a craft from the radar watcher grid.
+
+        Args:
+            craft (TCraft): Craft.
+        """
+        if craft.ai_auto_intercept_enabled and self.modes[craft] in ('idle', 'patrol') and not self._low_fuel(craft):
+            self.watchers.insert(craft, craft.position[0], craft.position[1])
+        else:
+            self.watchers.remove(craft)
+
+    def _contacts(self, craft):
+        """
+        UFOs within intercept range of a craft that no other craft is chasing.
+
+        Args:
+            craft (TCraft): Craft.
+        Returns:
+            list: (ufo, distance) pairs, nearest first.
+        """
+        chased = set(map(id, self.targets.values()))
+        return [pair for pair in self.ufos.within(craft.position[0], craft.position[1], self.intercept_range, 'ufo')
+                if id(pair[0]) not in chased]
+
+    def _low_fuel(self, craft):
+        """
+        Check whether auto-return should send a craft home.
+
+        Args:
+            craft (TCraft): Craft.
+        Returns:
+            bool: True if auto-return is enabled and fuel is at or below the threshold.
+        """
+        return craft.ai_auto_return_enabled and craft.current_fuel <= self.fuel_threshold * craft.max_fuel
+
+    def _distance(self, a, b):
+        """
+        Wrap-aware distance between two positions.
+
+        Args:
+            a (sequence): (x, y) position.
+            b (sequence): (x, y) position.
+        Returns:
+            float: Distance in tiles.
+        """
+        return self.watchers.distance(a[0], a[1], b[0], b[1])
+
+    @staticmethod
+    def _notify(craft, message):
+        """
+        Send a notification to a craft if it supports them.
+
+        Args:
+            craft (TCraft): Craft.
+            message (str): Notification text.
+        """
+        if hasattr(craft, 'add_notification'):
+            craft.add_notification(message)
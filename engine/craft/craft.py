@@ -10,6 +10,8 @@ Last standardized: 2025-06-14
 """
 
 from engine.globe.location import TLocation
+from engine.globe.movement import TGlobeMovement
+from engine.globe.world_locations import TWorldLocations
 from engine.globe.world_point import TWorldPoint
 from typing import List, Optional, Dict, Any
 
@@ -35,6 +37,7 @@ class TCraft(TLocation):
         ai_auto_return_enabled (bool): Whether auto-return is enabled.
         ai_auto_resupply_enabled (bool): Whether auto-resupply is enabled.
         patrol_route (list): List of patrol waypoints.
+        flight (TGlobeMovement|None): Current movement leg on the world map.
     """
     def __init__(self, pid, data : dict = {}):
         """
@@ -68,6 +71,7 @@ class TCraft(TLocation):
         self.crew_status: Dict[Any, str] = {unit: 'active' for unit in self.crew}  # e.g., 'active', 'wounded', 'dead'
         self.mission: Optional[Dict[str, Any]] = None  # Mission assignment
         self.notifications: List[str] = []  # Notification queue
+        self.flight: Optional[TGlobeMovement] = None  # Current movement leg
         # AI/Automation attributes
         self.ai_patrol_enabled = data.get('ai_patrol_enabled', False)
         self.ai_auto_intercept_enabled = data.get('ai_auto_intercept_enabled', False)
@@ -75,6 +79,16 @@ class TCraft(TLocation):
         self.ai_auto_resupply_enabled = data.get('ai_auto_resupply_enabled', True)
         self.patrol_route = data.get('patrol_route', [])  # List of waypoints
 
+    @property
+    def type(self):
+        """
+        Craft type (the name TInterception and TInterceptionBatch read combat stats from).
+
+        Returns:
+            TCraftType: The craft's type.
+        """
+        return self.craft_type
+
     def get_ammo_status(self):
         """
         Returns remaining ammo for each item in the craft's inventory.
@@ -253,24 +267,57 @@ class TCraft(TLocation):
         self.ai_auto_resupply_enabled = False
         self.add_notification("Auto-resupply disabled.")
 
-    def ai_tick(self):
+    def fly_to(self, target, width=None):
+        """
+        Start flying towards a world position along the shortest (wrapped) path at the craft type's speed.
+        A launched craft is registered in the world's location registry.
+
+        Args:
+            target (tuple): (x, y) target position.
+            width (int, optional): World width for wrap; defaults to the game's world map width.
+        Returns:
+            TGlobeMovement: The new movement leg.
+        """
+        if width is None:
+            width = getattr(getattr(self.game, 'worldmap', None), 'width', None)
+        self.flight = TGlobeMovement(self.position, target, getattr(self.craft_type, 'speed', 0), width)
+        locations = TWorldLocations.of(self.game)
+        if locations is not None:
+            locations.place(self, 'craft')
+        return self.flight
+
+    def advance_flight(self, ticks=1):
         """
-        Process automation routines for the craft. Should be called each turn/day.
+        Advance the current movement leg by a number of ticks in one jump.
 
-        Handles patrol, auto-intercept, auto-return, and auto-resupply logic.
+        Args:
+            ticks (int): Ticks to advance.
+        Returns:
+            int: Ticks used; the flight is cleared once the target is reached. A craft registered in the world's
+                location registry is moved there as well.
         """
-        if self.ai_patrol_enabled and self.patrol_route:
-            self.add_notification("Patrolling route.")
-            # Move to next waypoint (not implemented)
-        if self.ai_auto_intercept_enabled:
-            self.add_notification("Auto-intercept check.")
-            # Check for nearby UFOs and intercept (not implemented)
-        if self.ai_auto_return_enabled:
-            if hasattr(self, 'current_fuel') and hasattr(self, 'max_fuel'):
-                if self.current_fuel < self.max_fuel * 0.2:
-                    self.add_notification("Auto-returning to base due to low fuel.")
-                    # Return to base (not implemented)
-        if self.ai_auto_resupply_enabled:
-            # If at base and low on fuel/ammo, trigger resupply (not implemented)
-            pass
+        if self.flight is None:
+            return 0
+        used = self.flight.advance(ticks)
+        self.position = list(self.flight.position)
+        locations = TWorldLocations.of(self.game)
+        if locations is not None:
+            locations.update(self, *self.position)
+        if self.flight.arrived:
+            self.flight = None
+        return used
 
+    def ai_tick(self, autopilot):
+        """
+        Request an automation decision from the craft's autopilot at its current tick.
+
+        Patrol, auto-intercept, auto-return and auto-resupply are event-driven: TCraftAutopilot wakes the craft on
+        radar contact, fuel threshold and waypoint arrival, so the craft is not polled every turn. Call this after
+        changing automation flags or the patrol route.
+
+        Args:
+            autopilot (TCraftAutopilot): Autopilot controlling the craft.
+        """
+        if self not in autopilot.modes:
+            autopilot.register(self)
+        autopilot.wake(self)
@@ -11,6 +11,7 @@ Last standardized: 2025-06-14
 
 import random
 from engine.craft.craft import TCraft
+from engine.craft.interception_batch import TInterceptionBatch
 from engine.craft.craft_type import TCraftType
 from engine.item.craft_item import TCraftItem
 from location.ufo import TUfo
@@ -149,6 +150,47 @@ class TInterception:
             return False
         return True
 
+    def predict(self, trials=2000, seed=None, **kwargs):
+        """
+        Estimate the outcome of the fight from its current state with a vectorized batch simulation.
+
+        Args:
+            trials (int): Number of simulated fights.
+            seed (int, optional): Random seed.
+            **kwargs: disengage / max_turns for TInterceptionBatch.
+
+        Returns:
+            dict: Win/loss/escape probabilities, mean turns and mean remaining craft health.
+        """
+        return TInterceptionBatch.from_interception(self, **kwargs).predict(trials, seed)
+
+    def auto_resolve(self, seed=None, **kwargs):
+        """
+        Resolve the fight to the end without per-action logging (AI-vs-AI or auto-intercept).
+        Health, weapon ammo, distance, turn and crash status are updated from one simulated fight.
+
+        Args:
+            seed (int, optional): Random seed.
+            **kwargs: disengage / max_turns for TInterceptionBatch.
+
+        Returns:
+            str: 'win' (UFO crashed), 'loss' (craft crashed) or 'escape'.
+        """
+        result = TInterceptionBatch.from_interception(self, **kwargs).run(1, seed)
+        for idx, craft in enumerate(self.crafts):
+            craft.health = type(craft.health)(result['health'][0, idx])
+            for w, weapon in enumerate(getattr(craft, 'weapons', [])):
+                if hasattr(weapon, 'ammo'):
+                    weapon.ammo = int(result['ammo'][0, idx, w])
+        self.crashed = [bool(c) for c in result['crashed'][0]]
+        self.distance = float(result['distance'][0])
+        self.turn += int(result['turns'][0])
+        if self.crashed[1]:
+            return 'win'
+        if self.crashed[0]:
+            return 'loss'
+        return 'escape'
+
     def next_turn(self):
         """
         Advance the interception to the next turn, refueling, rearming, and repairing crafts as needed.
@@ -0,0 +1,156 @@
+"""
+interception_batch.py
+
+Defines the TInterceptionBatch class, a vectorized simulation of an interception between an XCOM craft and a UFO.
+Thousands of fights are played at once as numpy arrays following the TInterception rules (distance, 4 AP per turn,
+weapon range, accuracy, damage, ammo and crash chance), giving win/crash probabilities before engaging and a cheap
+auto-resolve (one trial) for AI-vs-AI or auto-intercept fights. No per-action log strings are built.
+
+Classes:
+    TInterceptionBatch: Vectorized batch of interception fights.
+
+Last standardized: 2026-10-18
+"""
+import numpy as np
+
+
+class TInterceptionBatch:
+    """
+    Batch of interception fights between side 0 (XCOM craft) and side 1 (UFO) played in parallel.
+    Each AP, every side that is still flying fires its first loaded weapon in range, otherwise closes in while it
+    has ammo and is above its disengage health, otherwise moves away. A fight ends when a side crashes, the distance
+    exceeds 100 km or `max_turns` turns have passed.
+
+    Attributes:
+        health (np.ndarray): float [side] starting health.
+        max_health (np.ndarray): float [side] type health (crash threshold base).
+        acceleration (np.ndarray): float [side] km per move action.
+        weapon_range (np.ndarray): float [side, weapon] range in km (-1 for padding slots, which never fire).
+        hit_chance (np.ndarray): float [side, weapon] hit probability.
+        damage (np.ndarray): float [side, weapon] damage per hit.
+        ammo (np.ndarray): float [side, weapon] ammo (inf for weapons without ammo).
+        distance (float): Starting distance in km.
+        crashed (np.ndarray): bool [side] crash state at the start.
+        disengage (np.ndarray): float [side] health fraction below which a side moves away.
+        max_turns (int): Turn limit of a fight.
+    """
+    AP = 4
+    ESCAPE_DISTANCE = 100
+
+    def __init__(self, craft, ufo, distance=100, crashed=(False, False), disengage=(0.0, 0.0), max_turns=50):
+        """
+        Read the combat stats of both sides.
+
+        Args:
+            craft: XCOM craft (health, type, weapons).
+            ufo: UFO (health, type, weapons).
+            distance (int): Starting distance in km.
+            crashed (sequence): Crash state of both sides.
+            disengage (sequence): Health fraction per side below which it breaks off.
+            max_turns (int): Turn limit of a fight.
+        """
+        sides = (craft, ufo)
+        weapons = [list(getattr(side, 'weapons', []) or []) for side in sides]
+        count = max(1, max(len(w) for w in weapons))
+        self.health = np.array([float(side.health) for side in sides])
+        self.max_health = np.array([float(side.type.health) for side in sides])
+        self.acceleration = np.array([float(getattr(side.type, 'acceleration', 3)) for side in sides])
+        self.weapon_range = np.full((2, count), -1.0)
+        self.hit_chance = np.zeros((2, count))
+        self.damage = np.zeros((2, count))
+        self.ammo = np.zeros((2, count))
+        for s, side in enumerate(sides):
+            for w, weapon in enumerate(weapons[s]):
+                self.weapon_range[s, w] = weapon.range * 10  # weapon.range is in 10km units
+                self.hit_chance[s, w] = getattr(weapon, 'accuracy', 0.5) + getattr(side.type, 'hit_bonus', 0)
+                self.damage[s, w] = getattr(weapon, 'damage', 1) + getattr(side.type, 'damage_bonus', 0)
+                self.ammo[s, w] = getattr(weapon, 'ammo', np.inf)
+        self.distance = float(distance)
+        self.crashed = np.array(crashed, dtype=bool)
+        self.disengage = np.array(disengage, dtype=float)
+        self.max_turns = max_turns
+
+    @classmethod
+    def from_interception(cls, interception, **kwargs):
+        """
+        Build a batch from the current state of a TInterception.
+
+        Args:
+            interception (TInterception): Ongoing interception.
+            **kwargs: disengage / max_turns.
+        Returns:
+            TInterceptionBatch: Batch starting from the interception's distance and crash state.
+        """
+        craft, ufo = interception.crafts
+        return cls(craft, ufo, interception.distance, interception.crashed, **kwargs)
+
+    def run(self, trials=1000, rng=None):
+        """
+        Play a number of fights to the end.
+
+        Args:
+            trials (int): Number of fights.
+            rng (np.random.Generator|int, optional): Random generator or seed.
+        Returns:
+            dict: Final per-trial arrays: 'health' [trial, side], 'ammo' [trial, side, weapon], 'crashed'
+                [trial, side], 'distance' [trial], 'turns' [trial].
+        """
+        rng = np.random.default_rng(rng)
+        health = np.tile(self.health, (trials, 1))
+        ammo = np.tile(self.ammo, (trials, 1, 1))
+        crashed = np.tile(self.crashed, (trials, 1))
+        distance = np.full(trials, self.distance)
+        turns = np.zeros(trials, dtype=np.int64)
+        threshold = self.max_health * 0.5
+        rows = np.arange(trials)
+        active = ~crashed.any(axis=1) & (distance <= self.ESCAPE_DISTANCE)
+        for turn in range(self.max_turns):
+            if not active.any():
+                break
+            turns[active] += 1
+            for _ in range(self.AP):
+                for side in (0, 1):
+                    acting = active & ~crashed[:, side]
+                    if not acting.any():
+                        continue
+                    target = 1 - side
+                    loaded = ammo[:, side] > 0
+                    in_range = loaded & (self.weapon_range[side] >= distance[:, None])
+                    fire = acting & in_range.any(axis=1)
+                    retreat = acting & ~fire & (~loaded.any(axis=1)
+                                                | (health[:, side] < self.disengage[side] * self.max_health[side]))
+                    close = acting & ~fire & ~retreat
+                    distance[close] = np.maximum(0, distance[close] - self.acceleration[side])
+                    distance[retreat] += self.acceleration[side]
+                    if fire.any():
+                        weapon = in_range.argmax(axis=1)
+                        hit = fire & (rng.random(trials) < self.hit_chance[side, weapon])
+                        health[hit, target] -= self.damage[side, weapon[hit]]
+                        ammo[rows[fire], side, weapon[fire]] -= 1
+                        # Crash chance grows with damage taken beyond half health (10% minimum)
+                        over = threshold[target] - health[:, target]
+                        chance = np.clip(over / threshold[target], 0.1, 1.0)
+                        crashed[:, target] |= hit & (over >= 0) & (rng.random(trials) < chance)
+                    active &= ~crashed.any(axis=1) & (distance <= self.ESCAPE_DISTANCE)
+        return {'health': health, 'ammo': ammo, 'crashed': crashed, 'distance': distance, 'turns': turns}
+
+    def predict(self, trials=2000, rng=None):
+        """
+        Estimate the outcome probabilities of the fight.
+
+        Args:
+            trials (int): Number of simulated fights.
+            rng (np.random.Generator|int, optional): Random generator or seed.
+        Returns:
+            dict: 'win' (UFO crashed), 'loss' (craft crashed), 'escape' (neither crashed), 'turns' (mean turns)
+                and 'craft_health' (mean remaining craft health).
+        """
+        result = self.run(trials, rng)
+        crashed = result['crashed']
+        return {
+            'win': float(np.mean(crashed[:, 1])),
+            'loss': float(np.mean(crashed[:, 0])),
+            'escape': float(np.mean(~crashed.any(axis=1))),
+            'turns': float(result['turns'].mean()),
+            'craft_health': float(result['health'][:, 0].mean()),
+        }
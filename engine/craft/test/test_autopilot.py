@@ -0,0 +1,111 @@
+"""
+Test suite for engine.craft.autopilot (TCraftAutopilot)
+Covers event-driven patrol, auto-intercept and auto-return using pytest.
+"""
+from types import SimpleNamespace
+
+from engine.craft.autopilot import TCraftAutopilot
+from engine.craft.craft import TCraft
+
+
+def make_craft(position=(10, 10), speed=1, fuel=100, **flags):
+    # Bypass __init__ (it needs the game singleton and a loaded mod)
+    craft = TCraft.__new__(TCraft)
+    craft.game = SimpleNamespace(worldmap=None)
+    craft.craft_type = SimpleNamespace(speed=speed, range=fuel)
+    craft.position = list(position)
+    craft.flight = None
+    craft.max_fuel = craft.current_fuel = fuel
+    craft.notifications = []
+    craft.ai_patrol_enabled = flags.get('patrol', False)
+    craft.ai_auto_intercept_enabled = flags.get('intercept', False)
+    craft.ai_auto_return_enabled = flags.get('auto_return', True)
+    craft.ai_auto_resupply_enabled = True
+    craft.patrol_route = flags.get('route', [])
+    return craft
+
+
+def test_idle_fleet_takes_no_decisions():
+    """Test crafts idle at base are never woken while nothing happens."""
+    autopilot = TCraftAutopilot(width=100)
+    for i in range(24):
+        autopilot.register(make_craft(position=(i * 4, 10), intercept=True))
+    assert autopilot.advance(1000) == 0
+    assert len(autopilot.scheduler) == 0
+
+
+def test_patrol_wakes_only_on_waypoint_arrival():
+    """Test a patrolling craft is woken once per waypoint and cycles its route across the seam."""
+    craft = make_craft(position=(98, 10), patrol=True, route=[(2, 10), (6, 10)], fuel=1000)
+    autopilot = TCraftAutopilot(width=100)
+    autopilot.register(craft)
+    assert autopilot.advance(4) == 2
+    assert craft.position == [2, 10]
+    assert autopilot.patrol_index[craft] == 1
+    assert autopilot.advance(4) == 1
+    assert craft.position == [6, 10]
+    assert autopilot.patrol_index[craft] == 0
+    assert craft.current_fuel == 1000 - 8
+
+
+def test_radar_contact_engages_and_returns_home():
+    """Test a UFO in range wakes only nearby crafts, contact engages it and the craft returns home to resupply."""
+    engaged = []
+    autopilot = TCraftAutopilot(width=100, intercept_range=15)
+
+    def engage(craft, ufo):
+        engaged.append((craft, ufo))
+        autopilot.remove_ufo(ufo)
+
+    autopilot.on_engage = engage
+    craft = make_craft(position=(10, 10), speed=2, fuel=20, intercept=True)
+    far = make_craft(position=(60, 10), intercept=True)
+    autopilot.register(craft)
+    autopilot.register(far)
+    ufo = object()
+    autopilot.update_ufo(ufo, 20, 10)
+    assert autopilot.scheduler.due_day(far) is None
+    autopilot.advance(5)
+    assert engaged == [(craft, ufo)]
+    assert autopilot.modes[craft] == 'return'
+    autopilot.advance(5)
+    assert craft.position == [10, 10]
+    assert craft.current_fuel == 20
+    assert autopilot.modes[craft] == 'idle'
+    assert autopilot.modes[far] == 'idle'
+
+
+def test_fuel_threshold_wakes_auto_return():
+    """Test a patrolling craft is woken when fuel reaches the threshold and flies home."""
+    craft = make_craft(position=(10, 10), fuel=10, patrol=True, route=[(50, 10)])
+    autopilot = TCraftAutopilot(width=100)
+    autopilot.register(craft)
+    assert autopilot.advance(8) == 2
+    assert craft.position == [18, 10]
+    assert autopilot.modes[craft] == 'return'
+    assert "Auto-returning to base due to low fuel." in craft.notifications
+    autopilot.advance(8)
+    assert craft.position == [10, 10]
+    assert craft.current_fuel == 10
+    assert autopilot.modes[craft] == 'patrol'
+
+
+def test_ufos_are_read_from_the_world_registry():
+    """Test a UFO moving in the world's location registry wakes a watching craft, which launches into the registry."""
+    from engine.globe.world import TWorld
+    world = TWorld('earth', {'size': [100, 20]})
+    autopilot = TCraftAutopilot(locations=world.locations)
+    assert autopilot.width == 100
+    craft = make_craft(position=(10, 10), speed=2, intercept=True)
+    craft.game = SimpleNamespace(worldmap=world)
+    autopilot.register(craft)
+    ufo = object()
+    world.locations.add(ufo, 'ufo', 90, 10)
+    assert autopilot.scheduler.due_day(craft) is None
+    world.locations.move(ufo, 98, 10)
+    assert autopilot.scheduler.due_day(craft) == 0
+    autopilot.advance(1)
+    assert autopilot.targets[craft] is ufo
+    assert world.locations.kinds[craft] == 'craft'
+    world.locations.remove(ufo)
+    assert autopilot.scheduler.due_day(craft) == 1
@@ -0,0 +1,49 @@
+"""
+Test suite for engine.craft.interception_batch (TInterceptionBatch)
+Covers batch outcome prediction and reproducibility using pytest.
+"""
+from types import SimpleNamespace
+
+from engine.craft.interception_batch import TInterceptionBatch
+
+
+def make_side(health, weapons, acceleration=3):
+    return SimpleNamespace(health=health, type=SimpleNamespace(health=health, acceleration=acceleration),
+                           weapons=weapons)
+
+
+def make_weapon(range_, accuracy, damage, ammo):
+    return SimpleNamespace(range=range_, accuracy=accuracy, damage=damage, ammo=ammo)
+
+
+def test_predict_favours_armed_side():
+    """Test an armed craft beats an unarmed UFO that cannot escape and probabilities sum to one."""
+    craft = make_side(100, [make_weapon(3, 0.8, 30, 50)])
+    ufo = make_side(60, [], acceleration=0)
+    batch = TInterceptionBatch(craft, ufo, distance=50)
+    result = batch.predict(trials=500, rng=1)
+    assert result['win'] == 1.0
+    assert result['loss'] == 0.0
+    assert abs(result['win'] + result['loss'] + result['escape'] - 1.0) < 1e-9
+    assert result['craft_health'] == 100
+
+
+def test_unarmed_fight_ends_in_escape():
+    """Test sides without ammo move apart until the fight breaks off."""
+    craft = make_side(100, [make_weapon(3, 0.8, 30, 0)])
+    ufo = make_side(60, [])
+    result = TInterceptionBatch(craft, ufo, distance=90).run(10, rng=0)
+    assert not result['crashed'].any()
+    assert (result['distance'] > 100).all()
+    assert (result['turns'] == 1).all()
+
+
+def test_run_is_reproducible_and_spends_ammo():
+    """Test the same seed gives the same fights and fired ammo is deducted."""
+    craft = make_side(100, [make_weapon(2, 0.5, 10, 6)])
+    ufo = make_side(100, [make_weapon(2, 0.5, 10, 6)])
+    batch = TInterceptionBatch(craft, ufo, distance=20)
+    first, second = batch.run(200, rng=7), batch.run(200, rng=7)
+    assert (first['health'] == second['health']).all()
+    assert (first['ammo'] <= 6).all() and (first['ammo'] >= 0).all()
+    assert (first['ammo'][:, 0, 0] < 6).all()
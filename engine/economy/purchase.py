@@ -268,16 +268,18 @@ class TPurchase:
                 # Apply reputation discount
                 total_cost = self.black_market.apply_reputation_effects(total_cost, entry.supplier)
 
-        # Place the order
-        order = self.purchase_manager.place_order(
-            base_id=base_id,
-            entry_id=entry_id,
-            quantity=quantity,
-            total_cost=total_cost,
-            delivery_time=delivery_time,
-            supplier=entry.supplier,
-            delivery_contents=delivery_contents
-        )
+        # Place the order (the game's delivery schedule is caught up before and rescheduled after)
+        from engine.engine.game import TGame
+        with TGame.system_change('deliveries'):
+            order = self.purchase_manager.place_order(
+                base_id=base_id,
+                entry_id=entry_id,
+                quantity=quantity,
+                total_cost=total_cost,
+                delivery_time=delivery_time,
+                supplier=entry.supplier,
+                delivery_contents=delivery_contents
+            )
 
         # Record purchase against monthly limit
         entry.record_purchase(quantity)
@@ -28,6 +28,9 @@ class TPurchaseEntry:
         items_buy (any): Items received on purchase.
         units_buy (any): Units received on purchase.
         crafts_buy (any): Crafts received on purchase.
+        black_market (bool): Whether the entry is sold by a black market supplier.
+        monthly_limit (int): Units that can be bought per month (0 = unlimited).
+        current_month_purchased (int): Units bought this month.
     """
     def __init__(self, pid, data=None):
         """
@@ -51,4 +54,81 @@ class TPurchaseEntry:
         self.country_needed = data.get('country_needed', [])
         self.items_buy = data.get('items_buy', None)
         self.units_buy = data.get('units_buy', None)
-        self.crafts_buy = data.get('crafts_buy', None)
\ No newline at end of file
+        self.crafts_buy = data.get('crafts_buy', None)
+        self.black_market = data.get('black_market', False)
+        self.monthly_limit = data.get('monthly_limit', 0)
+        self.current_month_purchased = 0
+
+    @property
+    def is_available(self):
+        """
+        Whether the entry can currently be ordered (monthly quota not used up).
+
+        Returns:
+            bool: True if at least one more unit can be bought this month.
+        """
+        return self.can_purchase(1)
+
+    def get_remaining_monthly_quota(self):
+        """
+        Units that can still be bought this month.
+
+        Returns:
+            int|None: Remaining units, or None if the entry has no monthly limit.
+        """
+        if not self.monthly_limit:
+            return None
+        return max(0, self.monthly_limit - self.current_month_purchased)
+
+    def can_purchase(self, quantity):
+        """
+        Check the monthly limit for an order.
+
+        Args:
+            quantity (int): Units to buy.
+        Returns:
+            bool: True if the quantity fits in this month's quota.
+        """
+        remaining = self.get_remaining_monthly_quota()
+        return remaining is None or quantity <= remaining
+
+    def record_purchase(self, quantity):
+        """
+        Count an order against this month's quota.
+
+        Args:
+            quantity (int): Units bought.
+        """
+        self.current_month_purchased += quantity
+
+    def reset_monthly_limit(self):
+        """
+        Start a new month's quota.
+        """
+        self.current_month_purchased = 0
+
+    def get_total_cost(self, quantity):
+        """
+        Price of an order.
+
+        Args:
+            quantity (int): Units to buy.
+        Returns:
+            int: Total cost.
+        """
+        return self.purchase_cost * quantity
+
+    def get_delivery_contents(self, quantity):
+        """
+        What an order delivers, in the purchase order format.
+
+        Args:
+            quantity (int): Units bought.
+        Returns:
+            dict: {'items'|'units'|'crafts': {id: quantity}} for the non-empty outputs.
+        """
+        contents = {}
+        for content_type, output in (('items', self.items_buy), ('units', self.units_buy), ('crafts', self.crafts_buy)):
+            if output:
+                contents[content_type] = {pid: count * quantity for pid, count in output.items()}
+        return contents
@@ -140,6 +140,15 @@ class PurchaseManager:
         if self.current_month not in self.monthly_purchases:
             self.monthly_purchases[self.current_month] = {}
     
+    def has_pending_orders(self) -> bool:
+        """
+        Check whether any order still waits to be sent to transit.
+
+        Returns:
+            bool: True if an order has status 'ordered'.
+        """
+        return any(order.status == 'ordered' for orders in self.active_orders.values() for order in orders)
+
     def process_daily_orders(self, transfer_manager) -> List[Tuple[str, PurchaseOrder]]:
         """
         Process all active orders for daily delivery updates.
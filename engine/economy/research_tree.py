@@ -27,6 +27,8 @@ class TResearchTree:
         assign_scientists(tech_id, scientists): Assign scientists to a tech.
         progress_all_research(): Advance all in-progress research.
         daily_progress(): Advance all research by one day.
+        advance_days(days): Advance all research by several days at once.
+        days_to_next_completion(): Days until the next research completes.
         is_completed(tech_id): Check if a tech is completed.
         lock_entry(tech_id), unlock_entry(tech_id): Lock/unlock a tech.
         _requirements_met(entry): Check if requirements are met for a tech.
@@ -68,7 +70,9 @@ class TResearchTree:
             tech_id (str): Technology ID to start.
         """
         if tech_id in self.available and tech_id not in self.in_progress and tech_id not in self.locked:
-            self.in_progress[tech_id] = 0
+            from engine.engine.game import TGame
+            with TGame.system_change('research'):
+                self.in_progress[tech_id] = 0
 
     def progress_research(self, tech_id, points):
         """
@@ -136,8 +140,10 @@ class TResearchTree:
             scientists (int): Number of scientists to assign.
         """
         if tech_id in self.in_progress:
-            self.in_progress[tech_id] = self.in_progress.get(tech_id, 0)
-            self.entries[tech_id].assigned_scientists = scientists
+            # Days before the reassignment are credited at the old staffing
+            from engine.engine.game import TGame
+            with TGame.system_change('research'):
+                self.entries[tech_id].assigned_scientists = scientists
 
     def progress_all_research(self):
         """
@@ -152,11 +158,21 @@ class TResearchTree:
         """
         Advance all research by one day (alias for progress_all_research).
         """
+        return self.advance_days(1)
+
+    def advance_days(self, days):
+        """
+        Advance all research by several days at once (progress grows linearly with assigned scientists).
+        Args:
+            days (int): Days to advance.
+        Returns:
+            list: Tech ids completed.
+        """
         completed_today = []
         for tech_id in list(self.in_progress.keys()):
             entry = self.entries[tech_id]
             scientists = getattr(entry, 'assigned_scientists', 0)
-            self.in_progress[tech_id] += scientists
+            self.in_progress[tech_id] += scientists * days
             if self.in_progress[tech_id] >= entry.cost:
                 self.complete_research(tech_id)
                 # Free scientists
@@ -164,6 +180,21 @@ class TResearchTree:
                 completed_today.append(tech_id)
         return completed_today
 
+    def days_to_next_completion(self):
+        """
+        Days until the first in-progress research with assigned scientists completes.
+        Returns:
+            int|None: Days left, or None if no research is progressing.
+        """
+        days = None
+        for tech_id, progress in self.in_progress.items():
+            entry = self.entries[tech_id]
+            scientists = getattr(entry, 'assigned_scientists', 0)
+            if scientists > 0:
+                left = max(1, -(-(entry.cost - progress) // scientists))
+                days = left if days is None else min(days, left)
+        return days
+
     def is_completed(self, tech_id):
         """
         Check if a technology is completed.
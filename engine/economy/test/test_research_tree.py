@@ -6,3 +6,16 @@ import pytest
 from engine.economy import research_tree
 
 # Add your test cases here following best practices
+
+
+def test_research_jumps_to_next_completion():
+    """Test research advances several days at once and predicts its completion day."""
+    tree = research_tree.TResearchTree()
+    entry = type('Entry', (), {'id': 'laser', 'cost': 100, 'prerequisites': [], '_cost_randomized': True,
+                               'assigned_scientists': 7})()
+    tree.entries['laser'] = entry
+    tree.in_progress['laser'] = 0
+    assert tree.days_to_next_completion() == 15
+    assert tree.advance_days(14) == []
+    assert tree.advance_days(1) == ['laser']
+    assert tree.days_to_next_completion() is None
@@ -6,3 +6,15 @@ import pytest
 from engine.economy import ttransfer
 
 # Add your test cases here following best practices
+
+
+def test_transfers_jump_to_next_delivery():
+    """Test several days can be ticked at once and the next delivery day is known."""
+    manager = ttransfer.TransferManager()
+    manager.add_transit(ttransfer.TTransfer('t1', 'OMEGA', 'item', 'rifle', 2, 5))
+    manager.add_transit(ttransfer.TTransfer('t2', 'OMEGA', 'item', 'clip', 4, 9))
+    assert manager.days_to_next_delivery() == 5
+    delivered = []
+    manager.tick_all(lambda *args: delivered.append(args), days=5)
+    assert delivered == [('OMEGA', 'item', 'rifle', 2)]
+    assert manager.days_to_next_delivery() == 4
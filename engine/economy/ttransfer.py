@@ -25,7 +25,7 @@ class TTransfer:
         status (str): 'in_transit', 'delivered', or 'cancelled'.
     
     Methods:
-        tick(): Progress the transit by one day.
+        tick(days): Progress the transit by one or more days.
         is_delivered(): Check if the transit is delivered.
         cancel(): Cancel the transit if still in transit.
     """
@@ -38,12 +38,14 @@ class TTransfer:
         self.days_left = days_required
         self.status = 'in_transit'  # in_transit, delivered, cancelled
 
-    def tick(self):
+    def tick(self, days=1):
         """
-        Progress the transit by one day. Mark as delivered if days_left reaches zero.
+        Progress the transit by one or more days. Mark as delivered if days_left reaches zero.
+        Args:
+            days (int): Days to progress.
         """
         if self.status == 'in_transit' and self.days_left > 0:
-            self.days_left -= 1
+            self.days_left = max(0, self.days_left - days)
             if self.days_left <= 0:
                 self.status = 'delivered'
 
@@ -72,7 +74,8 @@ class TransferManager:
     
     Methods:
         add_transit(transit): Add a new transit to the manager.
-        tick_all(base_storage_lookup): Progress all transits by one day and deliver if ready.
+        tick_all(base_storage_lookup, days): Progress all transits and deliver if ready.
+        days_to_next_delivery(): Days until the earliest transit arrives.
     """
     def __init__(self):
         self.transits = []  # List of Transit objects
@@ -85,14 +88,23 @@ class TransferManager:
         """
         self.transits.append(transit)
 
-    def tick_all(self, base_storage_lookup):
+    def tick_all(self, base_storage_lookup, days=1):
         """
-        Progress all transits by one day. Deliver to base storage if ready.
+        Progress all transits by one or more days. Deliver to base storage if ready.
         Args:
             base_storage_lookup (callable): Function(base_id, object_type, object_id, quantity) to add delivered goods.
+            days (int): Days to progress.
         """
         for transit in list(self.transits):
-            transit.tick()
+            transit.tick(days)
             if transit.is_delivered():
                 base_storage_lookup(transit.base_id, transit.object_type, transit.object_id, transit.quantity)
                 self.transits.remove(transit)
+
+    def days_to_next_delivery(self):
+        """
+        Days until the earliest transit in progress is delivered.
+        Returns:
+            int|None: Days left of the earliest transit, or None if nothing is in transit.
+        """
+        return min((t.days_left for t in self.transits if t.status == 'in_transit'), default=None)
@@ -12,6 +12,7 @@ from .game import TGame
 from .mod import TMod
 from .modloader import TModLoader
 from .savegame import TSaveGame
+from .simulator import TCampaignPolicy, TCampaignSimulator, THeuristicPolicy, TScriptedPolicy
 from .sounds import TSoundManager
 from .stats import TStatistics
 
@@ -22,6 +23,10 @@ __all__ = [
     "TMod",
     "TModLoader",
     "TSaveGame",
+    "TCampaignPolicy",
+    "TCampaignSimulator",
+    "THeuristicPolicy",
+    "TScriptedPolicy",
     "TSoundManager",
     "TStatistics",
 ]
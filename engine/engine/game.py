@@ -11,6 +11,7 @@ Last standardized: 2025-06-15
 
 from ..craft.craft import TCraft
 from ..globe.world import TWorld
+from ..globe.world_locations import TWorldLocations
 from ..lore.campaign import TCampaign
 from ..lore.calendar import TCalendar
 from ..economy.research_tree import TResearchTree
@@ -21,6 +22,7 @@ from ..lore.faction import TFaction
 from ..base.xbase import TBaseXCom  # Fixed import path
 from .mod import TMod, TUnitCategory, TItemCategory
 from ..base.facility import TFacility, TFacilityType
+from contextlib import contextmanager
 from pathlib import Path
 import os
 import yaml
@@ -55,6 +57,9 @@ class TGame:
         # Calendar for date, turn, and event triggers
         self.calendar : TCalendar = None
 
+        # Calendar day each geoscape subsystem was last advanced to (see schedule_systems)
+        self.system_days : Dict[str, int] = {}
+
         # XCOM budget, funding, and scoring
         self.budget = 0
         self.funding = 0
@@ -161,7 +166,12 @@ class TGame:
         if name in self.bases:
             return False
 
-        self.bases[name] = base
+        # Facilities already under construction at the base progress from today on
+        with self.system_change('facilities'):
+            self.bases[name] = base
+        locations = TWorldLocations.of(self)
+        if locations is not None:
+            locations.place(base, 'base')
 
         # If this is our first base, make it active
         if self.current_base_name is None:
@@ -182,6 +192,10 @@ class TGame:
         if name not in self.bases:
             return False
 
+        locations = TWorldLocations.of(self)
+        if locations is not None:
+            locations.remove(self.bases[name])
+
         # If removing the active base, we need to set a new active base
         if self.current_base_name == name:
             self.bases.pop(name)
@@ -521,52 +535,137 @@ class TGame:
         """Get the purchase system instance."""
         return self.purchase_system
 
+    # Geoscape subsystems driven by calendar scheduler events
+    GEOSCAPE_SYSTEMS = ('deliveries', 'research', 'facilities')
+
     def setup_calendar_integration(self):
         """
         Setup integration between game systems and calendar events.
         This should be called after all systems are initialized.
+        Daily subsystems are not ticked every day: each registers its next due day with the calendar scheduler
+        (see schedule_systems), so advancing time jumps between deliveries, research and construction completions.
         """
         if self.calendar:
             # Override calendar methods to call our game logic
-            original_on_day = self.calendar.on_day
             original_on_month = self.calendar.on_month
-            
-            def enhanced_on_day(*args, **kwargs):
-                original_on_day(*args, **kwargs)
-                self.on_daily_tick()
-            
+
             def enhanced_on_month(*args, **kwargs):
                 original_on_month(*args, **kwargs)
                 self.on_monthly_tick()
-            
-            self.calendar.on_day = enhanced_on_day
+
             self.calendar.on_month = enhanced_on_month
-            
+            self.schedule_systems()
+
             print("Calendar integration setup completed")
 
-    def on_daily_tick(self):
+    def schedule_systems(self):
         """
-        Called every day by the calendar system.
-        Processes all daily game events including transfers and purchases.
+        Bring every geoscape subsystem up to the current day and (re)register its next due day.
+        Changes made outside of the subsystems' events go through system_change(), which calls this afterwards.
         """
-        print(f"Processing daily tick for {self.calendar.get_date()}")
-        
-        # Process transfers and purchases
-        self.process_daily_transfers_and_purchases()
-        
-        # Process research if available
-        if self.research_tree:
-            completed_research = self.research_tree.daily_progress()
+        if not self.calendar:
+            return
+        today = self.calendar.total_days
+        for name in self.GEOSCAPE_SYSTEMS:
+            self._catch_up_system(name, today)
+            due = self._system_due_in(name)
+            if due is None:
+                self.calendar.scheduler.cancel(name)
+            else:
+                self.calendar.scheduler.schedule(today + due, self._run_system, key=name)
+
+    @classmethod
+    @contextmanager
+    def system_change(cls, name):
+        """
+        Context for changing a geoscape subsystem outside of its events (research started or scientists
+        reassigned, facility placed, order created). The subsystem is caught up to today before the change, so the
+        elapsed days are credited to the old state only, and every subsystem is rescheduled after it.
+        Does nothing while no game with a calendar exists.
+
+        Args:
+            name (str): Subsystem name (GEOSCAPE_SYSTEMS).
+        """
+        game = cls._instance if cls._initialized else None
+        calendar = game.calendar if game is not None else None
+        if calendar is not None:
+            game._catch_up_system(name, calendar.total_days)
+        yield
+        if calendar is not None:
+            game.schedule_systems()
+
+    def _run_system(self, day):
+        """
+        Scheduler callback: run every geoscape subsystem due on a day.
+
+        Args:
+            day (int): Calendar total_days of the event.
+        Returns:
+            None; due subsystems are rescheduled by schedule_systems().
+        """
+        self.schedule_systems()
+        return None
+
+    def _catch_up_system(self, name, today):
+        """
+        Advance one subsystem by the days elapsed since it last ran.
+
+        Args:
+            name (str): Subsystem name (GEOSCAPE_SYSTEMS).
+            today (int): Calendar total_days.
+        """
+        days = today - self.system_days.get(name, today)
+        self.system_days[name] = today
+        if days > 0:
+            self._advance_system(name, days)
+
+    def _advance_system(self, name, days):
+        """
+        Advance one subsystem by a number of days in one step.
+
+        Args:
+            name (str): Subsystem name (GEOSCAPE_SYSTEMS).
+            days (int): Days elapsed.
+        """
+        if name == 'deliveries':
+            # Transfers that complete delivery are added to base inventory, ready orders are sent to transit
+            self.transfer_manager.tick_all(self._add_delivered_items_to_base, days)
+            if self.purchase_system:
+                self.purchase_system.process_daily_purchases(self.transfer_manager)
+        elif name == 'research' and self.research_tree:
+            completed_research = self.research_tree.advance_days(days)
             if completed_research:
                 print(f"Research completed: {', '.join(completed_research)}")
-        
-        # Process base facilities (construction progress)
-        for base in self.bases.values():
-            for facility in base.facilities:
-                if not facility.completed:
-                    facility.build_day()
-                    if facility.completed:
-                        print(f"Facility construction completed at {base.name}: {facility.facility_type.name}")
+        elif name == 'facilities':
+            for base in self.bases.values():
+                for facility in base.facilities.values():
+                    if not facility.completed:
+                        facility.build_days(days)
+                        if facility.completed:
+                            base.facilities_version += 1
+                            print(f"Facility construction completed at {base.name}: {facility.facility_type.name}")
+
+    def _system_due_in(self, name):
+        """
+        Days until a subsystem next needs to run.
+
+        Args:
+            name (str): Subsystem name (GEOSCAPE_SYSTEMS).
+        Returns:
+            int|None: Days from today, or None if nothing is pending.
+        """
+        if name == 'deliveries':
+            due = self.transfer_manager.days_to_next_delivery()
+            if self.purchase_system and self.purchase_system.purchase_manager.has_pending_orders():
+                due = 1  # order readiness is checked daily
+            return due
+        if name == 'research':
+            return self.research_tree.days_to_next_completion() if self.research_tree else None
+        if name == 'facilities':
+            days = [facility.days_left() for base in self.bases.values() for facility in base.facilities.values()
+                    if not facility.completed]
+            return min(days) if days else None
+        return None
 
     def on_monthly_tick(self):
         """
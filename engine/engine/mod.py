@@ -19,9 +19,10 @@ from pytmx import TiledTileset
 from base.facility_type import TFacilityType
 from battle.battle_script import TBattleScript  # Fixed import
 from battle.deployment import TDeployment      # Fixed import
+from engine.battle.battle_tile_type import TBattleTileTypes
 from engine.battle.objective import TBattleObjective
 from battle.battle_effect import TBattleEffect  # Fixed import
-from battle.damage_model import TDamageModel    # Fixed import
+from engine.battle.damage_model import TDamageModel
 from battle.map_block import TMapBlock          # Fixed import
 from battle.terrain import TTerrain             # Fixed import
 from battle.tileset_manager import TTilesetManager  # Fixed import
@@ -420,6 +421,19 @@ class TMod:
             self.weapon_modes[pid] = obj
         print(f"Loaded {len(self.weapon_modes)} item modes")
 
+        # DAMAGE MODELS (HURT/STUN split per damage type)
+
+        datas = mod_data.get('damage_models', {})
+        for pid, dat in datas.items():
+            obj = TDamageModel(pid, dat)
+            self.damage_models[pid] = obj
+        TDamageModel.clear_tables()
+
+        # BATTLE TILE TYPES (shared floor/wall/roof records per tile id)
+
+        TBattleTileTypes.clear()
+        TBattleTileTypes.load(mod_data.get('tiles', {}))
+
         datas = mod_data.get('craft_items', {})
         for pid, dat in datas.items():
             dat['category'] = EItemCategory.CRAFT_ITEM
@@ -0,0 +1,430 @@
+"""
+engine/engine/simulator.py
+
+Defines the headless campaign simulator used for balance runs. It boots a mod without the GUI, advances the
+calendar through whole years while a player policy makes the strategic decisions (research picks, purchases,
+interceptions of the UFOs in the world's location registry), and reports funding, score and tech progression per
+month. Many seeds can be fanned out over a
+process pool.
+
+Classes:
+    TCampaignPolicy: Base player policy (makes no decisions).
+    THeuristicPolicy: Greedy policy: cheapest research first, buys a shopping list while money allows.
+    TScriptedPolicy: Policy following a fixed research order and monthly purchase plan.
+    TCampaignSimulator: Headless campaign runner producing a per-month report.
+
+Last standardized: 2026-10-18
+"""
+import random
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+class TCampaignPolicy:
+    """
+    Player decisions for the headless simulator; the base policy makes none.
+    Policies are called once per game week and must be picklable to run in a process pool.
+
+    Attributes:
+        name (str): Policy name shown in reports.
+    """
+    name = 'idle'
+
+    def choose_research(self, game, available) -> List[Tuple[str, int]]:
+        """
+        Pick research projects to start.
+
+        Args:
+            game (TGame): Game state.
+            available (list): TResearchEntry objects that can be started.
+        Returns:
+            list: (tech id, scientists) pairs.
+        """
+        return []
+
+    def choose_purchases(self, game) -> List[Tuple[str, str, int]]:
+        """
+        Pick purchase orders to place.
+
+        Args:
+            game (TGame): Game state.
+        Returns:
+            list: (purchase entry id, base id, quantity) triples.
+        """
+        return []
+
+    def choose_interceptions(self, game, ufos) -> list:
+        """
+        Pick UFOs to intercept.
+
+        Args:
+            game (TGame): Game state.
+            ufos (list): UFOs currently on the world map.
+        Returns:
+            list: UFOs to intercept.
+        """
+        return []
+
+
+class THeuristicPolicy(TCampaignPolicy):
+    """
+    Greedy policy: keeps a number of projects running (cheapest available first), re-buys a shopping list each
+    month while the budget stays above a reserve, and intercepts every UFO.
+
+    Attributes:
+        projects (int): Research projects kept running.
+        scientists (int): Scientists assigned to each project.
+        shopping_list (dict): Purchase entry id -> quantity bought each month.
+        reserve (int): Budget kept unspent.
+    """
+    name = 'heuristic'
+
+    def __init__(self, projects=2, scientists=10, shopping_list=None, reserve=0):
+        """
+        Initialize the policy.
+
+        Args:
+            projects (int): Research projects kept running.
+            scientists (int): Scientists assigned to each project.
+            shopping_list (dict, optional): Purchase entry id -> monthly quantity.
+            reserve (int): Budget kept unspent.
+        """
+        self.projects = projects
+        self.scientists = scientists
+        self.shopping_list = shopping_list or {}
+        self.reserve = reserve
+        self._bought_month = None
+
+    def choose_research(self, game, available):
+        free = self.projects - len(game.research_tree.in_progress)
+        cheapest = sorted(available, key=lambda entry: (entry.cost, entry.id))
+        return [(entry.id, self.scientists) for entry in cheapest[:max(0, free)]]
+
+    def choose_purchases(self, game):
+        month = (game.calendar.year, game.calendar.month)
+        if month == self._bought_month or game.budget <= self.reserve or not game.bases:
+            return []
+        self._bought_month = month
+        base_id = game.current_base_name or next(iter(game.bases))
+        return [(entry_id, base_id, quantity) for entry_id, quantity in self.shopping_list.items()]
+
+    def choose_interceptions(self, game, ufos):
+        return list(ufos)
+
+
+class TScriptedPolicy(TCampaignPolicy):
+    """
+    Policy following a fixed research order (one project at a time) and a purchase plan per campaign month.
+
+    Attributes:
+        research_order (list): Tech ids in the order they are researched.
+        scientists (int): Scientists assigned to the current project.
+        purchase_plan (dict): Campaign month index (0 = first month) -> list of (entry id, quantity).
+    """
+    name = 'scripted'
+
+    def __init__(self, research_order=(), scientists=10, purchase_plan=None):
+        """
+        Initialize the policy.
+
+        Args:
+            research_order (sequence): Tech ids in research order.
+            scientists (int): Scientists assigned to the current project.
+            purchase_plan (dict, optional): Campaign month index -> list of (entry id, quantity).
+        """
+        self.research_order = list(research_order)
+        self.scientists = scientists
+        self.purchase_plan = purchase_plan or {}
+        self._done_months = set()
+
+    def choose_research(self, game, available):
+        if game.research_tree.in_progress:
+            return []
+        ids = {entry.id for entry in available}
+        for tech_id in self.research_order:
+            if tech_id in ids:
+                return [(tech_id, self.scientists)]
+        return []
+
+    def choose_purchases(self, game):
+        month = game.calendar.total_days // 30
+        if month in self._done_months or not game.bases:
+            return []
+        self._done_months.add(month)
+        base_id = game.current_base_name or next(iter(game.bases))
+        return [(entry_id, base_id, quantity) for entry_id, quantity in self.purchase_plan.get(month, [])]
+
+
+class TCampaignSimulator:
+    """
+    Headless campaign runner: boots a mod, advances the calendar for a number of years and lets a policy play.
+    Weekly, the policy picks research, purchases and interceptions (from the UFOs registered in the world's
+    TWorldLocations); monthly, country funding is rolled up (TFunding) and a report row is recorded. Time advances through the calendar scheduler, so quiet stretches
+    are skipped.
+
+    Attributes:
+        mod_path (Path): Mod directory.
+        policy (TCampaignPolicy): Player policy.
+        seed (int): Random seed of the run.
+        years (int): Campaign length in years.
+        start_budget (int): Budget at the start of the campaign.
+        interception_resolver (callable): Function(game, ufo) -> score change for an interception.
+        game (TGame|None): Game being simulated.
+        funding (TFunding|None): Funding manager of the mod's countries.
+        months (list): Per-month report rows.
+        techs (list): (total_days, tech id) of completed research.
+        interceptions (int): Interceptions attempted.
+    """
+
+    def __init__(self, mod_path, policy: Optional[TCampaignPolicy] = None, seed: int = 0, years: int = 1,
+                 start_budget: int = 1000, interception_resolver: Optional[Callable] = None):
+        """
+        Initialize a simulator run.
+
+        Args:
+            mod_path (str|Path): Mod directory (e.g. mods/xcom).
+            policy (TCampaignPolicy, optional): Player policy; defaults to THeuristicPolicy().
+            seed (int): Random seed.
+            years (int): Campaign length in years (360-day calendar years).
+            start_budget (int): Budget at the start of the campaign.
+            interception_resolver (callable, optional): Function(game, ufo) -> score change; defaults to
+                auto_intercept().
+        """
+        self.mod_path = Path(mod_path)
+        self.policy = policy or THeuristicPolicy()
+        self.seed = seed
+        self.years = years
+        self.start_budget = start_budget
+        self.interception_resolver = interception_resolver or self.auto_intercept
+        self.game = None
+        self.funding = None
+        self.months: List[Dict[str, Any]] = []
+        self.techs: List[Tuple[int, str]] = []
+        self.interceptions = 0
+
+    def boot(self):
+        """
+        Create a fresh game from the mod without any GUI: mod data, starting bases, calendar, research tree
+        and purchase system.
+
+        Returns:
+            TGame: The booted game.
+        """
+        from engine.engine.game import TGame
+        from engine.engine.mod import TMod
+        from engine.engine.modloader import TModLoader
+        from engine.economy.research_tree import TResearchTree
+        from engine.lore.calendar import TCalendar
+
+        random.seed(self.seed)
+        # TGame is a singleton; start every run from a clean instance
+        TGame._instance = None
+        TGame._initialized = False
+        game = TGame()
+        loader = TModLoader(self.mod_path.name, self.mod_path)
+        loader.load_all_yaml_files()
+        game.mod = TMod(loader.yaml_data, self.mod_path)
+        game.mod.load_objects_from_data()
+        game.initialize_starting_bases()
+
+        game.calendar = TCalendar()
+        start = str(loader.yaml_data.get('calendar', {}).get('start_day', '2000-01-01'))
+        year, month, day = (int(part) for part in start.split('-'))
+        game.calendar.set_start_date(year, month, min(day, 30))
+
+        game.research_tree = TResearchTree()
+        for pid, entry in game.mod.researches.items():
+            entry.id = pid
+            game.research_tree.add_entry(entry)
+        game.initialize_purchase_system({'purchasing': loader.yaml_data.get('purchasing', {})})
+        game.budget = self.start_budget
+        return game
+
+    def attach(self, game):
+        """
+        Hook the simulator into a game's calendar (weekly decisions, monthly rollup).
+
+        Args:
+            game (TGame): Game with calendar and research tree set up.
+        """
+        from engine.globe.funding import TFunding
+
+        self.game = game
+        self.funding = TFunding(list(game.mod.countries.values()) if game.mod else [],
+                                world=getattr(game, 'worldmap', None))
+        game.calendar.on_week = self.on_week
+        game.calendar.on_month = self.on_month
+        game.schedule_systems()
+
+    def run(self, game=None) -> Dict[str, Any]:
+        """
+        Play the campaign for the configured number of years.
+
+        Args:
+            game (TGame, optional): Already set-up game; booted from the mod if omitted.
+        Returns:
+            dict: Report (see report()).
+        """
+        if game is None:
+            game = self.boot()
+        else:
+            random.seed(self.seed)
+        self.attach(game)
+        self.on_week()
+        game.calendar.advance_days(self.years * 360)
+        return self.report()
+
+    def on_week(self, *args, **kwargs):
+        """
+        Weekly calendar hook: record completed research and apply the policy's decisions.
+        """
+        from engine.globe.world_locations import TWorldLocations
+
+        game = self.game
+        tree = game.research_tree
+        # Credit the days before today at the old assignments, so new projects only progress from today on
+        game.schedule_systems()
+        self._record_techs()
+        for tech_id, scientists in self.policy.choose_research(game, tree.get_available_research()):
+            tree.start_research(tech_id)
+            tree.assign_scientists(tech_id, scientists)
+        if game.purchase_system:
+            for entry_id, base_id, quantity in self.policy.choose_purchases(game):
+                ok, order = game.purchase_system.place_purchase_order(
+                    entry_id, base_id, quantity, available_technologies=sorted(tree.completed),
+                    available_money=game.budget)
+                if ok:
+                    game.budget -= order.total_cost
+        locations = TWorldLocations.of(game)
+        ufos = locations.items('ufo') if locations is not None else []
+        for ufo in self.policy.choose_interceptions(game, ufos):
+            self.interceptions += 1
+            game.scoring += self.interception_resolver(game, ufo)
+        game.schedule_systems()
+
+    @staticmethod
+    def auto_intercept(game, ufo) -> int:
+        """
+        Default interception resolver: the first flyable craft stationed at a base fights the UFO through
+        TInterception.auto_resolve() (one TInterceptionBatch fight seeded from the run's random stream).
+        A crashed UFO is taken off the world map and scores its type's score_destroy.
+
+        Args:
+            game (TGame): Game state.
+            ufo (TUfo): UFO to intercept.
+        Returns:
+            int: Score change.
+        """
+        from engine.craft.interception import TInterception
+
+        crafts = [craft for base in game.bases.values()
+                  for craft in getattr(getattr(base, 'inventory', None), 'crafts', [])
+                  if craft.health > 0]
+        if not crafts:
+            return 0
+        outcome = TInterception(crafts[0], ufo).auto_resolve(seed=random.randrange(2 ** 32))
+        if outcome != 'win':
+            return 0
+        ufo.remove()
+        return getattr(ufo.type, 'score_destroy', 0) or 0
+
+    def on_month(self, *args, **kwargs):
+        """
+        Monthly calendar hook: roll up country funding into the budget and record a report row.
+        """
+        game = self.game
+        self._record_techs()
+        self.funding.monthly_report()
+        # Inactive countries report zero funding, so the history row total is this month's income
+        income = int(self.funding.funding_history[-1].sum()) if len(self.funding.funding_history) else 0
+        game.funding = income
+        game.budget += income
+        if game.purchase_system:
+            game.purchase_system.process_monthly_reset()
+        self.months.append({
+            'date': game.calendar.get_date(),
+            'budget': game.budget,
+            'funding': income,
+            'score': game.scoring,
+            'techs': len(game.research_tree.completed),
+            'countries': sum(1 for country in self.funding.country_list if country.active),
+        })
+
+    def _record_techs(self):
+        """
+        Record research completed since the last check and add its score.
+        """
+        game = self.game
+        known = {tech_id for _, tech_id in self.techs}
+        for tech_id in sorted(game.research_tree.completed - known):
+            self.techs.append((game.calendar.total_days, tech_id))
+            game.scoring += getattr(game.research_tree.entries.get(tech_id), 'score', 0) or 0
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Summary of the run.
+
+        Returns:
+            dict: seed, policy, months (per-month rows), techs ((day, tech id) pairs), interceptions and final
+            budget/score.
+        """
+        return {
+            'seed': self.seed,
+            'policy': self.policy.name,
+            'months': list(self.months),
+            'techs': list(self.techs),
+            'interceptions': self.interceptions,
+            'final_budget': self.game.budget if self.game else None,
+            'final_score': self.game.scoring if self.game else None,
+        }
+
+    @classmethod
+    def run_many(cls, mod_path, seeds: Sequence[int], policy: Optional[TCampaignPolicy] = None, years: int = 1,
+                 processes: Optional[int] = None, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Run one campaign per seed across a process pool (each worker process boots its own game).
+
+        Args:
+            mod_path (str|Path): Mod directory.
+            seeds (sequence): Random seeds.
+            policy (TCampaignPolicy, optional): Player policy (picklable); defaults to THeuristicPolicy().
+            years (int): Campaign length in years.
+            processes (int, optional): Worker processes; defaults to the CPU count. 1 runs in this process.
+            **kwargs: Other TCampaignSimulator arguments.
+        Returns:
+            list: Reports in seed order.
+        """
+        jobs = [(cls, str(mod_path), policy, seed, years, kwargs) for seed in seeds]
+        if processes == 1:
+            return [_run_job(job) for job in jobs]
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            return list(pool.map(_run_job, jobs))
+
+
+def _run_job(job) -> Dict[str, Any]:
+    """
+    Process pool worker: run one seeded campaign.
+
+    Args:
+        job (tuple): (simulator class, mod path, policy, seed, years, extra kwargs).
+    Returns:
+        dict: Simulator report.
+    """
+    sim_cls, mod_path, policy, seed, years, kwargs = job
+    return sim_cls(mod_path, policy=policy, seed=seed, years=years, **kwargs).run()
+
+
+if __name__ == '__main__':
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description='Headless campaign balance runs.')
+    parser.add_argument('mod_path', help='Mod directory, e.g. mods/xcom')
+    parser.add_argument('--seeds', type=int, default=8, help='Number of seeded runs')
+    parser.add_argument('--years', type=int, default=1, help='Campaign length in years')
+    parser.add_argument('--processes', type=int, default=None, help='Worker processes')
+    args = parser.parse_args()
+    reports = TCampaignSimulator.run_many(args.mod_path, range(args.seeds), years=args.years,
+                                          processes=args.processes)
+    print(json.dumps(reports, indent=2, default=str))
@@ -43,3 +43,62 @@ def test_get_base_status():
     assert game.get_base_status('OMEGA') in ['active', 'available']
     assert game.get_base_status('NONEXISTENT') == 'nonexistent'
 
+
+@pytest.fixture
+def scheduled_game(monkeypatch):
+    from types import SimpleNamespace
+    from engine.economy.research_tree import TResearchTree
+    from engine.lore.calendar import TCalendar
+    monkeypatch.setattr(TGame, '_instance', None)
+    monkeypatch.setattr(TGame, '_initialized', False)
+    game = TGame()
+    game.calendar = TCalendar()
+    game.research_tree = TResearchTree()
+    game.research_tree.add_entry(SimpleNamespace(id='laser', cost=100, tech_needed=[], tech_unlock=[],
+                                                 tech_give=[], _cost_randomized=True))
+    game.schedule_systems()
+    return game
+
+def test_research_started_late_is_not_credited_for_earlier_days(scheduled_game):
+    """Research started mid-campaign only progresses from the day it starts."""
+    game, tree = scheduled_game, scheduled_game.research_tree
+    game.calendar.advance_days(10)
+    tree.start_research('laser')
+    tree.assign_scientists('laser', 2)
+    game.calendar.advance_days(5)
+    game.schedule_systems()
+    assert tree.in_progress['laser'] == 10
+
+def test_scientist_change_credits_elapsed_days_at_old_staffing(scheduled_game):
+    """Reassigning scientists catches research up at the old rate first."""
+    game, tree = scheduled_game, scheduled_game.research_tree
+    tree.start_research('laser')
+    tree.assign_scientists('laser', 1)
+    game.calendar.advance_days(4)
+    tree.assign_scientists('laser', 5)
+    assert tree.in_progress['laser'] == 4
+    game.calendar.advance_days(2)
+    game.schedule_systems()
+    assert tree.in_progress['laser'] == 14
+
+def test_facility_completion_bumps_base_facilities_version(scheduled_game):
+    """Completing construction bumps the base's facilities version so radar re-reads its sources."""
+    from types import SimpleNamespace
+
+    class Facility:
+        facility_type = SimpleNamespace(name='Radar', build_time=3)
+        completed = False
+        build_progress = 0
+        def build_days(self, days):
+            self.build_progress += days
+            self.completed = self.build_progress >= self.facility_type.build_time
+        def days_left(self):
+            return 0 if self.completed else self.facility_type.build_time - self.build_progress
+
+    game = scheduled_game
+    base = SimpleNamespace(name='OMEGA', facilities={(0, 0): Facility()}, facilities_version=0)
+    game.add_base('OMEGA', base)
+    game.calendar.advance_days(3)
+    game.schedule_systems()
+    assert base.facilities[(0, 0)].completed
+    assert base.facilities_version == 1
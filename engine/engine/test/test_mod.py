@@ -1,5 +1,11 @@
 import pytest
+from pathlib import Path
+
+from engine.battle.battle_tile import TBattleTile
+from engine.battle.battle_tile_type import TBattleTileTypes
+from engine.engine.game import TGame
 from engine.engine.mod import TMod
+from engine.engine.modloader import TModLoader
 
 def test_mod_init():
     mod = TMod({}, '.')
@@ -34,3 +40,21 @@ def test_get_item_categories():
     assert isinstance(cats, list)
     assert any('name' in cat for cat in cats)
 
+def test_xcom_tiles_build_tile_type_records(monkeypatch):
+    """Test loading mods/xcom builds shared tile records from its 'tiles' section."""
+    # Terrains read the tileset manager through the TGame singleton; use a fresh one
+    monkeypatch.setattr(TGame, '_instance', None)
+    monkeypatch.setattr(TGame, '_initialized', False)
+    mod_path = Path(__file__).resolve().parents[3] / 'mods' / 'xcom'
+    loader = TModLoader(mod_path.name, mod_path)
+    loader.load_all_yaml_files()
+    game = TGame()
+    game.mod = TMod(loader.yaml_data, mod_path)
+    try:
+        game.mod.load_objects_from_data()
+        wall = TBattleTile('grass', 'wood_wall').wall
+        assert wall is TBattleTileTypes.get('wall', 'wood_wall')
+        assert wall.armor == 8 and wall.on_destroy() == 'wood_wall_dead'
+        assert TBattleTileTypes.get('floor', 'grass').destroyed_floor_id == 'grass_dead'
+    finally:
+        TBattleTileTypes.clear()
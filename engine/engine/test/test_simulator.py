@@ -0,0 +1,98 @@
+"""
+Test suite for engine.engine.simulator (TCampaignSimulator)
+Covers policy decisions, monthly funding rollups and seeded runs using pytest.
+"""
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from engine.economy.research_tree import TResearchTree
+from engine.engine.game import TGame
+from engine.engine.simulator import TCampaignSimulator, TScriptedPolicy, THeuristicPolicy
+from engine.globe.country import TCountry
+from engine.lore.calendar import TCalendar
+
+
+class DummyGame(SimpleNamespace):
+    """Minimal game: research advances through a calendar scheduler event."""
+
+    def schedule_systems(self):
+        today = self.calendar.total_days
+        self.research_tree.advance_days(today - self.last_day)
+        self.last_day = today
+        due = self.research_tree.days_to_next_completion()
+        if due is not None:
+            self.calendar.scheduler.schedule(today + due, lambda day: self.schedule_systems(), key='research')
+
+
+def make_game():
+    tree = TResearchTree()
+    for pid, cost, needed in (('laser', 50, []), ('plasma', 200, ['laser']), ('psi', 100, [])):
+        entry = SimpleNamespace(id=pid, cost=cost, score=cost // 10, tech_needed=needed, tech_unlock=[],
+                                tech_give=[], _cost_randomized=True)
+        tree.add_entry(entry)
+    countries = {'usa': TCountry('usa', {'name': 'USA', 'funding': 50, 'funding_cap': 100})}
+    return DummyGame(calendar=TCalendar(), research_tree=tree, mod=SimpleNamespace(countries=countries),
+                     purchase_system=None, bases={}, current_base_name=None, budget=0, funding=0, scoring=0,
+                     last_day=0)
+
+
+def test_scripted_policy_follows_research_order():
+    """Test a scripted run researches in order and records a row per month."""
+    sim = TCampaignSimulator('mods/xcom', policy=TScriptedPolicy(['laser', 'plasma', 'psi'], scientists=10),
+                             seed=1, years=1, start_budget=100)
+    report = sim.run(make_game())
+    assert [tech for _, tech in report['techs']] == ['laser', 'plasma', 'psi']
+    assert len(report['months']) == 12
+    assert report['final_score'] == 35
+    assert report['months'][0]['funding'] == report['months'][0]['budget']
+
+
+def test_heuristic_policy_runs_cheapest_first():
+    """Test the heuristic policy starts the cheapest available projects."""
+    game = make_game()
+    picks = THeuristicPolicy(projects=1, scientists=5).choose_research(game, game.research_tree.get_available_research())
+    assert picks == [('laser', 5)]
+
+
+def test_boots_xcom_mod_and_runs_a_year(monkeypatch):
+    """Test a seeded run boots mods/xcom headless, researches and rolls up funding every month."""
+    # boot() replaces the TGame singleton; restore it afterwards
+    monkeypatch.setattr(TGame, '_instance', TGame._instance)
+    monkeypatch.setattr(TGame, '_initialized', TGame._initialized)
+    mod_path = Path(__file__).resolve().parents[3] / 'mods' / 'xcom'
+    reports = TCampaignSimulator.run_many(mod_path, [3, 3], years=1, processes=1)
+    report = reports[0]
+    assert len(report['months']) == 12
+    assert report['techs'] and report['techs'][0][1] == 'laser_weapons'
+    assert report['months'][0]['funding'] > 0
+    assert report['final_budget'] == 1000 + sum(month['funding'] for month in report['months'])
+    assert reports[1] == report
+
+
+def test_intercepts_registered_ufos_with_auto_resolve():
+    """Test UFOs in the world registry are intercepted by a base craft and a crashed UFO scores and leaves."""
+    from engine.globe.world_locations import TWorldLocations
+
+    class Ufo:
+        def __init__(self, **kwargs):
+            self.__dict__.update(kwargs)
+        def remove(self):
+            locations.remove(self)
+
+    weapon = SimpleNamespace(range=5, accuracy=1.0, damage=100, ammo=10)
+    craft = SimpleNamespace(health=100, type=SimpleNamespace(health=100, acceleration=5), weapons=[weapon])
+    ufo = Ufo(health=50, type=SimpleNamespace(health=50, acceleration=0, score_destroy=25), weapons=[])
+    locations = TWorldLocations(None, 8, 240)
+    locations.add(ufo, 'ufo', 10, 10)
+    game = make_game()
+    game.worldmap = SimpleNamespace(locations=locations)
+    game.bases = {'alpha': SimpleNamespace(inventory=SimpleNamespace(crafts=[craft]))}
+    sim = TCampaignSimulator('mods/xcom', policy=THeuristicPolicy(projects=0), seed=2)
+    sim.game = game
+    sim.on_week()
+    assert sim.interceptions == 1
+    assert game.scoring == 25
+    assert ufo not in locations and craft.health == 100
+    sim.on_week()
+    assert sim.interceptions == 1
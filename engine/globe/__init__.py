@@ -10,8 +10,12 @@ from .country import TCountry
 from .diplomacy import TDiplomacy
 from .funding import TFunding
 from .location import TLocation
+from .movement import TGlobeMovement
 from .radar import TGlobalRadar
 from .region import TRegion
+from .spatial_grid import TSpatialGrid
 from .world import TWorld
+from .world_cache import TWorldCache
+from .world_locations import TWorldLocations
 from .world_point import TWorldPoint
 from .world_tile import TWorldTile
@@ -8,7 +8,7 @@ Classes:
 
 Last standardized: 2025-06-14
 """
-
+import numpy as np
 
 
 class TCountry:
@@ -113,16 +113,23 @@ class TCountry:
         if tile_pos in self.owned_tiles:
             self.owned_tiles.remove(tile_pos)
 
-    def calculate_owned_tiles(self, tiles=None):
+    def calculate_owned_tiles(self, tiles=None, world=None, layer_id=None):
         """
         Calculate and assign this country's owned tiles based on the world tile grid.
+        With a world, ownership is read from its owner layer in one vectorized pass instead of scanning tiles.
         Args:
             tiles (list): 2D array of TWorldTile.
+            world (TWorld, optional): World whose owner layer defines ownership.
+            layer_id (int, optional): Country id in the owner layer; defaults to pid.
         """
         self.owned_tiles = []
+        if world is not None:
+            ys, xs = np.nonzero(world.layers['owner'] == (self.pid if layer_id is None else layer_id))
+            self.owned_tiles = list(zip(xs.tolist(), ys.tolist()))
+            return
         if tiles is None:
             return
         for row in tiles:
             for tile in row:
                 if hasattr(tile, 'country_id') and tile.country_id == self.pid:
-                    self.owned_tiles.append((tile.x, tile.y))
\ No newline at end of file
+                    self.owned_tiles.append((tile.x, tile.y))
@@ -2,31 +2,77 @@
 funding.py
 
 Defines the TFunding class, which manages XCOM's funding based on country scores and generates monthly reports. Operates from the country perspective and updates funding and relations.
+Score events are accumulated into per-country and per-region arrays (batches of tile events via one bincount over
+the world's owner/region layers), and every monthly rollup is appended to compact history arrays read by reports
+and funding graphs.
 
 Classes:
     TFunding: Funding and monthly report manager for XCOM.
 
 Last standardized: 2025-06-14
 """
+import numpy as np
+
 
 class TFunding:
     """
     TFunding manages XCOM's funding based on the score in each country and generates monthly reports.
     This class operates from the country perspective.
+    Countries are addressed by slot (their position in `countries`); tile events are mapped to slots through the
+    world's owner layer, so ownership is never rescanned per event.
 
     Attributes:
         countries (list|dict): List or dict of TCountry instances.
-        month_scores (dict): Mapping of country IDs to their monthly scores.
+        world (TWorld|None): World whose owner/region layers locate tile score events.
+        country_list (list): TCountry instances in slot order.
+        slots (dict): Country pid -> slot index.
+        scores (np.ndarray): int64 [country] score of the current month.
+        region_scores (np.ndarray): int64 [region id] score of the current month.
+        score_history (np.ndarray): int64 [month, country] monthly scores.
+        funding_history (np.ndarray): int64 [month, country] funding after each monthly update.
+        region_history (np.ndarray): int64 [month, region id] monthly region scores.
     """
-    def __init__(self, countries):
+    def __init__(self, countries, world=None, layer_ids=None):
         """
         Initialize a TFunding instance.
 
         Args:
             countries (list|dict): List or dict of TCountry instances.
+            world (TWorld, optional): World used to locate tile score events.
+            layer_ids (dict, optional): Country pid -> id in the world's country/owner layers;
+                defaults to the pid itself for integer pids.
         """
         self.countries = countries
-        self.month_scores = {country.pid: 0 for country in countries}
+        self.world = world
+        country_list = list(countries.values()) if isinstance(countries, dict) else list(countries)
+        self.country_list = country_list
+        self.slots = {country.pid: slot for slot, country in enumerate(country_list)}
+        count = len(country_list)
+        if layer_ids is None:
+            layer_ids = {country.pid: country.pid for country in country_list
+                         if isinstance(country.pid, (int, np.integer))}
+        # Owner layer id -> country slot (-1 for tiles not owned by a known country)
+        size = max([int(layer_id) for layer_id in layer_ids.values()] + [-1]) + 1
+        self._layer_slots = np.full(size, -1, dtype=np.int64)
+        for pid, layer_id in layer_ids.items():
+            if pid in self.slots:
+                self._layer_slots[int(layer_id)] = self.slots[pid]
+        regions = int(world.layers['region'].max()) + 1 if world is not None and world.layers['region'].size else 0
+        self.scores = np.zeros(count, dtype=np.int64)
+        self.region_scores = np.zeros(regions, dtype=np.int64)
+        self.score_history = np.zeros((0, count), dtype=np.int64)
+        self.funding_history = np.zeros((0, count), dtype=np.int64)
+        self.region_history = np.zeros((0, regions), dtype=np.int64)
+
+    @property
+    def month_scores(self):
+        """
+        Scores of the current month per country.
+
+        Returns:
+            dict: Country pid -> score.
+        """
+        return {pid: int(self.scores[slot]) for pid, slot in self.slots.items()}
 
     def add_tile_score(self, country_id, score):
         """
@@ -36,25 +82,102 @@ class TFunding:
             country_id: The ID of the country.
             score (int): The score to add.
         """
-        if country_id in self.month_scores:
-            self.month_scores[country_id] += score
+        slot = self.slots.get(country_id)
+        if slot is not None:
+            self.scores[slot] += score
+
+    def add_score_events(self, xs, ys, scores):
+        """
+        Record a batch of score events at world tiles: each score goes to the tile's owning country and region.
+
+        Args:
+            xs (array-like): Tile x coordinates.
+            ys (array-like): Tile y coordinates.
+            scores (array-like|int): Score per event (or one score for all).
+        """
+        xs = np.asarray(xs, dtype=np.int64)
+        ys = np.asarray(ys, dtype=np.int64)
+        scores = np.broadcast_to(np.asarray(scores, dtype=np.int64), xs.shape)
+        owners = self.world.layers['owner'][ys, xs].astype(np.int64)
+        known = (owners >= 0) & (owners < len(self._layer_slots))
+        slots = np.full(owners.shape, -1, dtype=np.int64)
+        slots[known] = self._layer_slots[owners[known]]
+        owned = slots >= 0
+        self.scores += np.bincount(slots[owned], weights=scores[owned], minlength=len(self.scores)).astype(np.int64)
+        regions = self.world.layers['region'][ys, xs].astype(np.int64)
+        if regions.size:
+            counts = np.bincount(regions, weights=scores, minlength=len(self.region_scores)).astype(np.int64)
+            if len(counts) > len(self.region_scores):
+                self._grow_regions(len(counts))
+            self.region_scores += counts
+
+    def add_score_at(self, x, y, score):
+        """
+        Record one score event at a world tile.
+
+        Args:
+            x (int): Tile x coordinate.
+            y (int): Tile y coordinate.
+            score (int): Score to add.
+        """
+        self.add_score_events([x], [y], [score])
+
+    def _grow_regions(self, size):
+        """
+        Widen the region accumulators for region ids beyond the current size.
+
+        Args:
+            size (int): New number of region slots.
+        """
+        extra = size - len(self.region_scores)
+        self.region_scores = np.concatenate([self.region_scores, np.zeros(extra, dtype=np.int64)])
+        self.region_history = np.pad(self.region_history, ((0, 0), (0, extra)))
 
     def monthly_report(self):
         """
         Update all countries' funding and relation based on their monthly score.
+        The month's scores and resulting funding are appended to the history arrays, then the accumulators reset.
 
         Returns:
             dict: Summary report with relation, funding, active status, and score for each country.
         """
         report = {}
-        for country in self.countries:
-            score = self.month_scores.get(country.pid, 0)
+        funding = np.zeros(len(self.scores), dtype=np.int64)
+        for country in self.country_list:
+            slot = self.slots[country.pid]
+            score = int(self.scores[slot])
             country.monthly_update(score)
+            funding[slot] = country.funding
             report[country.name] = {
                 'relation': country.relation,
                 'funding': country.funding,
                 'active': country.active,
                 'score': score
             }
-            self.month_scores[country.pid] = 0
+        self.score_history = np.vstack([self.score_history, self.scores])
+        self.funding_history = np.vstack([self.funding_history, funding])
+        self.region_history = np.vstack([self.region_history, self.region_scores])
+        self.scores[:] = 0
+        self.region_scores[:] = 0
         return report
+
+    def country_history(self, country_id):
+        """
+        Monthly score and funding history of a country (e.g. for funding graphs).
+
+        Args:
+            country_id: The ID of the country.
+        Returns:
+            tuple: (scores, funding) int64 arrays, one value per month.
+        """
+        slot = self.slots[country_id]
+        return self.score_history[:, slot], self.funding_history[:, slot]
+
+    def total_history(self):
+        """
+        Monthly totals over all countries.
+
+        Returns:
+            tuple: (scores, funding) int64 arrays, one value per month.
+        """
+        return self.score_history.sum(axis=1), self.funding_history.sum(axis=1)
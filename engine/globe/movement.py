@@ -0,0 +1,145 @@
+"""
+engine/globe/movement.py
+
+Defines the TGlobeMovement class, a straight-line movement leg of a UFO or craft on the world map.
+The leg follows the shortest path across the east-west seam at sub-tile precision. Its per-tick step is computed
+once when the leg starts, so the position after any number of ticks is closed form and time compression can jump
+ahead without stepping every tick.
+
+Classes:
+    TGlobeMovement: Wrap-aware movement leg from a start to a target position at a fixed speed.
+
+Last standardized: 2026-10-18
+"""
+import math
+from typing import Optional, Tuple
+
+
+class TGlobeMovement:
+    """
+    Movement leg from a start to a target position at a fixed speed (tiles per tick).
+    The horizontal offset is taken across the seam when that is shorter; positions are floats wrapped into
+    [0, width). The leg arrives exactly on the target after `ticks` ticks.
+
+    Attributes:
+        start (tuple): (x, y) start position.
+        target (tuple): (x, y) target position.
+        speed (float): Tiles per tick.
+        width (int|None): World width for horizontal wrap, None for a flat map.
+        dx (float): Signed shortest horizontal offset from start to target.
+        dy (float): Vertical offset from start to target.
+        distance (float): Length of the leg in tiles.
+        step_x (float): Horizontal movement per tick.
+        step_y (float): Vertical movement per tick.
+        ticks (int): Ticks needed to arrive.
+        elapsed (int): Ticks advanced so far.
+    """
+
+    def __init__(self, start, target, speed: float, width: Optional[int] = None):
+        """
+        Start a movement leg.
+
+        Args:
+            start (tuple): (x, y) start position.
+            target (tuple): (x, y) target position.
+            speed (float): Tiles per tick (values below 1 tile are allowed, non-positive speeds never arrive).
+            width (int, optional): World width in tiles; enables horizontal wrap.
+        """
+        self.start = (start[0], start[1])
+        self.target = (target[0], target[1])
+        self.speed = speed
+        self.width = width or None
+        self.dx = self.delta_x(self.start[0], self.target[0], self.width)
+        self.dy = self.target[1] - self.start[1]
+        self.distance = math.hypot(self.dx, self.dy)
+        if self.distance == 0:
+            self.ticks = 0
+            self.step_x = self.step_y = 0.0
+        elif speed <= 0:
+            self.ticks = math.inf
+            self.step_x = self.step_y = 0.0
+        else:
+            self.ticks = math.ceil(self.distance / speed)
+            self.step_x = self.dx * speed / self.distance
+            self.step_y = self.dy * speed / self.distance
+        self.elapsed = 0
+
+    @staticmethod
+    def delta_x(x1: float, x2: float, width: Optional[int] = None) -> float:
+        """
+        Signed shortest horizontal offset from x1 to x2 (across the seam when wrapping).
+
+        Args:
+            x1 (float): Start X coordinate.
+            x2 (float): End X coordinate.
+            width (int, optional): World width in tiles.
+        Returns:
+            float: Offset in [-width / 2, width / 2) when wrapping, else x2 - x1.
+        """
+        dx = x2 - x1
+        if width:
+            dx = (dx + width / 2.0) % width - width / 2.0
+        return dx
+
+    def position_at(self, ticks: int) -> Tuple[float, float]:
+        """
+        Position after a number of ticks from the start of the leg, in closed form.
+
+        Args:
+            ticks (int): Ticks since the start (clamped to the leg).
+        Returns:
+            tuple: (x, y) position; exactly the target once arrived.
+        """
+        if ticks >= self.ticks:
+            return self.target
+        if ticks <= 0:
+            return self.start
+        x = self.start[0] + self.step_x * ticks
+        if self.width:
+            x %= self.width
+        return x, self.start[1] + self.step_y * ticks
+
+    @property
+    def position(self) -> Tuple[float, float]:
+        """
+        Current position of the leg.
+
+        Returns:
+            tuple: (x, y) position after the elapsed ticks.
+        """
+        return self.position_at(self.elapsed)
+
+    @property
+    def remaining(self):
+        """
+        Ticks left until arrival.
+
+        Returns:
+            int: Remaining ticks (inf if the leg never arrives).
+        """
+        return max(0, self.ticks - self.elapsed)
+
+    @property
+    def arrived(self) -> bool:
+        """
+        Check whether the leg has reached its target.
+
+        Returns:
+            bool: True once all ticks are elapsed.
+        """
+        return self.elapsed >= self.ticks
+
+    def advance(self, ticks: int = 1) -> int:
+        """
+        Advance the leg by up to a number of ticks in one jump.
+
+        Args:
+            ticks (int): Ticks to advance.
+        Returns:
+            int: Ticks actually used (fewer if the leg arrives earlier, 0 if it cannot move).
+        """
+        if self.ticks == math.inf:
+            return 0
+        used = min(ticks, self.remaining)
+        self.elapsed += used
+        return used
@@ -2,6 +2,8 @@
 radar.py
 
 Defines the TGlobalRadar class, which manages radar detection of UFOs and locations on the world map. Handles radar scanning from bases and crafts, updating cover and visibility for all locations.
+Detectable locations are looked up in the world's location registry (TWorldLocations), so each radar only visits
+locations within its range and UFOs moved by their own position setters need no separate index.
 
 Classes:
     TGlobalRadar: Global radar detection manager.
@@ -9,15 +11,28 @@ Classes:
 Last standardized: 2025-06-14
 """
 
-from engine.globe.world_point import TWorldPoint
+from engine.globe.world_locations import TWorldLocations
 
 class TGlobalRadar:
     """
     TGlobalRadar manages radar detection of UFOs and locations on the world map.
+    Locations are queried from the world's location registry; scanned locations the registry does not know yet
+    (e.g. mission sites) are registered as SITE_KIND while they are scanned. Each base's radar sources are cached
+    per facilities_version of the base, so they are read again after a facility is added, removed or completed;
+    invalidate_base() drops them explicitly (bases without a version are cached until then).
 
     Attributes:
         world: TWorld instance representing the world map.
+        index (TWorldLocations): The world's location registry (a private one if the world has none).
+        tracked (dict): Detectable locations of the last scan (insertion-ordered dict used as a set).
+        kinds (set): Registry kinds of the tracked locations.
+        base_sources (dict): Base -> (facilities version, (x, y), [(range, power), ...]) cached radar sources.
+        CELL_SIZE (int): Grid cell size in tiles of a private registry.
+        SITE_KIND (str): Kind under which untracked locations are registered.
     """
+    CELL_SIZE = 8
+    SITE_KIND = 'site'
+
     def __init__(self, world):
         """
         Initialize a TGlobalRadar instance.
@@ -26,6 +41,108 @@ class TGlobalRadar:
             world: TWorld instance.
         """
         self.world = world
+        locations = getattr(world, 'locations', None)
+        self.index = locations if locations is not None else TWorldLocations(world, self.CELL_SIZE)
+        self.tracked = {}
+        self.kinds = set()
+        self.base_sources = {}
+
+    @staticmethod
+    def _xy(position):
+        """
+        Coordinates of a position given as TWorldPoint or (x, y).
+
+        Args:
+            position: TWorldPoint or (x, y) iterable.
+        Returns:
+            tuple: (x, y).
+        """
+        if hasattr(position, 'x'):
+            return position.x, position.y
+        x, y = position
+        return x, y
+
+    @staticmethod
+    def is_detectable(loc):
+        """
+        Check whether a location can be detected by radar (not an XCOM base/craft and placed on the map).
+
+        Args:
+            loc (TLocation): Location to check.
+        Returns:
+            bool: True if radar applies to it.
+        """
+        return bool(loc.position) and not loc.name.startswith('XCOM')
+
+    def track(self, locations):
+        """
+        Set the locations scanned by radar: register unknown ones, refresh positions, and drop sites registered by
+        the radar that are gone (UFOs and bases are registered and removed by their owners).
+
+        Args:
+            locations (list): List of TLocation instances.
+        """
+        current = {}
+        for loc in locations:
+            if not self.is_detectable(loc):
+                continue
+            current[loc] = None
+            x, y = self._xy(loc.position)
+            self.index.add(loc, self.index.kinds.get(loc, self.SITE_KIND), x, y)
+        for loc in self.tracked:
+            if loc not in current and self.index.kinds.get(loc) == self.SITE_KIND:
+                self.index.remove(loc)
+        self.tracked = current
+        self.kinds = {self.index.kinds[loc] for loc in current}
+
+    def invalidate_base(self, base=None):
+        """
+        Drop cached radar sources of a base (or of all bases).
+
+        Args:
+            base (optional): Base whose facilities changed; None clears all.
+        """
+        if base is None:
+            self.base_sources.clear()
+        else:
+            self.base_sources.pop(base, None)
+
+    def get_base_sources(self, base):
+        """
+        Radar sources of a base, cached until its facilities_version changes.
+
+        Args:
+            base: XCOM base (provides position and get_radar_facilities(), optionally facilities_version).
+        Returns:
+            tuple: ((x, y), [(range, power), ...]).
+        """
+        version = getattr(base, 'facilities_version', None)
+        cached = self.base_sources.get(base)
+        if cached is None or cached[0] != version:
+            radars = [(radar.range, radar.power) for radar in base.get_radar_facilities()]
+            cached = (version, self._xy(base.position), radars)
+            self.base_sources[base] = cached
+        return cached[1], cached[2]
+
+    def sweep(self, position, radars):
+        """
+        Apply radar sources at one position to every tracked location in range.
+
+        Args:
+            position (tuple): (x, y) of the radar.
+            radars (list): (range, power) pairs.
+        """
+        if not radars:
+            return
+        max_range = max(radar_range for radar_range, _ in radars)
+        for kind in self.kinds:
+            for loc, dist in self.index.within(position[0], position[1], max_range, kind):
+                if loc not in self.tracked:
+                    continue
+                for radar_range, radar_power in radars:
+                    if dist <= radar_range:
+                        loc.cover = max(0, loc.cover - radar_power)
+                        loc.update_visibility()
 
     def scan(self, locations, bases, crafts):
         """
@@ -36,37 +153,20 @@ class TGlobalRadar:
             bases (list): List of XCOM base objects (must provide get_radar_facilities()).
             crafts (list): List of XCOM craft objects (must provide radar_power, radar_range, and position).
         """
+        self.track(locations)
+
         # 1. Scan from bases
         for base in bases:
-            radar_list = base.get_radar_facilities()  # Each should have .power and .range
-            base_pos = TWorldPoint.from_iterable(base.position)
-            for radar in radar_list:
-                for loc in locations:
-                    if loc.name.startswith('XCOM'):  # skip xcom bases/crafts
-                        continue
-                    if not loc.position:
-                        continue
-                    loc_pos = TWorldPoint.from_iterable(loc.position)
-                    if base_pos.tile_distance(loc_pos) <= radar.range:
-                        loc.cover = max(0, loc.cover - radar.power)
-                        loc.update_visibility()
+            position, radars = self.get_base_sources(base)
+            self.sweep(position, radars)
 
         # 2. Scan from crafts
         for craft in crafts:
             if not craft.is_on_world():
                 continue
-            craft_pos = TWorldPoint.from_iterable(craft.position)
-            radar_power = getattr(craft, 'radar_power', 0)
             radar_range = getattr(craft, 'radar_range', 0)
-            for loc in locations:
-                if loc.name.startswith('XCOM'):
-                    continue
-                if not loc.position:
-                    continue
-                loc_pos = TWorldPoint.from_iterable(loc.position)
-                if craft_pos.tile_distance(loc_pos) <= radar_range:
-                    loc.cover = max(0, loc.cover - radar_power)
-                    loc.update_visibility()
+            if radar_range:
+                self.sweep(self._xy(craft.position), [(radar_range, getattr(craft, 'radar_power', 0))])
 
         # 3. Replenish cover for all locations
         for loc in locations:
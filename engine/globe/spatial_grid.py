@@ -0,0 +1,218 @@
+"""
+engine/globe/spatial_grid.py
+
+Defines the TSpatialGrid class, a uniform bucket grid over world map coordinates used to find objects near a point
+without scanning every object. The grid can wrap horizontally like the world map (east-west seam).
+
+Classes:
+    TSpatialGrid: Wrap-aware uniform grid index of objects with (x, y) world positions.
+
+Last standardized: 2026-10-18
+"""
+import math
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+
+class TSpatialGrid:
+    """
+    Uniform grid index of objects on the world map.
+    Objects are bucketed by cell (cell_size tiles square); a radius query only visits the cells overlapping the
+    query circle. Moving an object within its cell costs one dict update.
+
+    Attributes:
+        cell_size (int): Cell size in tiles.
+        width (int|None): World width for horizontal wrap, None for a flat map.
+        positions (dict): Object -> (x, y) position.
+        cells (dict): (cell x, cell y) -> insertion-ordered dict of objects (used as a set).
+    """
+
+    def __init__(self, cell_size: int = 8, width: Optional[int] = None):
+        """
+        Initialize an empty grid.
+
+        Args:
+            cell_size (int): Cell size in tiles.
+            width (int, optional): World width in tiles; enables horizontal wrap.
+        """
+        self.cell_size = cell_size
+        self.width = width or None
+        self.positions: Dict[Hashable, Tuple[float, float]] = {}
+        self.cells: Dict[Tuple[int, int], Dict[Hashable, None]] = {}
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __contains__(self, item) -> bool:
+        return item in self.positions
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        """
+        Cell of a position (x wrapped into the world when wrapping).
+
+        Args:
+            x (float): X coordinate.
+            y (float): Y coordinate.
+        Returns:
+            tuple: (cell x, cell y).
+        """
+        if self.width:
+            x %= self.width
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def insert(self, item: Hashable, x: float, y: float) -> None:
+        """
+        Add an object, or move it if it is already indexed.
+
+        Args:
+            item: Object to index.
+            x (float): X coordinate.
+            y (float): Y coordinate.
+        """
+        if item in self.positions:
+            self.move(item, x, y)
+            return
+        self.positions[item] = (x, y)
+        self.cells.setdefault(self._cell(x, y), {})[item] = None
+
+    def move(self, item: Hashable, x: float, y: float) -> None:
+        """
+        Update the position of an indexed object (re-bucketed only when it changes cell).
+
+        Args:
+            item: Indexed object.
+            x (float): New X coordinate.
+            y (float): New Y coordinate.
+        """
+        old = self.positions[item]
+        self.positions[item] = (x, y)
+        old_cell, new_cell = self._cell(*old), self._cell(x, y)
+        if old_cell != new_cell:
+            self._unbucket(item, old_cell)
+            self.cells.setdefault(new_cell, {})[item] = None
+
+    def remove(self, item: Hashable) -> None:
+        """
+        Remove an object (no-op if it is not indexed).
+
+        Args:
+            item: Object to remove.
+        """
+        position = self.positions.pop(item, None)
+        if position is not None:
+            self._unbucket(item, self._cell(*position))
+
+    def _unbucket(self, item: Hashable, cell: Tuple[int, int]) -> None:
+        """
+        Remove an object from one cell bucket, dropping empty buckets.
+
+        Args:
+            item: Indexed object.
+            cell (tuple): Cell key.
+        """
+        bucket = self.cells.get(cell)
+        if bucket is not None:
+            bucket.pop(item, None)
+            if not bucket:
+                del self.cells[cell]
+
+    def clear(self) -> None:
+        """
+        Remove all objects.
+        """
+        self.positions.clear()
+        self.cells.clear()
+
+    def delta_x(self, x1: float, x2: float) -> float:
+        """
+        Signed shortest horizontal offset from x1 to x2 (across the seam when wrapping).
+
+        Args:
+            x1 (float): Start X coordinate.
+            x2 (float): End X coordinate.
+        Returns:
+            float: Offset in [-width / 2, width / 2) when wrapping, else x2 - x1.
+        """
+        dx = x2 - x1
+        if self.width:
+            dx = (dx + self.width / 2.0) % self.width - self.width / 2.0
+        return dx
+
+    def distance(self, x1: float, y1: float, x2: float, y2: float) -> float:
+        """
+        Euclidean distance between two positions, wrap-aware.
+
+        Args:
+            x1 (float): First X coordinate.
+            y1 (float): First Y coordinate.
+            x2 (float): Second X coordinate.
+            y2 (float): Second Y coordinate.
+        Returns:
+            float: Distance in tiles.
+        """
+        return math.hypot(self.delta_x(x1, x2), y2 - y1)
+
+    def _cells_in_range(self, x: float, y: float, radius: float) -> List[Tuple[int, int]]:
+        """
+        Cells overlapping the square around a circle (each cell listed once, wrapped when wrapping).
+
+        Args:
+            x (float): Center X coordinate.
+            y (float): Center Y coordinate.
+            radius (float): Radius in tiles.
+        Returns:
+            list: Cell keys.
+        """
+        size = self.cell_size
+        min_cy, max_cy = int((y - radius) // size), int((y + radius) // size)
+        min_cx, max_cx = int((x - radius) // size), int((x + radius) // size)
+        columns = range(min_cx, max_cx + 1)
+        if self.width:
+            count = -(-self.width // size)
+            if max_cx - min_cx + 1 >= count:
+                columns = range(count)
+            else:
+                columns = sorted({cx % count for cx in columns})
+        return [(cx, cy) for cy in range(min_cy, max_cy + 1) for cx in columns]
+
+    def query_radius(self, x: float, y: float, radius: float) -> List[Tuple[Any, float]]:
+        """
+        Objects within a radius of a position.
+
+        Args:
+            x (float): Center X coordinate.
+            y (float): Center Y coordinate.
+            radius (float): Radius in tiles (inclusive).
+        Returns:
+            list: (object, distance) pairs in index order.
+        """
+        found = []
+        for cell in self._cells_in_range(x, y, radius):
+            for item in self.cells.get(cell, ()):
+                ix, iy = self.positions[item]
+                dist = self.distance(x, y, ix, iy)
+                if dist <= radius:
+                    found.append((item, dist))
+        return found
+
+    def nearest(self, x: float, y: float, k: int = 1, max_radius: Optional[float] = None) -> List[Tuple[Any, float]]:
+        """
+        The k objects nearest to a position, searching outwards ring by ring of cells.
+
+        Args:
+            x (float): Center X coordinate.
+            y (float): Center Y coordinate.
+            k (int): Number of objects.
+            max_radius (float, optional): Ignore objects farther than this.
+        Returns:
+            list: Up to k (object, distance) pairs, nearest first.
+        """
+        if not self.positions or k <= 0:
+            return []
+        radius = float(self.cell_size)
+        limit = max_radius if max_radius is not None else float('inf')
+        while True:
+            found = self.query_radius(x, y, min(radius, limit))
+            if len(found) >= k or radius >= limit or len(found) == len(self.positions):
+                found.sort(key=lambda pair: pair[1])
+                return found[:k]
+            radius *= 2
@@ -53,3 +53,12 @@ def test_tcountry_monthly_update():
     country.monthly_update(-2000)
     assert country.relation >= 0
 
+
+def test_tcountry_owned_tiles_from_owner_layer():
+    """Test ownership is read from the world's owner layer."""
+    from engine.globe.world import TWorld
+    world = TWorld('earth', {'size': [3, 2]})
+    world.set_layers(country=[[4, 0, 4], [0, 4, 0]])
+    country = TCountry(pid=4, data={'name': 'Atlantis'})
+    country.calculate_owned_tiles(world=world)
+    assert sorted(country.owned_tiles) == [(0, 0), (1, 1), (2, 0)]
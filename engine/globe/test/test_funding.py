@@ -48,3 +48,24 @@ def test_tfunding_add_score_and_report():
     assert report['A']['score'] == 10
     assert report['B']['score'] == -5
 
+
+def test_score_events_accumulate_by_owner_and_region():
+    """Test batched tile events land on owning countries and regions and roll into history arrays."""
+    from engine.globe.world import TWorld
+    world = TWorld('earth', {'size': [4, 2]})
+    world.set_layers(country=[[1, 1, 2, 0], [1, 2, 2, 0]], region=[[1, 1, 1, 2], [1, 1, 2, 2]])
+    countries = [DummyCountry(1, 'France'), DummyCountry(2, 'USA')]
+    funding = TFunding(countries, world=world)
+    funding.add_score_events([0, 1, 2, 3, 1], [0, 1, 0, 0, 0], [10, -4, 7, 100, 5])
+    funding.add_tile_score(2, 1)
+    assert funding.month_scores == {1: 15, 2: 4}
+    assert funding.region_scores.tolist() == [0, 18, 100]
+    report = funding.monthly_report()
+    assert report['France']['score'] == 15
+    funding.add_score_at(2, 1, 3)
+    funding.monthly_report()
+    scores, money = funding.country_history(2)
+    assert scores.tolist() == [4, 3]
+    assert money.tolist() == [4, 7]
+    assert funding.region_history[:, 2].tolist() == [100, 3]
+    assert funding.month_scores == {1: 0, 2: 0}
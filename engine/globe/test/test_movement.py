@@ -0,0 +1,37 @@
+"""
+Test suite for engine.globe.movement (TGlobeMovement)
+Covers wrapped shortest paths, closed-form positions and multi-tick advances using pytest.
+"""
+
+import pytest
+from engine.globe.movement import TGlobeMovement
+
+
+def test_shortest_path_crosses_seam():
+    """Test a leg near the seam flies across it and wraps x into the world."""
+    move = TGlobeMovement((238, 10), (2, 10), speed=1, width=240)
+    assert move.dx == pytest.approx(4)
+    assert move.ticks == 4
+    assert move.position_at(1) == pytest.approx((239, 10))
+    assert move.position_at(3) == pytest.approx((1, 10))
+    assert move.position_at(10) == (2, 10)
+
+
+def test_closed_form_matches_stepping():
+    """Test one large advance lands where stepping tick by tick does, at sub-tile precision."""
+    stepped = TGlobeMovement((10, 5), (40, 45), speed=2.5, width=240)
+    jumped = TGlobeMovement((10, 5), (40, 45), speed=2.5, width=240)
+    for _ in range(7):
+        stepped.advance(1)
+    assert jumped.advance(7) == 7
+    assert jumped.position == pytest.approx(stepped.position)
+    assert jumped.position == pytest.approx((10 + 7 * 1.5, 5 + 7 * 2.0))
+    assert jumped.advance(100) == jumped.ticks - 7
+    assert jumped.arrived and jumped.position == (40, 45)
+
+
+def test_zero_distance_and_no_speed():
+    """Test a leg to the start arrives at once and a leg without speed never does."""
+    assert TGlobeMovement((3, 3), (3, 3), speed=5).arrived
+    stuck = TGlobeMovement((0, 0), (5, 0), speed=0)
+    assert stuck.advance(50) == 0 and not stuck.arrived
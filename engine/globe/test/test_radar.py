@@ -31,3 +31,92 @@ def test_tglobalradar_scan():
     radar.scan([loc], [base], [craft])
     assert loc.cover < 10
 
+
+
+class DummyLocation:
+    def __init__(self, name, pos, cover=10):
+        self.name = name; self.position = pos; self.cover = cover; self.visible = False
+    def update_visibility(self):
+        self.visible = self.cover <= 0
+    def replenish_cover(self):
+        pass
+
+
+class DummyWorld:
+    width = 240
+
+
+def test_tglobalradar_only_hits_locations_in_range_across_wrap():
+    class Radar:
+        range = 10; power = 4
+    class Base:
+        position = (2, 50)
+        calls = 0
+        def get_radar_facilities(self):
+            Base.calls += 1
+            return [Radar()]
+    radar = TGlobalRadar(DummyWorld())
+    near_wrapped = DummyLocation('UFO-1', (236, 50))
+    far = DummyLocation('UFO-2', (120, 50))
+    xcom = DummyLocation('XCOM Base', (2, 50))
+    base = Base()
+    radar.scan([near_wrapped, far, xcom], [base], [])
+    radar.scan([near_wrapped, far, xcom], [base], [])
+    assert near_wrapped.cover == 2
+    assert far.cover == 10 and xcom.cover == 10
+    assert Base.calls == 1
+    assert xcom not in radar.index
+
+
+def test_tglobalradar_rereads_sources_when_facilities_change():
+    class Radar:
+        range = 10; power = 4
+    class Base:
+        position = (2, 50)
+        facilities_version = 0
+        radars = []
+        def get_radar_facilities(self):
+            return self.radars
+    radar = TGlobalRadar(DummyWorld())
+    ufo = DummyLocation('UFO-1', (5, 50))
+    base = Base()
+    radar.scan([ufo], [base], [])
+    assert ufo.cover == 10
+    # A radar facility completes after the first scan
+    base.radars = [Radar()]
+    base.facilities_version += 1
+    radar.scan([ufo], [base], [])
+    assert ufo.cover == 6
+
+
+def test_tglobalradar_tracks_moving_and_removed_locations():
+    radar = TGlobalRadar(DummyWorld())
+    ufo = DummyLocation('UFO', (100, 10))
+    radar.track([ufo])
+    ufo.position = (5, 5)
+    radar.track([ufo])
+    assert radar.index.position(ufo) == (5, 5)
+    radar.track([])
+    assert len(radar.index) == 0
+
+
+def test_tglobalradar_uses_world_registry():
+    from engine.globe.world_locations import TWorldLocations
+    class World:
+        width = 240
+    world = World()
+    world.locations = TWorldLocations(world)
+    ufo = DummyLocation('UFO', (10, 10))
+    world.locations.add(ufo, 'ufo', 10, 10)
+    radar = TGlobalRadar(world)
+    assert radar.index is world.locations
+    class Radar:
+        range = 10; power = 4
+    class Base:
+        position = (5, 10)
+        def get_radar_facilities(self):
+            return [Radar()]
+    radar.scan([ufo], [Base()], [])
+    assert ufo.cover == 6
+    radar.track([])
+    assert world.locations.kinds[ufo] == 'ufo'
@@ -0,0 +1,39 @@
+"""
+Test suite for engine.globe.spatial_grid (TSpatialGrid)
+Covers insertion, movement, radius and nearest queries with horizontal wrap using pytest.
+"""
+
+import pytest
+from engine.globe.spatial_grid import TSpatialGrid
+
+
+def test_radius_query_matches_brute_force():
+    """Test radius queries return exactly the objects a full scan would find."""
+    grid = TSpatialGrid(cell_size=8, width=240)
+    points = {i: ((i * 37) % 240, (i * 11) % 120) for i in range(200)}
+    for item, (x, y) in points.items():
+        grid.insert(item, x, y)
+    for cx, cy, radius in ((0, 60, 25), (230, 5, 12), (120, 119, 40)):
+        expected = {item for item, (x, y) in points.items() if grid.distance(cx, cy, x, y) <= radius}
+        assert {item for item, _ in grid.query_radius(cx, cy, radius)} == expected
+
+
+def test_wrap_distance_and_move():
+    """Test distances wrap across the seam and moves re-bucket objects."""
+    grid = TSpatialGrid(cell_size=8, width=240)
+    assert grid.distance(1, 0, 239, 0) == pytest.approx(2)
+    assert grid.delta_x(239, 1) == pytest.approx(2)
+    grid.insert('ufo', 100, 10)
+    grid.move('ufo', 3, 10)
+    assert [item for item, _ in grid.query_radius(238, 10, 6)] == ['ufo']
+    grid.remove('ufo')
+    assert len(grid) == 0 and not grid.cells
+
+
+def test_nearest_returns_closest_first():
+    """Test nearest-k search widens until k objects are found."""
+    grid = TSpatialGrid(cell_size=4)
+    for item, x in (('a', 50), ('b', 5), ('c', 20)):
+        grid.insert(item, x, 0)
+    assert [item for item, _ in grid.nearest(0, 0, k=2)] == ['b', 'c']
+    assert grid.nearest(0, 0, k=3, max_radius=10) == [('b', 5.0)]
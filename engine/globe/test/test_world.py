@@ -0,0 +1,153 @@
+"""
+Test suite for engine.globe.world (TWorld)
+Covers NumPy world layers, tile views and text rendering using pytest.
+"""
+
+import numpy as np
+import pytest
+from engine.globe.world import TWorld
+
+
+class DummyBiome:
+    def __init__(self, type_):
+        self.type = type_
+
+
+@pytest.fixture
+def world():
+    world = TWorld('earth', {'size': [4, 3]})
+    world.set_layers(
+        biome=[[1, 1, 2, 2], [1, 1, 2, 2], [2, 2, 2, 2]],
+        country=[[5, 5, 0, 0], [5, 6, 0, 0], [0, 0, 0, 0]],
+        region=[[1, 1, 2, 2], [1, 1, 2, 2], [3, 3, 3, 3]],
+    )
+    return world
+
+
+def test_layers_are_arrays_and_owner_defaults_to_country(world):
+    """Test layers are [height, width] arrays and the owner layer starts as the country layer."""
+    assert world.layers['region'].shape == (3, 4)
+    assert world.width == 4 and world.height == 3
+    assert np.array_equal(world.layers['owner'], world.layers['country'])
+    world.layers['owner'][0, 0] = 6
+    assert world.layers['country'][0, 0] == 5
+
+
+def test_tiles_are_views(world):
+    """Test tile views read and write the layers."""
+    tile = world.get_tile(1, 1)
+    assert (tile.biome_id, tile.country_id, tile.region_id) == (1, 6, 1)
+    tile.region_id = 3
+    assert world.layers['region'][1, 1] == 3
+    assert world.tiles[1][1] is tile
+
+
+def test_classify_land(world):
+    """Test the land layer is derived from biome types."""
+    world.classify_land({1: DummyBiome('land'), 2: DummyBiome('water')})
+    assert world.layers['land'].sum() == 4
+    assert world.get_tile(0, 0).is_land is True
+    assert world.get_tile(3, 2).is_land is False
+
+
+def test_render_tile_map_to_text(world, tmp_path):
+    """Test the text render writes every layer and the city map."""
+    class DummyCity:
+        position = (2, 1)
+    world.cities.append(DummyCity())
+    out = tmp_path / 'world.txt'
+    world.render_tile_map_to_text(out)
+    lines = out.read_text(encoding='utf-8').splitlines()
+    assert lines[0] == 'BIOMES'
+    assert lines[1] == '  1   1   2   2'
+    assert lines[lines.index('CITIES') + 2] == '_ _ X _'
+
+
+def test_day_night_band_matches_reference():
+    """Test the vectorized day band matches the per-tile definition and is cached per time step."""
+    world = TWorld('earth', {'size': [240, 120]})
+    day_map = world.get_day_night_map(11)
+    assert day_map.shape == (120, 240)
+    sun = 30
+    for x in range(240):
+        dist = (x - sun) % 240
+        dist = min(dist, 240 - dist)
+        assert bool(day_map[5, x]) == (dist <= 22)
+    assert world._day_row(11) is world._day_row(11)
+    assert world.is_lit(sun, 60, 11) and not world.is_lit(sun + 120, 60, 11)
+
+
+def test_day_band_moves_with_hours():
+    """Test hours move the sun between day steps."""
+    world = TWorld('earth', {'size': [240, 120]})
+    assert world.sun_position(1, 12) == pytest.approx(1.5)
+    assert world.is_lit(22, 0, 1) and not world.is_lit(23, 0, 1)
+    assert world.is_lit(23, 0, 1, hour=12)
+
+
+def test_build_indexes_groups_tiles_and_bounds(world):
+    """Test one indexing pass gives per-id tile offsets, positions and bounding boxes."""
+    world.build_indexes()
+    assert world.tile_index['region'][2].tolist() == [2, 3, 6, 7]
+    assert world.tile_positions('country', 5) == [(0, 0), (1, 0), (0, 1)]
+    assert world.bounds['region'][3] == (0, 2, 3, 2)
+    assert world.tile_positions('country', 9) == []
+
+
+def test_region_adjacency_needs_shared_border(world):
+    """Test regions sharing at least two border edges are neighbours, including across the horizontal wrap."""
+    world.build_indexes()
+    assert world.region_neighbors[1] == {2, 3}
+    assert world.region_neighbors[3] == {1, 2}
+    world.set_layers(region=[[1, 0, 0, 2], [1, 0, 0, 2], [0, 0, 0, 0]])
+    world.build_indexes()
+    assert world.region_neighbors[1] == {2}
+
+
+def test_expanded_positions_add_neighbour_ring(world):
+    """Test region tiles expand by one tile in all directions, clipped to the map."""
+    world.build_indexes()
+    expanded = set(world.expanded_positions('region', 1))
+    assert expanded == {(x, y) for x in range(3) for y in range(3)}
+
+
+def test_tile_pools_filter_and_cache(world):
+    """Test tile pools combine region/country/land filters, are cached and give O(1) random picks."""
+    import random
+    world.classify_land({1: DummyBiome('land'), 2: DummyBiome('water')})
+    world.build_indexes()
+    world.build_pools()
+    assert world.tile_pool(region_id=1, land=True).tolist() == [0, 1, 4, 5]
+    assert world.tile_pool(region_id=2, land=True).tolist() == []
+    assert world.tile_pool(region_id=1, country_id=5).tolist() == [0, 1, 4]
+    assert world.tile_pool(land=False).size == 8
+    assert world.tile_pool(region_id=1, land=True) is world.tile_pool(region_id=1, land=True)
+    assert world.random_tile(random.Random(1), region_id=3) in {(0, 2), (1, 2), (2, 2), (3, 2)}
+    assert world.random_tile(random.Random(1), region_id=2, land=True) is None
+
+
+def test_remoteness_matches_wrapped_manhattan_distance():
+    """Test the distance field equals the wrapped Manhattan distance to the nearest city and follows city changes."""
+    class DummyCity:
+        def __init__(self, position):
+            self.position = position
+    world = TWorld('earth', {'size': [12, 6]})
+    world.cities.extend([DummyCity((1, 1)), DummyCity((6, 4))])
+    field = world.remoteness()
+    for y in range(6):
+        for x in range(12):
+            expected = min(min(abs(x - cx), 12 - abs(x - cx)) + abs(y - cy) for cx, cy in ((1, 1), (6, 4)))
+            assert field[y, x] == expected
+    assert world.remoteness() is field
+    world.cities.pop()
+    assert world.remoteness()[4, 6] == 5 + 3
+
+
+def test_most_remote_tile_in_region(world):
+    """Test remote tile selection is the argmax of the distance field over a region pool."""
+    class DummyCity:
+        position = (0, 0)
+    world.cities.append(DummyCity())
+    world.build_indexes()
+    assert world.most_remote_tile(region_id=2) == (2, 1)
+    assert world.most_remote_tile(region_id=9) is None
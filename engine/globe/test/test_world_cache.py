@@ -0,0 +1,60 @@
+"""
+Test suite for engine.globe.world_cache (TWorldCache)
+Covers cache keys and save/load round trips of processed worlds using pytest.
+"""
+
+import numpy as np
+import pytest
+from engine.globe.world import TWorld
+from engine.globe.world_cache import TWorldCache
+
+
+@pytest.fixture
+def world():
+    world = TWorld('earth', {'size': [4, 3]})
+    world.set_layers(
+        biome=[[1, 1, 2, 2], [1, 1, 2, 2], [2, 2, 2, 2]],
+        country=[[5, 5, 0, 0], [5, 6, 0, 0], [0, 0, 0, 0]],
+        region=[[1, 1, 2, 2], [1, 1, 2, 2], [3, 3, 3, 3]],
+        land=[[1, 1, 0, 0], [1, 1, 0, 0], [0, 0, 0, 0]],
+    )
+    world.build_indexes()
+    return world
+
+
+def test_key_depends_on_content_and_version(tmp_path):
+    """Test keys change with the TMX content and the mod version."""
+    tmx = tmp_path / 'earth.tmx'
+    tmx.write_text('<map/>')
+    key = TWorldCache.key(tmx, '1.0')
+    assert key == TWorldCache.key(tmx, '1.0')
+    assert key != TWorldCache.key(tmx, '1.1')
+    tmx.write_text('<map></map>')
+    assert key != TWorldCache.key(tmx, '1.0')
+
+
+def test_round_trip_restores_layers_indexes_and_cities(world, tmp_path):
+    """Test a saved world loads back with equal layers, indexes, adjacency and city positions."""
+    cache = TWorldCache(tmp_path / 'cache')
+    assert cache.load(TWorld, 'abc') is None
+    cache.save(world, 'abc', {'london': (1, 0)})
+    loaded, cities = cache.load(TWorld, 'abc')
+    for name in TWorldCache.LAYERS:
+        assert np.array_equal(loaded.layers[name], world.layers[name])
+    assert loaded.layers['land'].dtype == np.bool_
+    assert isinstance(loaded.layers['region'], np.memmap) or isinstance(loaded.layers['region'].base, np.memmap)
+    assert loaded.tile_positions('country', 5) == world.tile_positions('country', 5)
+    assert loaded.bounds['region'] == world.bounds['region']
+    assert loaded.region_neighbors == world.region_neighbors
+    assert cities == {'london': (1, 0)}
+
+
+def test_loaded_layers_are_copy_on_write(world, tmp_path):
+    """Test tile views can write to a loaded world without touching the cache files."""
+    cache = TWorldCache(tmp_path)
+    cache.save(world, 'abc', {})
+    loaded, _ = cache.load(TWorld, 'abc')
+    loaded.get_tile(0, 0).region_id = 9
+    again, _ = cache.load(TWorld, 'abc')
+    assert loaded.layers['region'][0, 0] == 9
+    assert again.layers['region'][0, 0] == 1
@@ -0,0 +1,76 @@
+"""
+Test suite for engine.globe.world_locations (TWorldLocations)
+Covers kind/region registration, incremental moves and wrap-aware queries using pytest.
+"""
+import random
+
+from engine.globe.world import TWorld
+
+
+class DummyCity:
+    def __init__(self, position):
+        self.position = position
+
+
+def make_world():
+    world = TWorld('earth', {'size': [40, 10]})
+    world.set_layers(region=[[1 if x < 20 else 2 for x in range(40)] for _ in range(10)])
+    return world
+
+
+def test_world_registers_cities_and_queries_by_region():
+    """Test cities are registered on first access and bucketed by the region layer."""
+    world = make_world()
+    paris, tokyo = DummyCity((5, 5)), DummyCity([30, 2])
+    world.cities.extend([paris, tokyo])
+    locations = world.locations
+    assert locations.in_region('city', 1) == [paris]
+    assert locations.in_region('city', 2) == [tokyo]
+    assert locations.choice(random.Random(0), 'city', 2) is tokyo
+    assert locations.choice(random.Random(0), 'city', 3) is None
+
+
+def test_nearest_and_within_wrap_across_seam():
+    """Test nearest-k and radius queries across kinds and the east-west seam."""
+    locations = make_world().locations
+    base, craft, ufo = object(), object(), object()
+    locations.add(base, 'base', 1, 5)
+    locations.add(craft, 'craft', 37, 5)
+    locations.add(ufo, 'ufo', 20, 5)
+    assert [item for item, _ in locations.nearest(39, 5, k=2)] == [base, craft]
+    assert locations.nearest(39, 5, kind='ufo')[0] == (ufo, 19.0)
+    assert [item for item, _ in locations.within(0, 5, 3.5)] == [base, craft]
+    assert locations.within(0, 5, 3.5, kind='base') == [(base, 1.0)]
+
+
+def test_moves_update_region_buckets_incrementally():
+    """Test moving an object across a region border re-buckets it, and removal forgets it."""
+    world = make_world()
+    locations = world.locations
+    ufo = object()
+    locations.add(ufo, 'ufo', 18, 5)
+    assert locations.update(ufo, 22.5, 5)
+    assert locations.in_region('ufo', 1) == []
+    assert locations.in_region('ufo', 2) == [ufo]
+    assert locations.position(ufo) == (22.5, 5)
+    world.set_layers(region=[[3] * 40 for _ in range(10)])
+    assert locations.in_region('ufo', 3) == [ufo]
+    locations.remove(ufo)
+    assert ufo not in locations
+    assert not locations.update(ufo, 1, 1)
+    assert locations.by_region == {}
+
+
+def test_watchers_and_place():
+    """Test watchers of a kind see additions, moves and removals, and place() uses the object's own position."""
+    locations = make_world().locations
+    seen = []
+    locations.watch('ufo', lambda item, position: seen.append((item, position)))
+    ufo = DummyCity((3, 4))
+    assert locations.place(ufo, 'ufo')
+    locations.place(DummyCity((1, 1)), 'base')
+    locations.move(ufo, 39, 4)
+    locations.remove(ufo)
+    assert seen == [(ufo, (3, 4)), (ufo, (39, 4)), (ufo, None)]
+    assert locations.distance(39, 4, 1, 4) == 2
+    assert not locations.place(object(), 'site')
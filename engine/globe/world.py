@@ -1,5 +1,6 @@
 """
-TWorld: Represents the world map as a 2D array of WorldTiles. Supports multiple worlds in the game.
+TWorld: Represents the world map as NumPy tile layers (biome, country, region, land/sea, owner) with TWorldTile views.
+Supports multiple worlds in the game.
 
 Classes:
     TWorld: Main class for world map management.
@@ -7,8 +8,10 @@ Classes:
 Last standardized: 2024-06-11
 """
 
+import numpy as np
 from pytmx import TiledTileLayer
 from economy.ttransfer import TTransfer
+from engine.globe.world_locations import TWorldLocations
 from engine.globe.world_tile import TWorldTile
 from location.city import TCity
 from lore.faction import TFaction
@@ -16,8 +19,10 @@ from pathlib import Path
 
 class TWorld:
     """
-    Represents a map of the world as a 2D array of WorldTiles.
+    Represents a map of the world as a set of [height, width] NumPy layers.
     Supports multiple worlds in the game.
+    Layers hold per-tile ids so geoscape systems (radar, UFO scripts, funding, rendering) can work on whole arrays;
+    tiles are TWorldTile views over the layers, built on first access for code that works per tile.
 
     Attributes:
         pid (str): World identifier.
@@ -31,11 +36,27 @@ class TWorld:
         regions (bool): Whether regions are present.
         tech_start (list): Starting technologies.
         transfer_list (list[TTransfer]): Global transfer list.
-        tiles (list[list[TWorldTile]]): 2D array of world tiles.
+        layers (dict[str, np.ndarray]): Layer name ('biome', 'country', 'region', 'land', 'owner') -> [height, width] array.
+        tiles (list[list[TWorldTile]]): 2D array of tile views over the layers (built lazily).
         cities (list[TCity]): List of city objects.
         factions (list[TFaction]): List of factions.
         diplomacy (dict): Diplomacy/relations mapping.
+        tile_index (dict): Layer name -> {id: sorted flat tile offsets (y * width + x)}, built by build_indexes().
+        bounds (dict): Layer name -> {id: (min_x, min_y, max_x, max_y)} inclusive bounding boxes.
+        index_groups (dict): Layer name -> (sorted offsets, ids, starts, counts) the tile index was built from.
+        region_neighbors (dict): Region id -> set of region ids sharing a border.
+        region_lookup (dict): Region id -> TRegion.
+        locations (TWorldLocations): Spatial registry of cities, bases, crafts and UFOs (built on first access).
+        LAYER_TYPES (dict): Layer name -> NumPy dtype.
+        MIN_SHARED_BORDER (int): Border edges two regions must share to be neighbours.
+        DAY_BAND_SPEED (int): Tiles the day band moves per day.
+        DAY_BAND_HALF_WIDTH (int): Half width of the day band in tiles.
     """
+    LAYER_TYPES = {'biome': np.int32, 'country': np.int32, 'region': np.int32, 'land': np.bool_, 'owner': np.int32}
+    MIN_SHARED_BORDER = 2
+    DAY_BAND_SPEED = 3
+    DAY_BAND_HALF_WIDTH = 22
+
     def __init__(self, pid, data):
         self.pid = pid
         self.name = data.get('name', pid)
@@ -48,27 +69,438 @@ class TWorld:
         self.regions = data.get('regions', False)
         self.tech_start = data.get('tech_start', [])
         self.transfer_list = list[TTransfer]
-        self.tiles : list[list[TWorldTile]] = []
         self.cities : list[TCity] = []
         self.factions : list[TFaction] = []
         self.diplomacy : dict[str, int] = {}
+        self.layers : dict[str, np.ndarray] = {}
+        self.tile_index : dict[str, dict[int, np.ndarray]] = {}
+        self.bounds : dict[str, dict[int, tuple]] = {}
+        self.index_groups : dict[str, tuple] = {}
+        self.region_neighbors : dict[int, set[int]] = {}
+        self.region_lookup : dict = {}
+        self._pools : dict[tuple, np.ndarray] = {}
+        self._remoteness : np.ndarray | None = None
+        self._remoteness_key = None
+        self._tiles : list[list[TWorldTile]] | None = None
+        self._day_cache_key = None
+        self._day_cache_row = None
+        self._locations : TWorldLocations | None = None
+        self.set_layers()
+
+    @property
+    def width(self) -> int:
+        """
+        Width of the world in tiles.
+        """
+        return int(self.size[0]) if self.size else 0
+
+    @property
+    def height(self) -> int:
+        """
+        Height of the world in tiles.
+        """
+        return int(self.size[1]) if self.size else 0
+
+    def set_layers(self, biome=None, country=None, region=None, land=None, owner=None):
+        """
+        Replace the world layers; missing layers are zero-filled (owner defaults to a copy of the country layer).
+        The world size follows the given arrays, and tile views are rebuilt on next access.
+
+        Args:
+            biome (array-like, optional): Biome id per tile, [height][width].
+            country (array-like, optional): Country id per tile.
+            region (array-like, optional): Region id per tile.
+            land (array-like, optional): True for land tiles.
+            owner (array-like, optional): Owning country id per tile.
+        """
+        given = {'biome': biome, 'country': country, 'region': region, 'land': land, 'owner': owner}
+        shape = next((np.shape(value) for value in given.values() if value is not None), (self.height, self.width))
+        if owner is None and country is not None:
+            given['owner'] = country
+        for name, dtype in self.LAYER_TYPES.items():
+            value = given[name]
+            if value is None:
+                self.layers[name] = np.zeros(shape, dtype=dtype)
+            else:
+                self.layers[name] = np.array(value, dtype=dtype).reshape(shape)
+        self.size = [int(shape[1]), int(shape[0])]
+        self._tiles = None
+        self._day_cache_key = None
+        self.tile_index = {}
+        self.bounds = {}
+        self.index_groups = {}
+        self.region_neighbors = {}
+        self._pools.clear()
+        self._remoteness = None
+        if self._locations is not None:
+            self._locations.rebuild()
+
+    @property
+    def locations(self) -> TWorldLocations:
+        """
+        Spatial registry of everything positioned on this world; cities are registered when it is first built.
+        """
+        if self._locations is None:
+            self._locations = TWorldLocations(self)
+            self._locations.sync('city', self.cities)
+        return self._locations
+
+    def classify_land(self, biomes):
+        """
+        Fill the land layer from biome types ('land' biomes are land, everything else is sea).
+
+        Args:
+            biomes (dict): Biome id -> TBiome.
+        """
+        land_ids = []
+        for pid, biome in biomes.items():
+            if getattr(biome, 'type', 'land') != 'land':
+                continue
+            try:
+                land_ids.append(int(pid))
+            except (TypeError, ValueError):
+                continue
+        self.layers['land'] = np.isin(self.layers['biome'], land_ids)
+        self._pools.clear()
+
+    def build_indexes(self, names=('region', 'country', 'biome')):
+        """
+        Build per-id tile offsets and bounding boxes for id layers, and region adjacency, in one pass per layer.
+        Offsets are grouped by a stable argsort of the layer, so each layer is read once instead of once per id.
+
+        Args:
+            names (iterable): Id layers to index.
+        """
+        for name in names:
+            flat = self.layers[name].ravel()
+            order = np.argsort(flat, kind='stable').astype(np.int32)
+            ids, starts, counts = np.unique(flat[order], return_index=True, return_counts=True)
+            self.set_index(name, order, ids, starts, counts)
+        if 'region' in names:
+            self.region_neighbors = self.layer_adjacency('region')
+
+    def set_index(self, name, order, ids, starts, counts):
+        """
+        Install the index of one id layer from its grouped offsets (used by build_indexes() and the world cache).
+
+        Args:
+            name (str): Id layer name.
+            order (np.ndarray): Flat tile offsets sorted by id.
+            ids (np.ndarray): Distinct ids in ascending order.
+            starts (np.ndarray): Start of each id's group in order.
+            counts (np.ndarray): Size of each id's group.
+        """
+        width = self.width
+        index = {}
+        bounds = {}
+        for pid, start, count in zip(np.asarray(ids).tolist(), np.asarray(starts).tolist(), np.asarray(counts).tolist()):
+            offsets = order[start:start + count]
+            xs, ys = offsets % width, offsets // width
+            index[pid] = offsets
+            bounds[pid] = (int(xs.min()), int(ys.min()), int(xs.max()), int(ys.max()))
+        self.tile_index[name] = index
+        self.bounds[name] = bounds
+        self.index_groups[name] = (order, ids, starts, counts)
+        self._pools.clear()
+
+    def layer_adjacency(self, name):
+        """
+        Ids of a layer that share at least MIN_SHARED_BORDER tile edges (the world wraps horizontally; id 0 is ignored).
+
+        Args:
+            name (str): Id layer name.
+        Returns:
+            dict: Id -> set of neighbouring ids.
+        """
+        layer = self.layers[name]
+        pairs = []
+        if layer.size:
+            # Horizontal edges including the wrap seam, then vertical edges
+            pairs.append((layer, np.roll(layer, -1, axis=1)))
+            pairs.append((layer[:-1, :], layer[1:, :]))
+        edges = {}
+        for a, b in pairs:
+            mask = (a != b) & (a != 0) & (b != 0)
+            low = np.minimum(a[mask], b[mask]).astype(np.int64)
+            high = np.maximum(a[mask], b[mask]).astype(np.int64)
+            keys, counts = np.unique(np.stack([low, high], axis=1), axis=0, return_counts=True)
+            for (first, second), count in zip(keys.tolist(), counts.tolist()):
+                edges[(first, second)] = edges.get((first, second), 0) + count
+        neighbors = {pid: set() for pid in np.unique(layer).tolist() if pid != 0}
+        for (first, second), count in edges.items():
+            if count >= self.MIN_SHARED_BORDER:
+                neighbors[first].add(second)
+                neighbors[second].add(first)
+        return neighbors
+
+    def tile_pool(self, region_id=None, country_id=None, biome_id=None, land=None):
+        """
+        Flat offsets of the tiles matching all given filters, cached per filter combination.
+        Id filters use the tile index (build_indexes()); land=True/False keeps land or sea tiles only.
+
+        Args:
+            region_id (int, optional): Region id.
+            country_id (int, optional): Country id.
+            biome_id (int, optional): Biome id.
+            land (bool, optional): True for land, False for sea, None for both.
+        Returns:
+            np.ndarray: Sorted flat tile offsets (y * width + x), possibly empty.
+        """
+        key = (region_id, country_id, biome_id, land)
+        pool = self._pools.get(key)
+        if pool is None:
+            for name, pid in (('region', region_id), ('country', country_id), ('biome', biome_id)):
+                if pid is None:
+                    continue
+                offsets = self.tile_index.get(name, {}).get(pid, np.zeros(0, dtype=np.int32))
+                pool = offsets if pool is None else np.intersect1d(pool, offsets, assume_unique=True)
+            if pool is None:
+                pool = np.arange(self.width * self.height, dtype=np.int32)
+            pool = np.sort(pool)
+            if land is not None:
+                pool = pool[self.layers['land'].ravel()[pool] == bool(land)]
+            self._pools[key] = pool
+        return pool
+
+    def build_pools(self):
+        """
+        Precompute the tile pools used by UFO scripts: every region (all, land, sea), every country and the whole map.
+        """
+        for land in (None, True, False):
+            self.tile_pool(land=land)
+            for region_id in self.tile_index.get('region', {}):
+                self.tile_pool(region_id=region_id, land=land)
+        for country_id in self.tile_index.get('country', {}):
+            self.tile_pool(country_id=country_id)
+
+    def random_tile(self, rng, region_id=None, country_id=None, biome_id=None, land=None):
+        """
+        Pick a random tile from a tile pool in O(1).
+
+        Args:
+            rng: Random generator with randrange() (random module or random.Random).
+            region_id (int, optional): Region id.
+            country_id (int, optional): Country id.
+            biome_id (int, optional): Biome id.
+            land (bool, optional): True for land, False for sea, None for both.
+        Returns:
+            tuple|None: (x, y), or None if the pool is empty.
+        """
+        pool = self.tile_pool(region_id, country_id, biome_id, land)
+        if not len(pool):
+            return None
+        offset = int(pool[rng.randrange(len(pool))])
+        return offset % self.width, offset // self.width
+
+    def city_positions(self):
+        """
+        Tile positions of the world's cities.
+
+        Returns:
+            list[tuple]: (x, y) per city with a position.
+        """
+        positions = []
+        for city in self.cities:
+            position = getattr(city, 'position', None)
+            if position is None:
+                continue
+            if hasattr(position, 'x'):
+                positions.append((int(position.x), int(position.y)))
+            else:
+                positions.append((int(position[0]), int(position[1])))
+        return positions
+
+    def remoteness(self):
+        """
+        Distance (in tile steps, wrapping east-west) from every tile to the nearest city.
+        Computed by a multi-source breadth-first wavefront over the whole map and cached until the cities change.
+
+        Returns:
+            np.ndarray: int32 [height, width]; width + height everywhere when there are no cities.
+        """
+        positions = self.city_positions()
+        key = tuple(sorted(positions))
+        if self._remoteness is None or self._remoteness_key != key:
+            height, width = self.height, self.width
+            unreached = width + height
+            dist = np.full((height, width), unreached, dtype=np.int32)
+            frontier = np.zeros((height, width), dtype=bool)
+            for x, y in positions:
+                if 0 <= x < width and 0 <= y < height:
+                    frontier[y, x] = True
+            step = 0
+            while frontier.any():
+                dist[frontier] = step
+                grown = frontier | np.roll(frontier, 1, axis=1) | np.roll(frontier, -1, axis=1)
+                grown[1:, :] |= frontier[:-1, :]
+                grown[:-1, :] |= frontier[1:, :]
+                frontier = grown & (dist == unreached)
+                step += 1
+            self._remoteness = dist
+            self._remoteness_key = key
+        return self._remoteness
+
+    def most_remote_tile(self, region_id=None, country_id=None, land=None):
+        """
+        Tile of a pool farthest from any city (first such tile in row-major order).
+
+        Args:
+            region_id (int, optional): Region id.
+            country_id (int, optional): Country id.
+            land (bool, optional): True for land, False for sea, None for both.
+        Returns:
+            tuple|None: (x, y), or None if the pool is empty.
+        """
+        pool = self.tile_pool(region_id=region_id, country_id=country_id, land=land)
+        if not len(pool):
+            return None
+        offset = int(pool[np.argmax(self.remoteness().ravel()[pool])])
+        return offset % self.width, offset // self.width
 
-    def get_day_night_map(self, day_of_month):
+    def register_regions(self, regions):
+        """
+        Set the region lookup used by UFO scripts.
+
+        Args:
+            regions (dict|iterable): Region id -> TRegion, or TRegion instances (keyed by pid).
+        """
+        if isinstance(regions, dict):
+            self.region_lookup = dict(regions)
+        else:
+            self.region_lookup = {region.pid: region for region in regions}
+
+    def get_region(self, region_id):
+        """
+        Look up a region by id.
+
+        Args:
+            region_id: Region id.
+        Returns:
+            TRegion|None: Region, or None if unknown.
+        """
+        return self.region_lookup.get(region_id)
+
+    def tile_positions(self, name, pid):
+        """
+        (x, y) positions of all tiles with an id in a layer (requires build_indexes()).
+
+        Args:
+            name (str): Id layer name.
+            pid (int): Id to look up.
+        Returns:
+            list[tuple]: Tile positions in row-major order.
+        """
+        offsets = self.tile_index.get(name, {}).get(pid)
+        if offsets is None:
+            return []
+        return list(zip((offsets % self.width).tolist(), (offsets // self.width).tolist()))
+
+    def expanded_positions(self, name, pid):
+        """
+        Tiles of an id plus their 8-way neighbours (within map bounds), computed inside the id's bounding box.
+
+        Args:
+            name (str): Id layer name.
+            pid (int): Id to look up.
+        Returns:
+            list[tuple]: (x, y) positions.
+        """
+        box = self.bounds.get(name, {}).get(pid)
+        if box is None:
+            return []
+        x0, y0 = max(0, box[0] - 1), max(0, box[1] - 1)
+        x1, y1 = min(self.width - 1, box[2] + 1), min(self.height - 1, box[3] + 1)
+        mask = np.pad(self.layers[name][y0:y1 + 1, x0:x1 + 1] == pid, 1)
+        grown = np.zeros_like(mask)
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                grown |= np.roll(np.roll(mask, dy, axis=0), dx, axis=1)
+        ys, xs = np.nonzero(grown[1:-1, 1:-1])
+        return list(zip((xs + x0).tolist(), (ys + y0).tolist()))
+
+    @property
+    def tiles(self) -> list[list[TWorldTile]]:
+        """
+        2D array [y][x] of TWorldTile views over the layers, built on first access.
+        """
+        if self._tiles is None:
+            self._tiles = [[TWorldTile(x, y, world=self) for x in range(self.width)] for y in range(self.height)]
+        return self._tiles
+
+    def get_tile(self, x, y) -> TWorldTile:
+        """
+        Get the tile view at (x, y).
+
+        Args:
+            x (int): X coordinate.
+            y (int): Y coordinate.
+        Returns:
+            TWorldTile: Tile view.
+        """
+        return self.tiles[y][x]
+
+    def sun_position(self, day_of_month, hour=0):
+        """
+        X coordinate (in tiles, fractional) of the center of the day band.
+        The band moves DAY_BAND_SPEED tiles per day; hours move it smoothly between days.
+
+        Args:
+            day_of_month (int): Day of the month (1-based).
+            hour (float, optional): Hour of the day (0-24).
+        Returns:
+            float: Sun center x in [0, width).
+        """
+        width = self.width or 240
+        return (self.DAY_BAND_SPEED * (day_of_month - 1 + hour / 24.0)) % width
+
+    def _day_row(self, day_of_month, hour=0):
+        """
+        Day mask of one row (the band is vertical, so all rows are equal), cached for the last time step.
+
+        Args:
+            day_of_month (int): Day of the month (1-based).
+            hour (float, optional): Hour of the day.
+        Returns:
+            np.ndarray: Bool array [width], True where it is day.
+        """
+        key = (day_of_month, hour)
+        if self._day_cache_key != key:
+            width = self.width or 240
+            dist = np.abs(np.arange(width) - self.sun_position(day_of_month, hour)) % width
+            dist = np.minimum(dist, width - dist)
+            self._day_cache_row = dist <= self.DAY_BAND_HALF_WIDTH
+            self._day_cache_key = key
+        return self._day_cache_row
+
+    def get_day_night_map(self, day_of_month, hour=0):
         """
         Returns a 2D array (size: [height][width]) with True for day, False for night for each tile.
         The day/night band moves westward, completing a full cycle in 30 days.
+        The row mask is computed once per time step and broadcast (read-only) to the full map.
+
+        Args:
+            day_of_month (int): Day of the month (1-based).
+            hour (float, optional): Hour of the day (0-24).
+        Returns:
+            np.ndarray: Read-only bool array [height, width].
+        """
+        height = self.height or 120
+        row = self._day_row(day_of_month, hour)
+        return np.broadcast_to(row, (height, row.shape[0]))
+
+    def is_lit(self, x, y, day_of_month, hour=0):
         """
-        width = self.size[0] if self.size and self.size[0] else 240
-        height = self.size[1] if self.size and self.size[1] else 120
-        day_night_map = [[False for _ in range(width)] for _ in range(height)]
-        sun_center = (3 * (day_of_month - 1)) % width
-        for y in range(height):
-            for x in range(width):
-                dist = (x - sun_center) % width
-                if dist > width // 2:
-                    dist = width - dist
-                day_night_map[y][x] = dist <= 22
-        return day_night_map
+        Check whether a tile is in daylight (O(1) after the first query of a time step).
+
+        Args:
+            x (int): X coordinate.
+            y (int): Y coordinate (the band is vertical, kept for a uniform tile API).
+            day_of_month (int): Day of the month (1-based).
+            hour (float, optional): Hour of the day.
+        Returns:
+            bool: True if the tile is lit.
+        """
+        return bool(self._day_row(day_of_month, hour)[x])
 
     def render_tile_map_to_text(self, out_path):
         """
@@ -77,35 +509,17 @@ class TWorld:
         Adds a city map layer: 'X' for city, '_' for no city.
         """
         with open(out_path, 'w', encoding='utf-8') as f:
-            width = self.size[0]
-            height = self.size[1]
-            # Biomes
-            f.write('BIOMES\n')
-            for y in range(height):
-                row = [f"{self.tiles[y][x].biome_id:3d}" if self.tiles[y][x] else '  0' for x in range(width)]
-                f.write(' '.join(row) + '\n')
-            f.write('\n')
-            # Countries
-            f.write('COUNTRIES\n')
-            for y in range(height):
-                row = [f"{self.tiles[y][x].country_id:3d}" if self.tiles[y][x] else '  0' for x in range(width)]
-                f.write(' '.join(row) + '\n')
-            f.write('\n')
-            # Regions
-            f.write('REGIONS\n')
-            for y in range(height):
-                row = [f"{self.tiles[y][x].region_id:3d}" if self.tiles[y][x] else '  0' for x in range(width)]
-                f.write(' '.join(row) + '\n')
-            f.write('\n')
+            for header, name in (('BIOMES', 'biome'), ('COUNTRIES', 'country'), ('REGIONS', 'region')):
+                f.write(header + '\n')
+                np.savetxt(f, self.layers[name], fmt='%3d', delimiter=' ')
+                f.write('\n')
             # Cities
             f.write('CITIES\n')
-            # Build a set of city positions for fast lookup
-            city_positions = set()
+            city_map = np.full((self.height, self.width), '_')
             for city in self.cities:
-                city_positions.add(city.position)
-            for y in range(height):
-                row = [('X' if (x, y) in city_positions else '_') for x in range(width)]
-                f.write(' '.join(row) + '\n')
+                x, y = city.position
+                city_map[y, x] = 'X'
+            np.savetxt(f, city_map, fmt='%s', delimiter=' ')
 
     def render_world_layers_to_png(self, output_path):
         """
@@ -119,26 +533,15 @@ class TWorld:
         tile_size = 16  # Assuming 16x16 tiles
         img = Image.new('RGBA', (width * tile_size, height * tile_size))
         tileset_manager = game.mod.tileset_manager
-        # Helper to draw a layer
-
-        for y in range(height):
-            for x in range(width):
-                tile = self.tiles[y][x]
-                # Biome layer
-                gid = tile.biome_id
-                tile_img, mask = tileset_manager.all_tiles.get(f'biomes_{gid:03d}', (None, None))
-                if tile_img is not None:
-                    img.paste(tile_img, (x * tile_size, y * tile_size), mask)
-                # Region layer
-                gid = tile.region_id
-                tile_img, mask = tileset_manager.all_tiles.get(f'regions_{gid:03d}', (None, None))
-                if tile_img is not None:
-                    img.paste(tile_img, (x * tile_size, y * tile_size), mask)
-                # Country layer
-                gid = tile.country_id
-                tile_img, mask = tileset_manager.all_tiles.get(f'countries_{gid:03d}', (None, None))
-                if tile_img is not None:
-                    img.paste(tile_img, (x * tile_size, y * tile_size), mask)
+        # Layers in stacking order; each tile image is looked up once per id
+        for prefix, name in (('biomes', 'biome'), ('regions', 'region'), ('countries', 'country')):
+            layer = self.layers[name]
+            for gid in np.unique(layer):
+                tile_img, mask = tileset_manager.all_tiles.get(f'{prefix}_{int(gid):03d}', (None, None))
+                if tile_img is None:
+                    continue
+                for y, x in np.argwhere(layer == gid):
+                    img.paste(tile_img, (int(x) * tile_size, int(y) * tile_size), mask)
         # Draw cities
         for city in self.cities:
             x, y = city.position
@@ -149,18 +552,71 @@ class TWorld:
         img.save(output_path)
 
     @classmethod
-    def from_tmx(cls, tmx_path):
+    def from_tmx(cls, tmx_path, cache_dir=None, mod_version=None):
         """
         Load a world TMX file and create a TWorld instance with all tiles, using GID mapping for biomes, countries, and regions.
         Also loads city objects from a layer named 'city' and assigns them to the world.
+        With a cache directory, the processed world is stored in a TWorldCache keyed by the TMX hash and mod version
+        and memory-mapped on later loads instead of parsing the TMX again.
+
+        Args:
+            tmx_path (str|Path): World TMX file.
+            cache_dir (str|Path, optional): Compiled world cache directory.
+            mod_version (str, optional): Mod version for the cache key (defaults to the mod's 'version' data).
+        Returns:
+            TWorld: Loaded world.
         """
-        import pytmx
-        from engine.globe.world_tile import TWorldTile
+        from engine.engine.game import TGame
+        from engine.globe.world_cache import TWorldCache
         tmx_path = Path(tmx_path)
+        game = TGame()
+        cache = key = None
+        loaded = None
+        if cache_dir is not None:
+            if mod_version is None:
+                mod_version = (getattr(game.mod, 'mod_data', None) or {}).get('version', '')
+            cache = TWorldCache(cache_dir)
+            key = cache.key(tmx_path, mod_version)
+            loaded = cache.load(cls, key)
+        if loaded is not None:
+            world, city_positions = loaded
+        else:
+            world, city_positions = cls._parse_tmx(tmx_path, game)
+            # One indexing pass over the id layers gives ownership, region tiles, bounds and adjacency
+            world.build_indexes()
+            if cache is not None:
+                cache.save(world, key, city_positions)
+        for country in game.mod.countries.values():
+            country.owned_tiles = world.tile_positions('country', country.pid)
+        for region in game.mod.regions.values():
+            region.tiles = world.expanded_positions('region', region.pid)
+            region.neighbors = list(world.region_neighbors.get(region.pid, ()))
+        world.register_regions(game.mod.regions)
+        world.build_pools()
+        world.cities.clear()
+        for city_id, position in city_positions.items():
+            city_obj = game.mod.cities.get(city_id)
+            if not city_obj:
+                continue
+            city_obj.position = position
+            world.cities.append(city_obj)
+        world.locations.sync('city', world.cities)
+        return world
+
+    @classmethod
+    def _parse_tmx(cls, tmx_path, game):
+        """
+        Parse a world TMX file into layers and city positions.
+
+        Args:
+            tmx_path (Path): World TMX file.
+            game (TGame): Game with the loaded mod (biomes for land/sea).
+        Returns:
+            tuple: (TWorld, {city id: (x, y)}).
+        """
+        import pytmx
         tmx = pytmx.TiledMap(str(tmx_path))
         width, height = tmx.width, tmx.height
-        from engine.engine.game import TGame
-        game = TGame()
         used_tilesets = {
             (tileset.name,
              tileset.firstgid,
@@ -171,57 +627,24 @@ class TWorld:
         def process_layer(layer):
             if layer is None:
                 return None
-            data = [[0 for _ in range(width)] for _ in range(height)]
-            div_factor = 1.0 / 18
-            for x, y, image in layer.tiles():
-                ix, iy, _, __ = image[1]
-                dx = (ix - 1) * div_factor
-                dy = (iy - 1) * div_factor
-                dn = dy * 10 + dx + 1
-                data[y][x] = int(dn)
+            data = np.zeros((height, width), dtype=np.int32)
+            cells = [(x, y, image[1][0], image[1][1]) for x, y, image in layer.tiles()]
+            if not cells:
+                return data
+            xs, ys, ixs, iys = np.array(cells, dtype=np.int64).T
+            # Tile id from its position in the 10-column, 18px-spaced tileset image
+            data[ys, xs] = ((iys - 1) / 18.0 * 10 + (ixs - 1) / 18.0 + 1).astype(np.int32)
             return data
         layers = {l.name: l for l in tmx.visible_layers if hasattr(l, 'data') and l.name in ('biome', 'country', 'region')}
         biome_layer: TiledTileLayer = layers.get('biome')
         country_layer: TiledTileLayer = layers.get('country')
         region_layer: TiledTileLayer = layers.get('region')
-        biome_layer_data = process_layer(biome_layer)
-        country_layer_data = process_layer(country_layer)
-        region_layer_data = process_layer(region_layer)
         world = cls(pid="Earth", data={"size": [width, height]})
-        world.tiles = [[TWorldTile(x, y) for x in range(width)] for y in range(height)]
         world.used_tilesets = used_tilesets
-        for y in range(height):
-            for x in range(width):
-                biome_gid = biome_layer_data[y][x] if biome_layer_data else 0
-                country_gid = country_layer_data[y][x] if country_layer_data else 0
-                region_gid = region_layer_data[y][x] if region_layer_data else 0
-                tile = TWorldTile(x, y, {
-                    'biome_id': biome_gid,
-                    'country_id': country_gid,
-                    'region_id': region_gid
-                })
-                world.tiles[y][x] = tile
-        countries_dict = game.mod.countries
-        regions_dict = game.mod.regions
-        biomes_dict = game.mod.biomes
-        for country in countries_dict.values():
-            country.calculate_owned_tiles(world.tiles)
-        for y in range(height):
-            for x in range(width):
-                tile = world.tiles[y][x]
-                if tile.region_id in regions_dict.keys():
-                    regions_dict[tile.region_id].tiles.append(tile)
-        region_neighbors = {region.pid: set() for region in regions_dict.values()}
-        region_ids = list(regions_dict.keys())
-        for i, id1 in enumerate(region_ids):
-            for id2 in region_ids[i+1:]:
-                common = set(regions_dict[id1].tiles).intersection(regions_dict[id2].tiles)
-                if len(common) >= 2:
-                    region_neighbors[id1].add(id2)
-                    region_neighbors[id2].add(id1)
-        for region in regions_dict.values():
-            region.calculate_region_tiles(world.tiles, width, height, region_neighbors)
-        world.cities.clear()
+        world.set_layers(biome=process_layer(biome_layer), country=process_layer(country_layer),
+                         region=process_layer(region_layer))
+        world.classify_land(game.mod.biomes)
+        city_positions = {}
         city_layer = None
         for layer in tmx.layers:
             if layer.name == 'city' :
@@ -232,11 +655,5 @@ class TWorld:
                 city_id = obj.name
                 if not city_id:
                     continue
-                city_obj = game.mod.cities.get(city_id)
-                if not city_obj:
-                    continue
-                tile_x = int(obj.x // 16)
-                tile_y = int(obj.y // 16)
-                city_obj.position = (tile_x, tile_y)
-                world.cities.append(city_obj)
-        return world
+                city_positions[city_id] = (int(obj.x // 16), int(obj.y // 16))
+        return world, city_positions
@@ -0,0 +1,142 @@
+"""
+engine/globe/world_cache.py
+
+Defines the TWorldCache class, a compiled binary cache of processed world maps.
+The layers, tile indexes, region adjacency and city positions derived from a world TMX file are stored once per
+(TMX content hash, mod version) and memory-mapped on later starts, so the geoscape does not re-parse the TMX
+or re-derive static world data.
+
+Classes:
+    TWorldCache: Save and load processed TWorld data keyed by TMX hash and mod version.
+
+Last standardized: 2026-10-18
+"""
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+
+class TWorldCache:
+    """
+    Compiled world cache in a directory.
+    Each entry is three files named after its key:
+        <key>.layers.npy: int32 [layer, height, width] stack of the world layers (LAYERS order).
+        <key>.index.npy: int32 [layer, height * width] tile offsets sorted by id, per indexed layer.
+        <key>.json: size, tileset info, index groups (ids, starts, counts), region adjacency and city positions.
+    The JSON file is written last, so an entry without it is incomplete and ignored.
+
+    Attributes:
+        path (Path): Cache directory.
+        LAYERS (tuple): Layer order in the layer stack.
+        INDEXED (tuple): Indexed layers in the index stack.
+        FORMAT (int): Cache format version, part of every key.
+    """
+    LAYERS = ('biome', 'country', 'region', 'land', 'owner')
+    INDEXED = ('region', 'country', 'biome')
+    FORMAT = 1
+
+    def __init__(self, path):
+        """
+        Initialize a cache in a directory (created on first save).
+
+        Args:
+            path (str|Path): Cache directory.
+        """
+        self.path = Path(path)
+
+    @classmethod
+    def key(cls, tmx_path, mod_version='') -> str:
+        """
+        Cache key of a world TMX file: hash of its content, the mod version and the cache format.
+
+        Args:
+            tmx_path (str|Path): World TMX file.
+            mod_version (str): Mod version string.
+        Returns:
+            str: Hex key.
+        """
+        digest = hashlib.sha256(Path(tmx_path).read_bytes())
+        digest.update(f'|{mod_version}|{cls.FORMAT}'.encode('utf-8'))
+        return digest.hexdigest()[:32]
+
+    def _files(self, key: str) -> Tuple[Path, Path, Path]:
+        """
+        Paths of the files of a cache entry.
+
+        Args:
+            key (str): Cache key.
+        Returns:
+            tuple: (layers file, index file, meta file).
+        """
+        return (self.path / f'{key}.layers.npy', self.path / f'{key}.index.npy', self.path / f'{key}.json')
+
+    def has(self, key: str) -> bool:
+        """
+        Check whether a complete entry exists for a key.
+
+        Args:
+            key (str): Cache key.
+        Returns:
+            bool: True if the entry can be loaded.
+        """
+        return all(path.exists() for path in self._files(key))
+
+    def save(self, world, key: str, cities: Optional[Dict[str, Tuple[int, int]]] = None) -> None:
+        """
+        Store a processed world (build_indexes() is run if the world has no index yet).
+
+        Args:
+            world (TWorld): World with layers filled.
+            key (str): Cache key.
+            cities (dict, optional): City id -> (x, y); defaults to the world's cities.
+        """
+        if any(name not in world.index_groups for name in self.INDEXED):
+            world.build_indexes(self.INDEXED)
+        if cities is None:
+            cities = {city.pid: tuple(city.position) for city in world.cities}
+        self.path.mkdir(parents=True, exist_ok=True)
+        layers_file, index_file, meta_file = self._files(key)
+        np.save(layers_file, np.stack([world.layers[name].astype(np.int32) for name in self.LAYERS]))
+        np.save(index_file, np.stack([world.index_groups[name][0].astype(np.int32) for name in self.INDEXED]))
+        groups = {
+            name: [np.asarray(part).tolist() for part in world.index_groups[name][1:]] for name in self.INDEXED
+        }
+        meta = {
+            'size': list(world.size),
+            'used_tilesets': sorted(list(entry) for entry in getattr(world, 'used_tilesets', ())),
+            'groups': groups,
+            'region_neighbors': {str(pid): sorted(ids) for pid, ids in world.region_neighbors.items()},
+            'cities': {str(pid): list(position) for pid, position in cities.items()},
+        }
+        meta_file.write_text(json.dumps(meta), encoding='utf-8')
+
+    def load(self, world_cls, key: str, pid: str = 'Earth'):
+        """
+        Load a world from the cache; layers and index offsets are memory-mapped copy-on-write.
+
+        Args:
+            world_cls (type): TWorld class to instantiate.
+            key (str): Cache key.
+            pid (str): World identifier.
+        Returns:
+            tuple|None: (TWorld, {city id: (x, y)}), or None if there is no complete entry.
+        """
+        if not self.has(key):
+            return None
+        layers_file, index_file, meta_file = self._files(key)
+        meta = json.loads(meta_file.read_text(encoding='utf-8'))
+        stack = np.load(layers_file, mmap_mode='c')
+        orders = np.load(index_file, mmap_mode='c')
+        world = world_cls(pid, {'size': meta['size']})
+        for i, name in enumerate(self.LAYERS):
+            world.layers[name] = stack[i].astype(np.bool_) if name == 'land' else stack[i]
+        world.used_tilesets = {tuple(entry) for entry in meta['used_tilesets']}
+        for i, name in enumerate(self.INDEXED):
+            ids, starts, counts = meta['groups'][name]
+            world.set_index(name, orders[i], np.array(ids), np.array(starts), np.array(counts))
+        world.region_neighbors = {int(pid): set(ids) for pid, ids in meta['region_neighbors'].items()}
+        cities = {city_id: tuple(position) for city_id, position in meta['cities'].items()}
+        return world, cities
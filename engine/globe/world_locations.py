@@ -0,0 +1,411 @@
+"""
+engine/globe/world_locations.py
+
+Defines the TWorldLocations class, the registry of everything with a position on a world map (cities, bases,
+crafts, UFOs, sites). Each kind of location is kept in a wrap-aware spatial grid and bucketed by the region under
+it, so nearest-k, within-radius and per-region queries never scan full lists. Moving objects update the registry
+incrementally: a move costs one dict update, plus a re-bucket when the object changes cell or region. Systems that
+react to movement (e.g. craft autopilots waiting for radar contacts) watch a kind instead of keeping their own index.
+
+Classes:
+    TWorldLocations: Spatial registry of world map locations by kind and region.
+
+Last standardized: 2026-10-18
+"""
+import heapq
+import math
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from engine.globe.spatial_grid import TSpatialGrid
+
+
+class TWorldLocations:
+    """
+    Registry of world map locations, queried by position, kind and region.
+    Every object is registered under a kind ('city', 'base', 'craft', 'ufo', ...) with an (x, y) position; its
+    region is read from the world's region layer (or the object's region_id when the world has no layers).
+
+    Attributes:
+        world (TWorld): World the locations are on.
+        cell_size (int): Spatial grid cell size in tiles.
+        grids (dict): Kind -> TSpatialGrid of that kind's objects.
+        kinds (dict): Object -> kind.
+        regions (dict): Object -> region id.
+        by_region (dict): (kind, region id) -> insertion-ordered dict of objects (used as a set).
+        watchers (dict): Kind -> callbacks(item, position) run when an object of that kind is added or moved
+            (position is None when it is removed).
+    """
+
+    def __init__(self, world, cell_size: int = 8, width: Optional[int] = None):
+        """
+        Initialize an empty registry for a world.
+
+        Args:
+            world (TWorld|None): World map (None for a registry without a map, e.g. in a standalone autopilot).
+            cell_size (int): Spatial grid cell size in tiles.
+            width (int, optional): World width for horizontal wrap; defaults to the world's width.
+        """
+        self.world = world
+        self.cell_size = cell_size
+        self._width = width
+        self.grids: Dict[str, TSpatialGrid] = {}
+        self.kinds: Dict[Hashable, str] = {}
+        self.regions: Dict[Hashable, Any] = {}
+        self.by_region: Dict[Tuple[str, Any], Dict[Hashable, None]] = {}
+        self.watchers: Dict[str, List[Callable]] = {}
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __contains__(self, item) -> bool:
+        return item in self.kinds
+
+    @property
+    def width(self) -> Optional[int]:
+        """
+        World width used for horizontal wrap.
+
+        Returns:
+            int|None: Width in tiles, or None for a flat map.
+        """
+        return self._width or getattr(self.world, 'width', None) or None
+
+    @staticmethod
+    def of(game) -> Optional['TWorldLocations']:
+        """
+        Location registry of a game's world map.
+
+        Args:
+            game (TGame): Game (may be None or have no world map yet).
+        Returns:
+            TWorldLocations|None: The registry, or None if there is no world map.
+        """
+        return getattr(getattr(game, 'worldmap', None), 'locations', None)
+
+    @staticmethod
+    def position_of(item) -> Optional[Tuple[float, float]]:
+        """
+        Position of an object from its `position` attribute (TWorldPoint, tuple or list) or x/y attributes.
+
+        Args:
+            item: Object with a position.
+        Returns:
+            tuple|None: (x, y), or None if the object has no position.
+        """
+        position = getattr(item, 'position', None)
+        if position is None:
+            if getattr(item, 'x', None) is None:
+                return None
+            return item.x, item.y
+        if hasattr(position, 'x'):
+            return position.x, position.y
+        return position[0], position[1]
+
+    def _region_at(self, item, x: float, y: float):
+        """
+        Region id under a position.
+
+        Args:
+            item: Object at the position (fallback region_id when the world has no region layer).
+            x (float): X coordinate.
+            y (float): Y coordinate.
+        Returns:
+            Region id, or None.
+        """
+        layer = getattr(self.world, 'layers', {}).get('region')
+        width, height = self.width, getattr(self.world, 'height', 0)
+        if layer is None or not layer.size or not width:
+            return getattr(item, 'region_id', None)
+        tx, ty = int(x // 1) % width, int(y // 1)
+        if not 0 <= ty < height:
+            return getattr(item, 'region_id', None)
+        return int(layer[ty, tx])
+
+    def add(self, item: Hashable, kind: str, x: float, y: float) -> None:
+        """
+        Register an object, or move it if it is already registered.
+
+        Args:
+            item: Object to register.
+            kind (str): Location kind ('city', 'base', 'craft', 'ufo', ...).
+            x (float): X coordinate.
+            y (float): Y coordinate.
+        """
+        if item in self.kinds:
+            if self.kinds[item] == kind:
+                self.move(item, x, y)
+                return
+            self.remove(item)
+        grid = self.grids.get(kind)
+        if grid is None:
+            grid = self.grids[kind] = TSpatialGrid(self.cell_size, self.width)
+        grid.insert(item, x, y)
+        self.kinds[item] = kind
+        region = self._region_at(item, x, y)
+        self.regions[item] = region
+        self.by_region.setdefault((kind, region), {})[item] = None
+        self._notify(kind, item, (x, y))
+
+    def place(self, item: Hashable, kind: str) -> bool:
+        """
+        Register an object at its own position (see position_of), e.g. when it is created or launched.
+
+        Args:
+            item: Object to register.
+            kind (str): Location kind.
+        Returns:
+            bool: True if registered, False if the object has no position.
+        """
+        position = self.position_of(item)
+        if position is None:
+            return False
+        self.add(item, kind, *position)
+        return True
+
+    def move(self, item: Hashable, x: float, y: float) -> None:
+        """
+        Update the position of a registered object.
+
+        Args:
+            item: Registered object.
+            x (float): New X coordinate.
+            y (float): New Y coordinate.
+        """
+        kind = self.kinds[item]
+        self.grids[kind].move(item, x, y)
+        region = self._region_at(item, x, y)
+        old = self.regions[item]
+        if region != old:
+            self._unbucket(item, (kind, old))
+            self.regions[item] = region
+            self.by_region.setdefault((kind, region), {})[item] = None
+        self._notify(kind, item, (x, y))
+
+    def update(self, item: Hashable, x: float, y: float) -> bool:
+        """
+        Move an object if it is registered (for position setters of objects that may not be on the map).
+
+        Args:
+            item: Object.
+            x (float): New X coordinate.
+            y (float): New Y coordinate.
+        Returns:
+            bool: True if the object is registered and was moved.
+        """
+        if item not in self.kinds:
+            return False
+        self.move(item, x, y)
+        return True
+
+    def remove(self, item: Hashable) -> None:
+        """
+        Unregister an object (no-op if it is not registered).
+
+        Args:
+            item: Object to remove.
+        """
+        kind = self.kinds.pop(item, None)
+        if kind is None:
+            return
+        self.grids[kind].remove(item)
+        self._unbucket(item, (kind, self.regions.pop(item)))
+        self._notify(kind, item, None)
+
+    def watch(self, kind: str, callback: Callable) -> None:
+        """
+        Call a function whenever an object of a kind is added, moved or removed.
+
+        Args:
+            kind (str): Location kind.
+            callback (callable): Function(item, (x, y) or None when removed).
+        """
+        self.watchers.setdefault(kind, []).append(callback)
+
+    def unwatch(self, kind: str, callback: Callable) -> None:
+        """
+        Stop calling a function registered with watch().
+
+        Args:
+            kind (str): Location kind.
+            callback (callable): Registered function.
+        """
+        callbacks = self.watchers.get(kind, [])
+        if callback in callbacks:
+            callbacks.remove(callback)
+
+    def _notify(self, kind: str, item: Hashable, position: Optional[Tuple[float, float]]) -> None:
+        """
+        Run the watchers of a kind.
+
+        Args:
+            kind (str): Location kind.
+            item: Changed object.
+            position (tuple|None): New position, None when removed.
+        """
+        for callback in self.watchers.get(kind, ()):
+            callback(item, position)
+
+    def _unbucket(self, item: Hashable, key: Tuple[str, Any]) -> None:
+        """
+        Remove an object from one region bucket, dropping empty buckets.
+
+        Args:
+            item: Registered object.
+            key (tuple): (kind, region id).
+        """
+        bucket = self.by_region.get(key)
+        if bucket is not None:
+            bucket.pop(item, None)
+            if not bucket:
+                del self.by_region[key]
+
+    def sync(self, kind: str, items) -> None:
+        """
+        Make a kind's registered objects match a list (objects positioned by `position_of`).
+
+        Args:
+            kind (str): Location kind.
+            items (iterable): Objects of this kind; objects without a position are skipped.
+        """
+        keep = {}
+        for item in items:
+            position = self.position_of(item)
+            if position is not None:
+                keep[item] = position
+        for item in self.items(kind):
+            if item not in keep:
+                self.remove(item)
+        for item, (x, y) in keep.items():
+            self.add(item, kind, x, y)
+
+    def rebuild(self) -> None:
+        """
+        Re-index every object after the world's size or region layer changed.
+        """
+        entries = [(item, kind, self.grids[kind].positions[item]) for item, kind in self.kinds.items()]
+        self.grids.clear()
+        self.kinds.clear()
+        self.regions.clear()
+        self.by_region.clear()
+        for item, kind, (x, y) in entries:
+            self.add(item, kind, x, y)
+
+    def position(self, item: Hashable) -> Tuple[float, float]:
+        """
+        Registered position of an object.
+
+        Args:
+            item: Registered object.
+        Returns:
+            tuple: (x, y).
+        """
+        return self.grids[self.kinds[item]].positions[item]
+
+    def items(self, kind: str) -> List[Any]:
+        """
+        Registered objects of a kind.
+
+        Args:
+            kind (str): Location kind.
+        Returns:
+            list: Objects in registration order.
+        """
+        grid = self.grids.get(kind)
+        return list(grid.positions) if grid is not None else []
+
+    def in_region(self, kind: str, region_id) -> List[Any]:
+        """
+        Registered objects of a kind inside a region.
+
+        Args:
+            kind (str): Location kind.
+            region_id: Region id.
+        Returns:
+            list: Objects in registration order.
+        """
+        return list(self.by_region.get((kind, region_id), ()))
+
+    def distance(self, x1: float, y1: float, x2: float, y2: float) -> float:
+        """
+        Wrap-aware distance between two positions.
+
+        Args:
+            x1 (float): First X coordinate.
+            y1 (float): First Y coordinate.
+            x2 (float): Second X coordinate.
+            y2 (float): Second Y coordinate.
+        Returns:
+            float: Distance in tiles.
+        """
+        dx = x2 - x1
+        if self.width:
+            dx = (dx + self.width / 2.0) % self.width - self.width / 2.0
+        return math.hypot(dx, y2 - y1)
+
+    def _grids(self, kind: Optional[str]) -> List[TSpatialGrid]:
+        """
+        Grids searched by a query.
+
+        Args:
+            kind (str, optional): Location kind, or None for all kinds.
+        Returns:
+            list: Spatial grids.
+        """
+        if kind is None:
+            return list(self.grids.values())
+        grid = self.grids.get(kind)
+        return [grid] if grid is not None else []
+
+    def within(self, x: float, y: float, radius: float, kind: Optional[str] = None) -> List[Tuple[Any, float]]:
+        """
+        Objects within a radius of a position (wrap-aware).
+
+        Args:
+            x (float): Center X coordinate.
+            y (float): Center Y coordinate.
+            radius (float): Radius in tiles (inclusive).
+            kind (str, optional): Only objects of this kind.
+        Returns:
+            list: (object, distance) pairs, nearest first.
+        """
+        found = []
+        for grid in self._grids(kind):
+            found.extend(grid.query_radius(x, y, radius))
+        found.sort(key=lambda pair: pair[1])
+        return found
+
+    def nearest(self, x: float, y: float, kind: Optional[str] = None, k: int = 1,
+                max_radius: Optional[float] = None) -> List[Tuple[Any, float]]:
+        """
+        The k objects nearest to a position (wrap-aware).
+
+        Args:
+            x (float): Center X coordinate.
+            y (float): Center Y coordinate.
+            kind (str, optional): Only objects of this kind.
+            k (int): Number of objects.
+            max_radius (float, optional): Ignore objects farther than this.
+        Returns:
+            list: Up to k (object, distance) pairs, nearest first.
+        """
+        found = []
+        for grid in self._grids(kind):
+            found.extend(grid.nearest(x, y, k, max_radius))
+        return heapq.nsmallest(k, found, key=lambda pair: pair[1])
+
+    def choice(self, rng, kind: str, region_id=None, predicate: Optional[Callable[[Any], bool]] = None):
+        """
+        Random registered object of a kind, optionally inside a region and matching a predicate.
+
+        Args:
+            rng (random.Random): Random generator (or the random module).
+            kind (str): Location kind.
+            region_id (optional): Region id; any region if omitted.
+            predicate (callable, optional): Function(object) -> bool filter.
+        Returns:
+            Object, or None if nothing matches.
+        """
+        candidates = self.in_region(kind, region_id) if region_id else self.items(kind)
+        if predicate is not None:
+            candidates = [item for item in candidates if predicate(item)]
+        return rng.choice(candidates) if candidates else None
@@ -2,6 +2,7 @@
 TWorldTile: Represents a single tile on the world map.
 Each tile is assigned to a region, may belong to a country, and has a biome.
 May also have one or more locations (e.g., cities, bases, crash sites).
+Tiles of a TWorld are views over the world's NumPy layers; standalone tiles keep their own values.
 
 Classes:
     TWorldTile: Main class for world map tiles.
@@ -14,6 +15,7 @@ class TWorldTile:
     Represents a single tile on the world map.
     Each tile is assigned to a region, may belong to a country, and has a biome.
     May also have one or more locations (e.g., cities, bases, crash sites).
+    When created by a TWorld, layer attributes read and write the world's layer arrays at (y, x).
 
     Attributes:
         x (int): X coordinate of the tile.
@@ -21,9 +23,16 @@ class TWorldTile:
         region_id (int|str|None): Region identifier for this tile.
         country_id (int|str|None): Country identifier for this tile.
         biome_id (int|str|None): Biome identifier for this tile.
+        owner_id (int|str|None): Country currently owning the tile.
+        is_land (bool|None): Whether the tile is land.
         locations (list): List of location IDs or objects present on this tile.
+        world (TWorld|None): World whose layers back this tile.
     """
-    def __init__(self, x, y, data=None):
+    # Tile attribute -> TWorld layer name
+    LAYER_ATTRS = {'biome_id': 'biome', 'country_id': 'country', 'region_id': 'region',
+                   'owner_id': 'owner', 'is_land': 'land'}
+
+    def __init__(self, x, y, data=None, world=None):
         """
         Initialize a TWorldTile instance.
 
@@ -31,20 +40,52 @@ class TWorldTile:
             x (int): X coordinate of the tile.
             y (int): Y coordinate of the tile.
             data (dict, optional): Optional dictionary containing initial values for
-                region_id, country_id, biome_id, and locations.
+                region_id, country_id, biome_id, owner_id, is_land and locations.
+            world (TWorld, optional): World whose layers back this tile.
         """
         self.x = x
         self.y = y
-        self.region_id = None
-        self.country_id = None
-        self.biome_id = None
+        self.world = world
+        self._values = {}
         self.locations = []
         if data:
-            self.region_id = data.get('region_id', None)
-            self.country_id = data.get('country_id', None)
-            self.biome_id = data.get('biome_id', None)
+            for attr in self.LAYER_ATTRS:
+                if attr in data:
+                    setattr(self, attr, data[attr])
             self.locations = data.get('locations', [])
 
+    def _get(self, attr):
+        """
+        Read a layer attribute from the world layers or the tile's own values.
+
+        Args:
+            attr (str): Tile attribute name.
+        Returns:
+            Layer value (Python scalar), or None for unset standalone values.
+        """
+        if self.world is None:
+            return self._values.get(attr)
+        return self.world.layers[self.LAYER_ATTRS[attr]][self.y, self.x].item()
+
+    def _set(self, attr, value):
+        """
+        Write a layer attribute to the world layers or the tile's own values.
+
+        Args:
+            attr (str): Tile attribute name.
+            value: New value.
+        """
+        if self.world is None:
+            self._values[attr] = value
+        else:
+            self.world.layers[self.LAYER_ATTRS[attr]][self.y, self.x] = value
+
+    region_id = property(lambda self: self._get('region_id'), lambda self, value: self._set('region_id', value))
+    country_id = property(lambda self: self._get('country_id'), lambda self, value: self._set('country_id', value))
+    biome_id = property(lambda self: self._get('biome_id'), lambda self, value: self._set('biome_id', value))
+    owner_id = property(lambda self: self._get('owner_id'), lambda self, value: self._set('owner_id', value))
+    is_land = property(lambda self: self._get('is_land'), lambda self, value: self._set('is_land', value))
+
     def __repr__(self):
         """
         Return a string representation of the TWorldTile instance.
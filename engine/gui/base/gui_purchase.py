@@ -20,8 +20,8 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtGui import QFont, QIcon
 
-from ..gui.base.gui_core_screen import TGuiCoreScreen
-from ..gui.theme_manager import XcomStyle
+from gui.gui_core import TGuiCoreScreen
+from gui.theme_manager import XcomStyle
 
 
 class TPurchaseGui(TGuiCoreScreen):
@@ -2,19 +2,411 @@
 XCOM GUI Module: gui_map.py
 
 Represents the globe map display GUI screen.
+The world layers are pre-composited once into a zoom-level pyramid of cached pixmap chunks; UFOs, crafts and
+bases are drawn as a separate overlay, and only the screen areas of markers that moved are repainted.
 
 Classes:
+    TGlobeTilePyramid: Zoom-level pyramid of world map pixmap chunks built from TWorld layers.
     TGuiGlobeMap: Main GUI screen for globe map display.
 
 Last updated: 2025-06-14
 """
 
+import numpy as np
+from PySide6.QtCore import QPoint, QRect, Qt
+from PySide6.QtGui import QColor, QImage, QPainter, QPixmap, QRegion
+
 from gui.gui_core import TGuiCoreScreen
 
 
+class TGlobeTilePyramid:
+    """
+    Pre-composited world map images per zoom level, cut into fixed-size pixmap chunks.
+    Level 0 is composited once from the world layers (tileset images per biome, or palette colours) with country
+    borders; every other level is a scaled copy of it. Chunks are converted to pixmaps on first use and cached.
+
+    Attributes:
+        world (TWorld): World map.
+        TILE_SIZES (tuple): Pixels per world tile for each zoom level (0 = most detailed).
+        CHUNK (int): Chunk size in pixels.
+        images (dict): Level -> composited QImage.
+        chunks (dict): (level, chunk x, chunk y) -> QPixmap.
+    """
+    TILE_SIZES = (16, 8, 4, 2)
+    CHUNK = 256
+    LAND_COLOR = (70, 110, 60)
+    SEA_COLOR = (20, 40, 90)
+    BORDER_COLOR = (200, 200, 120)
+
+    def __init__(self, world, palette=None, tile_images=None):
+        """
+        Build the level 0 composite of a world.
+
+        Args:
+            world (TWorld): World with layers filled.
+            palette (dict, optional): Biome id -> (r, g, b); unlisted biomes use land/sea colours.
+            tile_images (dict, optional): Biome id -> QImage of a TILE_SIZES[0] tile from the tileset.
+        """
+        self.world = world
+        self.images = {}
+        self.chunks = {}
+        self.images[0] = self._composite(palette or {}, tile_images or {})
+
+    def _composite(self, palette, tile_images):
+        """
+        Composite the most detailed level from the world layers.
+
+        Args:
+            palette (dict): Biome id -> (r, g, b).
+            tile_images (dict): Biome id -> QImage tile.
+        Returns:
+            QImage: Level 0 image.
+        """
+        layers = self.world.layers
+        size = self.TILE_SIZES[0]
+        rgb = np.where(layers['land'][..., None], self.LAND_COLOR, self.SEA_COLOR).astype(np.uint8)
+        biome = layers['biome']
+        for biome_id, color in palette.items():
+            rgb[biome == biome_id] = color
+        # Country borders: tiles whose owner differs from the east or south neighbour (east wraps)
+        owner = layers['owner']
+        border = (owner != np.roll(owner, -1, axis=1))
+        border[:-1] |= owner[:-1] != owner[1:]
+        border &= owner != 0
+        rgb[border] = self.BORDER_COLOR
+        pixels = np.ascontiguousarray(np.repeat(np.repeat(rgb, size, axis=0), size, axis=1))
+        height, width = pixels.shape[:2]
+        image = QImage(pixels.data, width, height, width * 3, QImage.Format.Format_RGB888).copy()
+        if tile_images:
+            painter = QPainter(image)
+            for biome_id, tile in tile_images.items():
+                ys, xs = np.nonzero((biome == biome_id) & ~border)
+                for x, y in zip(xs.tolist(), ys.tolist()):
+                    painter.drawImage(x * size, y * size, tile)
+            painter.end()
+        return image
+
+    def tile_size(self, level):
+        """
+        Pixels per world tile at a zoom level.
+
+        Args:
+            level (int): Zoom level.
+        Returns:
+            int: Tile size in pixels.
+        """
+        return self.TILE_SIZES[level]
+
+    def image(self, level):
+        """
+        Composited image of a zoom level (scaled from level 0 on first use).
+
+        Args:
+            level (int): Zoom level.
+        Returns:
+            QImage: Level image.
+        """
+        image = self.images.get(level)
+        if image is None:
+            size = self.TILE_SIZES[level]
+            image = self.images[0].scaled(self.world.width * size, self.world.height * size,
+                                          Qt.AspectRatioMode.IgnoreAspectRatio,
+                                          Qt.TransformationMode.SmoothTransformation)
+            self.images[level] = image
+        return image
+
+    def chunk(self, level, cx, cy):
+        """
+        Cached pixmap of one chunk of a level.
+
+        Args:
+            level (int): Zoom level.
+            cx (int): Chunk column.
+            cy (int): Chunk row.
+        Returns:
+            QPixmap: Chunk pixmap (smaller at the right/bottom edges).
+        """
+        key = (level, cx, cy)
+        pixmap = self.chunks.get(key)
+        if pixmap is None:
+            image = self.image(level)
+            rect = QRect(cx * self.CHUNK, cy * self.CHUNK, self.CHUNK, self.CHUNK).intersected(image.rect())
+            pixmap = QPixmap.fromImage(image.copy(rect))
+            self.chunks[key] = pixmap
+        return pixmap
+
+    def build(self):
+        """
+        Pre-build every level and chunk (e.g. behind a loading screen).
+        """
+        for level in range(len(self.TILE_SIZES)):
+            image = self.image(level)
+            for cy in range(-(-image.height() // self.CHUNK)):
+                for cx in range(-(-image.width() // self.CHUNK)):
+                    self.chunk(level, cx, cy)
+
+
 class TGuiGlobeMap(TGuiCoreScreen):
     """
     Globe map display GUI screen.
     Inherits from TGuiCoreScreen.
+    Paints the visible chunks of the current zoom level of a TGlobeTilePyramid (wrapping east-west) and an
+    overlay of markers. Moving markers invalidates only their old and new rectangles.
+
+    Attributes:
+        pyramid (TGlobeTilePyramid|None): Cached world map levels.
+        level (int): Current zoom level.
+        offset_x (int): Horizontal scroll in pixels of the current level (wrapped to the world width).
+        offset_y (int): Vertical scroll in pixels of the current level.
+        markers (dict): Marker key -> (x, y, kind) in world tile coordinates.
+        MARKER_COLORS (dict): Marker kind -> colour.
+        MARKER_SIZE (int): Marker size in pixels.
     """
-    pass
\ No newline at end of file
+    MARKER_COLORS = {'ufo': QColor(255, 60, 60), 'craft': QColor(60, 255, 60), 'base': QColor(60, 140, 255)}
+    MARKER_SIZE = 6
+
+    def __init__(self, parent=None):
+        """
+        Initialize the map screen without a world.
+
+        Args:
+            parent: Parent widget.
+        """
+        super().__init__(parent)
+        self.pyramid = None
+        self.level = 1
+        self.offset_x = 0
+        self.offset_y = 0
+        self.markers = {}
+        self._drag_start = None
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent)
+
+    def set_world(self, world, palette=None, tile_images=None):
+        """
+        Show a world; its layers are composited once into the level pyramid.
+
+        Args:
+            world (TWorld): World with layers filled.
+            palette (dict, optional): Biome id -> (r, g, b).
+            tile_images (dict, optional): Biome id -> QImage tile.
+        """
+        self.pyramid = TGlobeTilePyramid(world, palette, tile_images)
+        self.offset_x = self.offset_y = 0
+        self.update()
+
+    def world_pixels(self):
+        """
+        Size of the world at the current zoom level.
+
+        Returns:
+            tuple: (width, height) in pixels, (0, 0) without a world.
+        """
+        if self.pyramid is None:
+            return 0, 0
+        size = self.pyramid.tile_size(self.level)
+        return self.pyramid.world.width * size, self.pyramid.world.height * size
+
+    def set_zoom(self, level, anchor=None):
+        """
+        Change the zoom level, keeping the world point under an anchor fixed.
+
+        Args:
+            level (int): New zoom level (clamped to the pyramid).
+            anchor (QPoint, optional): Widget point to keep fixed; defaults to the centre.
+        """
+        if self.pyramid is None:
+            return
+        level = max(0, min(len(self.pyramid.TILE_SIZES) - 1, level))
+        if level == self.level:
+            return
+        if anchor is None:
+            anchor = self.rect().center()
+        x, y = self.screen_to_world(anchor.x(), anchor.y())
+        self.level = level
+        size = self.pyramid.tile_size(level)
+        self.offset_x = int(x * size - anchor.x())
+        self.offset_y = int(y * size - anchor.y())
+        self._clamp_offsets()
+        self.update()
+
+    def pan(self, dx, dy):
+        """
+        Scroll the map by a number of pixels (wrapping east-west).
+
+        Args:
+            dx (int): Horizontal scroll.
+            dy (int): Vertical scroll.
+        """
+        self.offset_x += dx
+        self.offset_y += dy
+        self._clamp_offsets()
+        self.update()
+
+    def _clamp_offsets(self):
+        """
+        Wrap the horizontal offset and keep the vertical offset inside the world.
+        """
+        width, height = self.world_pixels()
+        if width:
+            self.offset_x %= width
+        self.offset_y = max(0, min(self.offset_y, max(0, height - self.height())))
+
+    def world_to_screen(self, x, y):
+        """
+        Widget position of a world point (first wrapped copy right of the left edge).
+
+        Args:
+            x (float): World x in tiles.
+            y (float): World y in tiles.
+        Returns:
+            tuple: (x, y) in widget pixels.
+        """
+        size = self.pyramid.tile_size(self.level)
+        width, _ = self.world_pixels()
+        return int((x * size - self.offset_x) % width), int(y * size - self.offset_y)
+
+    def screen_to_world(self, sx, sy):
+        """
+        World point under a widget position.
+
+        Args:
+            sx (int): Widget x.
+            sy (int): Widget y.
+        Returns:
+            tuple: (x, y) in world tiles.
+        """
+        size = self.pyramid.tile_size(self.level)
+        return ((sx + self.offset_x) / size) % self.pyramid.world.width, (sy + self.offset_y) / size
+
+    def _marker_rect(self, x, y):
+        """
+        Widget rectangle covered by a marker.
+
+        Args:
+            x (float): World x in tiles.
+            y (float): World y in tiles.
+        Returns:
+            QRect: Marker rectangle.
+        """
+        sx, sy = self.world_to_screen(x, y)
+        half = self.MARKER_SIZE // 2 + 1
+        return QRect(sx - half, sy - half, 2 * half, 2 * half)
+
+    def set_markers(self, markers):
+        """
+        Replace the overlay markers, repainting only markers that appeared, moved or disappeared.
+
+        Args:
+            markers (dict): Marker key -> (x, y, kind) in world tiles; kind is 'ufo', 'craft' or 'base'.
+        Returns:
+            int: Number of markers repainted.
+        """
+        dirty = QRegion()
+        changed = 0
+        if self.pyramid is not None:
+            for key, old in self.markers.items():
+                new = markers.get(key)
+                if new != old:
+                    changed += 1
+                    dirty += self._marker_rect(old[0], old[1])
+                    if new is not None:
+                        dirty += self._marker_rect(new[0], new[1])
+            for key, new in markers.items():
+                if key not in self.markers:
+                    changed += 1
+                    dirty += self._marker_rect(new[0], new[1])
+        self.markers = dict(markers)
+        if not dirty.isEmpty():
+            self.update(dirty)
+        return changed
+
+    def move_marker(self, key, x, y, kind=None):
+        """
+        Move (or add) one marker.
+
+        Args:
+            key: Marker key (e.g. the UFO or craft object).
+            x (float): World x in tiles.
+            y (float): World y in tiles.
+            kind (str, optional): Marker kind; keeps the current kind if omitted.
+        """
+        markers = dict(self.markers)
+        if kind is None:
+            kind = markers.get(key, (0, 0, 'ufo'))[2]
+        markers[key] = (x, y, kind)
+        self.set_markers(markers)
+
+    def paintEvent(self, event):
+        """
+        Paint the cached chunks under the exposed area, then the markers inside it.
+
+        Args:
+            event (QPaintEvent): Paint event.
+        """
+        painter = QPainter(self)
+        exposed = event.rect()
+        painter.fillRect(exposed, QColor(0, 0, 0))
+        if self.pyramid is None:
+            painter.end()
+            return
+        chunk = self.pyramid.CHUNK
+        width, height = self.world_pixels()
+        # World pixel range under the exposed area; the world repeats east-west
+        left, top = exposed.left() + self.offset_x, max(0, exposed.top() + self.offset_y)
+        right, bottom = exposed.right() + self.offset_x, min(height - 1, exposed.bottom() + self.offset_y)
+        for copy in range(left // width, right // width + 1):
+            base = copy * width
+            first = max(0, left - base) // chunk
+            last = min(width - 1, right - base) // chunk
+            for cy in range(top // chunk, bottom // chunk + 1):
+                for cx in range(first, last + 1):
+                    painter.drawPixmap(base + cx * chunk - self.offset_x, cy * chunk - self.offset_y,
+                                       self.pyramid.chunk(self.level, cx, cy))
+        painter.setPen(Qt.PenStyle.NoPen)
+        for x, y, kind in self.markers.values():
+            rect = self._marker_rect(x, y)
+            if rect.intersects(exposed):
+                painter.setBrush(self.MARKER_COLORS.get(kind, QColor(255, 255, 255)))
+                painter.drawEllipse(rect.adjusted(1, 1, -1, -1))
+        painter.end()
+
+    def wheelEvent(self, event):
+        """
+        Zoom in or out around the mouse position.
+
+        Args:
+            event (QWheelEvent): Wheel event.
+        """
+        step = -1 if event.angleDelta().y() > 0 else 1
+        self.set_zoom(self.level + step, event.position().toPoint())
+
+    def mousePressEvent(self, event):
+        """
+        Start dragging the map.
+
+        Args:
+            event (QMouseEvent): Mouse event.
+        """
+        self._drag_start = event.position().toPoint()
+
+    def mouseMoveEvent(self, event):
+        """
+        Drag the map.
+
+        Args:
+            event (QMouseEvent): Mouse event.
+        """
+        if self._drag_start is not None:
+            point = event.position().toPoint()
+            delta = self._drag_start - point
+            self._drag_start = point
+            self.pan(delta.x(), delta.y())
+
+    def mouseReleaseEvent(self, event):
+        """
+        Stop dragging the map.
+
+        Args:
+            event (QMouseEvent): Mouse event.
+        """
+        self._drag_start = None
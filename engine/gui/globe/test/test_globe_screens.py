@@ -2,6 +2,8 @@ import unittest
 from engine.gui.globe.gui_research import TGuiGlobeResearch
 from engine.gui.globe.gui_reports import TGuiGlobeReports
 from engine.gui.globe.gui_production import TGuiGlobeProduction
+from engine.gui.globe.gui_map import TGuiGlobeMap, TGlobeTilePyramid
+from engine.globe.world import TWorld
 from PySide6.QtWidgets import QApplication
 import sys
 
@@ -22,5 +24,30 @@ class TestTGuiGlobeProduction(unittest.TestCase):
         screen = TGuiGlobeProduction()
         self.assertIsNotNone(screen)
 
+class TestTGuiGlobeMap(unittest.TestCase):
+    def make_world(self):
+        world = TWorld('earth', {'size': [40, 20]})
+        country = [[1 if x < 20 else 2 for x in range(40)] for _ in range(20)]
+        world.set_layers(biome=country, country=country, land=[[x < 30 for x in range(40)] for _ in range(20)])
+        return world
+
+    def test_pyramid_levels_and_chunks(self):
+        pyramid = TGlobeTilePyramid(self.make_world(), palette={1: (10, 200, 10)})
+        self.assertEqual((pyramid.image(0).width(), pyramid.image(0).height()), (640, 320))
+        self.assertEqual(pyramid.image(3).width(), 80)
+        self.assertEqual(pyramid.chunk(0, 2, 1).width(), 128)
+        self.assertIs(pyramid.chunk(0, 2, 1), pyramid.chunk(0, 2, 1))
+
+    def test_only_moved_markers_repaint(self):
+        screen = TGuiGlobeMap()
+        screen.resize(200, 100)
+        screen.set_world(self.make_world())
+        self.assertEqual(screen.set_markers({'u1': (5, 5, 'ufo'), 'b1': (10, 3, 'base')}), 2)
+        self.assertEqual(screen.set_markers({'u1': (6, 5, 'ufo'), 'b1': (10, 3, 'base')}), 1)
+        self.assertEqual(screen.set_markers({'u1': (6, 5, 'ufo')}), 1)
+        self.assertEqual(screen.world_to_screen(39, 0), (312, 0))
+        screen.pan(-16, 0)
+        self.assertEqual(screen.world_to_screen(39, 0)[0], 8)
+
 if __name__ == '__main__':
     unittest.main()
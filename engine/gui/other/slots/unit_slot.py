@@ -11,8 +11,8 @@ Last standardized: 2025-06-15
 
 from typing import Optional, Dict
 from gui.other.slots.inventory_slot import TInventorySlot
-from PySide6.QtCore import Qt, Signal, QSize
-from PySide6.QtGui import QDrag, QCursor, QMimeData
+from PySide6.QtCore import Qt, Signal, QSize, QMimeData
+from PySide6.QtGui import QDrag, QCursor
 from PySide6.QtWidgets import QToolTip
 from unit.unit import TUnit
 
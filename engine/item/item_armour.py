@@ -77,21 +77,9 @@ class TItemArmour(TItem):
         Returns:
             float: Final damage to be applied to the unit (after shield and resistance).
         """
-        # Apply damage to shield first
-        shield_damage = min(self.shield, damage)
-        self.shield -= shield_damage
-        remaining_damage = damage - shield_damage
-
-        # If there is no shield left, apply resistance to remaining damage
-        if remaining_damage > 0:
-            resistances = self.item_type.armour_resistance
-            if not resistances:
-                return remaining_damage
-            modifier = resistances.get(damage_type, 1.0)
-            final_damage = remaining_damage * float(modifier)
-            return final_damage
-
-        return 0.0
+        # Imported here: the battle package imports units, which import armour
+        from engine.battle.damage_model import TDamageModel
+        return TDamageModel.absorb(self, damage, damage_type)
 
     def get_stat_modifiers(self):
         """
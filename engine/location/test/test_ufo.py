@@ -31,3 +31,27 @@ class TestTUfo:
         assert ufo.health == 0
         assert ufo.is_destroyed()
 
+
+    def test_advance_script_flies_across_seam_in_one_jump(self):
+        steps = [{'type': 'move', 'delay': 3}, {'type': 'patrol'}]
+        script = MagicMock(MOVE_STEPS=('move',))
+        script.get_step.side_effect = lambda i: steps[i] if i < len(steps) else None
+        script.pick_target.return_value = (4, 10)
+        ufo = TUfo.__new__(TUfo)  # skip TLocation/TGame setup
+        ufo.game = MagicMock()
+        ufo.game.worldmap.width = 240
+        ufo.ufo_script = script
+        ufo.script_step = 0
+        ufo.speed_max = 2
+        ufo.set_position(236, 10)
+        ufo.advance_script(1)
+        assert ufo.get_position() == pytest.approx((238, 10))
+        ufo.advance_script(2)
+        assert ufo.get_position() == pytest.approx((2, 10))
+        assert (ufo.x, ufo.y) == (2, 10)
+        ufo.advance_script(1 + 3 + 1)
+        assert ufo.get_position() == (4, 10)
+        assert ufo.script_step == 1
+        # The move target is only picked; the step is never processed (which would place the UFO on it)
+        script.pick_target.assert_called_once()
+        assert script.process_current_step.call_count == 1
@@ -27,3 +27,78 @@ class TestTUfoScript:
         script = TUfoScript('script4', {'steps': [1, 2, 3]})
         assert script.total_steps() == 3
 
+
+
+class DummyUfo:
+    def __init__(self, region_id=1):
+        self.region_id = region_id
+        self.x = self.y = None
+        self.status = 'flying'
+    def set_position(self, x, y):
+        self.x, self.y = x, y
+
+
+class DummyGame:
+    def __init__(self):
+        from engine.globe.world import TWorld
+        world = TWorld('earth', {'size': [4, 3]})
+        world.set_layers(
+            region=[[1, 1, 2, 2], [1, 1, 2, 2], [1, 1, 2, 2]],
+            country=[[5, 0, 6, 6], [5, 0, 6, 6], [0, 0, 0, 0]],
+            land=[[1, 0, 0, 0], [1, 0, 0, 0], [0, 0, 0, 0]],
+        )
+        world.build_indexes()
+        world.register_regions({1: object(), 2: object()})
+        world.build_pools()
+        self.worldmap = world
+
+
+class TestTUfoScriptTargets:
+    def test_move_land_and_sea_pick_from_region_pools(self):
+        game = DummyGame()
+        script = TUfoScript('s', {'steps': [{'type': TUfoScript.STEP_MOVE_LAND}, {'type': TUfoScript.STEP_MOVE_SEA}]})
+        ufo = DummyUfo(region_id=1)
+        for _ in range(10):
+            script.process_current_step(ufo, game, 0)
+            assert (ufo.x, ufo.y) in {(0, 0), (0, 1)}
+            script.process_current_step(ufo, game, 1)
+            assert ufo.x in (0, 1) and not game.worldmap.layers['land'][ufo.y, ufo.x]
+
+    def test_move_country_and_region(self):
+        game = DummyGame()
+        script = TUfoScript('s', {'steps': [
+            {'type': TUfoScript.STEP_MOVE_COUNTRY, 'country_id': 6, 'region_id': 2},
+            {'type': TUfoScript.STEP_MOVE_REGION},
+        ]})
+        ufo = DummyUfo(region_id=1)
+        script.process_current_step(ufo, game, 0)
+        assert (ufo.x, ufo.y) in {(2, 0), (3, 0), (2, 1), (3, 1)}
+        script.process_current_step(ufo, game, 1)
+        assert ufo.x in (2, 3)
+
+    def test_land_step_uses_land_layer(self):
+        game = DummyGame()
+        script = TUfoScript('s', {'steps': [{'type': TUfoScript.STEP_LAND}]})
+        ufo = DummyUfo()
+        ufo.x, ufo.y = 0, 0
+        script.process_current_step(ufo, game, 0)
+        assert ufo.status == 'landed'
+
+    def test_move_remote_picks_tile_farthest_from_cities(self):
+        game = DummyGame()
+        class City:
+            position = (0, 0)
+        game.worldmap.cities.append(City())
+        script = TUfoScript('s', {'steps': [{'type': TUfoScript.STEP_MOVE_REMOTE}]})
+        ufo = DummyUfo(region_id=1)
+        script.process_current_step(ufo, game, 0)
+        assert (ufo.x, ufo.y) == (1, 2)
+
+    def test_pick_target_does_not_move_ufo(self):
+        game = DummyGame()
+        script = TUfoScript('s', {'steps': [{'type': TUfoScript.STEP_MOVE_LAND}, {'type': TUfoScript.STEP_PATROL}]})
+        ufo = DummyUfo(region_id=1)
+        ufo.x, ufo.y = 3, 2
+        assert script.pick_target(ufo, game, 0) in {(0, 0), (0, 1)}
+        assert (ufo.x, ufo.y) == (3, 2)
+        assert script.pick_target(ufo, game, 1) is None
@@ -9,7 +9,11 @@ Classes:
 Last updated: 2025-06-14
 """
 
+import math
+
 from globe.location import TLocation
+from engine.globe.movement import TGlobeMovement
+from engine.globe.world_locations import TWorldLocations
 
 
 class TUfo(TLocation):
@@ -43,87 +47,92 @@ class TUfo(TLocation):
         self.speed_max = self.ufo_type.speed
         self.health = self.ufo_type.health
 
+        # Register on the world map so radar, autopilots and scripts find it
+        locations = TWorldLocations.of(self.game)
+        if locations is not None:
+            locations.place(self, 'ufo')
+
+    @property
+    def type(self):
+        """
+        UFO type (the name TInterception and TInterceptionBatch read combat stats from).
+        Returns:
+            TUfoType: The UFO's type.
+        """
+        return self.ufo_type
+
+    def world_width(self):
+        """
+        Width of the world map the UFO flies over (for east-west wrap).
+        Returns:
+            int|None: World width in tiles, or None if there is no world map.
+        """
+        worldmap = getattr(self.game, 'worldmap', None)
+        return getattr(worldmap, 'width', None) or None
+
     def advance_script(self, turns=1):
         """
         Advance the UFO's script by the given number of turns.
         Handles step progress, movement, and post-step delays.
+        Movement follows the shortest wrapped path at sub-tile precision (TGlobeMovement), and long movement legs
+        and delays are consumed in one jump, so advancing many turns costs one update per script step.
         """
         if not self.ufo_script:
             return
         if not hasattr(self, '_step_state'):
-            self._step_state = {
-                'progress': 0,        # Progress for current step (e.g., movement progress)
-                'delay': 0,           # Delay after step is completed
-                'target': None,       # Target position for movement steps
-                'completed': False    # Whether the current step is completed
-            }
-        for _ in range(turns):
-            while True:
-                step = self.ufo_script.get_step(self.script_step)
-                if not step:
-                    return  # No more steps
-                duration = step.get('duration', 1)  # How long the step takes (for movement, may be dynamic)
-                delay = step.get('delay', 0)        # How long to wait after step is completed
-                step_type = step.get('type')
-                # If step is not completed, process it
-                if not self._step_state['completed']:
-                    # Handle movement steps that may take multiple turns
-                    if step_type in [
-                        self.ufo_script.STEP_MOVE_RANDOM,
-                        self.ufo_script.STEP_MOVE_CITY,
-                        self.ufo_script.STEP_MOVE_CRAFT,
-                        self.ufo_script.STEP_MOVE_ABASE,
-                        self.ufo_script.STEP_MOVE_XBASE,
-                        self.ufo_script.STEP_MOVE_REGION,
-                        self.ufo_script.STEP_MOVE_COUNTRY,
-                        self.ufo_script.STEP_MOVE_LAND,
-                        self.ufo_script.STEP_MOVE_SEA,
-                        self.ufo_script.STEP_MOVE_REMOTE
-                    ]:
-                        # If no target, pick one
-                        if self._step_state['target'] is None:
-                            # Use script logic to pick a target
-                            prev_pos = getattr(self, 'position', None)
-                            self.ufo_script.process_current_step(self, self.game, self.script_step, pick_target_only=True)
-                            # After this, self._step_state['target'] should be set
-                            if self._step_state['target'] is None:
-                                # Fallback: treat as completed if no target
-                                self._step_state['completed'] = True
-                                continue
-                        # Move towards target
-                        tx, ty = self._step_state['target']
-                        cx, cy = self.position if hasattr(self, 'position') else (self.x, self.y)
-                        speed = max(1, self.speed_max)
-                        # Simple straight-line movement (can be replaced with pathfinding)
-                        dx = tx - cx
-                        dy = ty - cy
-                        dist = abs(dx) + abs(dy)
-                        if dist == 0:
-                            self._step_state['completed'] = True
-                        else:
-                            # Move up to speed tiles towards target
-                            move_x = min(speed, abs(dx)) * (1 if dx > 0 else -1 if dx < 0 else 0)
-                            move_y = min(speed - abs(move_x), abs(dy)) * (1 if dy > 0 else -1 if dy < 0 else 0)
-                            new_x = cx + move_x
-                            new_y = cy + move_y
-                            self.set_position(new_x, new_y)
-                            # If reached target, mark as completed
-                            if (new_x, new_y) == (tx, ty):
-                                self._step_state['completed'] = True
-                        break  # Only move once per turn
-                    else:
-                        # Non-movement steps: process and mark as completed
-                        self.ufo_script.process_current_step(self, self.game, self.script_step)
-                        self._step_state['completed'] = True
-                        break
+            self._step_state = self._new_step_state()
+        remaining = turns
+        while remaining > 0:
+            step = self.ufo_script.get_step(self.script_step)
+            if not step:
+                return  # No more steps
+            delay = step.get('delay', 0)        # How long to wait after step is completed
+            step_type = step.get('type')
+            state = self._step_state
+            if not state['completed']:
+                if step_type in self.ufo_script.MOVE_STEPS:
+                    if state['move'] is None:
+                        # The script only picks the target; the UFO flies there below
+                        start = self.get_position()
+                        target = self.ufo_script.pick_target(self, self.game, self.script_step) or start
+                        state['target'] = target
+                        state['move'] = TGlobeMovement(start, target, self.speed_max, self.world_width())
+                    move = state['move']
+                    used = move.advance(remaining)
+                    remaining -= used
+                    self.set_position(*move.position)
+                    if move.arrived:
+                        state['completed'] = True
+                    elif not used:
+                        return  # Cannot move (no speed)
                 else:
-                    # Step is completed, handle delay
-                    if self._step_state['delay'] < delay:
-                        self._step_state['delay'] += 1
-                        break  # Wait for delay
-                    # Step and delay finished, go to next step
-                    self.script_step += 1
-                    self._step_state = {'progress': 0, 'delay': 0, 'target': None, 'completed': False}
+                    # Non-movement steps: process and mark as completed (takes one turn)
+                    self.ufo_script.process_current_step(self, self.game, self.script_step)
+                    state['completed'] = True
+                    remaining -= 1
+            elif state['delay'] < delay:
+                # Step is completed, wait out the delay
+                wait = min(remaining, delay - state['delay'])
+                state['delay'] += wait
+                remaining -= wait
+            else:
+                # Step and delay finished, go to next step
+                self.script_step += 1
+                self._step_state = self._new_step_state()
+
+    @staticmethod
+    def _new_step_state():
+        """
+        Fresh progress state of a script step.
+        Returns:
+            dict: Step state (movement leg, target, delay waited, completion flag).
+        """
+        return {
+            'move': None,         # TGlobeMovement leg of a movement step
+            'delay': 0,           # Delay after step is completed
+            'target': None,       # Target position for movement steps
+            'completed': False    # Whether the current step is completed
+        }
 
     def move_to(self, new_position):
         """
@@ -136,13 +145,27 @@ class TUfo(TLocation):
     def set_position(self, x, y):
         """
         Set the UFO's position on the world map.
+        Positions may be fractional while flying; x and y hold the tile under the UFO.
+        A UFO registered in the world's location registry is moved there as well.
         Args:
-            x (int): X coordinate.
-            y (int): Y coordinate.
+            x (float): X coordinate.
+            y (float): Y coordinate.
         """
         self.position = (x, y)
-        self.x = x
-        self.y = y
+        self.x = int(math.floor(x))
+        self.y = int(math.floor(y))
+        locations = TWorldLocations.of(getattr(self, 'game', None))
+        if locations is not None:
+            locations.update(self, x, y)
+
+    def remove(self):
+        """
+        Take the UFO off the world map (script end, landing on water): it leaves the location registry.
+        """
+        self.status = 'removed'
+        locations = TWorldLocations.of(getattr(self, 'game', None))
+        if locations is not None:
+            locations.remove(self)
 
     def get_position(self):
         """
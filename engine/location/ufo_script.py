@@ -9,11 +9,7 @@ Classes:
 Last updated: 2025-06-14
 """
 
-from engine.globe.region import TRegion
 from engine.lore.faction import TFaction
-from engine.location.city import TCity
-from engine.base.abase import TBaseAlien
-from engine.craft.craft import TCraft
 
 class TUfoScript:
     """
@@ -40,6 +36,11 @@ class TUfoScript:
     STEP_MOVE_LAND = 'Move to land tile in this region'
     STEP_MOVE_SEA = 'Move to sea tile in this region'
     STEP_MOVE_REMOTE = 'Move to random tile that is far from any existing city'
+    # Steps that place the UFO on a target picked by the script
+    START_STEPS = (STEP_START_RANDOM, STEP_START_CITY, STEP_START_ABASE, STEP_START_XBASE)
+    # Steps that fly the UFO to a target picked by the script
+    MOVE_STEPS = (STEP_MOVE_RANDOM, STEP_MOVE_CITY, STEP_MOVE_CRAFT, STEP_MOVE_ABASE, STEP_MOVE_XBASE,
+                  STEP_MOVE_REGION, STEP_MOVE_COUNTRY, STEP_MOVE_LAND, STEP_MOVE_SEA, STEP_MOVE_REMOTE)
     STEP_PATROL = 'Stay in air but do not move'
     STEP_LAND = 'Land on land, if on water then remove'
     STEP_DIVE = 'Dive under water, if on land then crash'
@@ -80,22 +81,21 @@ class TUfoScript:
         """
         return len(self.steps)
 
-    def process_current_step(self, ufo, game, step_idx, **kwargs):
+    def pick_target(self, ufo, game, step_idx, **kwargs):
         """
-        Process the current step for the UFO using internal step logic.
-        Returns True if step was processed, False if invalid.
+        Pick the position a start or move step sends the UFO to, without moving the UFO.
         Args:
             ufo: TUfo instance.
             game: Game instance.
-            step_idx (int): Index of the current step.
+            step_idx (int): Index of the step.
             **kwargs: Additional arguments for step processing.
         Returns:
-            bool: True if processed, False otherwise.
+            tuple or None: (x, y) target, or None if the step has no target or none could be found.
         """
         import random
         step = self.get_step(step_idx)
         if not step:
-            return False
+            return None
         step_type = step.get('type')
         step_kwargs = dict(step)
         step_kwargs.pop('type', None)
@@ -103,151 +103,116 @@ class TUfoScript:
         step_kwargs.update(kwargs)
         world = game.worldmap
 
-        # Helper functions with type casting
-        def random_tile(region_id=None, land=None):
-            region = None
-            if region_id:
-                region = next((r for r in world.regions if r.id == region_id), None)
-                if region and not isinstance(region, TRegion):
-                    region = TRegion(region)
-            tiles = region.region_tiles if region else [ (x, y) for y in range(world.size[1]) for x in range(world.size[0]) ]
-            if land is not None:
-                tiles = [t for t in tiles if world.tiles[t[1]][t[0]].biome.type == ('land' if land else 'sea')]
-            return random.choice(tiles) if tiles else None
+        # Helper functions
+        def random_tile(region_id=None, land=None, country_id=None):
+            # O(1) pick from the world's precomputed tile pools
+            return world.random_tile(random, region_id=region_id or None, country_id=country_id, land=land)
+
+        # Cities, bases and crafts come from the world's location registry (bucketed by region)
+        locations = world.locations
+
+        def located(item):
+            return locations.position(item) if item else None
 
         def random_city(region_id=None):
-            cities = [c for c in game.worldmap.cities if (not region_id or c.region_id == region_id)]
-            # Cast to TCity
-            return random.choice([c if isinstance(c, TCity) else TCity(c) for c in cities]) if cities else None
+            return located(locations.choice(random, 'city', region_id))
 
         def random_base(region_id=None, faction=None):
-            bases = [b for b in game.worldmap.bases if (not region_id or b.region_id == region_id) and (not faction or b.faction == faction)]
-            # Cast to TAbase or TXbase depending on faction
-            if not bases:
-                return None
-            b = random.choice(bases)
-            if getattr(b, 'faction', None) == 'xcom':
-                return b if isinstance(b, TXbase) else TXbase(b)
-            return b if isinstance(b, TAbase) else TAbase(b)
+            return located(locations.choice(random, 'base', region_id,
+                                            lambda b: not faction or getattr(b, 'faction', None) == faction))
 
         def random_craft(region_id=None):
-            crafts = [c for c in game.worldmap.crafts if (not region_id or c.region_id == region_id)]
-            return random.choice([c if isinstance(c, TCraft) else TCraft(c) for c in crafts]) if crafts else None
+            return located(locations.choice(random, 'craft', region_id))
 
-        # Step logic
         # --- Start steps ---
         if step_type == self.STEP_START_RANDOM:
             # Start in a random tile in region
-            region_id = step_kwargs.get('region_id')
-            tile = random_tile(region_id)
-            if tile:
-                ufo.set_position(*tile)
-
-        elif step_type == self.STEP_START_CITY:
+            return random_tile(step_kwargs.get('region_id'))
+        if step_type == self.STEP_START_CITY:
             # Start in a random city in region
-            region_id = step_kwargs.get('region_id')
-            city = random_city(region_id)
-            if city:
-                ufo.set_position(city.x, city.y)
-        elif step_type == self.STEP_START_ABASE:
+            return random_city(step_kwargs.get('region_id'))
+        if step_type == self.STEP_START_ABASE:
             # Start in a random alien base in region
-            region_id = step_kwargs.get('region_id')
-            base = random_base(region_id, faction=ufo.faction)
-            if base:
-                ufo.set_position(base.x, base.y)
-        elif step_type == self.STEP_START_XBASE:
+            return random_base(step_kwargs.get('region_id'), faction=ufo.faction)
+        if step_type == self.STEP_START_XBASE:
             # Start in a random XCOM base in region
-            region_id = step_kwargs.get('region_id')
-            base = random_base(region_id, faction='xcom')
-            if base:
-                ufo.set_position(base.x, base.y)
+            return random_base(step_kwargs.get('region_id'), faction='xcom')
         # --- Move steps ---
-        elif step_type == self.STEP_MOVE_RANDOM:
+        region_id = step_kwargs.get('region_id', ufo.region_id)
+        if step_type == self.STEP_MOVE_RANDOM:
             # Move to a random tile in region
-            region_id = step_kwargs.get('region_id', ufo.region_id)
-            tile = random_tile(region_id)
-            if tile:
-                ufo.set_position(*tile)
-        elif step_type == self.STEP_MOVE_CITY:
+            return random_tile(region_id)
+        if step_type == self.STEP_MOVE_CITY:
             # Move to a random city in region
-            region_id = step_kwargs.get('region_id', ufo.region_id)
-            city = random_city(region_id)
-            if city:
-                ufo.set_position(city.x, city.y)
-        elif step_type == self.STEP_MOVE_CRAFT:
+            return random_city(region_id)
+        if step_type == self.STEP_MOVE_CRAFT:
             # Move to a random XCOM craft in region
-            region_id = step_kwargs.get('region_id', ufo.region_id)
-            craft = random_craft(region_id)
-            if craft:
-                ufo.set_position(craft.x, craft.y)
-        elif step_type == self.STEP_MOVE_ABASE:
+            return random_craft(region_id)
+        if step_type == self.STEP_MOVE_ABASE:
             # Move to a random alien base in region
-            region_id = step_kwargs.get('region_id', ufo.region_id)
-            base = random_base(region_id, faction=ufo.faction)
-            if base:
-                ufo.set_position(base.x, base.y)
-        elif step_type == self.STEP_MOVE_XBASE:
+            return random_base(region_id, faction=ufo.faction)
+        if step_type == self.STEP_MOVE_XBASE:
             # Move to a random XCOM base in region
-            region_id = step_kwargs.get('region_id', ufo.region_id)
-            base = random_base(region_id, faction='xcom')
-            if base:
-                ufo.set_position(base.x, base.y)
-        elif step_type == self.STEP_MOVE_REGION:
+            return random_base(region_id, faction='xcom')
+        if step_type == self.STEP_MOVE_REGION:
             # Move to a neighboring region
-            region = next((r for r in world.regions if r.id == ufo.region_id), None)
-            if region and hasattr(region, 'neighbors'):
-                neighbor = random.choice(region.neighbors) if region.neighbors else None
-                if neighbor:
-                    tile = random_tile(neighbor.id)
-                    if tile:
-                        ufo.set_position(*tile)
-        elif step_type == self.STEP_MOVE_COUNTRY:
+            neighbors = sorted(world.region_neighbors.get(ufo.region_id, ()))
+            return random_tile(random.choice(neighbors)) if neighbors else None
+        if step_type == self.STEP_MOVE_COUNTRY:
             # Move to a tile owned by a specific country
-            region_id = step_kwargs.get('region_id', ufo.region_id)
-            country_id = step_kwargs.get('country_id')
-            region = next((r for r in world.regions if r.id == region_id), None)
-            if region:
-                tiles = [t for t in region.region_tiles if world.tiles[t[1]][t[0]].owner_country_id == country_id]
-                if tiles:
-                    ufo.set_position(*random.choice(tiles))
-        elif step_type == self.STEP_MOVE_LAND:
+            if world.get_region(region_id) is None:
+                return None
+            return random_tile(region_id, country_id=step_kwargs.get('country_id'))
+        if step_type == self.STEP_MOVE_LAND:
             # Move to a land tile in region
-            region_id = step_kwargs.get('region_id', ufo.region_id)
-            tile = random_tile(region_id, land=True)
-            if tile:
-                ufo.set_position(*tile)
-        elif step_type == self.STEP_MOVE_SEA:
+            return random_tile(region_id, land=True)
+        if step_type == self.STEP_MOVE_SEA:
             # Move to a sea tile in region
-            region_id = step_kwargs.get('region_id', ufo.region_id)
-            tile = random_tile(region_id, land=False)
-            if tile:
-                ufo.set_position(*tile)
-        elif step_type == self.STEP_MOVE_REMOTE:
-            # Move to a tile far from any city
-            region_id = step_kwargs.get('region_id', ufo.region_id)
-            city_coords = [(c.x, c.y) for c in game.worldmap.cities]
-            region = next((r for r in world.regions if r.id == region_id), None)
-            tiles = region.region_tiles if region else []
-            def min_dist(tile):
-                return min([abs(tile[0]-cx)+abs(tile[1]-cy) for (cx,cy) in city_coords]) if city_coords else 999
-            remote_tiles = sorted(tiles, key=min_dist, reverse=True)
-            if remote_tiles:
-                ufo.set_position(*remote_tiles[0])
+            return random_tile(region_id, land=False)
+        if step_type == self.STEP_MOVE_REMOTE:
+            # Move to a tile far from any city: argmax of the world's distance-to-nearest-city field over the region
+            if world.get_region(region_id) is None:
+                return None
+            return world.most_remote_tile(region_id=region_id)
+        return None
+
+    def process_current_step(self, ufo, game, step_idx, **kwargs):
+        """
+        Process the current step for the UFO using internal step logic.
+        Start and move steps place the UFO on the target picked by pick_target().
+        Returns True if step was processed, False if invalid.
+        Args:
+            ufo: TUfo instance.
+            game: Game instance.
+            step_idx (int): Index of the current step.
+            **kwargs: Additional arguments for step processing.
+        Returns:
+            bool: True if processed, False otherwise.
+        """
+        step = self.get_step(step_idx)
+        if not step:
+            return False
+        step_type = step.get('type')
+        world = game.worldmap
+
+        # Step logic
+        if step_type in self.START_STEPS or step_type in self.MOVE_STEPS:
+            target = self.pick_target(ufo, game, step_idx, **kwargs)
+            if target:
+                ufo.set_position(*target)
         # --- Other actions ---
         elif step_type == self.STEP_PATROL:
             # Stay in air, do not move
             pass
         elif step_type == self.STEP_LAND:
             # Land on land, remove if on water
-            tile = world.tiles[ufo.y][ufo.x]
-            if tile.biome.type == 'land':
+            if world.layers['land'][ufo.y, ufo.x]:
                 ufo.status = 'landed'
             else:
                 ufo.remove()
         elif step_type == self.STEP_DIVE:
             # Dive under water, crash if on land
-            tile = world.tiles[ufo.y][ufo.x]
-            if tile.biome.type == 'sea':
+            if not world.layers['land'][ufo.y, ufo.x]:
                 ufo.status = 'dived'
             else:
                 ufo.status = 'crashed'
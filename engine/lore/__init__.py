@@ -19,6 +19,7 @@ from .organization import TOrganization
 from .quest import TQuest
 from .quest_engine import TQuestEngine
 from .quest_manager import QuestManager
+from .scheduler import TScheduler
 
 __all__ = [
     "TCalendar",
@@ -32,4 +33,5 @@ __all__ = [
     "TQuest",
     "TQuestEngine",
     "QuestManager",
+    "TScheduler",
 ]
\ No newline at end of file
@@ -2,6 +2,8 @@
 XCOM Lore Module: calendar.py
 
 Manages the in-game calendar, campaign scheduling, and event checks.
+Time advances from event to event: the calendar jumps to the next week/month boundary or scheduler event
+instead of stepping every day (unless a daily hook is installed).
 
 Classes:
     TCalendar: Main calendar and campaign scheduling manager.
@@ -10,6 +12,7 @@ Last updated: 2025-06-14
 """
 import logging
 from engine.lore.campaign_step import TCampaignStep
+from engine.lore.scheduler import TScheduler
 
 
 class TCalendar:
@@ -23,6 +26,7 @@ class TCalendar:
         day (int): Current day (1-30).
         total_days (int): Total days elapsed since start.
         campaign_months (dict): Campaign rules for each month.
+        scheduler (TScheduler): Events keyed by due day (total_days).
     """
     def __init__(self, data=None):
         """
@@ -36,6 +40,7 @@ class TCalendar:
         self.day = 1
         self.total_days = 0
         self.campaign_months = {}
+        self.scheduler = TScheduler()
         if data is None:
             data = {}
         # Parse campaign steps for each month
@@ -87,26 +92,66 @@ class TCalendar:
     def advance_days(self, n, *args, **kwargs):
         """
         Advance the game by n days, performing all checks (daily, weekly, monthly, quarterly, yearly).
+        Days without a week/month boundary or scheduled event are skipped in one jump, unless on_day is
+        overridden, in which case every day is visited.
 
         Args:
             n (int): Number of days to advance.
         """
-        for _ in range(n):
-            self._advance_one_day(*args, **kwargs)
+        end = self.total_days + n
+        daily = self.has_daily_hook()
+        while self.total_days < end:
+            if daily:
+                target = self.total_days + 1
+            else:
+                target = min(end, self.next_boundary())
+                due = self.scheduler.next_day()
+                if due is not None:
+                    target = max(self.total_days + 1, min(target, due))
+            self._advance_to(target, daily, *args, **kwargs)
+
+    def has_daily_hook(self):
+        """
+        Check whether on_day has been overridden (by a subclass or on the instance).
+
+        Returns:
+            bool: True if every day must be visited.
+        """
+        return 'on_day' in self.__dict__ or type(self).on_day is not TCalendar.on_day
+
+    def next_boundary(self):
+        """
+        Next day (total_days) on which a weekly or monthly check fires.
+
+        Returns:
+            int: total_days of the next week start or month start, whichever comes first.
+        """
+        next_week = self.total_days + ((1 - self.total_days) % 7 or 7)
+        next_month = self.total_days + (31 - self.day)
+        return min(next_week, next_month)
 
     def _advance_one_day(self, *args, **kwargs):
         """
         Advance the calendar by one day and trigger event checks.
         """
-        self.day += 1
-        self.total_days += 1
-        if self.day > 30:
-            self.day = 1
-            self.month += 1
-            if self.month > 12:
-                self.month = 1
-                self.year += 1
-        self.on_day(*args, **kwargs)
+        self._advance_to(self.total_days + 1, True, *args, **kwargs)
+
+    def _advance_to(self, target, daily, *args, **kwargs):
+        """
+        Jump the calendar to a day and trigger the checks of that day.
+        Scheduled events due by then run after the daily check and before the weekly and longer checks.
+
+        Args:
+            target (int): New total_days.
+            daily (bool): Whether to call on_day.
+        """
+        ordinal = (self.year * 12 + self.month - 1) * 30 + self.day - 1 + (target - self.total_days)
+        self.year, rest = divmod(ordinal, 360)
+        self.month, self.day = rest // 30 + 1, rest % 30 + 1
+        self.total_days = target
+        if daily:
+            self.on_day(*args, **kwargs)
+        self.scheduler.run_until(self.total_days)
         # Weekly, monthly, quarterly, yearly checks
         if (self.total_days % 7) == 1:
             self.on_week(*args, **kwargs)
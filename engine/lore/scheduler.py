@@ -0,0 +1,130 @@
+"""
+XCOM Lore Module: scheduler.py
+
+Discrete-event scheduler for geoscape time. Subsystems register the day their next event is due
+(research completion, delivery, facility completion, ...) and the calendar jumps directly between due days
+instead of ticking every day.
+
+Classes:
+    TScheduler: Priority queue of keyed events ordered by due day.
+
+Last standardized: 2026-10-18
+"""
+import heapq
+import itertools
+
+
+class TScheduler:
+    """
+    Priority queue of events keyed by name and ordered by due day (calendar total_days).
+    Each key has at most one pending event; scheduling a key again replaces its event (stale heap entries are
+    skipped when popped). Events due on the same day run in scheduling order.
+    An event callback receives the day it fires and returns the day of its next event, or None to stop.
+
+    Attributes:
+        events (dict): Key -> (due day, sequence number, callback) of pending events.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty scheduler.
+        """
+        self.events = {}
+        self._heap = []
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self.events)
+
+    def __contains__(self, key):
+        return key in self.events
+
+    def schedule(self, day, callback, key=None):
+        """
+        Schedule (or reschedule) an event.
+
+        Args:
+            day (int): Due day (calendar total_days).
+            callback (callable): Function(day) -> next due day or None.
+            key (hashable, optional): Event key; a unique key is generated if omitted.
+        Returns:
+            Key of the event.
+        """
+        seq = next(self._counter)
+        if key is None:
+            key = ('event', seq)
+        self.events[key] = (day, seq, callback)
+        heapq.heappush(self._heap, (day, seq, key))
+        return key
+
+    def cancel(self, key):
+        """
+        Remove a pending event (no-op if the key is not scheduled).
+
+        Args:
+            key (hashable): Event key.
+        """
+        self.events.pop(key, None)
+
+    def due_day(self, key):
+        """
+        Due day of a pending event.
+
+        Args:
+            key (hashable): Event key.
+        Returns:
+            int|None: Due day, or None if the key is not scheduled.
+        """
+        event = self.events.get(key)
+        return event[0] if event else None
+
+    def _discard_stale(self):
+        """
+        Pop heap entries of cancelled or rescheduled events from the top of the heap.
+        """
+        heap = self._heap
+        while heap:
+            day, seq, key = heap[0]
+            event = self.events.get(key)
+            if event is not None and event[1] == seq:
+                return
+            heapq.heappop(heap)
+
+    def next_day(self):
+        """
+        Day of the earliest pending event.
+
+        Returns:
+            int|None: Due day, or None if nothing is scheduled.
+        """
+        self._discard_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def run_until(self, day):
+        """
+        Run all events due on or before a day, in due order. Events rescheduled by their callback for a day
+        within the range run again.
+
+        Args:
+            day (int): Last day to run (inclusive).
+        Returns:
+            int: Number of events run.
+        """
+        count = 0
+        while True:
+            due = self.next_day()
+            if due is None or due > day:
+                return count
+            _, seq, key = heapq.heappop(self._heap)
+            _, _, callback = self.events.pop(key)
+            count += 1
+            next_due = callback(due)
+            if next_due is not None and key not in self.events:
+                self.schedule(next_due, callback, key)
+
+    def clear(self):
+        """
+        Remove all pending events.
+        """
+        self.events.clear()
+        self._heap.clear()
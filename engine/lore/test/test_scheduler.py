@@ -0,0 +1,42 @@
+"""
+Test suite for TScheduler class.
+Covers keyed scheduling, rescheduling, cancellation and calendar jumps between events.
+"""
+from engine.lore.calendar import TCalendar
+from engine.lore.scheduler import TScheduler
+
+
+def test_events_run_in_due_order_and_reschedule():
+    """Test events run by due day, callbacks can reschedule themselves and replaced events are skipped."""
+    scheduler = TScheduler()
+    fired = []
+    scheduler.schedule(5, lambda day: fired.append(('a', day)), key='a')
+    scheduler.schedule(3, lambda day: fired.append(('b', day)) or (day + 4 if day < 10 else None), key='b')
+    scheduler.schedule(2, lambda day: fired.append(('old', day)), key='a')
+    scheduler.schedule(4, lambda day: fired.append(('c', day)), key='c')
+    scheduler.cancel('c')
+    assert scheduler.next_day() == 2
+    assert scheduler.run_until(12) == 4
+    assert fired == [('old', 2), ('b', 3), ('b', 7), ('b', 11)]
+    assert scheduler.next_day() is None and len(scheduler) == 0
+
+
+def test_calendar_jumps_between_events():
+    """Test advance_days only visits boundary and event days, and still fires monthly checks."""
+    cal = TCalendar()
+    visited, months = [], []
+    cal.on_month = lambda *args, **kwargs: months.append(cal.get_date())
+    cal.scheduler.schedule(45, lambda day: visited.append(day), key='research')
+    cal.advance_days(90)
+    assert (cal.year, cal.month, cal.day, cal.total_days) == (2000, 4, 1, 90)
+    assert visited == [45]
+    assert months == [(2000, 2, 1), (2000, 3, 1), (2000, 4, 1)]
+
+
+def test_calendar_visits_every_day_with_daily_hook():
+    """Test an overridden on_day still runs once per day."""
+    cal = TCalendar()
+    days = []
+    cal.on_day = lambda *args, **kwargs: days.append(cal.total_days)
+    cal.advance_days(10)
+    assert days == list(range(1, 11))